@@ -0,0 +1,25 @@
+-- Migration: 013_tax_daily_snapshots.sql
+-- Per-day VAT totals per tenant and tax method, so a UStVA period is a sum
+-- over ~30-90 rows instead of a scan of all invoices and lines.
+-- IST rows are keyed by paid_at day, SOLL rows by issue_date. Rows are
+-- refreshed by invoiceService whenever an invoice changes and backfilled
+-- on demand by calculateTaxPeriod(). Sums are unrounded (NUMERIC).
+
+CREATE TABLE IF NOT EXISTS tax_daily_snapshots (
+    tenant_id TEXT NOT NULL,
+    tax_method VARCHAR(4) NOT NULL,
+    day DATE NOT NULL,
+    standard_19_net NUMERIC NOT NULL DEFAULT 0,
+    standard_19_vat NUMERIC NOT NULL DEFAULT 0,
+    reduced_7_net NUMERIC NOT NULL DEFAULT 0,
+    reduced_7_vat NUMERIC NOT NULL DEFAULT 0,
+    zero_rated_net NUMERIC NOT NULL DEFAULT 0,
+    zero_rated_vat NUMERIC NOT NULL DEFAULT 0,
+    reverse_charge_net NUMERIC NOT NULL DEFAULT 0,
+    reverse_charge_vat NUMERIC NOT NULL DEFAULT 0,
+    eu_sales_net NUMERIC NOT NULL DEFAULT 0,
+    eu_sales_vat NUMERIC NOT NULL DEFAULT 0,
+    invoice_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tenant_id, tax_method, day)
+);
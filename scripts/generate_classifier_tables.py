@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Generate the Aho-Corasick tables used by messageClassifier.ts.
+
+Reads the keyword lists from src/services/core/messageClassifierWords.json,
+builds one automaton over all of them and writes it out as a dense DFA
+(state x char-class -> state) plus, per state, an output bitmask of the
+word lists and the pattern triggers (literal prefixes of the intent
+regexes) that end there.
+
+Run after editing the word lists:
+
+    python3 scripts/generate_classifier_tables.py
+"""
+import base64
+import hashlib
+import json
+import os
+import struct
+from collections import deque
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS = os.path.join(BASE, "src/services/core/messageClassifierWords.json")
+OUT = os.path.join(BASE, "src/services/core/messageClassifierTables.ts")
+
+# Bit per word list — must match the *_BIT constants in messageClassifier.ts
+LIST_BITS = [
+    ("abusive", 1 << 0),
+    ("germanHints", 1 << 1),
+    ("englishHints", 1 << 2),
+    ("greetings", 1 << 3),
+    ("thanks", 1 << 4),
+    ("botQuestions", 1 << 5),
+    ("statusQuestions", 1 << 6),
+    ("abortTokens", 1 << 7),
+    ("orderTokens", 1 << 8),
+    ("vehicleBrands", 1 << 9),
+    ("oemMarkers", 1 << 10),
+    ("turnAbusive", 1 << 11),
+]
+
+# Not a bit list: each trigger reports its index, see TRIGGER_IDS
+TRIGGER_LIST = "patternTriggers"
+
+
+def build_automaton(words, triggers):
+    """words: list of (word, bit); triggers: list of words.
+    Returns (alphabet, dfa rows, outputs, trigger ids per state)."""
+    alphabet = sorted({ch for word in [w for w, _ in words] + triggers for ch in word})
+    char_class = {ch: i + 1 for i, ch in enumerate(alphabet)}  # 0 = any other char
+
+    goto = [{}]
+    outputs = [0]
+    hits = [[]]
+
+    def insert(word):
+        state = 0
+        for ch in word:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][ch] = nxt
+                goto.append({})
+                outputs.append(0)
+                hits.append([])
+            state = nxt
+        return state
+
+    for word, bit in words:
+        outputs[insert(word)] |= bit
+    for trigger_id, word in enumerate(triggers):
+        hits[insert(word)].append(trigger_id)
+
+    # Breadth-first fail links; outputs inherit from their fail state and
+    # missing edges are resolved through the fail chain (dense DFA)
+    n_classes = len(alphabet) + 1
+    dfa = [[0] * n_classes for _ in goto]
+    fail = [0] * len(goto)
+    queue = deque()
+    for ch, nxt in goto[0].items():
+        dfa[0][char_class[ch]] = nxt
+        queue.append(nxt)
+    while queue:
+        state = queue.popleft()
+        outputs[state] |= outputs[fail[state]]
+        hits[state] = hits[state] + hits[fail[state]]
+        for cls in range(n_classes):
+            dfa[state][cls] = dfa[fail[state]][cls]
+        for ch, nxt in goto[state].items():
+            fail[nxt] = dfa[fail[state]][char_class[ch]]
+            dfa[state][char_class[ch]] = nxt
+            queue.append(nxt)
+
+    return alphabet, dfa, outputs, hits
+
+
+def scan(alphabet, dfa, outputs, hits, text):
+    """Returns (bitmask, [(trigger id, end index)])."""
+    char_class = {ch: i + 1 for i, ch in enumerate(alphabet)}
+    state, mask, found = 0, 0, []
+    for i, ch in enumerate(text):
+        state = dfa[state][char_class.get(ch, 0)]
+        mask |= outputs[state]
+        found.extend((trigger_id, i) for trigger_id in hits[state])
+    return mask, found
+
+
+def self_check(words, triggers, alphabet, dfa, outputs, hits):
+    # Every word on its own, and embedded in filler, must report its bit;
+    # every trigger must be reported at the position where it ends
+    for word, bit in words:
+        for text in (word, "xx " + word + " yy"):
+            if not scan(alphabet, dfa, outputs, hits, text)[0] & bit:
+                raise SystemExit(f"automaton misses {word!r}")
+    for trigger_id, word in enumerate(triggers):
+        text = "xx " + word + " yy"
+        if (trigger_id, 2 + len(word)) not in scan(alphabet, dfa, outputs, hits, text)[1]:
+            raise SystemExit(f"automaton misses trigger {word!r}")
+    if scan(alphabet, dfa, outputs, hits, "0123456789 ,.") != (0, []):
+        raise SystemExit("automaton reports a match on neutral text")
+
+
+def main():
+    with open(WORDS, "rb") as f:
+        raw = f.read()
+    lists = json.loads(raw)
+
+    words = []
+    for name, bit in LIST_BITS:
+        for word in lists[name]:
+            if word != word.lower():
+                raise SystemExit(f"{name}: {word!r} must be lowercase")
+            if any(ord(ch) > 0xFFFF for ch in word):
+                raise SystemExit(f"{name}: {word!r} contains a non-BMP character")
+            words.append((word, bit))
+    triggers = lists[TRIGGER_LIST]
+    if len(set(triggers)) != len(triggers) or any(t != t.lower() or not t for t in triggers):
+        raise SystemExit(f"{TRIGGER_LIST}: triggers must be unique, non-empty and lowercase")
+
+    alphabet, dfa, outputs, hits = build_automaton(words, triggers)
+    self_check(words, triggers, alphabet, dfa, outputs, hits)
+    if len(dfa) > 0xFFFF:
+        raise SystemExit("too many states for Uint16 tables")
+
+    # CSR layout: triggers ending in state s are TRIGGER_IDS[TRIGGER_OFFSETS[s]:TRIGGER_OFFSETS[s + 1]]
+    trigger_offsets, trigger_ids = [0], []
+    for state_hits in hits:
+        trigger_ids.extend(state_hits)
+        trigger_offsets.append(len(trigger_ids))
+
+    flat = [nxt for row in dfa for nxt in row]
+    transitions = base64.b64encode(struct.pack(f"<{len(flat)}H", *flat)).decode("ascii")
+    alphabet_js = json.dumps("".join(alphabet), ensure_ascii=True)
+
+    out = f"""/**
+ * GENERATED by scripts/generate_classifier_tables.py — do not edit.
+ * Source: messageClassifierWords.json ({len(words)} keywords, {len(triggers)} triggers, {len(dfa)} states)
+ */
+
+export const WORDS_SHA256 = "{hashlib.sha256(raw).hexdigest()}";
+
+/** Characters with their own class; class = index + 1, 0 = any other char */
+export const ALPHABET = {alphabet_js};
+
+export const STATE_COUNT = {len(dfa)};
+export const CLASS_COUNT = {len(alphabet) + 1};
+
+/** Dense DFA, row-major [state * CLASS_COUNT + class], Uint16 little-endian */
+export const TRANSITIONS_B64 =
+    "{transitions}";
+
+/** Word-list bits reported when entering each state */
+export const OUTPUTS: readonly number[] = {json.dumps(outputs)};
+
+/** Pattern triggers, in messageClassifierWords.json order */
+export const TRIGGERS: readonly string[] = {json.dumps(triggers, ensure_ascii=True)};
+
+/** Triggers ending in state s: TRIGGER_IDS[TRIGGER_OFFSETS[s] .. TRIGGER_OFFSETS[s + 1]) */
+export const TRIGGER_OFFSETS: readonly number[] = {json.dumps(trigger_offsets)};
+export const TRIGGER_IDS: readonly number[] = {json.dumps(trigger_ids)};
+"""
+    with open(OUT, "w") as f:
+        f.write(out)
+    print(f"Wrote {os.path.relpath(OUT, BASE)}: {len(words)} keywords, {len(triggers)} triggers, "
+          f"{len(dfa)} states, {len(alphabet) + 1} char classes")
+
+
+if __name__ == "__main__":
+    main()
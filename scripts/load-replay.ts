@@ -0,0 +1,131 @@
+/**
+ * Capacity test: replays a conversation corpus through the webhook → botQueue
+ * → botWorker path at increasing concurrency, with Twilio, Gemini and
+ * ScraperAPI answered by local stand-ins, and prints throughput, turn latency
+ * and queue lag per step plus the capacity (turns/s within the SLO).
+ *
+ * Needs Postgres (DATABASE_URL) and Redis (REDIS_URL). Unless --target is
+ * given, the app is started with the stand-in environment from --app
+ * (default: the release build, dist/index.js, which also runs the worker).
+ *
+ * Usage: DATABASE_URL=... REDIS_URL=redis://localhost:6379 \
+ *   ts-node -r tsconfig-paths/register scripts/load-replay.ts [options]
+ *
+ *   --corpus <file>          conversations + recorded responses (default scripts/load-replay.corpus.json)
+ *   --concurrency 1,2,4,8    concurrency steps (stops at the first SLO breach)
+ *   --repeat <n>             replay each conversation n times per step (default 5)
+ *   --slo-p95 <ms>           p95 turn latency SLO (default 10000)
+ *   --max-failures <rate>    failure rate SLO (default 0.01)
+ *   --latency <svc>=<spec>   twilio|gemini|scraper|media = fixed:ms | uniform:min,max |
+ *                            normal:mean,sd | lognormal:median,sigma (repeatable)
+ *   --seed <n>               latency seed (default 1)
+ *   --think <ms>             pause between turns of a conversation (default 0)
+ *   --target <url>           webhook of an already running stack started with the stand-in env
+ *   --stand-in-port <port>   fixed stand-in port (for --target; default random)
+ *   --app <entry>            app entry to spawn (default dist/index.js)
+ *   --port <port>            port for the spawned app (default 3900)
+ *   --json                   print the report as JSON
+ */
+
+import { spawn, ChildProcess } from "child_process";
+import path from "path";
+import { StandInServer, StandInService, LatencySpec, parseLatency } from "../src/services/testing/loadReplayStandIns";
+import { loadCorpus, runCapacitySweep, formatCapacityReport } from "../src/services/testing/loadReplay";
+
+function parseArgs(argv: string[]): Map<string, string[]> {
+    const args = new Map<string, string[]>();
+    for (let i = 0; i < argv.length; i++) {
+        if (!argv[i].startsWith("--")) throw new Error(`Unexpected argument ${argv[i]}`);
+        const name = argv[i].slice(2);
+        const value = argv[i + 1] && !argv[i + 1].startsWith("--") ? argv[++i] : "true";
+        args.set(name, [...(args.get(name) || []), value]);
+    }
+    return args;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const arg = (name: string, fallback: string) => args.get(name)?.[0] ?? fallback;
+
+async function waitForHealth(baseUrl: string, app: ChildProcess, timeoutMs = 60_000): Promise<void> {
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+        if (app.exitCode !== null) throw new Error(`App exited with ${app.exitCode} before becoming healthy`);
+        try {
+            if ((await fetch(`${baseUrl}/health`)).ok) return;
+        } catch {
+            // not listening yet
+        }
+        await new Promise(resolve => setTimeout(resolve, 500));
+    }
+    throw new Error(`App not healthy after ${timeoutMs}ms`);
+}
+
+async function run() {
+    const corpus = loadCorpus(arg("corpus", path.join(__dirname, "load-replay.corpus.json")));
+    const latency: Partial<Record<StandInService, LatencySpec>> = {};
+    for (const entry of args.get("latency") || []) {
+        const [service, spec] = entry.split("=");
+        if (!["twilio", "gemini", "scraper", "media"].includes(service) || !spec) {
+            throw new Error(`Invalid --latency ${entry} (expected <twilio|gemini|scraper|media>=<spec>)`);
+        }
+        latency[service as StandInService] = parseLatency(spec);
+    }
+
+    const standIns = new StandInServer({
+        port: Number(arg("stand-in-port", "0")),
+        seed: Number(arg("seed", "1")),
+        latency,
+        llmFixtures: corpus.llm,
+        defaultLlmResponse: corpus.defaultLlmResponse,
+        scraperFixtures: corpus.scraper,
+        media: corpus.mediaFiles,
+    });
+    const standInUrl = await standIns.start();
+
+    let app: ChildProcess | null = null;
+    let webhookUrl = args.get("target")?.[0];
+    if (webhookUrl) {
+        console.error(`Stand-ins on ${standInUrl}; the target must run with:`);
+        for (const [key, value] of Object.entries(standIns.getEnv())) console.error(`  ${key}=${value}`);
+    } else {
+        const entry = path.resolve(arg("app", "dist/index.js"));
+        const port = arg("port", "3900");
+        // TypeScript entries run with this process's loader flags (ts-node)
+        app = spawn(process.execPath, [...(entry.endsWith(".ts") ? process.execArgv : []), entry], {
+            env: { ...process.env, ...standIns.getEnv(), PORT: port, LOG_LEVEL: process.env.LOG_LEVEL || "warn" },
+            stdio: ["ignore", "ignore", "inherit"],
+        });
+        await waitForHealth(`http://127.0.0.1:${port}`, app);
+        webhookUrl = `http://127.0.0.1:${port}/webhook/whatsapp`;
+    }
+
+    try {
+        const levels = arg("concurrency", "1,2,4,8,16").split(",").map(Number);
+        const report = await runCapacitySweep({
+            webhookUrl,
+            standIns,
+            corpus,
+            repeat: Number(arg("repeat", "5")),
+            thinkTimeMs: Number(arg("think", "0")),
+        }, levels, {
+            p95TurnMs: Number(arg("slo-p95", "10000")),
+            maxFailureRate: Number(arg("max-failures", "0.01")),
+        });
+
+        if (args.has("json")) {
+            console.log(JSON.stringify(report, null, 2));
+        } else {
+            console.log(`Load replay: ${corpus.conversations.length} conversations × ${arg("repeat", "5")} per step against ${webhookUrl}`);
+            console.log(formatCapacityReport(report));
+        }
+        if (!report.capacity) process.exitCode = 1;
+    } finally {
+        app?.kill("SIGTERM");
+        await standIns.stop();
+    }
+}
+
+run().catch((err) => {
+    console.error("Load replay failed", err);
+    process.exit(1);
+});
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Rank LLM prompts by estimated tokens spent per day.
+
+Reads the JSON log lines written by src/utils/logger.ts and aggregates the
+"[PromptRegistry] Token usage" entries that promptRegistry.ts emits every
+10 minutes (each one covers only the calls since the previous entry, so
+they can simply be summed; restarts lose at most one window).
+
+    docker logs api 2>&1 | python3 scripts/prompt_token_report.py
+    python3 scripts/prompt_token_report.py app.log app.log.1 --days 7
+    python3 scripts/prompt_token_report.py app.log --json
+
+"static %" is the share of tokens coming from the compiled system prompt,
+i.e. what provider-side prefix caching can serve.
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import date, timedelta
+
+MESSAGE = "[PromptRegistry] Token usage"
+BUCKETS = ["256", "512", "1024", "2048", "4096", "8192", "16384", "+Inf"]
+
+
+def read_entries(files):
+    """Yield (day, prompts) for every token usage log line."""
+    streams = [open(path, encoding="utf-8", errors="replace") for path in files] or [sys.stdin]
+    for stream in streams:
+        for line in stream:
+            if MESSAGE not in line:
+                continue
+            # Log shippers may prefix the JSON with a timestamp or pod name
+            start = line.find("{")
+            try:
+                entry = json.loads(line[start:])
+            except ValueError:
+                continue
+            if entry.get("message") != MESSAGE:
+                continue
+            prompts = (entry.get("meta") or {}).get("prompts") or {}
+            yield entry.get("timestamp", "")[:10], prompts
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def aggregate(entries, since=None):
+    """-> {prompt: {"days": {day: tokens}, "calls", "tokens", "static", "max", "histogram"}}"""
+    stats = defaultdict(lambda: {
+        "days": defaultdict(int),
+        "calls": 0,
+        "tokens": 0,
+        "static": 0,
+        "max": 0,
+        "histogram": defaultdict(int),
+    })
+    for day, prompts in entries:
+        if since and day < since:
+            continue
+        for name, usage in prompts.items():
+            s = stats[name]
+            s["days"][day] += usage.get("tokens", 0)
+            s["calls"] += usage.get("calls", 0)
+            s["tokens"] += usage.get("tokens", 0)
+            s["static"] += usage.get("staticTokens", 0)
+            s["max"] = max(s["max"], usage.get("maxTokens", 0))
+            for bucket, count in (usage.get("histogram") or {}).items():
+                s["histogram"][bucket] += count
+    return stats
+
+
+def rank(stats):
+    # Average over every day in the logs, not just the days a prompt was used
+    days = len({day for s in stats.values() for day in s["days"]}) or 1
+    rows = []
+    for name, s in stats.items():
+        rows.append({
+            "prompt": name,
+            "tokensPerDay": round(s["tokens"] / days),
+            "peakDay": max(s["days"].items(), key=lambda kv: kv[1])[0] if s["days"] else None,
+            "calls": s["calls"],
+            "tokens": s["tokens"],
+            "avgTokens": round(s["tokens"] / s["calls"]) if s["calls"] else 0,
+            "maxTokens": s["max"],
+            "staticShare": round(s["static"] / s["tokens"], 3) if s["tokens"] else 0.0,
+            "histogram": {b: s["histogram"][b] for b in BUCKETS if s["histogram"].get(b)},
+        })
+    rows.sort(key=lambda r: r["tokensPerDay"], reverse=True)
+    return rows
+
+
+def print_table(rows):
+    if not rows:
+        print("No prompt token usage found.")
+        return
+    total = sum(r["tokensPerDay"] for r in rows) or 1
+    header = f"{'prompt':<18} {'tokens/day':>12} {'share':>6} {'calls':>9} {'avg':>7} {'max':>7} {'static %':>9}  histogram (<= tokens: calls)"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        histogram = " ".join(f"{b}:{n}" for b, n in r["histogram"].items())
+        print(
+            f"{r['prompt']:<18} {r['tokensPerDay']:>12,} {r['tokensPerDay'] / total:>6.0%} {r['calls']:>9,} "
+            f"{r['avgTokens']:>7,} {r['maxTokens']:>7,} {r['staticShare']:>9.0%}  {histogram}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="JSON log files (default: stdin)")
+    parser.add_argument("--days", type=int, help="only the last N days")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    since = (date.today() - timedelta(days=args.days - 1)).isoformat() if args.days else None
+    rows = rank(aggregate(read_entries(args.files), since))
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
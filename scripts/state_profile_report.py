@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Rank conversation states by the time and Gemini budget they cost.
+
+Reads either
+  - the JSON log lines written by src/utils/logger.ts, aggregating the
+    "[StateMachine] Transition profile" entries that stateMachine/tracing.ts
+    emits every 10 minutes (each covers only the transitions since the
+    previous entry, so they can simply be summed), or
+  - JSON exports of GET /api/bot/state-machine/profile (one per pod; the
+    totals since that pod started).
+
+    docker logs worker 2>&1 | python3 scripts/state_profile_report.py
+    python3 scripts/state_profile_report.py app.log app.log.1 --days 7
+    curl -H "Authorization: Bearer $TOKEN" $API/api/bot/state-machine/profile > profile.json
+    python3 scripts/state_profile_report.py profile.json --json
+
+"io %" splits the handler wall time into awaited DB, LLM and scraper time;
+the rest is CPU and un-instrumented I/O. p50/p95 are upper bucket bounds.
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import date, timedelta
+
+MESSAGE = "[StateMachine] Transition profile"
+BUCKETS = ["10", "50", "100", "250", "500", "1000", "2500", "5000", "10000", "30000", "+Inf"]
+IO_KINDS = ["db", "llm", "scraper"]
+
+
+def read_snapshot(text):
+    """Return the states of a /state-machine/profile export, or None."""
+    try:
+        doc = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(doc, dict) and "states" in doc and "message" not in doc:
+        return (doc.get("generatedAt") or "")[:10], doc["states"]
+    return None
+
+
+def read_entries(files):
+    """Yield (day, states) for every profile log line or export."""
+    streams = [open(path, encoding="utf-8", errors="replace") for path in files] or [sys.stdin]
+    for stream in streams:
+        text = stream.read()
+        if stream is not sys.stdin:
+            stream.close()
+        snapshot = read_snapshot(text)
+        if snapshot:
+            yield snapshot
+            continue
+        for line in text.splitlines():
+            if MESSAGE not in line:
+                continue
+            # Log shippers may prefix the JSON with a timestamp or pod name
+            start = line.find("{")
+            try:
+                entry = json.loads(line[start:])
+            except ValueError:
+                continue
+            if entry.get("message") != MESSAGE:
+                continue
+            states = (entry.get("meta") or {}).get("states") or {}
+            yield entry.get("timestamp", "")[:10], states
+
+
+def aggregate(entries, since=None):
+    """-> {state: {"handler", "count", "errors", "wallMs", "maxWallMs", "ioMs", "ioCalls", "budgetTokens", "histogram", "transitions"}}"""
+    stats = defaultdict(lambda: {
+        "handler": "",
+        "count": 0,
+        "errors": 0,
+        "wallMs": 0.0,
+        "maxWallMs": 0.0,
+        "ioMs": defaultdict(float),
+        "ioCalls": defaultdict(int),
+        "budgetTokens": 0,
+        "histogram": defaultdict(int),
+        "transitions": defaultdict(int),
+    })
+    for day, states in entries:
+        if since and day and day < since:
+            continue
+        for state, profile in states.items():
+            s = stats[state]
+            s["handler"] = profile.get("handler") or s["handler"]
+            s["count"] += profile.get("count", 0)
+            s["errors"] += profile.get("errors", 0)
+            s["wallMs"] += profile.get("wallMs", 0)
+            s["maxWallMs"] = max(s["maxWallMs"], profile.get("maxWallMs", 0))
+            s["budgetTokens"] += profile.get("budgetTokens", 0)
+            for kind in IO_KINDS:
+                s["ioMs"][kind] += (profile.get("ioMs") or {}).get(kind, 0)
+                s["ioCalls"][kind] += (profile.get("ioCalls") or {}).get(kind, 0)
+            for bucket, count in (profile.get("histogram") or {}).items():
+                s["histogram"][bucket] += count
+            for next_state, count in (profile.get("transitions") or {}).items():
+                s["transitions"][next_state] += count
+    return stats
+
+
+def percentile(histogram, count, q):
+    """Upper bound of the bucket holding the q-th quantile."""
+    if not count:
+        return None
+    seen = 0
+    for bucket in BUCKETS:
+        seen += histogram.get(bucket, 0)
+        if seen >= q * count:
+            return bucket
+    return "+Inf"
+
+
+def rank(stats):
+    rows = []
+    for state, s in stats.items():
+        count = s["count"] or 1
+        wall = s["wallMs"] or 1
+        top = sorted(s["transitions"].items(), key=lambda kv: kv[1], reverse=True)[:3]
+        rows.append({
+            "state": state,
+            "handler": s["handler"],
+            "count": s["count"],
+            "errorRate": round(s["errors"] / count, 3),
+            "totalMs": round(s["wallMs"]),
+            "avgMs": round(s["wallMs"] / count, 1),
+            "p50Ms": percentile(s["histogram"], s["count"], 0.5),
+            "p95Ms": percentile(s["histogram"], s["count"], 0.95),
+            "maxMs": round(s["maxWallMs"]),
+            "ioShare": {kind: round(s["ioMs"][kind] / wall, 3) for kind in IO_KINDS},
+            "ioCallsPerTransition": {kind: round(s["ioCalls"][kind] / count, 2) for kind in IO_KINDS},
+            "budgetTokens": s["budgetTokens"],
+            "budgetPerTransition": round(s["budgetTokens"] / count, 2),
+            "topTransitions": dict(top),
+        })
+    rows.sort(key=lambda r: r["totalMs"], reverse=True)
+    return rows
+
+
+def print_table(rows):
+    if not rows:
+        print("No state machine transitions found.")
+        return
+    total = sum(r["totalMs"] for r in rows) or 1
+    header = (
+        f"{'state':<28} {'count':>8} {'time %':>7} {'avg ms':>8} {'p50':>6} {'p95':>6} {'max ms':>8} "
+        f"{'db %':>5} {'llm %':>6} {'scr %':>6} {'llm/tr':>7} {'err %':>6}  next states"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        io = r["ioShare"]
+        transitions = " ".join(f"{state}:{n}" for state, n in r["topTransitions"].items())
+        print(
+            f"{r['state']:<28} {r['count']:>8,} {r['totalMs'] / total:>7.0%} {r['avgMs']:>8,.0f} {r['p50Ms'] or '-':>6} "
+            f"{r['p95Ms'] or '-':>6} {r['maxMs']:>8,} {io['db']:>5.0%} {io['llm']:>6.0%} {io['scraper']:>6.0%} "
+            f"{r['budgetPerTransition']:>7.2f} {r['errorRate']:>6.1%}  {transitions}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="JSON log files or profile exports (default: stdin)")
+    parser.add_argument("--days", type=int, help="only the last N days")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    since = (date.today() - timedelta(days=args.days - 1)).isoformat() if args.days else None
+    rows = rank(aggregate(read_entries(args.files), since))
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
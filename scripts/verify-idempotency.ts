@@ -0,0 +1,93 @@
+/**
+ * Multi-process idempotency check against a local Redis.
+ *
+ * Forks several "worker" processes that all race to claim the same set of
+ * Twilio MessageSids (as competing worker-deployment replicas would), then
+ * verifies every SID was claimed by exactly one process.
+ *
+ * Usage: REDIS_URL=redis://localhost:6379 ts-node -r tsconfig-paths/register scripts/verify-idempotency.ts [workers] [messages]
+ */
+
+import { fork } from "child_process";
+import IORedis from "ioredis";
+import { IdempotencyStore } from "../src/queue/idempotency";
+
+const REDIS_URL = process.env.REDIS_URL || "redis://localhost:6379";
+const isChild = process.argv[2] === "--child";
+const argOffset = isChild ? 5 : 2; // child: --child <owner> <runId> <workers> <messages>
+const WORKERS = Number(process.argv[argOffset] || 4);
+const MESSAGES = Number(process.argv[argOffset + 1] || 2000);
+
+interface ChildReport {
+    owner: string;
+    claimed: string[];
+    stats: ReturnType<IdempotencyStore["getStats"]>;
+}
+
+async function runChild(owner: string, runId: string) {
+    const redis = new IORedis(REDIS_URL, { maxRetriesPerRequest: 1 });
+    const store = new IdempotencyStore(redis);
+    const claimed: string[] = [];
+
+    // Every child claims every SID, in a different order, to maximise contention
+    const sids = Array.from({ length: MESSAGES }, (_, i) => `SM${runId}${i}`);
+    const offset = Number(owner.split("-")[1]) * Math.floor(MESSAGES / WORKERS);
+    for (let i = 0; i < sids.length; i++) {
+        const sid = sids[(i + offset) % sids.length];
+        if (await store.claim(`msg:${sid}`, owner, 60_000) === "claimed") claimed.push(sid);
+    }
+
+    // A redelivery of the same job must be allowed through
+    if (claimed.length > 0 && await store.claim(`msg:${claimed[0]}`, owner, 60_000) !== "owned") {
+        throw new Error(`${owner}: redelivery of own job was not recognised`);
+    }
+
+    const report: ChildReport = { owner, claimed, stats: store.getStats() };
+    process.send!(report);
+    await redis.quit();
+}
+
+async function runParent() {
+    const runId = Date.now().toString(36);
+    console.log(`Idempotency check: ${WORKERS} processes × ${MESSAGES} messages against ${REDIS_URL}`);
+
+    const reports = await Promise.all(Array.from({ length: WORKERS }, (_, i) =>
+        new Promise<ChildReport>((resolve, reject) => {
+            const child = fork(__filename, ["--child", `worker-${i}`, runId, String(WORKERS), String(MESSAGES)], {
+                execArgv: process.execArgv,
+            });
+            child.on("message", (msg) => resolve(msg as ChildReport));
+            child.on("error", reject);
+            child.on("exit", (code) => { if (code !== 0) reject(new Error(`worker-${i} exited with ${code}`)); });
+        })
+    ));
+
+    const claimCounts = new Map<string, number>();
+    for (const r of reports) {
+        for (const sid of r.claimed) claimCounts.set(sid, (claimCounts.get(sid) || 0) + 1);
+        console.log(`  ${r.owner}: claimed=${r.claimed.length} hits=${r.stats.hits} misses=${r.stats.misses} redisErrors=${r.stats.redisErrors}`);
+    }
+
+    const doubles = [...claimCounts.values()].filter(c => c > 1).length;
+    const missing = MESSAGES - claimCounts.size;
+    console.log(`Result: unique=${claimCounts.size} doubleProcessed=${doubles} unclaimed=${missing}`);
+
+    if (doubles > 0 || missing > 0) {
+        console.error("❌ Idempotency violated");
+        process.exit(1);
+    }
+    console.log("✅ Every message claimed exactly once");
+}
+
+if (isChild) {
+    const [, , , owner, runId] = process.argv;
+    runChild(owner, runId).catch((err) => {
+        console.error(err);
+        process.exit(1);
+    });
+} else {
+    runParent().catch((err) => {
+        console.error("Idempotency check failed", err);
+        process.exit(1);
+    });
+}
@@ -328,6 +328,13 @@ initDb().then(async () => {
     logger.error('Email assignments migration failed (non-critical):', err);
   });
 
+  // Share runtime feature-flag changes across API and worker pods
+  if (process.env.REDIS_URL) {
+    const { connection } = await import('./queue/connection');
+    const { startFeatureFlagSync } = await import('./services/core/featureFlags');
+    await startFeatureFlagSync(connection);
+  }
+
   const server = app.listen(env.port, () => {
     logger.info(`Bot service listening on port ${env.port}`);
   });
@@ -343,7 +350,19 @@ initDb().then(async () => {
       logger.info('[Shutdown] HTTP server closed');
     });
 
-    // 2. Close database pool
+    // 2. Write buffered audit entries, then close database pool
+    try {
+      const { stopFeatureFlagSync } = await import('./services/core/featureFlags');
+      await stopFeatureFlagSync();
+    } catch (err) {
+      logger.error('[Shutdown] Error stopping feature flag sync', { error: err });
+    }
+    try {
+      const { closeAuditSinks } = await import('./services/compliance/auditSink');
+      await closeAuditSinks();
+    } catch (err) {
+      logger.error('[Shutdown] Error flushing audit log', { error: err });
+    }
     try {
       const { closePool } = await import('./services/core/database');
       await closePool();
@@ -0,0 +1,122 @@
+/**
+ * Rate Limiter Benchmark
+ *
+ * Measures per-request cost of the sliding-window limiter with a large
+ * population of active keys. Runs the local store always, and the Redis
+ * Lua backend when REDIS_URL is set.
+ *
+ * Usage: ts-node src/middleware/__benchmarks__/rateLimiterBenchmark.ts [keys] [requests]
+ */
+
+import { SlidingWindowMemoryStore } from '../rateLimiter';
+
+const KEY_COUNT = Number(process.argv[2] || 50_000);
+const REQUESTS = Number(process.argv[3] || 1_000_000);
+const WINDOW_MS = 60_000;
+const MAX_REQUESTS = 60;
+
+interface BenchmarkResult {
+  backend: string;
+  keys: number;
+  requests: number;
+  totalMs: number;
+  nsPerRequest: number;
+  requestsPerSec: number;
+  heapDeltaMb: number;
+}
+
+function formatResult(r: BenchmarkResult): string {
+  return `${r.backend.padEnd(8)} keys=${r.keys} requests=${r.requests} ` +
+    `total=${r.totalMs.toFixed(0)}ms ${r.nsPerRequest.toFixed(0)}ns/req ` +
+    `${Math.round(r.requestsPerSec).toLocaleString()} req/s heapΔ=${r.heapDeltaMb.toFixed(1)}MB`;
+}
+
+function keyFor(i: number): string {
+  return `api:10.0.${(i >> 8) & 255}.${i & 255}:${i}`;
+}
+
+function benchmarkMemory(): BenchmarkResult {
+  const store = new SlidingWindowMemoryStore();
+  global.gc?.();
+  const heapBefore = process.memoryUsage().heapUsed;
+
+  // Warm up: every key has state before timing starts
+  const base = Date.now();
+  for (let i = 0; i < KEY_COUNT; i++) store.hitSync(keyFor(i), WINDOW_MS, MAX_REQUESTS, base);
+
+  const keys = Array.from({ length: KEY_COUNT }, (_, i) => keyFor(i));
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < REQUESTS; i++) {
+    // Spread requests over two windows so the previous-window weighting is exercised
+    store.hitSync(keys[(i * 7919) % KEY_COUNT], WINDOW_MS, MAX_REQUESTS, base + Math.floor((i / REQUESTS) * 2 * WINDOW_MS));
+  }
+  const totalNs = Number(process.hrtime.bigint() - start);
+  const heapAfter = process.memoryUsage().heapUsed;
+
+  return {
+    backend: 'memory',
+    keys: store.size,
+    requests: REQUESTS,
+    totalMs: totalNs / 1e6,
+    nsPerRequest: totalNs / REQUESTS,
+    requestsPerSec: REQUESTS / (totalNs / 1e9),
+    heapDeltaMb: (heapAfter - heapBefore) / 1024 / 1024,
+  };
+}
+
+async function benchmarkRedis(redisUrl: string): Promise<BenchmarkResult> {
+  const { createRateLimiter } = await import('../rateLimiter');
+  const limiter = createRateLimiter({ name: 'bench', windowMs: WINDOW_MS, maxRequests: MAX_REQUESTS });
+  const requests = Math.min(REQUESTS, 100_000);
+  const concurrency = 64;
+
+  const res: any = { setHeader() { }, status() { return res; }, json() { return res; } };
+  const hit = (i: number) => limiter({ method: 'GET', path: '/bench', ip: keyFor(i % KEY_COUNT) } as any, res, () => { });
+
+  // Let the Redis connection come up, then warm every key
+  await hit(0);
+  await new Promise(r => setTimeout(r, 500));
+  for (let i = 0; i < KEY_COUNT; i += concurrency) {
+    await Promise.all(Array.from({ length: Math.min(concurrency, KEY_COUNT - i) }, (_, j) => hit(i + j)));
+  }
+
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < requests; i += concurrency) {
+    await Promise.all(Array.from({ length: Math.min(concurrency, requests - i) }, (_, j) => hit((i + j) * 7919)));
+  }
+  const totalNs = Number(process.hrtime.bigint() - start);
+
+  return {
+    backend: `redis@${redisUrl.replace(/\/\/.*@/, '//')}`,
+    keys: KEY_COUNT,
+    requests,
+    totalMs: totalNs / 1e6,
+    nsPerRequest: totalNs / requests,
+    requestsPerSec: requests / (totalNs / 1e9),
+    heapDeltaMb: 0,
+  };
+}
+
+export async function runRateLimiterBenchmark(): Promise<BenchmarkResult[]> {
+  const results = [benchmarkMemory()];
+  console.log(formatResult(results[0]));
+
+  if (process.env.REDIS_URL) {
+    const redis = await benchmarkRedis(process.env.REDIS_URL);
+    results.push(redis);
+    console.log(formatResult(redis));
+  }
+
+  return results;
+}
+
+// Run if called directly
+if (require.main === module) {
+  require('dotenv').config();
+  runRateLimiterBenchmark()
+    .then(() => process.exit(0))
+    .catch(err => {
+      console.error('Benchmark failed:', err);
+      process.exit(1);
+    });
+}
@@ -1,7 +1,7 @@
 /**
  * Tests for Rate Limiter Middleware (in-memory store)
  */
-import { createRateLimiter, clearAllRateLimits } from '../rateLimiter';
+import { createRateLimiter, clearAllRateLimits, SlidingWindowMemoryStore, RedisStore } from '../rateLimiter';
 import { Request, Response, NextFunction } from 'express';
 
 // Mock the logger to avoid console noise during tests
@@ -14,6 +14,15 @@ jest.mock('@utils/logger', () => ({
   },
 }));
 
+// Hashes as SLIDING_WINDOW_LUA leaves them; the tests write them directly
+const mockRedisHashes = new Map<string, Record<string, string>>();
+jest.mock('ioredis', () => jest.fn().mockImplementation(() => ({
+  defineCommand: jest.fn(),
+  on: jest.fn((event: string, cb: () => void) => { if (event === 'ready') cb(); }),
+  connect: jest.fn().mockResolvedValue(undefined),
+  hmget: jest.fn(async (key: string, ...fields: string[]) => fields.map(f => mockRedisHashes.get(key)?.[f] ?? null)),
+})));
+
 function mockReqResNext(ip = '127.0.0.1', method = 'GET', path = '/test') {
   const req = {
     ip,
@@ -127,3 +136,85 @@ describe('Rate Limiter', () => {
     );
   });
 });
+
+describe('SlidingWindowMemoryStore', () => {
+  const WINDOW = 60000;
+
+  it('should not allow a double burst across a window edge', () => {
+    const store = new SlidingWindowMemoryStore();
+    const edge = 10 * WINDOW;
+
+    // Exhaust the limit at the very end of one window
+    for (let i = 0; i < 10; i++) {
+      expect(store.hitSync('k', WINDOW, 10, edge - 1).allowed).toBe(true);
+    }
+
+    // Right after the edge the previous window still weighs ~100%
+    const decision = store.hitSync('k', WINDOW, 10, edge + 1);
+    expect(decision.allowed).toBe(false);
+    expect(decision.retryAfterMs).toBeGreaterThan(0);
+  });
+
+  it('should admit requests again as the previous window decays', () => {
+    const store = new SlidingWindowMemoryStore();
+    const start = 20 * WINDOW;
+
+    for (let i = 0; i < 10; i++) store.hitSync('k', WINDOW, 10, start);
+    expect(store.hitSync('k', WINDOW, 10, start + WINDOW + 1).allowed).toBe(false);
+
+    // Halfway through the next window the estimate is 10 * 0.5 = 5
+    expect(store.hitSync('k', WINDOW, 10, start + WINDOW + WINDOW / 2).allowed).toBe(true);
+  });
+
+  it('should not count rejected requests', () => {
+    const store = new SlidingWindowMemoryStore();
+    const now = 30 * WINDOW;
+
+    store.hitSync('k', WINDOW, 1, now);
+    for (let i = 0; i < 5; i++) store.hitSync('k', WINDOW, 1, now + 1);
+
+    // Two windows later all state has aged out
+    expect(store.hitSync('k', WINDOW, 1, now + 2 * WINDOW).allowed).toBe(true);
+  });
+
+  it('should keep at most maxKeys entries without a cleanup timer', () => {
+    const store = new SlidingWindowMemoryStore(100);
+    for (let i = 0; i < 1000; i++) store.hitSync(`key-${i}`, WINDOW, 5, 0);
+    expect(store.size).toBeLessThanOrEqual(100);
+  });
+});
+
+describe('RedisStore', () => {
+  const WINDOW = 60000;
+
+  afterEach(() => {
+    mockRedisHashes.clear();
+    jest.useRealTimers();
+  });
+
+  it('should report the weighted estimate and the end of the window like the memory store', async () => {
+    const start = 40 * WINDOW;
+    jest.useFakeTimers().setSystemTime(start + WINDOW / 2);
+    mockRedisHashes.set('rl:k', { ws: String(start), w: String(WINDOW), p: '8', c: '3' });
+
+    const memory = new SlidingWindowMemoryStore();
+    for (let i = 0; i < 8; i++) memory.hitSync('k', WINDOW, 100, start - WINDOW);
+    for (let i = 0; i < 3; i++) memory.hitSync('k', WINDOW, 100, start);
+
+    const expected = { count: 7, resetAt: start + WINDOW };
+    expect(await new RedisStore('redis://test').get('k')).toEqual(expected);
+    expect(await memory.get('k')).toEqual(expected);
+  });
+
+  it('should roll a hash from an earlier window forward', async () => {
+    const start = 50 * WINDOW;
+    jest.useFakeTimers().setSystemTime(start + WINDOW + WINDOW / 4);
+    mockRedisHashes.set('rl:k', { ws: String(start), w: String(WINDOW), p: '0', c: '4' });
+
+    const store = new RedisStore('redis://test');
+    expect(await store.get('k')).toEqual({ count: 3, resetAt: start + 2 * WINDOW });
+
+    jest.setSystemTime(start + 2 * WINDOW + 1);
+    expect(await store.get('k')).toBeNull();
+  });
+});
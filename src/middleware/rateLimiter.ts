@@ -2,7 +2,9 @@
  * 🛡️ Rate Limiting Middleware
  * 
  * Provides API rate limiting to protect against abuse.
- * Uses Redis when REDIS_URL is set (production), falls back to in-memory for dev.
+ * Approximate sliding window (previous + current window counts, O(1) per key).
+ * Uses an atomic Redis Lua script when REDIS_URL is set so limits hold across
+ * all API pods, falls back to the in-memory store for dev or while Redis is down.
  */
 import { Request, Response, NextFunction } from "express";
 import { logger } from "@utils/logger";
@@ -16,9 +18,15 @@ interface RateLimitEntry {
     resetAt: number;
 }
 
+interface RateLimitDecision extends RateLimitEntry {
+    allowed: boolean;
+    retryAfterMs: number;
+}
+
 interface RateLimitConfig {
     windowMs: number;      // Time window in milliseconds
     maxRequests: number;   // Max requests per window
+    name?: string;         // Namespace so limiters sharing a key (e.g. req.ip) don't collide
     keyGenerator?: (req: Request) => string;
     skipSuccessfulRequests?: boolean;
     message?: string;
@@ -26,48 +34,137 @@ interface RateLimitConfig {
 
 interface RateLimitStore {
     get(key: string): Promise<RateLimitEntry | null>;
-    increment(key: string, windowMs: number): Promise<RateLimitEntry>;
+    hit(key: string, windowMs: number, maxRequests: number): Promise<RateLimitDecision>;
     reset(key: string): Promise<void>;
     clear(): Promise<void>;
 }
 
+// ============================================================================
+// SLIDING WINDOW MATH
+// ============================================================================
+//
+// Approximate sliding window: keep only the counts of the current and the
+// previous fixed window. The previous count is weighted by how much of it
+// still overlaps the sliding window, so a client can no longer burst 2x the
+// limit across a window edge. State per key is three numbers.
+
+interface WindowCounts {
+    prev: number;
+    curr: number;
+    elapsed: number; // ms since the current fixed window started
+}
+
+function estimateCount({ prev, curr, elapsed }: WindowCounts, windowMs: number): number {
+    return prev * ((windowMs - elapsed) / windowMs) + curr;
+}
+
+/**
+ * Milliseconds until one more request would be admitted.
+ */
+function computeRetryAfterMs(counts: WindowCounts, windowMs: number, maxRequests: number): number {
+    const { prev, curr, elapsed } = counts;
+    if (maxRequests <= 0) return windowMs - elapsed;
+
+    // Still inside the current window: wait for the previous window's weight to decay
+    if (curr + 1 <= maxRequests && prev > 0) {
+        const t = windowMs * (1 - (maxRequests - 1 - curr) / prev) - elapsed;
+        if (t <= windowMs - elapsed) return Math.max(0, Math.ceil(t));
+    }
+
+    // Next window: the current count becomes the decaying previous count
+    const untilNextWindow = windowMs - elapsed;
+    const decay = curr > 0 ? windowMs * Math.max(0, 1 - (maxRequests - 1) / curr) : 0;
+    return Math.ceil(untilNextWindow + decay);
+}
+
+function toDecision(counts: WindowCounts, allowed: boolean, windowMs: number, maxRequests: number, now: number): RateLimitDecision {
+    const count = Math.ceil(estimateCount(counts, windowMs));
+    const retryAfterMs = allowed ? 0 : computeRetryAfterMs(counts, windowMs, maxRequests);
+    return {
+        allowed,
+        count: allowed ? count : Math.max(count, maxRequests + 1),
+        resetAt: allowed ? now + (windowMs - counts.elapsed) : now + retryAfterMs,
+        retryAfterMs,
+    };
+}
+
+interface SlidingWindowEntry {
+    windowStart: number;
+    windowMs: number;
+    prev: number;
+    curr: number;
+}
+
+/** Advance the entry to the fixed window containing `now` */
+function rollWindow(entry: SlidingWindowEntry, now: number): WindowCounts {
+    const windowStart = now - (now % entry.windowMs);
+    if (windowStart !== entry.windowStart) {
+        entry.prev = windowStart - entry.windowStart === entry.windowMs ? entry.curr : 0;
+        entry.curr = 0;
+        entry.windowStart = windowStart;
+    }
+    return { prev: entry.prev, curr: entry.curr, elapsed: now - windowStart };
+}
+
+/** Weighted estimate and end of the current fixed window, null once aged out */
+function peekWindow(entry: SlidingWindowEntry, now: number): RateLimitEntry | null {
+    const counts = rollWindow(entry, now);
+    if (counts.prev === 0 && counts.curr === 0) return null;
+    return {
+        count: Math.ceil(estimateCount(counts, entry.windowMs)),
+        resetAt: entry.windowStart + entry.windowMs,
+    };
+}
+
 // ============================================================================
 // IN-MEMORY STORE (Development / Fallback)
 // ============================================================================
 
-class InMemoryStore implements RateLimitStore {
-    private store = new Map<string, RateLimitEntry>();
-    private cleanupInterval: ReturnType<typeof setInterval>;
+const MAX_LOCAL_KEYS = 200_000;
+const STALE_PRUNE_PER_HIT = 4;
 
-    constructor() {
-        // Cleanup expired entries every minute
-        this.cleanupInterval = setInterval(() => {
-            const now = Date.now();
-            for (const [key, entry] of this.store.entries()) {
-                if (entry.resetAt < now) {
-                    this.store.delete(key);
-                }
-            }
-        }, 60000);
+/**
+ * Constant-memory sliding-window store.
+ *
+ * The Map is kept in last-hit order, so stale keys accumulate at the head and
+ * are pruned a few at a time on each hit instead of by a timer sweep.
+ */
+export class SlidingWindowMemoryStore implements RateLimitStore {
+    private store = new Map<string, SlidingWindowEntry>();
+
+    constructor(private readonly maxKeys: number = MAX_LOCAL_KEYS) { }
+
+    get size(): number {
+        return this.store.size;
     }
 
     async get(key: string): Promise<RateLimitEntry | null> {
         const entry = this.store.get(key);
-        if (!entry || entry.resetAt < Date.now()) return null;
-        return entry;
+        return entry ? peekWindow(entry, Date.now()) : null;
+    }
+
+    async hit(key: string, windowMs: number, maxRequests: number): Promise<RateLimitDecision> {
+        return this.hitSync(key, windowMs, maxRequests, Date.now());
     }
 
-    async increment(key: string, windowMs: number): Promise<RateLimitEntry> {
-        const now = Date.now();
+    hitSync(key: string, windowMs: number, maxRequests: number, now: number): RateLimitDecision {
         let entry = this.store.get(key);
+        if (entry) {
+            this.store.delete(key);
+        } else {
+            entry = { windowStart: now - (now % windowMs), windowMs, prev: 0, curr: 0 };
+        }
+        this.store.set(key, entry);
 
-        if (!entry || entry.resetAt < now) {
-            entry = { count: 0, resetAt: now + windowMs };
-            this.store.set(key, entry);
+        const counts = rollWindow(entry, now);
+        const allowed = estimateCount(counts, windowMs) + 1 <= maxRequests;
+        if (allowed) {
+            entry.curr++;
+            counts.curr++;
         }
 
-        entry.count++;
-        return entry;
+        this.prune(now, key);
+        return toDecision(counts, allowed, windowMs, maxRequests, now);
     }
 
     async reset(key: string): Promise<void> {
@@ -77,34 +174,83 @@ class InMemoryStore implements RateLimitStore {
     async clear(): Promise<void> {
         this.store.clear();
     }
+
+    private prune(now: number, currentKey: string): void {
+        let budget = STALE_PRUNE_PER_HIT;
+        for (const [key, entry] of this.store) {
+            if (key === currentKey) break;
+            const stale = now - entry.windowStart >= 2 * entry.windowMs;
+            if (!stale && this.store.size <= this.maxKeys) break;
+            this.store.delete(key);
+            if (--budget === 0) break;
+        }
+    }
 }
 
 // ============================================================================
 // REDIS STORE (Production)
 // ============================================================================
 
-class RedisStore implements RateLimitStore {
+/**
+ * Atomic sliding-window check-and-increment.
+ * KEYS[1] = hash key, ARGV = now (ms), windowMs, maxRequests
+ * Returns { allowed, prev, curr, elapsed } after the decision. The window
+ * length is stored with the counts so get() can compute the same estimate.
+ */
+const SLIDING_WINDOW_LUA = `
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local ws = now - (now % window)
+local data = redis.call('HMGET', KEYS[1], 'ws', 'p', 'c')
+local lastWs = tonumber(data[1])
+local p = tonumber(data[2]) or 0
+local c = tonumber(data[3]) or 0
+if lastWs ~= ws then
+  if lastWs == ws - window then p = c else p = 0 end
+  c = 0
+end
+local elapsed = now - ws
+local allowed = 0
+if p * (window - elapsed) / window + c + 1 <= limit then
+  c = c + 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'ws', ws, 'w', window, 'p', p, 'c', c)
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return { allowed, p, c, elapsed }
+`;
+
+/**
+ * Shared limiter state for all API pods. Falls back to a local
+ * sliding-window store while Redis is unreachable instead of failing open.
+ */
+export class RedisStore implements RateLimitStore {
     private redis: any;
     private connected = false;
+    private fallback = new SlidingWindowMemoryStore();
 
     constructor(redisUrl: string) {
         this.initRedis(redisUrl);
     }
 
-    private async initRedis(redisUrl: string) {
+    private initRedis(redisUrl: string) {
         try {
-            // @ts-ignore — redis is an optional dependency, only loaded when REDIS_URL is set
-            const { createClient } = await import('redis');
-            this.redis = createClient({ url: redisUrl });
+            const Redis = require("ioredis");
+            this.redis = new Redis(redisUrl, { maxRetriesPerRequest: 1, lazyConnect: true });
+            this.redis.defineCommand('slidingWindowHit', { numberOfKeys: 1, lua: SLIDING_WINDOW_LUA });
             this.redis.on('error', (err: Error) => {
                 logger.error('[RateLimit] Redis error', { error: err.message });
                 this.connected = false;
             });
-            this.redis.on('connect', () => {
+            this.redis.on('ready', () => {
                 logger.info('[RateLimit] Redis connected for rate limiting');
                 this.connected = true;
             });
-            await this.redis.connect();
+            this.redis.connect().catch((err: any) => {
+                logger.warn('[RateLimit] Redis unavailable, falling back to in-memory', { error: err?.message });
+                this.connected = false;
+            });
         } catch (err: any) {
             logger.warn('[RateLimit] Redis unavailable, falling back to in-memory', { error: err?.message });
             this.connected = false;
@@ -112,45 +258,46 @@ class RedisStore implements RateLimitStore {
     }
 
     async get(key: string): Promise<RateLimitEntry | null> {
-        if (!this.connected || !this.redis) return null;
+        if (!this.connected || !this.redis) return this.fallback.get(key);
         try {
-            const data = await this.redis.get(`rl:${key}`);
-            return data ? JSON.parse(data) : null;
+            const [ws, w, p, c] = await this.redis.hmget(`rl:${key}`, 'ws', 'w', 'p', 'c');
+            // Hashes written before the window length was stored expire within 2 windows
+            if (ws === null || w === null) return null;
+            return peekWindow(
+                { windowStart: Number(ws), windowMs: Number(w), prev: Number(p) || 0, curr: Number(c) || 0 },
+                Date.now()
+            );
         } catch (err) {
-          logger.warn('[RateLimiter] Redis increment error', { error: err });
+            logger.warn('[RateLimiter] Redis get error', { error: err });
             return null;
         }
     }
 
-    async increment(key: string, windowMs: number): Promise<RateLimitEntry> {
+    async hit(key: string, windowMs: number, maxRequests: number): Promise<RateLimitDecision> {
         if (!this.connected || !this.redis) {
-            // Fallback: allow the request (fail-open)
-            return { count: 1, resetAt: Date.now() + windowMs };
+            return this.fallback.hit(key, windowMs, maxRequests);
         }
 
         try {
-            const redisKey = `rl:${key}`;
-            const ttlSeconds = Math.ceil(windowMs / 1000);
-
-            // Atomic: INCR returns new count, EXPIRE sets TTL only on first access
-            const count = await this.redis.incr(redisKey);
-            if (count === 1) {
-                // First request in this window — set expiry
-                await this.redis.expire(redisKey, ttlSeconds);
-            }
-
-            // Calculate resetAt from Redis TTL
-            const ttl = await this.redis.ttl(redisKey);
-            const resetAt = Date.now() + (ttl > 0 ? ttl * 1000 : windowMs);
-
-            return { count, resetAt };
+            const now = Date.now();
+            const [allowed, prev, curr, elapsed] = await this.redis.slidingWindowHit(
+                `rl:${key}`, now, windowMs, maxRequests
+            );
+            return toDecision(
+                { prev: Number(prev), curr: Number(curr), elapsed: Number(elapsed) },
+                Number(allowed) === 1,
+                windowMs,
+                maxRequests,
+                now
+            );
         } catch (err: any) {
-            logger.error('[RateLimit] Redis increment failed', { error: err?.message });
-            return { count: 1, resetAt: Date.now() + windowMs };
+            logger.error('[RateLimit] Redis hit failed, using local limiter', { error: err?.message });
+            return this.fallback.hit(key, windowMs, maxRequests);
         }
     }
 
     async reset(key: string): Promise<void> {
+        await this.fallback.reset(key);
         if (!this.connected || !this.redis) return;
         try {
             await this.redis.del(`rl:${key}`);
@@ -158,7 +305,8 @@ class RedisStore implements RateLimitStore {
     }
 
     async clear(): Promise<void> {
-        // Not implemented for Redis (would need SCAN + DEL)
+        // Redis keys expire on their own (PEXPIRE 2x window); only the local fallback is cleared
+        await this.fallback.clear();
     }
 }
 
@@ -179,7 +327,7 @@ function getStore(): RateLimitStore {
         if (process.env.NODE_ENV === 'production') {
             logger.warn('[RateLimit] ⚠️ Using in-memory rate limiting in production! Set REDIS_URL for distributed rate limiting.');
         }
-        activeStore = new InMemoryStore();
+        activeStore = new SlidingWindowMemoryStore();
     }
 
     return activeStore;
@@ -196,6 +344,7 @@ export function createRateLimiter(config: RateLimitConfig) {
     const {
         windowMs = 60000,
         maxRequests = 100,
+        name,
         keyGenerator = (req) => req.ip || "unknown",
         message = "Too many requests, please try again later."
     } = config;
@@ -208,21 +357,20 @@ export function createRateLimiter(config: RateLimitConfig) {
         }
 
         const store = getStore();
-        const key = keyGenerator(req);
+        const key = name ? `${name}:${keyGenerator(req)}` : keyGenerator(req);
 
         try {
-            const entry = await store.increment(key, windowMs);
+            const decision = await store.hit(key, windowMs, maxRequests);
 
             // Set rate limit headers
             res.setHeader("X-RateLimit-Limit", maxRequests);
-            res.setHeader("X-RateLimit-Remaining", Math.max(0, maxRequests - entry.count));
-            res.setHeader("X-RateLimit-Reset", Math.ceil(entry.resetAt / 1000));
+            res.setHeader("X-RateLimit-Remaining", Math.max(0, maxRequests - decision.count));
+            res.setHeader("X-RateLimit-Reset", Math.ceil(decision.resetAt / 1000));
 
-            if (entry.count > maxRequests) {
-                const now = Date.now();
+            if (!decision.allowed) {
                 logger.warn("[RateLimit] Limit exceeded", {
                     key,
-                    count: entry.count,
+                    count: decision.count,
                     limit: maxRequests,
                     path: req.path
                 });
@@ -230,7 +378,7 @@ export function createRateLimiter(config: RateLimitConfig) {
                 res.status(429).json({
                     error: "rate_limit_exceeded",
                     message,
-                    retryAfter: Math.ceil((entry.resetAt - now) / 1000)
+                    retryAfter: Math.ceil(decision.retryAfterMs / 1000)
                 });
                 return;
             }
@@ -252,6 +400,7 @@ export function createRateLimiter(config: RateLimitConfig) {
  * Strict rate limit for authentication endpoints
  */
 export const authLimiter = createRateLimiter({
+    name: "auth",
     windowMs: 15 * 60 * 1000, // 15 minutes
     maxRequests: 15,          // 15 attempts per 15 min
     message: "Too many login attempts. Please try again in 15 minutes."
@@ -261,6 +410,7 @@ export const authLimiter = createRateLimiter({
  * Standard API rate limit
  */
 export const apiLimiter = createRateLimiter({
+    name: "api",
     windowMs: 60 * 1000,      // 1 minute
     maxRequests: 60,          // 60 requests per minute
     message: "API rate limit exceeded. Please slow down."
@@ -270,6 +420,7 @@ export const apiLimiter = createRateLimiter({
  * Relaxed rate limit for WhatsApp webhook
  */
 export const webhookLimiter = createRateLimiter({
+    name: "webhook",
     windowMs: 60 * 1000,      // 1 minute
     maxRequests: 200,         // 200 messages per minute (high volume)
     keyGenerator: (req) => req.body?.From || req.ip || "unknown",
@@ -280,6 +431,7 @@ export const webhookLimiter = createRateLimiter({
  * Heavy operation rate limit (OEM lookup, scraping)
  */
 export const heavyOperationLimiter = createRateLimiter({
+    name: "heavy",
     windowMs: 60 * 1000,      // 1 minute
     maxRequests: 10,          // 10 heavy ops per minute
     message: "Too many requests. Heavy operations are limited."
@@ -290,7 +442,7 @@ export const heavyOperationLimiter = createRateLimiter({
 // ============================================================================
 
 /**
- * Get current rate limit stats for a key
+ * Get current rate limit stats for a key (namespaced as `${name}:${key}` for named limiters)
  */
 export async function getRateLimitStats(key: string): Promise<RateLimitEntry | null> {
     return getStore().get(key);
@@ -0,0 +1,69 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { logger } from '@utils/logger';
+import { ORCHESTRATOR_PROMPT } from '../orchestratorPrompt';
+import {
+    compilePrompt, estimateTokens, getPromptTokenStats, logPromptTokenUsage, promptMessages, recordPromptUsage,
+} from '../promptRegistry';
+
+describe('estimateTokens', () => {
+    it('should count word pieces and punctuation', () => {
+        expect(estimateTokens('')).toBe(0);
+        expect(estimateTokens('Hallo')).toBe(2);
+        expect(estimateTokens('Bremsscheiben vorne, bitte!')).toBe(4 + 2 + 1 + 2 + 1);
+        expect(estimateTokens('Zündkerze')).toBe(3);
+    });
+
+    it('should stay in a plausible range for the orchestrator prompt', () => {
+        const tokens = estimateTokens(ORCHESTRATOR_PROMPT);
+        expect(tokens).toBeGreaterThan(ORCHESTRATOR_PROMPT.length / 6);
+        expect(tokens).toBeLessThan(ORCHESTRATOR_PROMPT.length / 2);
+    });
+});
+
+describe('compilePrompt', () => {
+    it('should compile once and share identical text across languages', () => {
+        const de = compilePrompt('orchestrator', 'de');
+        expect(compilePrompt('orchestrator', 'de')).toBe(de);
+        expect(compilePrompt('orchestrator', 'en')).toBe(de);
+        expect(de.text).toBe(ORCHESTRATOR_PROMPT);
+        expect(de.version).toMatch(/^[0-9a-f]{12}$/);
+        expect(Object.isFrozen(de)).toBe(true);
+    });
+});
+
+describe('token accounting', () => {
+    it('should put the static prompt first and account it per prompt', () => {
+        const messages = promptMessages('textNlu', 'Ich brauche Bremsbeläge für meinen Golf 7', 'de');
+        expect(messages[0]).toEqual({ role: 'system', content: compilePrompt('textNlu').text });
+        expect(messages[1].role).toBe('user');
+
+        const orchestrator = compilePrompt('orchestrator');
+        const total = recordPromptUsage('orchestrator', [
+            { role: 'system', content: orchestrator.text },
+            { role: 'system', content: 'Zusammenfassung: Golf 7' },
+            { role: 'user', content: '{"latestMessage":"hi"}' },
+        ]);
+        expect(total).toBe(orchestrator.tokens + estimateTokens('Zusammenfassung: Golf 7') + estimateTokens('{"latestMessage":"hi"}'));
+
+        const stats = getPromptTokenStats().prompts;
+        expect(stats.textNlu.calls).toBe(1);
+        expect(stats.orchestrator).toMatchObject({ calls: 1, tokens: total, staticTokens: orchestrator.tokens });
+        expect(Object.values(stats.orchestrator.histogram)).toEqual([1]);
+    });
+
+    it('should log usage per window and reset it', () => {
+        promptMessages('generalQa', '{}');
+        logPromptTokenUsage();
+        expect(logger.info).toHaveBeenCalledWith('[PromptRegistry] Token usage', expect.objectContaining({
+            prompts: expect.objectContaining({ generalQa: expect.objectContaining({ calls: 1 }) }),
+        }));
+
+        (logger.info as jest.Mock).mockClear();
+        logPromptTokenUsage();
+        expect(logger.info).not.toHaveBeenCalled();
+        expect(getPromptTokenStats().prompts.generalQa.calls).toBe(1);
+    });
+});
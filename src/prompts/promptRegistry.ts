@@ -0,0 +1,242 @@
+/**
+ * 📚 PROMPT REGISTRY
+ *
+ * Single entry point for the system prompts sent to the LLM:
+ * - compiles each prompt once per (name, language) and hands out the same
+ *   frozen string afterwards, so the static text is never rebuilt per call
+ * - keeps the static system prompt as the first, byte-identical part of
+ *   every request and puts everything per-call after it, so provider-side
+ *   prefix caching can hit
+ * - estimates tokens per rendered prompt and keeps a per-prompt histogram;
+ *   a delta is logged every 10 minutes for scripts/prompt_token_report.py
+ *
+ * The current prompts are language-independent (the customer language is
+ * part of the per-call payload), so all languages share one compiled entry
+ * unless a definition builds a language-specific variant.
+ */
+
+import { createHash } from "crypto";
+import { logger } from "@utils/logger";
+import type { ChatMessage } from "../services/intelligence/geminiService";
+import { BOT_SYSTEM_PROMPT } from "./botSystemPrompt";
+import { COLLECT_PART_BRAIN_PROMPT } from "./collectPartBrainPrompt";
+import { GENERAL_QA_SYSTEM_PROMPT } from "./generalQaPrompt";
+import { ORCHESTRATOR_PROMPT } from "./orchestratorPrompt";
+import { TEXT_NLU_PROMPT } from "./textNluPrompt";
+import { VEHICLE_DOCUMENT_EXTRACTOR_PROMPT } from "./vehicleDocumentPrompt";
+
+// ============================================================================
+// Definitions
+// ============================================================================
+
+const DEFINITIONS = {
+    orchestrator: (_language: string) => ORCHESTRATOR_PROMPT,
+    collectPartBrain: (_language: string) => COLLECT_PART_BRAIN_PROMPT,
+    generalQa: (_language: string) => GENERAL_QA_SYSTEM_PROMPT,
+    textNlu: (_language: string) => TEXT_NLU_PROMPT,
+    botSystem: (_language: string) => BOT_SYSTEM_PROMPT,
+    vehicleDocument: (_language: string) => VEHICLE_DOCUMENT_EXTRACTOR_PROMPT,
+};
+
+export type PromptName = keyof typeof DEFINITIONS;
+
+export interface CompiledPrompt {
+    name: PromptName;
+    language: string;
+    text: string;
+    /** Short content hash — changes whenever the prompt text changes */
+    version: string;
+    /** Estimated tokens of the static text */
+    tokens: number;
+}
+
+// ============================================================================
+// Token estimation
+// ============================================================================
+
+/**
+ * Cheap token estimate without a tokenizer: runs of letters/digits count
+ * one token per 4 characters, every other non-space character counts one.
+ * Close enough for ranking prompts and spotting growth; not for billing.
+ */
+export function estimateTokens(text: string): number {
+    let tokens = 0;
+    let run = 0;
+    for (let i = 0; i < text.length; i++) {
+        const c = text.charCodeAt(i);
+        const wordChar =
+            (c >= 48 && c <= 57) || (c >= 65 && c <= 90) || (c >= 97 && c <= 122) ||
+            (c >= 0xc0 && c < 0x2000 && c !== 0xd7 && c !== 0xf7);
+        if (wordChar) {
+            run++;
+            continue;
+        }
+        if (run > 0) {
+            tokens += Math.ceil(run / 4);
+            run = 0;
+        }
+        if (c > 32) tokens++;
+    }
+    if (run > 0) tokens += Math.ceil(run / 4);
+    return tokens;
+}
+
+// ============================================================================
+// Compilation
+// ============================================================================
+
+const compiled = new Map<string, CompiledPrompt>();
+
+/**
+ * Static system prompt for `name`, compiled once per language.
+ */
+export function compilePrompt(name: PromptName, language = "de"): CompiledPrompt {
+    const key = `${name}:${language}`;
+    let entry = compiled.get(key);
+    if (!entry) {
+        const text = DEFINITIONS[name](language);
+        // Languages that produce identical text share one entry (and one cache prefix)
+        const shared = Array.from(compiled.values()).find(c => c.name === name && c.text === text);
+        entry = shared ?? Object.freeze({
+            name,
+            language,
+            text,
+            version: createHash("sha256").update(text).digest("hex").substring(0, 12),
+            tokens: estimateTokens(text),
+        });
+        compiled.set(key, entry);
+    }
+    return entry;
+}
+
+/**
+ * `[system, user]` messages for a single-turn call, with token accounting.
+ */
+export function promptMessages(name: PromptName, userContent: string, language?: string): ChatMessage[] {
+    const prompt = compilePrompt(name, language);
+    const messages: ChatMessage[] = [
+        { role: "system", content: prompt.text },
+        { role: "user", content: userContent },
+    ];
+    recordPromptUsage(name, messages, language);
+    return messages;
+}
+
+// ============================================================================
+// Token accounting
+// ============================================================================
+
+/** Histogram upper bounds (tokens per rendered prompt) */
+export const TOKEN_BUCKETS = [256, 512, 1024, 2048, 4096, 8192, 16384, Infinity];
+
+interface PromptUsage {
+    calls: number;
+    tokens: number;
+    staticTokens: number;
+    maxTokens: number;
+    histogram: number[];
+}
+
+const emptyUsage = (): PromptUsage => ({
+    calls: 0,
+    tokens: 0,
+    staticTokens: 0,
+    maxTokens: 0,
+    histogram: new Array(TOKEN_BUCKETS.length).fill(0),
+});
+
+/** Since process start */
+const totals = new Map<PromptName, PromptUsage>();
+/** Since the last periodic log line */
+let windowUsage = new Map<PromptName, PromptUsage>();
+let windowStart = Date.now();
+
+function add(map: Map<PromptName, PromptUsage>, name: PromptName, tokens: number, staticTokens: number, bucket: number): void {
+    let usage = map.get(name);
+    if (!usage) {
+        usage = emptyUsage();
+        map.set(name, usage);
+    }
+    usage.calls++;
+    usage.tokens += tokens;
+    usage.staticTokens += staticTokens;
+    usage.maxTokens = Math.max(usage.maxTokens, tokens);
+    usage.histogram[bucket]++;
+}
+
+/**
+ * Account the messages of one LLM call against prompt `name`. The compiled
+ * system prompt is counted from its cached estimate; everything else is
+ * estimated per call. Returns the estimated total.
+ */
+export function recordPromptUsage(name: PromptName, messages: ChatMessage[], language?: string): number {
+    const prompt = compilePrompt(name, language);
+    let staticTokens = 0;
+    let tokens = 0;
+    for (const message of messages) {
+        if (message.content === prompt.text) {
+            staticTokens += prompt.tokens;
+        } else {
+            tokens += estimateTokens(message.content);
+        }
+    }
+    tokens += staticTokens;
+
+    let bucket = 0;
+    while (tokens > TOKEN_BUCKETS[bucket]) bucket++;
+    add(totals, name, tokens, staticTokens, bucket);
+    add(windowUsage, name, tokens, staticTokens, bucket);
+    return tokens;
+}
+
+function summarize(map: Map<PromptName, PromptUsage>) {
+    const result: Record<string, {
+        calls: number;
+        tokens: number;
+        staticTokens: number;
+        avgTokens: number;
+        maxTokens: number;
+        histogram: Record<string, number>;
+    }> = {};
+    for (const [name, usage] of map) {
+        const histogram: Record<string, number> = {};
+        TOKEN_BUCKETS.forEach((le, i) => {
+            if (usage.histogram[i] > 0) histogram[le === Infinity ? "+Inf" : String(le)] = usage.histogram[i];
+        });
+        result[name] = {
+            calls: usage.calls,
+            tokens: usage.tokens,
+            staticTokens: usage.staticTokens,
+            avgTokens: Math.round(usage.tokens / usage.calls),
+            maxTokens: usage.maxTokens,
+            histogram,
+        };
+    }
+    return result;
+}
+
+/**
+ * Token usage per prompt since process start, plus the compiled versions
+ */
+export function getPromptTokenStats() {
+    return {
+        prompts: summarize(totals),
+        compiled: Array.from(new Set(compiled.values())).map(({ name, language, version, tokens }) => ({ name, language, version, tokens })),
+    };
+}
+
+/**
+ * Log the usage since the previous call and start a new window.
+ * This log line is what scripts/prompt_token_report.py aggregates.
+ */
+export function logPromptTokenUsage(): void {
+    if (windowUsage.size === 0) return;
+    const prompts = summarize(windowUsage);
+    const windowSeconds = Math.round((Date.now() - windowStart) / 1000);
+    windowUsage = new Map();
+    windowStart = Date.now();
+    logger.info("[PromptRegistry] Token usage", { windowSeconds, prompts });
+}
+
+// Auto-log every 10 minutes
+setInterval(logPromptTokenUsage, 10 * 60 * 1000).unref();
@@ -0,0 +1,83 @@
+import { IdempotencyStore } from '../idempotency';
+
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+/** Minimal in-process stand-in for the ioredis calls the store uses */
+function fakeRedis() {
+    const data = new Map<string, string>();
+    return {
+        data,
+        set: jest.fn(async (key: string, value: string, _px: string, _ttl: number, _nx: string) => {
+            if (data.has(key)) return null;
+            data.set(key, value);
+            return 'OK';
+        }),
+        get: jest.fn(async (key: string) => data.get(key) ?? null),
+        del: jest.fn(async (key: string) => (data.delete(key) ? 1 : 0)),
+        // Only the RELEASE_IF_OWNER script
+        eval: jest.fn(async (_script: string, _keys: number, key: string, owner: string) =>
+            (data.get(key) === owner && data.delete(key) ? 1 : 0)),
+    };
+}
+
+describe('IdempotencyStore', () => {
+    it('should claim once, recognise own retries and reject other owners', async () => {
+        const store = new IdempotencyStore(fakeRedis());
+
+        expect(await store.claim('msg:SM1', 'job-1')).toBe('claimed');
+        expect(await store.claim('msg:SM1', 'job-1')).toBe('owned');
+        expect(await store.claim('msg:SM1', 'job-2')).toBe('duplicate');
+
+        const stats = store.getStats();
+        expect(stats).toMatchObject({ backend: 'redis', misses: 1, ownerRetries: 1, hits: 1 });
+    });
+
+    it('should share claims between stores on the same Redis (multiple replicas)', async () => {
+        const redis = fakeRedis();
+        const podA = new IdempotencyStore(redis);
+        const podB = new IdempotencyStore(redis);
+
+        expect(await podA.claim('msg:SM2', 'job-a')).toBe('claimed');
+        expect(await podB.claim('msg:SM2', 'job-b')).toBe('duplicate');
+    });
+
+    it('should fall back to the local LRU when Redis fails', async () => {
+        const redis = fakeRedis();
+        redis.set.mockRejectedValue(new Error('ECONNREFUSED'));
+        const store = new IdempotencyStore(redis);
+
+        expect(await store.claim('msg:SM3', 'job-1')).toBe('claimed');
+        expect(await store.claim('msg:SM3', 'job-2')).toBe('duplicate');
+        expect(store.getStats().redisErrors).toBe(2);
+    });
+
+    it('should bound the local cache', async () => {
+        const store = new IdempotencyStore(null, 50);
+        for (let i = 0; i < 500; i++) await store.claim(`msg:${i}`, 'job');
+        expect(store.getStats().localEntries).toBe(50);
+
+        // Oldest keys were evicted, newest are still deduplicated
+        expect(await store.claim('msg:499', 'other')).toBe('duplicate');
+    });
+
+    it('should allow reprocessing after release', async () => {
+        const store = new IdempotencyStore(fakeRedis());
+        await store.claim('msg:SM4', 'job-1');
+        await store.release('msg:SM4');
+        expect(await store.claim('msg:SM4', 'job-2')).toBe('claimed');
+    });
+
+    it('should only release a claim held by the given owner', async () => {
+        const redis = fakeRedis();
+        const store = new IdempotencyStore(redis);
+        await store.claim('msg:SM5', 'job-1');
+
+        await store.release('msg:SM5', 'job-2');
+        expect(await store.claim('msg:SM5', 'job-3')).toBe('duplicate');
+
+        await store.release('msg:SM5', 'job-1');
+        expect(await store.claim('msg:SM5', 'job-3')).toBe('claimed');
+    });
+});
@@ -0,0 +1,132 @@
+const mockRedis = { current: null as any };
+const mockQueues = { standard: null as any, fast: null as any };
+jest.mock('../connection', () => ({
+    get connection() { return mockRedis.current; },
+}));
+jest.mock('../botQueue', () => ({
+    get botQueue() { return mockQueues.standard; },
+    get botFastQueue() { return mockQueues.fast; },
+    BOT_QUEUE_NAME: 'bot-message-queue',
+    BOT_FAST_QUEUE_NAME: 'bot-message-fast',
+}));
+jest.mock('../../services/adapters/phoneMerchantMapper', () => ({ getMerchantByPhone: jest.fn() }));
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { classifyLane, dispatchToLane, releaseSenderLane, takeNextMessage, recordQueueWait, getLaneStats } from '../laneScheduler';
+
+describe('classifyLane', () => {
+    it('should route smalltalk and status checks to the fast lane', () => {
+        expect(classifyLane({ text: 'Hallo' })).toBe('fast');
+        expect(classifyLane({ text: 'Danke!' })).toBe('fast');
+        expect(classifyLane({ text: 'Wo ist meine Lieferung?' })).toBe('fast');
+    });
+
+    it('should keep part requests and media in the standard lane', () => {
+        expect(classifyLane({ text: 'Ich brauche Bremsscheiben vorne für Golf 7' })).toBe('standard');
+        expect(classifyLane({ text: 'Hallo', mediaUrls: ['https://api.twilio.com/m1'] })).toBe('standard');
+        expect(classifyLane({ text: '' })).toBe('standard');
+    });
+
+    it('should keep long messages in the standard lane even with smalltalk words', () => {
+        expect(classifyLane({ text: `Hallo, ${'ich suche ein Teil '.repeat(10)}` })).toBe('standard');
+    });
+});
+
+describe('dispatchToLane', () => {
+    const from = 'whatsapp:+491701234567';
+    const settings = { merchantId: 'm1', batchWindowMs: 0, queueWeight: 1 };
+    // botlane:sender:<from> → { lane, pending }, as kept by the sticky-lane scripts
+    let senders: Map<string, { lane: string; pending: number }>;
+
+    beforeEach(() => {
+        senders = new Map();
+        mockQueues.standard = { add: jest.fn() };
+        mockQueues.fast = { add: jest.fn() };
+        mockRedis.current = {
+            lrem: jest.fn(async () => 0),
+            eval: jest.fn(async (script: string, _keys: number, key: string, lane?: string) => {
+                if (script.includes("'pending', 1)")) {
+                    const sender = senders.get(key) ?? { lane: lane!, pending: 0 };
+                    sender.pending++;
+                    senders.set(key, sender);
+                    return sender.lane;
+                }
+                if (script.includes("'pending', -1)")) {
+                    const sender = senders.get(key);
+                    if (sender && --sender.pending <= 0) senders.delete(key);
+                    return 0;
+                }
+                return 1; // ENQUEUE_LUA
+            }),
+        };
+    });
+
+    afterAll(() => {
+        mockRedis.current = null;
+        mockQueues.standard = mockQueues.fast = null;
+    });
+
+    it('should throw when the queue is unavailable', async () => {
+        mockRedis.current = null;
+        await expect(dispatchToLane({ from: 'whatsapp:+49', text: 'Hallo' })).rejects.toThrow('Queue not initialized');
+    });
+
+    it('should keep a sender in their lane while earlier messages are pending', async () => {
+        expect(await dispatchToLane({ from, text: 'IMAGE_MESSAGE', mediaUrls: ['https://api.twilio.com/m1'] }, settings)).toBe('standard');
+        // A quick follow-up must not overtake the photo through the fast lane
+        expect(await dispatchToLane({ from, text: 'Danke!' }, settings)).toBe('standard');
+        expect(mockQueues.fast.add).not.toHaveBeenCalled();
+        expect(mockQueues.standard.add).toHaveBeenCalledTimes(2);
+
+        await releaseSenderLane(from);
+        await releaseSenderLane(from);
+        expect(await dispatchToLane({ from, text: 'Hallo' }, settings)).toBe('fast');
+    });
+
+    it('should release the sender when the dispatch token cannot be added', async () => {
+        mockQueues.fast.add.mockRejectedValueOnce(new Error('redis down'));
+        await expect(dispatchToLane({ from, text: 'Hallo' }, settings)).rejects.toThrow('redis down');
+        expect(senders.size).toBe(0);
+    });
+});
+
+describe('takeNextMessage', () => {
+    afterEach(() => { mockRedis.current = null; });
+
+    it('should hand a retried dispatch token the message it already took', async () => {
+        const pending = [JSON.stringify({ from: 'a', text: 'Foto' }), JSON.stringify({ from: 'b', text: 'ja' })];
+        const taken = new Map<string, string>();
+        mockRedis.current = {
+            // DEQUEUE_LUA: taken message first, else pop and keep it under the token
+            eval: jest.fn(async (_script: string, _keys: number, _ring: string, _credit: string, _weight: string, takenKey: string) => {
+                if (taken.has(takenKey)) return ['', taken.get(takenKey)];
+                const msg = pending.shift();
+                if (!msg) return null;
+                taken.set(takenKey, msg);
+                return ['m1', msg];
+            }),
+        };
+
+        expect(await takeNextMessage('standard', 'dispatch-1')).toEqual({ from: 'a', text: 'Foto' });
+        // job.updateData failed → BullMQ retries the same token
+        expect(await takeNextMessage('standard', 'dispatch-1')).toEqual({ from: 'a', text: 'Foto' });
+        expect(await takeNextMessage('standard', 'dispatch-2')).toEqual({ from: 'b', text: 'ja' });
+        expect(mockRedis.current.eval.mock.calls[0][5]).toBe('botlane:standard:taken:dispatch-1');
+    });
+});
+
+describe('getLaneStats', () => {
+    it('should report queue-wait percentiles per lane', () => {
+        for (let i = 1; i <= 100; i++) recordQueueWait('fast', i);
+        recordQueueWait('standard', 5000);
+
+        const stats = getLaneStats();
+        expect(stats.fast.processed).toBe(100);
+        expect(stats.fast.p50Ms).toBe(51);
+        expect(stats.fast.p95Ms).toBe(96);
+        expect(stats.fast.maxMs).toBe(100);
+        expect(stats.standard.p99Ms).toBe(5000);
+    });
+});
@@ -0,0 +1,111 @@
+const mockLists = new Map<string, string[]>();
+jest.mock('../connection', () => ({
+    connection: {
+        // CLAIM_BATCH_LUA
+        eval: jest.fn(async (_script: string, _keys: number, batchKey: string, processingKey: string) => {
+            if (!mockLists.has(processingKey)) {
+                if (!mockLists.has(batchKey)) return [];
+                mockLists.set(processingKey, mockLists.get(batchKey)!);
+                mockLists.delete(batchKey);
+            }
+            return [...mockLists.get(processingKey)!];
+        }),
+        del: jest.fn(async (key: string) => Number(mockLists.delete(key))),
+    },
+}));
+jest.mock('../laneScheduler', () => ({ dispatchToLane: jest.fn(), getMerchantQueueSettings: jest.fn() }));
+jest.mock('../botQueue', () => ({ botQueue: null }));
+jest.mock('../../services/adapters/phoneMerchantMapper', () => ({ getMerchantByPhone: jest.fn() }));
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { mergeBotJobs, enqueueBotMessage, flushBatch } from '../messageBatcher';
+import { dispatchToLane } from '../laneScheduler';
+
+describe('mergeBotJobs', () => {
+    const from = 'whatsapp:+491701234567';
+
+    it('should join burst texts in arrival order', () => {
+        const merged = mergeBotJobs([
+            { from, text: 'Golf 7', messageSid: 'SM1' },
+            { from, text: '2016', messageSid: 'SM2' },
+            { from, text: 'Bremsen vorne', messageSid: 'SM3' },
+        ]);
+
+        expect(merged).toEqual(expect.objectContaining({
+            from,
+            text: 'Golf 7\n2016\nBremsen vorne',
+            messageSid: 'SM3',
+            messageSids: ['SM1', 'SM2', 'SM3'],
+        }));
+    });
+
+    it('should concatenate media and drop image placeholders next to real text', () => {
+        const merged = mergeBotJobs([
+            { from, text: 'IMAGE_MESSAGE', mediaUrls: ['https://api.twilio.com/m1'] },
+            { from, text: 'Hier mein Fahrzeugschein' },
+            { from, text: 'IMAGE_MESSAGE', mediaUrls: ['https://api.twilio.com/m2'] },
+        ]);
+
+        expect(merged?.text).toBe('Hier mein Fahrzeugschein');
+        expect(merged?.mediaUrls).toEqual(['https://api.twilio.com/m1', 'https://api.twilio.com/m2']);
+    });
+
+    it('should keep the placeholder for media-only bursts', () => {
+        const merged = mergeBotJobs([
+            { from, text: 'IMAGE_MESSAGE', mediaUrls: ['u1'] },
+            { from, text: 'IMAGE_MESSAGE', mediaUrls: ['u2'] },
+        ]);
+        expect(merged?.text).toBe('IMAGE_MESSAGE');
+    });
+
+    it('should return single jobs unchanged and null for empty batches', () => {
+        const job = { from, text: 'Hallo' };
+        expect(mergeBotJobs([job])).toBe(job);
+        expect(mergeBotJobs([])).toBeNull();
+    });
+});
+
+describe('enqueueBotMessage', () => {
+    it('should throw when the queue is unavailable so the webhook can fall back', async () => {
+        await expect(enqueueBotMessage({ from: 'whatsapp:+49', text: 'x' })).rejects.toThrow('Queue not initialized');
+    });
+});
+
+describe('flushBatch', () => {
+    const from = 'whatsapp:+491701234567';
+    const batchKey = `botbatch:${from}`;
+
+    beforeEach(() => {
+        mockLists.clear();
+        (dispatchToLane as jest.Mock).mockReset();
+    });
+
+    it('should dispatch the merged burst and drop it once dispatched', async () => {
+        mockLists.set(batchKey, [
+            JSON.stringify({ from, text: 'Golf 7', messageSid: 'SM1' }),
+            JSON.stringify({ from, text: '2016', messageSid: 'SM2' }),
+        ]);
+
+        const merged = await flushBatch(batchKey, 'batch-SM1');
+
+        expect(merged?.text).toBe('Golf 7\n2016');
+        expect(dispatchToLane).toHaveBeenCalledWith(merged);
+        expect(mockLists.size).toBe(0);
+    });
+
+    it('should keep the burst for the retry when the dispatch fails', async () => {
+        mockLists.set(batchKey, [JSON.stringify({ from, text: 'Bremsen vorne', messageSid: 'SM1' })]);
+        (dispatchToLane as jest.Mock).mockRejectedValueOnce(new Error('queue.add failed'));
+
+        await expect(flushBatch(batchKey, 'batch-SM1')).rejects.toThrow('queue.add failed');
+        // A message arriving meanwhile starts its own batch
+        mockLists.set(batchKey, [JSON.stringify({ from, text: 'ja', messageSid: 'SM2' })]);
+
+        const merged = await flushBatch(batchKey, 'batch-SM1');
+        expect(merged?.text).toBe('Bremsen vorne');
+        expect(mockLists.get(batchKey)).toHaveLength(1);
+        expect(mockLists.has(`${batchKey}:processing:batch-SM1`)).toBe(false);
+    });
+});
@@ -2,19 +2,29 @@ import { Queue } from "bullmq";
 import { connection } from "./connection";
 
 export const BOT_QUEUE_NAME = "bot-message-queue";
+export const BOT_FAST_QUEUE_NAME = "bot-message-fast";
 
+// #2 FIX: Exponential backoff + DLQ — prevents retry storms & credit waste
+const defaultJobOptions = {
+    attempts: 3,
+    backoff: {
+        type: 'exponential',
+        delay: 2000, // 2s → 4s → 8s
+    },
+    removeOnComplete: { count: 100 },  // Keep last 100 completed
+    removeOnFail: { count: 500 },      // Keep last 500 failed (DLQ visibility)
+};
+
+// Standard lane: full bot turns (OCR, OEM lookup, LLM) + burst batch flushes
 export const botQueue = connection ? new Queue(BOT_QUEUE_NAME, {
     connection: connection!,
-    // #2 FIX: Exponential backoff + DLQ — prevents retry storms & credit waste
-    defaultJobOptions: {
-        attempts: 3,
-        backoff: {
-            type: 'exponential',
-            delay: 2000, // 2s → 4s → 8s
-        },
-        removeOnComplete: { count: 100 },  // Keep last 100 completed
-        removeOnFail: { count: 500 },      // Keep last 500 failed (DLQ visibility)
-    },
+    defaultJobOptions,
+}) : null;
+
+// Fast lane: cheap intents (smalltalk, status checks) so they never wait behind OEM lookups
+export const botFastQueue = connection ? new Queue(BOT_FAST_QUEUE_NAME, {
+    connection: connection!,
+    defaultJobOptions,
 }) : null;
 
 export interface BotJobData {
@@ -23,4 +33,9 @@ export interface BotJobData {
     orderId?: string | null;
     mediaUrls?: string[];
     messageSid?: string; // Twilio MessageSid for typing indicator
+    messageSids?: string[]; // All MessageSids merged into this job (burst batching)
+    batchKey?: string; // Set on "whatsapp-batch" jobs until the pending batch is drained
+    merchantId?: string; // Tenant used for fair scheduling
+    dispatchId?: string; // Stable id across lane dispatch + retries (idempotency owner)
+    enqueuedAt?: number; // Epoch ms when the message entered its lane (queue-wait metric)
 }
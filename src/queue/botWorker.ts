@@ -1,9 +1,12 @@
 import { Worker, Job } from "bullmq";
 import { connection } from "./connection";
-import { BOT_QUEUE_NAME, BotJobData } from "./botQueue";
+import { BotJobData } from "./botQueue";
+import { IdempotencyStore } from "./idempotency";
+import { flushBatch } from "./messageBatcher";
+import { BOT_LANES, BotLane, takeNextMessage, recordQueueWait, getLaneStats, finishDispatch } from "./laneScheduler";
 import { handleIncomingBotMessage } from "../services/core/botLogicService";
 import { insertMessage } from "../services/adapters/supabaseService";
-import { recordActivity, startSessionTimeoutChecker } from "../services/core/sessionTimeout";
+import { recordActivity, startSessionTimeoutChecker, stopSessionTimeoutChecker } from "../services/core/sessionTimeout";
 import { withGeminiBudget } from "../services/intelligence/geminiBudget";
 import twilio from "twilio";
 import { logger } from "@utils/logger";
@@ -11,26 +14,41 @@ import { logger } from "@utils/logger";
 const TWILIO_ACCOUNT_SID = process.env.TWILIO_ACCOUNT_SID;
 const TWILIO_AUTH_TOKEN = process.env.TWILIO_AUTH_TOKEN;
 const TWILIO_WHATSAPP_NUMBER = process.env.TWILIO_WHATSAPP_NUMBER || "whatsapp:+14155238886";
+// Local stand-in for load tests (see services/testing/loadReplay.ts); unset = api.twilio.com
+const TWILIO_API_BASE_URL = (process.env.TWILIO_API_BASE_URL || "https://api.twilio.com").replace(/\/+$/, "");
+// Approved WhatsApp template for the 24h inactivity follow-up; unset = no follow-ups
+const SESSION_TIMEOUT_CONTENT_SID = process.env.TWILIO_SESSION_TIMEOUT_CONTENT_SID;
 
 // ============================================================================
-// K5: Idempotency — Prevent duplicate Twilio replies on BullMQ retry
+// K5: Idempotency — Prevent duplicate processing across replicas and restarts
+// Keyed on Twilio MessageSid (Redis SET NX, local LRU fallback)
 // ============================================================================
-const processedJobs = new Map<string, number>(); // jobId → timestamp
-const IDEMPOTENCY_TTL_MS = 120_000; // 120s (was 60s — extend for retries with backoff)
-
-function markJobProcessed(jobId: string): boolean {
-    // Clean expired entries
-    const now = Date.now();
-    for (const [id, ts] of processedJobs) {
-        if (now - ts > IDEMPOTENCY_TTL_MS) processedJobs.delete(id);
-    }
+const idempotencyStore = new IdempotencyStore(connection);
+
+function dedupKeyFor(job: Job<BotJobData>): string {
+    return job.data.messageSid ? `msg:${job.data.messageSid}` : `job:${job.id}`;
+}
+
+function jobOwnerFor(job: Job<BotJobData>): string {
+    return job.data.dispatchId || String(job.id);
+}
+
+/** Idempotency keys of every MessageSid merged into this job */
+function messageKeysFor(job: Job<BotJobData>): string[] {
+    const sids = job.data.messageSids ?? [];
+    return sids.length > 0 ? sids.map(sid => `msg:${sid}`) : [dedupKeyFor(job)];
+}
 
-    if (processedJobs.has(jobId)) {
-        logger.warn("[BotWorker] Duplicate job detected, skipping Twilio reply", { jobId });
-        return false; // already processed
+/**
+ * Claim every MessageSid merged into this job. Returns false only if all of
+ * them were already handled by another job (pure Twilio redelivery).
+ */
+async function claimMessages(job: Job<BotJobData>, owner: string): Promise<boolean> {
+    let fresh = false;
+    for (const key of messageKeysFor(job)) {
+        if (await idempotencyStore.claim(key, owner) !== "duplicate") fresh = true;
     }
-    processedJobs.set(jobId, now);
-    return true;
+    return fresh;
 }
 
 // ============================================================================
@@ -38,13 +56,22 @@ function markJobProcessed(jobId: string): boolean {
 // ============================================================================
 let twilioClient: ReturnType<typeof twilio> | null = null;
 
+/** Sends every Twilio REST call to TWILIO_API_BASE_URL instead of *.twilio.com */
+class BaseUrlRequestClient extends twilio.RequestClient {
+    request(opts: any): Promise<any> {
+        return super.request({ ...opts, uri: opts.uri.replace(/^https:\/\/[^/]+/, TWILIO_API_BASE_URL) });
+    }
+}
+
 function getTwilioClient(): ReturnType<typeof twilio> | null {
     if (!TWILIO_ACCOUNT_SID || !TWILIO_AUTH_TOKEN) {
         logger.error("Twilio credentials missing, cannot send reply");
         return null;
     }
     if (!twilioClient) {
-        twilioClient = twilio(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN);
+        twilioClient = process.env.TWILIO_API_BASE_URL
+            ? twilio(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, { httpClient: new BaseUrlRequestClient() })
+            : twilio(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN);
         logger.info("[BotWorker] Twilio client initialized (singleton)");
     }
     return twilioClient;
@@ -102,7 +129,7 @@ async function sendTypingIndicator(messageSid: string | undefined): Promise<void
     if (!messageSid || !TWILIO_ACCOUNT_SID || !TWILIO_AUTH_TOKEN) return;
 
     try {
-        const url = `https://api.twilio.com/2010-04-01/Accounts/${TWILIO_ACCOUNT_SID}/Messages/${messageSid}/UserDefinedMessages.json`;
+        const url = `${TWILIO_API_BASE_URL}/2010-04-01/Accounts/${TWILIO_ACCOUNT_SID}/Messages/${messageSid}/UserDefinedMessages.json`;
         const auth = Buffer.from(`${TWILIO_ACCOUNT_SID}:${TWILIO_AUTH_TOKEN}`).toString('base64');
 
         // Send read receipt + typing indicator via Twilio UserDefinedMessages
@@ -128,140 +155,225 @@ async function sendTypingIndicator(messageSid: string | undefined): Promise<void
 // #2 FIX: Worker with exponential backoff + DLQ + reduced concurrency
 // ============================================================================
 
-const worker = new Worker<BotJobData>(
-    BOT_QUEUE_NAME,
-    async (job: Job<BotJobData>) => {
-        const { from, text, orderId, mediaUrls, messageSid } = job.data;
+/**
+ * Resolve what a lane job should process:
+ * - "whatsapp-batch": flush the pending burst into its lane, nothing else to do
+ * - "dispatch": pop the next message by weighted round-robin (once — the pop
+ *   also keeps it under the token's id, so a retry gets the same message
+ *   even if storing it on the job failed)
+ * - anything else (legacy "whatsapp-msg"): the job data is the message
+ */
+async function resolveLaneJob(lane: BotLane, job: Job<BotJobData>): Promise<boolean> {
+    if (job.name === "whatsapp-batch") {
+        await flushBatch(job.data.batchKey!, job.id!);
+        return false;
+    }
 
-        logger.info("📥 INCOMING MESSAGE", {
-            from,
-            message: text?.substring(0, 100),
-            hasMedia: !!(mediaUrls && mediaUrls.length > 0),
-            orderId,
-            jobId: job.id,
-            attempt: job.attemptsMade + 1
-        });
+    if (job.name === "dispatch" && !job.data.dispatchId) {
+        const message = await takeNextMessage(lane, job.id!);
+        if (!message) {
+            logger.warn("[BotWorker] Dispatch token without pending message", { lane, jobId: job.id });
+            return false;
+        }
+        await job.updateData(message);
+        const waitMs = Date.now() - (message.enqueuedAt || Date.now());
+        recordQueueWait(lane, waitMs);
+        logger.info("[BotWorker] Dispatched from lane", { lane, merchantId: message.merchantId, queueWaitMs: waitMs });
+    }
 
-        // P1 #9: Record activity for session timeout tracking
-        // recordActivity moved to after handleIncomingBotMessage (see below for language population)
+    return true;
+}
 
-        // Send typing indicator immediately (non-blocking)
-        sendTypingIndicator(messageSid).catch(() => { });
+async function processBotJob(lane: BotLane, job: Job<BotJobData>): Promise<void> {
+    if (!await resolveLaneJob(lane, job)) return;
 
-        try {
-            // ============================================================
-            // #1 FIX: Pass sendInterimReply callback into handleIncomingBotMessage
-            // This sends the Zwischennachricht BEFORE OEM lookup starts,
-            // not after the entire function returns.
-            // ============================================================
-            const sendInterimReply = async (message: string) => {
-                try {
-                    await sendTwilioReply(from, message);
-                    logger.info("📤 INTERIM REPLY SENT", { to: from, message: message.substring(0, 50) });
-                } catch (err: any) {
-                    // Non-fatal: interim message failure shouldn't block main flow
-                    logger.warn("[BotWorker] Interim reply failed (non-blocking)", { error: err?.message });
-                }
-            };
-
-            // 1. Process Logic — with callback for interim messages
-            // AUDIT FIX: Wrap with Gemini API budget (max 8 calls per message)
-            const GEMINI_BUDGET = parseInt(process.env.GEMINI_BUDGET_PER_REQUEST || '8', 10);
-            const result = await withGeminiBudget(GEMINI_BUDGET, () =>
-                handleIncomingBotMessage({
-                    from,
-                    text,
-                    orderId: orderId || null,
-                    mediaUrls
-                }, sendInterimReply),
-                job.id
-            );
-
-            logger.info("🤖 BOT GENERATED REPLY", {
-                replyLength: result.reply?.length,
-                replyPreview: result.reply?.substring(0, 150),
-                hasContentSid: !!result.contentSid,
-                orderId: result.orderId
-            });
+    const { from, text, orderId, mediaUrls, messageSid } = job.data;
+
+    logger.info("📥 INCOMING MESSAGE", {
+        from,
+        message: text?.substring(0, 100),
+        hasMedia: !!(mediaUrls && mediaUrls.length > 0),
+        orderId,
+        jobId: job.id,
+        attempt: job.attemptsMade + 1
+    });
+
+    // K5: Drop Twilio webhook retries / duplicate deliveries of the same message.
+    // A BullMQ retry of this very job re-claims as "owned" and continues.
+    const dedupKey = dedupKeyFor(job);
+    const jobOwner = jobOwnerFor(job);
+    if (!await claimMessages(job, jobOwner)) {
+        logger.warn("[BotWorker] Duplicate message detected, skipping", { jobId: job.id, dedupKey });
+        return;
+    }
+
+    // Send typing indicator immediately (non-blocking)
+    sendTypingIndicator(messageSid).catch(() => { });
 
-            // 2. Persist Reply
+    try {
+        // ============================================================
+        // #1 FIX: Pass sendInterimReply callback into handleIncomingBotMessage
+        // This sends the Zwischennachricht BEFORE OEM lookup starts,
+        // not after the entire function returns.
+        // ============================================================
+        const sendInterimReply = async (message: string) => {
             try {
-                await insertMessage(from, result.reply, "OUT" as any);
-            } catch (dbErr: any) {
-                logger.warn("Failed to persist outgoing bot message", { error: dbErr?.message });
+                await sendTwilioReply(from, message);
+                logger.info("📤 INTERIM REPLY SENT", { to: from, message: message.substring(0, 50) });
+            } catch (err: any) {
+                // Non-fatal: interim message failure shouldn't block main flow
+                logger.warn("[BotWorker] Interim reply failed (non-blocking)", { error: err?.message });
             }
+        };
 
-            // 3. Idempotency check before sending reply
-            if (!markJobProcessed(job.id || `${from}-${Date.now()}`)) {
-                logger.warn("[BotWorker] Skipping duplicate Twilio send", { jobId: job.id });
-                return; // Don't send again on retry
-            }
+        // 1. Process Logic — with callback for interim messages
+        // AUDIT FIX: Wrap with Gemini API budget (max 8 calls per message)
+        const GEMINI_BUDGET = parseInt(process.env.GEMINI_BUDGET_PER_REQUEST || '8', 10);
+        const result = await withGeminiBudget(GEMINI_BUDGET, () =>
+            handleIncomingBotMessage({
+                from,
+                text,
+                orderId: orderId || null,
+                mediaUrls
+            }, sendInterimReply),
+            job.id
+        );
+
+        // P1 #9: Record activity for session timeout tracking (re-arms the 24h deadline).
+        // The result carries no language; getTimeoutMessage() falls back to German.
+        if (SESSION_TIMEOUT_CONTENT_SID && result.orderId) recordActivity(from, result.orderId, null);
+
+        logger.info("🤖 BOT GENERATED REPLY", {
+            replyLength: result.reply?.length,
+            replyPreview: result.reply?.substring(0, 150),
+            hasContentSid: !!result.contentSid,
+            orderId: result.orderId
+        });
+
+        // 2. Persist Reply
+        try {
+            await insertMessage(from, result.reply, "OUT" as any);
+        } catch (dbErr: any) {
+            logger.warn("Failed to persist outgoing bot message", { error: dbErr?.message });
+        }
+
+        // 3. Idempotency check before sending reply (a retry must not re-send)
+        const replyKey = `reply:${dedupKey}`;
+        if (await idempotencyStore.claim(replyKey, jobOwner) !== "claimed") {
+            logger.warn("[BotWorker] Skipping duplicate Twilio send", { jobId: job.id });
+            return; // Don't send again on retry
+        }
 
-            // 4. Send Reply via Twilio
+        // 4. Send Reply via Twilio
+        try {
             await sendTwilioReply(from, result.reply, {
                 mediaUrl: (result as any).mediaUrl,
                 contentSid: result.contentSid,
                 contentVariables: result.contentVariables
             });
-
-            // 5. Persist lastBotMessage for orchestrator context
-            try {
-                const { updateOrderData } = await import("../services/adapters/supabaseService");
-                if (result.orderId) {
-                    await updateOrderData(result.orderId, { lastBotMessage: result.reply });
-                }
-            } catch (err) { logger.debug('[BotWorker] Failed to persist lastBotMessage', { error: (err as any)?.message }); }
-
-        } catch (err: any) {
-            logger.error("Bot worker failed", {
-                error: err?.message,
-                jobId: job.id,
-                from,
-                attempt: job.attemptsMade + 1,
-                maxAttempts: job.opts?.attempts || 3
-            });
-            throw err; // Let BullMQ handle retry with exponential backoff
+        } catch (sendErr) {
+            // Nothing was delivered — let the BullMQ retry send it
+            await idempotencyStore.release(replyKey);
+            throw sendErr;
         }
-    },
-    {
-        connection: connection!,
-        concurrency: 3,
-        // #2 FIX: Default job options with exponential backoff
-        settings: {},
+
+        // 5. Persist lastBotMessage for orchestrator context
+        try {
+            const { updateOrderData } = await import("../services/adapters/supabaseService");
+            if (result.orderId) {
+                await updateOrderData(result.orderId, { lastBotMessage: result.reply });
+            }
+        } catch (err) { logger.debug('[BotWorker] Failed to persist lastBotMessage', { error: (err as any)?.message }); }
+
+    } catch (err: any) {
+        logger.error("Bot worker failed", {
+            error: err?.message,
+            jobId: job.id,
+            from,
+            attempt: job.attemptsMade + 1,
+            maxAttempts: job.opts?.attempts || 3
+        });
+        throw err; // Let BullMQ handle retry with exponential backoff
     }
-);
+}
+
+// One worker per lane, each with its own concurrency limit
+function createLaneWorker(lane: BotLane): Worker<BotJobData> {
+    return new Worker<BotJobData>(
+        BOT_LANES[lane].queueName,
+        (job: Job<BotJobData>) => processBotJob(lane, job),
+        {
+            connection: connection!,
+            concurrency: BOT_LANES[lane].concurrency,
+            // #2 FIX: Default job options with exponential backoff
+            settings: {},
+        }
+    );
+}
+
+const laneWorkers: Record<BotLane, Worker<BotJobData>> = {
+    standard: createLaneWorker("standard"),
+    fast: createLaneWorker("fast"),
+};
+const worker = laneWorkers.standard;
 
 // #2 FIX: Configure default job options on the queue side
 // Note: BullMQ applies backoff from Job options, not Worker options.
 // The queue producer (botQueue.ts) should set these. Here we configure
 // the worker to handle retries gracefully via the job's own settings.
 
-worker.on("completed", (job: Job) => {
-    logger.info("Job completed", { jobId: job.id });
-});
-
-worker.on("failed", (job: Job | undefined, err: Error) => {
-    const isFinalFail = job && job.attemptsMade >= (job.opts?.attempts || 3);
-    logger.error(isFinalFail ? "Job DEAD-LETTERED (all retries exhausted)" : "Job FAILED (will retry)", {
-        jobId: job?.id,
-        error: err.message,
-        attemptsMade: job?.attemptsMade,
-        maxAttempts: job?.opts?.attempts || 3,
-        deadLettered: isFinalFail
+for (const [lane, laneWorker] of Object.entries(laneWorkers) as [BotLane, Worker<BotJobData>][]) {
+    laneWorker.on("completed", (job: Job) => {
+        if (job.name === "dispatch") finishDispatch(lane, job.id!, job.data.from).catch(() => { });
+        logger.info("Job completed", {
+            jobId: job.id,
+            lane,
+            queueWait: getLaneStats()[lane],
+            idempotency: idempotencyStore.getStats(),
+        });
+    });
+
+    laneWorker.on("failed", (job: Job | undefined, err: Error) => {
+        const isFinalFail = job && job.attemptsMade >= (job.opts?.attempts || 3);
+        logger.error(isFinalFail ? "Job DEAD-LETTERED (all retries exhausted)" : "Job FAILED (will retry)", {
+            jobId: job?.id,
+            lane,
+            error: err.message,
+            attemptsMade: job?.attemptsMade,
+            maxAttempts: job?.opts?.attempts || 3,
+            deadLettered: isFinalFail
+        });
+
+        // Free the messages so a later Twilio redelivery can still be answered;
+        // sids another job claimed first stay with that job
+        if (job && isFinalFail) {
+            if (job.name === "dispatch") finishDispatch(lane, job.id!, job.data.from).catch(() => { });
+            const owner = jobOwnerFor(job);
+            for (const key of messageKeysFor(job)) {
+                idempotencyStore.release(key, owner).catch(() => { });
+            }
+        }
     });
-});
+}
 
-// P1 #9: Start session timeout checker
-startSessionTimeoutChecker(async (waId: string, message: string) => {
-    await sendTwilioReply(waId, message);
-});
+// P1 #9: Start session timeout checker. The follow-up goes out 24h after the
+// last message, i.e. outside WhatsApp's customer-care window, where Twilio only
+// delivers approved templates — so it stays off until one is configured.
+if (SESSION_TIMEOUT_CONTENT_SID) {
+    startSessionTimeoutChecker(async (waId: string, message: string) => {
+        await sendTwilioReply(waId, message, { contentSid: SESSION_TIMEOUT_CONTENT_SID });
+    }, { redis: connection });
+} else {
+    logger.info("[BotWorker] TWILIO_SESSION_TIMEOUT_CONTENT_SID not set — session timeout follow-ups disabled");
+}
 
 // AUDIT FIX: Graceful shutdown — finish in-flight jobs before exit
 async function gracefulShutdown(signal: string) {
     logger.info(`[BotWorker] ${signal} received — closing worker gracefully...`);
+    stopSessionTimeoutChecker();
     try {
-        await worker.close();
-        logger.info("[BotWorker] Worker closed successfully, all in-flight jobs finished");
+        await Promise.all(Object.values(laneWorkers).map(w => w.close()));
+        logger.info("[BotWorker] Lane workers closed successfully, all in-flight jobs finished");
     } catch (err: any) {
         logger.error("[BotWorker] Error during graceful shutdown", { error: err?.message });
     }
@@ -271,4 +383,4 @@ async function gracefulShutdown(signal: string) {
 process.on("SIGTERM", () => gracefulShutdown("SIGTERM"));
 process.on("SIGINT", () => gracefulShutdown("SIGINT"));
 
-export { worker };
+export { worker, laneWorkers, idempotencyStore, getLaneStats };
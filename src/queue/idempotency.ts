@@ -0,0 +1,159 @@
+/**
+ * Job Idempotency Store
+ *
+ * Deduplicates inbound WhatsApp messages across all worker replicas.
+ * Keyed on the Twilio MessageSid, so Twilio webhook retries (new job, same
+ * SID) are dropped, while BullMQ redeliveries of the *same* job (retry after
+ * failure, stalled job after a pod restart) may continue.
+ *
+ * Redis: SET key owner NX PX ttl (atomic across pods)
+ * Fallback: bounded in-process LRU with the same semantics
+ */
+
+import { logger } from "@utils/logger";
+
+const IDEMPOTENCY_PREFIX = "idem:";
+export const IDEMPOTENCY_TTL_MS = Number(process.env.IDEMPOTENCY_TTL_MS || 24 * 60 * 60 * 1000); // Twilio retries for up to several hours
+const LOCAL_MAX_ENTRIES = Number(process.env.IDEMPOTENCY_LOCAL_MAX || 10_000);
+
+// Compare-and-delete, so releasing never drops another owner's claim
+const RELEASE_IF_OWNER = `
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0`;
+
+export type ClaimResult =
+    | "claimed"      // first time this key is seen — go ahead
+    | "owned"        // already claimed by the same owner (BullMQ retry / stalled job)
+    | "duplicate";   // claimed by another owner — skip
+
+export interface IdempotencyStats {
+    backend: "redis" | "memory";
+    hits: number;         // duplicates detected
+    misses: number;       // first-seen keys
+    ownerRetries: number; // same owner re-claimed (retry of the same job)
+    redisErrors: number;
+    localEntries: number;
+}
+
+interface LocalEntry {
+    owner: string;
+    expiresAt: number;
+}
+
+/**
+ * Bounded LRU of claims. Insertion order is recency order, so the head is
+ * the oldest entry and is evicted first.
+ */
+class LocalClaimCache {
+    private entries = new Map<string, LocalEntry>();
+
+    constructor(private readonly maxEntries: number) { }
+
+    get size(): number {
+        return this.entries.size;
+    }
+
+    get(key: string, now: number): LocalEntry | undefined {
+        const entry = this.entries.get(key);
+        if (!entry) return undefined;
+        if (entry.expiresAt <= now) {
+            this.entries.delete(key);
+            return undefined;
+        }
+        return entry;
+    }
+
+    set(key: string, owner: string, ttlMs: number, now: number): void {
+        this.entries.delete(key);
+        this.entries.set(key, { owner, expiresAt: now + ttlMs });
+        while (this.entries.size > this.maxEntries) {
+            const oldest = this.entries.keys().next().value as string;
+            this.entries.delete(oldest);
+        }
+    }
+
+    delete(key: string): void {
+        this.entries.delete(key);
+    }
+}
+
+export class IdempotencyStore {
+    private local: LocalClaimCache;
+    private stats = { hits: 0, misses: 0, ownerRetries: 0, redisErrors: 0 };
+
+    /**
+     * @param redis ioredis-compatible client, or null for local-only mode
+     */
+    constructor(private readonly redis: any | null, maxLocalEntries: number = LOCAL_MAX_ENTRIES) {
+        this.local = new LocalClaimCache(maxLocalEntries);
+    }
+
+    /**
+     * Atomically claim `key` for `owner`. Falls back to the local LRU when
+     * Redis is unavailable so a Redis outage degrades to per-pod dedup
+     * instead of no dedup at all.
+     */
+    async claim(key: string, owner: string, ttlMs: number = IDEMPOTENCY_TTL_MS): Promise<ClaimResult> {
+        const redisKey = `${IDEMPOTENCY_PREFIX}${key}`;
+
+        if (this.redis) {
+            try {
+                const result = await this.redis.set(redisKey, owner, "PX", ttlMs, "NX");
+                if (result === "OK") {
+                    this.local.set(key, owner, ttlMs, Date.now());
+                    return this.record("claimed");
+                }
+                const existing = await this.redis.get(redisKey);
+                // Key expired between SET and GET — treat as a fresh claim
+                if (existing === null) return this.claim(key, owner, ttlMs);
+                return this.record(existing === owner ? "owned" : "duplicate");
+            } catch (err: any) {
+                this.stats.redisErrors++;
+                logger.warn("[Idempotency] Redis claim failed, using local cache", { key, error: err?.message });
+            }
+        }
+
+        const now = Date.now();
+        const existing = this.local.get(key, now);
+        if (!existing) {
+            this.local.set(key, owner, ttlMs, now);
+            return this.record("claimed");
+        }
+        return this.record(existing.owner === owner ? "owned" : "duplicate");
+    }
+
+    /**
+     * Drop a claim (e.g. after the job was dead-lettered) so a later
+     * delivery of the same message can be processed. With `owner`, only a
+     * claim still held by that owner is dropped.
+     */
+    async release(key: string, owner?: string): Promise<void> {
+        const entry = this.local.get(key, Date.now());
+        if (owner === undefined || entry?.owner === owner) this.local.delete(key);
+        if (!this.redis) return;
+        try {
+            if (owner === undefined) await this.redis.del(`${IDEMPOTENCY_PREFIX}${key}`);
+            else await this.redis.eval(RELEASE_IF_OWNER, 1, `${IDEMPOTENCY_PREFIX}${key}`, owner);
+        } catch (err: any) {
+            this.stats.redisErrors++;
+            logger.warn("[Idempotency] Redis release failed", { key, error: err?.message });
+        }
+    }
+
+    getStats(): IdempotencyStats {
+        return {
+            backend: this.redis ? "redis" : "memory",
+            ...this.stats,
+            localEntries: this.local.size,
+        };
+    }
+
+    private record(result: ClaimResult): ClaimResult {
+        if (result === "claimed") this.stats.misses++;
+        else if (result === "owned") this.stats.ownerRetries++;
+        else this.stats.hits++;
+        return result;
+    }
+}
@@ -0,0 +1,338 @@
+/**
+ * Lane Scheduler — priority lanes + weighted fair scheduling across merchants
+ *
+ * Inbound messages are routed to one of two lanes, each backed by its own
+ * BullMQ queue and worker with its own concurrency limit:
+ *   - fast:     short text-only smalltalk / status checks
+ *   - standard: everything else (OCR, OEM lookup, LLM turns)
+ *
+ * A sender's messages stay in one lane while any of them is pending (sticky
+ * lane), so a quick "ja" is never answered before the photo it refers to.
+ *
+ * Within a lane every merchant has its own FIFO sub-queue (Redis list).
+ * The BullMQ job is only a "dispatch" token; when a worker picks it up it
+ * pops the next message by weighted round-robin over the merchants that
+ * currently have pending messages. One merchant's campaign therefore only
+ * delays its own customers, not every tenant.
+ *
+ * Redis keys per lane:
+ *   botlane:<lane>:ring        list of merchants with pending messages (rotation order)
+ *   botlane:<lane>:q:<merchant> FIFO of serialized BotJobData
+ *   botlane:<lane>:credit      hash merchant → messages left in the current turn
+ *   botlane:<lane>:weight      hash merchant → weight (messages per round)
+ *   botlane:<lane>:taken:<job> message popped for a dispatch token, until it finished
+ *
+ * Per sender:
+ *   botlane:sender:<from>      hash lane, pending (dispatch tokens not yet finished)
+ */
+
+import { randomUUID } from "crypto";
+import { botQueue, botFastQueue, BotJobData, BOT_QUEUE_NAME, BOT_FAST_QUEUE_NAME } from "./botQueue";
+import { connection } from "./connection";
+import { getMerchantByPhone } from "../services/adapters/phoneMerchantMapper";
+import { classifyMessage } from "../services/core/messageClassifier";
+import { logger } from "@utils/logger";
+
+export type BotLane = "fast" | "standard";
+
+export const BOT_LANES: Record<BotLane, { queueName: string; concurrency: number }> = {
+    standard: {
+        queueName: BOT_QUEUE_NAME,
+        concurrency: Number(process.env.BOT_LANE_STANDARD_CONCURRENCY || 3),
+    },
+    fast: {
+        queueName: BOT_FAST_QUEUE_NAME,
+        concurrency: Number(process.env.BOT_LANE_FAST_CONCURRENCY || 4),
+    },
+};
+
+const FAST_LANE_MAX_CHARS = 120;
+const FAST_LANE_INTENTS = new Set(["greeting", "status_question", "smalltalk"]);
+const DEFAULT_BATCH_WINDOW_MS = Number(process.env.BOT_BATCH_WINDOW_MS ?? 2500);
+const MAX_BATCH_WINDOW_MS = 15_000;
+const MERCHANT_SETTINGS_CACHE_TTL_MS = 60_000;
+const MERCHANT_SETTINGS_CACHE_MAX = 10_000;
+/** Safety net if a worker dies without releasing a sender's lane */
+const STICKY_LANE_TTL_MS = 15 * 60 * 1000;
+/** Outlives every BullMQ retry of a dispatch token */
+const TAKEN_TTL_MS = 24 * 60 * 60 * 1000;
+
+// ============================================================================
+// Lane classification
+// ============================================================================
+
+/**
+ * Cheap intents go to the fast lane. Anything with media or longer text may
+ * need OCR / OEM resolution and stays in the standard lane.
+ */
+export function classifyLane(data: Pick<BotJobData, "text" | "mediaUrls">): BotLane {
+    if (data.mediaUrls && data.mediaUrls.length > 0) return "standard";
+    const text = (data.text || "").trim();
+    if (!text || text.length > FAST_LANE_MAX_CHARS) return "standard";
+    const { smalltalk, intent } = classifyMessage(text);
+    if (smalltalk) return "fast";
+    return FAST_LANE_INTENTS.has(intent) ? "fast" : "standard";
+}
+
+// ============================================================================
+// Per-merchant queue settings (cached — resolved on every inbound webhook)
+// ============================================================================
+
+export interface MerchantQueueSettings {
+    merchantId: string;
+    batchWindowMs: number;
+    queueWeight: number;
+}
+
+const settingsCache = new Map<string, { value: MerchantQueueSettings; expiresAt: number }>();
+
+export async function getMerchantQueueSettings(from: string): Promise<MerchantQueueSettings> {
+    const now = Date.now();
+    const cached = settingsCache.get(from);
+    if (cached && cached.expiresAt > now) return cached.value;
+
+    const value: MerchantQueueSettings = {
+        merchantId: process.env.DEFAULT_MERCHANT_ID || "admin",
+        batchWindowMs: DEFAULT_BATCH_WINDOW_MS,
+        queueWeight: 1,
+    };
+    try {
+        const mapping = await getMerchantByPhone(from);
+        if (mapping?.merchantId) {
+            value.merchantId = mapping.merchantId;
+            const { getMerchantSettings } = await import("../services/adapters/supabaseService");
+            const settings = await getMerchantSettings(mapping.merchantId);
+            if (typeof settings?.messageBatchWindowMs === "number") value.batchWindowMs = settings.messageBatchWindowMs;
+            if (typeof settings?.queueWeight === "number") value.queueWeight = settings.queueWeight;
+        }
+    } catch (err: any) {
+        logger.debug("[LaneScheduler] Merchant settings lookup failed, using defaults", { error: err?.message });
+    }
+
+    value.batchWindowMs = Math.max(0, Math.min(value.batchWindowMs, MAX_BATCH_WINDOW_MS));
+    value.queueWeight = Math.max(1, Math.min(Math.round(value.queueWeight), 100));
+
+    if (settingsCache.size >= MERCHANT_SETTINGS_CACHE_MAX) {
+        settingsCache.delete(settingsCache.keys().next().value as string);
+    }
+    settingsCache.set(from, { value, expiresAt: now + MERCHANT_SETTINGS_CACHE_TTL_MS });
+    return value;
+}
+
+// ============================================================================
+// Redis scripts
+// ============================================================================
+
+// KEYS: merchant list, ring, weights — ARGV: payload, merchantId, weight
+const ENQUEUE_LUA = `
+local n = redis.call('RPUSH', KEYS[1], ARGV[1])
+if n == 1 then redis.call('RPUSH', KEYS[2], ARGV[2]) end
+redis.call('HSET', KEYS[3], ARGV[2], ARGV[3])
+return n
+`;
+
+// KEYS: ring, credits, weights, taken — ARGV: merchant list key prefix, taken ttl
+// Weighted round-robin: the merchant at the head of the ring is served until
+// its credit (= weight) is used up, then rotated to the tail. The popped
+// message is kept under the token's taken key in the same step, so a retry
+// of the token gets the same message back.
+const DEQUEUE_LUA = `
+local taken = redis.call('GET', KEYS[4])
+if taken then return { '', taken } end
+local ringLen = redis.call('LLEN', KEYS[1])
+for i = 1, ringLen do
+  local m = redis.call('LINDEX', KEYS[1], 0)
+  if not m then return false end
+  local listKey = ARGV[1] .. m
+  local msg = redis.call('LPOP', listKey)
+  if not msg or redis.call('LLEN', listKey) == 0 then
+    redis.call('LPOP', KEYS[1])
+    redis.call('HDEL', KEYS[2], m)
+  else
+    local credit = tonumber(redis.call('HGET', KEYS[2], m)) or tonumber(redis.call('HGET', KEYS[3], m)) or 1
+    credit = credit - 1
+    if credit <= 0 then
+      redis.call('RPUSH', KEYS[1], redis.call('LPOP', KEYS[1]))
+      redis.call('HDEL', KEYS[2], m)
+    else
+      redis.call('HSET', KEYS[2], m, credit)
+    end
+  end
+  if msg then
+    redis.call('SET', KEYS[4], msg, 'PX', ARGV[2])
+    return { m, msg }
+  end
+end
+return false
+`;
+
+// KEYS: sender — ARGV: classified lane, ttl
+// A sender with pending messages keeps their lane; otherwise the classified one.
+const STICKY_LANE_LUA = `
+local lane = redis.call('HGET', KEYS[1], 'lane') or ARGV[1]
+redis.call('HSET', KEYS[1], 'lane', lane)
+redis.call('HINCRBY', KEYS[1], 'pending', 1)
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return lane
+`;
+
+// KEYS: sender
+const RELEASE_SENDER_LUA = `
+if redis.call('HINCRBY', KEYS[1], 'pending', -1) <= 0 then redis.call('DEL', KEYS[1]) end
+return 0
+`;
+
+const senderKey = (from: string) => `botlane:sender:${from}`;
+
+function laneKeys(lane: BotLane) {
+    const base = `botlane:${lane}`;
+    return {
+        ring: `${base}:ring`,
+        credit: `${base}:credit`,
+        weight: `${base}:weight`,
+        listPrefix: `${base}:q:`,
+        taken: (tokenId: string) => `${base}:taken:${tokenId}`,
+    };
+}
+
+// ============================================================================
+// Dispatch (producer side)
+// ============================================================================
+
+/**
+ * Put a message into its lane (the sender's sticky lane if they have
+ * messages pending): append to the merchant's sub-queue, then add one
+ * dispatch token to the lane's BullMQ queue.
+ * Throws if the queue is unavailable (caller falls back to sync processing).
+ */
+export async function dispatchToLane(data: BotJobData, settings?: MerchantQueueSettings): Promise<BotLane> {
+    if (!botQueue || !botFastQueue || !connection) {
+        throw new Error("Queue not initialized");
+    }
+    const lane = await connection.eval(STICKY_LANE_LUA, 1, senderKey(data.from),
+        classifyLane(data), STICKY_LANE_TTL_MS) as BotLane;
+    const queue = lane === "fast" ? botFastQueue : botQueue;
+
+    const merchant = settings ?? await getMerchantQueueSettings(data.from);
+    const message: BotJobData = {
+        ...data,
+        batchKey: undefined,
+        merchantId: merchant.merchantId,
+        dispatchId: data.dispatchId || randomUUID(),
+        enqueuedAt: Date.now(),
+    };
+
+    const keys = laneKeys(lane);
+    const payload = JSON.stringify(message);
+    try {
+        await connection.eval(ENQUEUE_LUA, 3,
+            `${keys.listPrefix}${merchant.merchantId}`, keys.ring, keys.weight,
+            payload, merchant.merchantId, String(merchant.queueWeight));
+        await queue.add("dispatch", { from: data.from, text: "" }, { jobId: `dispatch-${message.dispatchId}` });
+    } catch (err) {
+        // Without a token nobody would pop the message
+        await connection.lrem(`${keys.listPrefix}${merchant.merchantId}`, 1, payload).catch(() => 0);
+        await releaseSenderLane(data.from).catch(() => undefined);
+        throw err;
+    }
+
+    return lane;
+}
+
+/**
+ * A dispatch token of `from` is finished (completed or dead-lettered); once
+ * none is left their next message is classified afresh.
+ */
+export async function releaseSenderLane(from: string): Promise<void> {
+    if (!connection) return;
+    await connection.eval(RELEASE_SENDER_LUA, 1, senderKey(from));
+}
+
+/**
+ * Dispatch token `tokenId` is finished: drop its taken message and release
+ * the sender's lane.
+ */
+export async function finishDispatch(lane: BotLane, tokenId: string, from: string): Promise<void> {
+    if (!connection) return;
+    await connection.del(laneKeys(lane).taken(tokenId));
+    await releaseSenderLane(from);
+}
+
+// ============================================================================
+// Take next (worker side)
+// ============================================================================
+
+/**
+ * Pop the next message of a lane by weighted round-robin across merchants,
+ * for dispatch token `tokenId` (the BullMQ job id). Calling it again for the
+ * same token returns the message already taken.
+ */
+export async function takeNextMessage(lane: BotLane, tokenId: string): Promise<BotJobData | null> {
+    if (!connection) return null;
+    const keys = laneKeys(lane);
+    const result = await connection.eval(DEQUEUE_LUA, 4, keys.ring, keys.credit, keys.weight, keys.taken(tokenId),
+        keys.listPrefix, TAKEN_TTL_MS) as [string, string] | null;
+    if (!result) return null;
+
+    try {
+        return JSON.parse(result[1]);
+    } catch (err: any) {
+        logger.warn("[LaneScheduler] Dropping unparseable message", { lane, merchantId: result[0], error: err?.message });
+        return null;
+    }
+}
+
+// ============================================================================
+// Queue-wait metrics per lane (worker process)
+// ============================================================================
+
+const WAIT_SAMPLE_SIZE = 1000;
+
+interface LaneWaitStats {
+    samples: number[];
+    next: number;
+    processed: number;
+    maxMs: number;
+}
+
+const waitStats: Record<BotLane, LaneWaitStats> = {
+    fast: { samples: [], next: 0, processed: 0, maxMs: 0 },
+    standard: { samples: [], next: 0, processed: 0, maxMs: 0 },
+};
+
+export function recordQueueWait(lane: BotLane, waitMs: number): void {
+    const stats = waitStats[lane];
+    if (stats.samples.length < WAIT_SAMPLE_SIZE) {
+        stats.samples.push(waitMs);
+    } else {
+        stats.samples[stats.next] = waitMs;
+        stats.next = (stats.next + 1) % WAIT_SAMPLE_SIZE;
+    }
+    stats.processed++;
+    if (waitMs > stats.maxMs) stats.maxMs = waitMs;
+}
+
+function percentile(sorted: number[], p: number): number {
+    if (sorted.length === 0) return 0;
+    return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+}
+
+/**
+ * Queue-wait percentiles over the last WAIT_SAMPLE_SIZE messages per lane.
+ */
+export function getLaneStats(): Record<BotLane, { processed: number; p50Ms: number; p95Ms: number; p99Ms: number; maxMs: number; concurrency: number }> {
+    const out = {} as ReturnType<typeof getLaneStats>;
+    for (const lane of Object.keys(waitStats) as BotLane[]) {
+        const stats = waitStats[lane];
+        const sorted = [...stats.samples].sort((a, b) => a - b);
+        out[lane] = {
+            processed: stats.processed,
+            p50Ms: percentile(sorted, 50),
+            p95Ms: percentile(sorted, 95),
+            p99Ms: percentile(sorted, 99),
+            maxMs: stats.maxMs,
+            concurrency: BOT_LANES[lane].concurrency,
+        };
+    }
+    return out;
+}
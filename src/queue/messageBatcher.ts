@@ -0,0 +1,166 @@
+/**
+ * Message Batcher — coalesces burst messages per conversation
+ *
+ * Customers often send several short WhatsApp messages in a row
+ * ("Golf 7", "2016", "Bremsen vorne"). Instead of one bot turn (and LLM
+ * calls) per message, messages from the same sender arriving within a short
+ * window are collected in a Redis list and processed as one job.
+ *
+ * Flow:
+ *   webhook ──RPUSH botbatch:<from>──▶ first message schedules a delayed
+ *   "whatsapp-batch" job ──after window──▶ worker moves the list to a
+ *   processing key of that job, merges text + mediaUrls into a single
+ *   BotJobData and dispatches it to its lane (see laneScheduler.ts). The
+ *   processing key is deleted only once the dispatch succeeded, so a BullMQ
+ *   retry of a failed flush finds the same burst again.
+ *
+ * The window is configurable per merchant (MerchantSettings.messageBatchWindowMs),
+ * default BOT_BATCH_WINDOW_MS; 0 disables batching.
+ */
+
+import { botQueue, BotJobData } from "./botQueue";
+import { connection } from "./connection";
+import { dispatchToLane, getMerchantQueueSettings } from "./laneScheduler";
+import { logger } from "@utils/logger";
+
+const BATCH_KEY_PREFIX = "botbatch:";
+/** How long a claimed burst waits for its job's retry after a failed dispatch */
+const PROCESSING_TTL_MS = 24 * 60 * 60 * 1000;
+export const IMAGE_PLACEHOLDER_TEXT = "IMAGE_MESSAGE";
+
+// ============================================================================
+// Enqueue (API side)
+// ============================================================================
+
+/**
+ * Enqueue an inbound message, coalescing it with other messages from the
+ * same sender that arrive within the merchant's batch window.
+ * Throws if the queue is unavailable (caller falls back to sync processing).
+ */
+export async function enqueueBotMessage(data: BotJobData): Promise<void> {
+    if (!botQueue || !connection) {
+        throw new Error("Queue not initialized");
+    }
+
+    const settings = await getMerchantQueueSettings(data.from);
+    if (settings.batchWindowMs === 0) {
+        await dispatchToLane(data, settings);
+        return;
+    }
+
+    const windowMs = settings.batchWindowMs;
+    const batchKey = `${BATCH_KEY_PREFIX}${data.from}`;
+    const payload = JSON.stringify(data);
+    const results = await connection.multi()
+        .rpush(batchKey, payload)
+        .pexpire(batchKey, windowMs * 10 + 60_000)
+        .exec();
+    const length = Number(results?.[0]?.[1] ?? 0);
+
+    if (length !== 1) {
+        logger.info("[MessageBatcher] Message coalesced into pending batch", { from: data.from, batchSize: length });
+        return;
+    }
+
+    // First message of a new batch schedules the flush job
+    try {
+        await botQueue.add("whatsapp-batch", { from: data.from, text: "", batchKey }, {
+            delay: windowMs,
+            jobId: `batch-${data.messageSid || Date.now().toString(36)}`,
+        });
+    } catch (err) {
+        await connection.lrem(batchKey, 1, payload).catch(() => 0);
+        throw err;
+    }
+}
+
+/**
+ * Flush a pending burst: claim it for `jobId`, merge it, and hand the merged
+ * message to its lane. Returns the merged message (null if the batch was
+ * empty). If the dispatch throws, the burst stays claimed for the retry.
+ */
+export async function flushBatch(batchKey: string, jobId: string): Promise<BotJobData | null> {
+    const processingKey = `${batchKey}:processing:${jobId}`;
+    const pending = await claimBatch(batchKey, processingKey);
+
+    // Twilio may redeliver a message into the same burst
+    const seenSids = new Set<string>();
+    const unique = pending.filter(m => {
+        if (!m.messageSid) return true;
+        if (seenSids.has(m.messageSid)) return false;
+        seenSids.add(m.messageSid);
+        return true;
+    });
+
+    const merged = mergeBotJobs(unique);
+    if (merged) {
+        await dispatchToLane(merged);
+        logger.info("[MessageBatcher] Flushed burst", {
+            from: merged.from,
+            messages: unique.length,
+            mediaCount: merged.mediaUrls?.length || 0,
+        });
+    }
+    await connection?.del(processingKey);
+    return merged;
+}
+
+// ============================================================================
+// Claim + merge (worker side)
+// ============================================================================
+
+// KEYS[1] = pending batch, KEYS[2] = processing key of the flushing job.
+// First attempt: move the batch over (later messages start a new batch).
+// Retry: the processing key already holds the burst.
+const CLAIM_BATCH_LUA = `
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then return {} end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+redis.call('PEXPIRE', KEYS[2], ARGV[1])
+return redis.call('LRANGE', KEYS[2], 0, -1)
+`;
+
+/**
+ * Atomically take all pending messages of a batch into `processingKey`
+ * (or re-read them from there on a retry).
+ */
+export async function claimBatch(batchKey: string, processingKey: string): Promise<BotJobData[]> {
+    if (!connection) return [];
+    const raw = (await connection.eval(CLAIM_BATCH_LUA, 2, batchKey, processingKey, PROCESSING_TTL_MS) as string[] | null) || [];
+
+    const jobs: BotJobData[] = [];
+    for (const item of raw) {
+        try {
+            jobs.push(JSON.parse(item));
+        } catch (err: any) {
+            logger.warn("[MessageBatcher] Dropping unparseable batch entry", { batchKey, error: err?.message });
+        }
+    }
+    return jobs;
+}
+
+/**
+ * Merge burst messages into one job: texts joined by newline (image
+ * placeholders dropped when real text exists), media URLs concatenated.
+ */
+export function mergeBotJobs(jobs: BotJobData[]): BotJobData | null {
+    if (jobs.length === 0) return null;
+    if (jobs.length === 1) return jobs[0];
+
+    const texts = jobs
+        .map(j => (j.text || "").trim())
+        .filter(t => t && t !== IMAGE_PLACEHOLDER_TEXT);
+    const mediaUrls = jobs.flatMap(j => j.mediaUrls || []);
+    const last = jobs[jobs.length - 1];
+
+    return {
+        from: jobs[0].from,
+        text: texts.length > 0 ? texts.join("\n") : (mediaUrls.length > 0 ? IMAGE_PLACEHOLDER_TEXT : ""),
+        orderId: last.orderId ?? null,
+        mediaUrls: mediaUrls.length > 0 ? mediaUrls : undefined,
+        // Typing indicator goes to the latest message
+        messageSid: last.messageSid,
+        messageSids: jobs.flatMap(j => j.messageSids ?? (j.messageSid ? [j.messageSid] : [])),
+    };
+}
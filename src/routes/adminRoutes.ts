@@ -804,7 +804,8 @@ router.put("/oem-records/:id", async (req: Request, res: Response) => {
                 part_description = COALESCE(?, part_description),
                 model = COALESCE(?, model),
                 confidence = COALESCE(?, confidence),
-                sources = json_insert(COALESCE(sources, '[]'), '$[#]', 'manual-edit')
+                sources = json_insert(COALESCE(sources, '[]'), '$[#]', 'manual-edit'),
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         `);
 
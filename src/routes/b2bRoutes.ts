@@ -11,6 +11,8 @@ import {
 } from '../services/b2bSuppliers/supplierConfigService';
 import { getSupplier, getAllSuppliers } from '../services/b2bSuppliers/types';
 import { applyMargin } from '../services/b2bSuppliers/marginEngine';
+import { resolveOemApexBatch, BatchPartRequest, MAX_BATCH_PARTS } from '../services/intelligence/apexBatchPipeline';
+import { heavyOperationLimiter } from '../middleware/rateLimiter';
 
 const router = Router();
 router.use(authMiddleware);
@@ -108,4 +110,68 @@ router.post('/calculate-margin', async (req: Request, res: Response) => {
     }
 });
 
+// POST /api/b2b/oem/batch - Resolve a part list for one vehicle
+// Body: { vehicle: { vin?, make?, model?, year?, ... }, parts: [{ id?, text }] }
+// With "Accept: application/x-ndjson" each part is streamed as one JSON line
+// as soon as it is resolved, followed by a final {"done": true, stats} line.
+// A client disconnect stops further lookups; in-flight ones still finish.
+router.post('/oem/batch', heavyOperationLimiter, async (req: Request, res: Response) => {
+    const { vehicle, parts } = req.body || {};
+    if (!vehicle || typeof vehicle !== 'object') {
+        return res.status(400).json({ error: 'vehicle is required' });
+    }
+    if (!Array.isArray(parts) || parts.length === 0) {
+        return res.status(400).json({ error: 'parts must be a non-empty array' });
+    }
+    if (parts.length > MAX_BATCH_PARTS) {
+        return res.status(413).json({ error: `Too many parts (max ${MAX_BATCH_PARTS})` });
+    }
+
+    const batchParts: BatchPartRequest[] = parts.map((p: any, i: number) => ({
+        id: String(p?.id ?? i),
+        rawText: String(p?.text ?? p?.rawText ?? ''),
+        suspectedNumber: p?.suspectedNumber ?? null,
+        position: p?.position,
+    }));
+    const orderId = `b2b-${req.tenantId}-${Date.now().toString(36)}`;
+
+    // res 'close' before the response ended = the client went away
+    // (req 'close' also fires as soon as the body has been read)
+    const disconnect = new AbortController();
+    res.on('close', () => {
+        if (!res.writableEnded) disconnect.abort();
+    });
+
+    const stream = (req.headers.accept || '').includes('application/x-ndjson');
+    if (stream) {
+        res.status(200);
+        res.setHeader('Content-Type', 'application/x-ndjson');
+        res.setHeader('Cache-Control', 'no-cache');
+        res.flushHeaders();
+    }
+
+    try {
+        const summary = await resolveOemApexBatch(vehicle, batchParts, {
+            orderId,
+            onResult: stream ? (r) => {
+                if (!disconnect.signal.aborted) res.write(JSON.stringify(r) + '\n');
+            } : undefined,
+            signal: disconnect.signal,
+        });
+        if (disconnect.signal.aborted) return;
+        if (stream) {
+            res.end(JSON.stringify({ done: true, stats: summary.stats }) + '\n');
+        } else {
+            res.json(summary);
+        }
+    } catch (error: any) {
+        if (disconnect.signal.aborted) return;
+        if (stream) {
+            res.end(JSON.stringify({ done: true, error: error.message }) + '\n');
+        } else {
+            res.status(500).json({ error: error.message });
+        }
+    }
+});
+
 export default router;
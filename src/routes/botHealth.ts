@@ -1,5 +1,6 @@
 import { Router, type Request, type Response } from "express";
 import { authMiddleware } from "../middleware/authMiddleware";
+import { getStateMachineProfile } from "../services/core/stateMachine/tracing";
 
 export function createBotHealthRouter(): Router {
     const router = Router();
@@ -27,6 +28,12 @@ export function createBotHealthRouter(): Router {
         }
     });
 
+    // Per-state transition profile (wall time, I/O wait, Gemini budget) since process start.
+    // Save the JSON and feed it to scripts/state_profile_report.py for an offline report.
+    router.get("/state-machine/profile", (_req: Request, res: Response) => {
+        return res.status(200).json(getStateMachineProfile());
+    });
+
     return router;
 }
 
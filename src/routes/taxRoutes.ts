@@ -97,7 +97,8 @@ router.get('/periods/:id', async (req: Request, res: Response) => {
 
 /**
  * POST /api/tax/periods/calculate
- * Calculate tax period (preview, doesn't save)
+ * Calculate tax period (preview, doesn't save). Pass include_invoices: false
+ * for the totals only.
  */
 router.post('/periods/calculate', async (req: Request, res: Response) => {
     try {
@@ -107,7 +108,10 @@ router.post('/periods/calculate', async (req: Request, res: Response) => {
             return res.status(400).json({ error: 'period_start and period_end are required' });
         }
 
-        const aggregation = await calculateTaxPeriod((req as any).tenantId!, period_start, period_end);
+        // include_invoices: false skips the invoice scan — the totals come from daily snapshots
+        const aggregation = await calculateTaxPeriod((req as any).tenantId!, period_start, period_end, {
+            includeInvoices: req.body.include_invoices !== false
+        });
         res.json(aggregation);
     } catch (error: any) {
         logger.error('Error calculating tax period:', error);
@@ -149,7 +153,7 @@ router.get('/export/:year/:month', async (req: Request, res: Response) => {
         const periodEnd = `${year}-${month.padStart(2, '0')}-${lastDay}`;
 
         // Calculate tax period
-        const calculation = await calculateTaxPeriod((req as any).tenantId!, periodStart, periodEnd);
+        const calculation = await calculateTaxPeriod((req as any).tenantId!, periodStart, periodEnd, { includeInvoices: true });
 
         // For now, return JSON (PDF generation can be added later)
         res.json({
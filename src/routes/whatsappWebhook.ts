@@ -2,7 +2,7 @@ import crypto from "crypto";
 import express from "express";
 import twilio from "twilio";
 import { env } from "../config/env";
-import { botQueue } from "../queue/botQueue";
+import { enqueueBotMessage } from "../queue/messageBatcher";
 import { logger } from "@utils/logger";
 
 const router = express.Router();
@@ -90,10 +90,8 @@ router.post("/", async (req, res) => {
   };
 
   try {
-    if (!botQueue) {
-      throw new Error('Queue not initialized');
-    }
-    await botQueue.add("whatsapp-msg", jobData);
+    // Coalesces burst messages per sender; throws if the queue is unavailable
+    await enqueueBotMessage(jobData);
     res.type("text/xml").send("<Response></Response>");
   } catch (err: any) {
     logger.warn("[Twilio Webhook] Queue unavailable, falling back to sync processing", { error: err?.message });
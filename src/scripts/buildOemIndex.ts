@@ -0,0 +1,62 @@
+#!/usr/bin/env node
+/**
+ * 📦 OEM Index Builder (CLI)
+ *
+ * Builds and publishes the read-only OEM index — see
+ * services/intelligence/oemIndexBuilder.ts. Running workers also rebuild it
+ * themselves (oemDatabase.refreshIndexInBackground()) after writes.
+ *
+ * Run with: npm run build:oem-index -- [--source <db>] [--out <dir>] [--keep <n>]
+ *       or: node dist/scripts/buildOemIndex.js [...]   (production image)
+ */
+
+import path from 'path';
+import { buildOemIndex, OEMIndexBuildOptions } from '../services/intelligence/oemIndexBuilder';
+
+// ============================================================================
+// Configuration
+// ============================================================================
+
+const DATA_DIR = process.env.OEM_DATA_PATH || path.join(__dirname, '../../oem-data');
+
+function parseArgs(argv: string[]): OEMIndexBuildOptions {
+    const args: OEMIndexBuildOptions = {
+        source: path.join(DATA_DIR, 'oem-database.sqlite'),
+        out: process.env.OEM_INDEX_PATH || DATA_DIR,
+        keep: 2,
+    };
+    for (let i = 0; i < argv.length; i++) {
+        if (argv[i] === '--source') args.source = argv[++i];
+        else if (argv[i] === '--out') args.out = argv[++i];
+        else if (argv[i] === '--keep') args.keep = Math.max(1, parseInt(argv[++i], 10) || 2);
+    }
+    return args;
+}
+
+// ============================================================================
+// CLI
+// ============================================================================
+
+if (require.main === module) {
+    const args = parseArgs(process.argv.slice(2));
+
+    console.log('📦 OEM Index Builder');
+    console.log('='.repeat(60));
+    console.log(`📁 Source: ${args.source}`);
+    console.log(`📁 Output: ${args.out}`);
+
+    try {
+        const result = buildOemIndex(args);
+        console.log(`✅ Built ${result.file} in ${result.durationMs}ms`);
+        console.log(`   Records:       ${result.records}`);
+        console.log(`   Supersessions: ${result.supersessions}`);
+        console.log(`   Size:          ${(result.bytes / 1024 / 1024).toFixed(1)} MB`);
+        console.log(`   SHA-256:       ${result.sha256}`);
+        if (result.removed.length > 0) {
+            console.log(`   Removed:       ${result.removed.join(', ')}`);
+        }
+    } catch (err: any) {
+        console.error(`❌ Build failed: ${err.message}`);
+        process.exit(1);
+    }
+}
@@ -12,6 +12,8 @@ export interface MerchantSettings {
     dealerName?: string;
     deliveryTimeBufferDays?: number;
     supportedLanguages?: string[];
+    messageBatchWindowMs?: number; // Coalesce burst WhatsApp messages (0 = off)
+    queueWeight?: number; // Fair-share weight in the bot queue lanes (default 1)
 
     // Onboarding / Twilio Fields
     twilio_phone_number?: string;
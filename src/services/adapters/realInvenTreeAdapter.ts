@@ -2,6 +2,7 @@ import * as localAdapter from '../adapters/inventreeAdapter';
 import axios from 'axios';
 import * as dotenv from 'dotenv';
 import { logger } from '@utils/logger';
+import { keepAliveAgents } from '@utils/httpClient';
 
 import https from 'https';
 
@@ -18,6 +19,8 @@ const api = axios.create({
         'Content-Type': 'application/json'
     },
     timeout: 5000,
+    // Pooled keep-alive sockets instead of a TLS handshake per sync call
+    ...(BASE_URL ? keepAliveAgents(BASE_URL) : {}),
 });
 
 
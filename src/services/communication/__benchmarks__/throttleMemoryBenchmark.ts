@@ -0,0 +1,130 @@
+/**
+ * Message Throttle Memory Benchmark
+ *
+ * Heap used by the throttle state for N users (default 100,000), each sent
+ * a few messages: the previous Map-of-Maps implementation (inlined below as
+ * LegacyThrottle) vs. the typed-array store in messageThrottle.ts. Then
+ * replays a random send trace through both and checks that
+ * shouldSendMessage() returns identical results.
+ *
+ * Usage: LOG_LEVEL=warn node --expose-gc -r ts-node/register -r tsconfig-paths/register \
+ *   src/services/communication/__benchmarks__/throttleMemoryBenchmark.ts [users] [messagesPerUser]
+ */
+
+import { shouldSendMessage, recordMessageSent, cleanupThrottleState, getThrottleStats } from '../messageThrottle';
+
+const USERS = Number(process.argv[2] || 100_000);
+const MESSAGES_PER_USER = Number(process.argv[3] || 4);
+
+/** The Map-based implementation this store replaced, kept for comparison. */
+class LegacyThrottle {
+  private users = new Map<string, { lastSentAt: number; recentMessages: Map<string, number> }>();
+
+  shouldSend(userId: string, text: string, now: number): number {
+    const state = this.state(userId);
+    const lastSent = state.recentMessages.get(hash(text.substring(0, 200)));
+    if (lastSent && now - lastSent < 10_000) return -1;
+    const elapsed = now - state.lastSentAt;
+    return elapsed < 2000 ? 2000 - elapsed : 0;
+  }
+
+  record(userId: string, text: string, now: number): void {
+    const state = this.state(userId);
+    state.lastSentAt = now;
+    state.recentMessages.set(hash(text.substring(0, 200)), now);
+    if (state.recentMessages.size > 50) {
+      for (const [h, ts] of state.recentMessages) if (ts < now - 10_000) state.recentMessages.delete(h);
+    }
+  }
+
+  cleanup(now: number): void {
+    for (const [userId, state] of this.users) if (state.lastSentAt < now - 60_000) this.users.delete(userId);
+  }
+
+  private state(userId: string) {
+    let state = this.users.get(userId);
+    if (!state) {
+      state = { lastSentAt: 0, recentMessages: new Map() };
+      this.users.set(userId, state);
+    }
+    return state;
+  }
+}
+
+function hash(str: string): string {
+  let h = 0;
+  for (let i = 0; i < str.length; i++) {
+    h = ((h << 5) - h) + str.charCodeAt(i);
+    h = h & h;
+  }
+  return String(Math.abs(h));
+}
+
+function heapUsed(): number {
+  global.gc?.();
+  return process.memoryUsage().heapUsed + process.memoryUsage().arrayBuffers;
+}
+
+// Deterministic clock and PRNG so both implementations see the same trace
+let clock = Date.now();
+Date.now = () => clock;
+let seed = 42;
+const random = () => ((seed = (seed * 1103515245 + 12345) & 0x7fffffff) / 0x7fffffff);
+
+const userId = (i: number) => `whatsapp:+49170${String(i).padStart(7, '0')}`;
+const message = (i: number, j: number) => `Ihr Angebot für Bremsscheibe ${(i + j) % 50}: ${(19.99 + j).toFixed(2)} €`;
+
+function measure(label: string, fill: () => void): void {
+  const before = heapUsed();
+  const start = process.hrtime.bigint();
+  fill();
+  const ms = Number(process.hrtime.bigint() - start) / 1e6;
+  const bytes = heapUsed() - before;
+  console.log(`${label.padEnd(14)} ${(bytes / 1024 / 1024).toFixed(1).padStart(7)} MiB  ${(bytes / USERS).toFixed(0).padStart(5)} B/user  ${ms.toFixed(0).padStart(6)} ms`);
+}
+
+function run(): void {
+  if (!global.gc) console.warn('Run with --expose-gc for stable numbers');
+  console.log(`Throttle memory: ${USERS} users × ${MESSAGES_PER_USER} messages`);
+
+  const legacy = new LegacyThrottle();
+  measure('Map-of-Maps', () => {
+    for (let j = 0; j < MESSAGES_PER_USER; j++) {
+      for (let i = 0; i < USERS; i++) legacy.record(userId(i), message(i, j), clock);
+      clock += 2500;
+    }
+  });
+
+  clock -= 2500 * MESSAGES_PER_USER;
+  measure('typed slab', () => {
+    for (let j = 0; j < MESSAGES_PER_USER; j++) {
+      for (let i = 0; i < USERS; i++) recordMessageSent(userId(i), message(i, j));
+      clock += 2500;
+    }
+  });
+  console.log(`  store: ${getThrottleStats().users} users, ${(getThrottleStats().bytes / 1024 / 1024).toFixed(1)} MiB typed arrays`);
+
+  // Equivalence: random sends to a small population, with time jumps past the windows
+  let mismatches = 0;
+  const steps = 200_000;
+  for (let step = 0; step < steps; step++) {
+    clock += Math.floor(random() * 700);
+    if (random() < 0.001) clock += 70_000;
+    const user = userId(Math.floor(random() * 200));
+    const text = message(Math.floor(random() * 3), Math.floor(random() * 3));
+    const expected = legacy.shouldSend(user, text, clock);
+    if (shouldSendMessage(user, text) !== expected) mismatches++;
+    if (expected === 0) {
+      legacy.record(user, text, clock);
+      recordMessageSent(user, text);
+    }
+    if (step % 10_000 === 0) {
+      legacy.cleanup(clock);
+      cleanupThrottleState();
+    }
+  }
+  console.log(`shouldSendMessage mismatches: ${mismatches} / ${steps}`);
+  if (mismatches > 0) process.exit(1);
+}
+
+run();
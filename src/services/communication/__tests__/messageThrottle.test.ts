@@ -0,0 +1,73 @@
+jest.mock('@utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+
+import { shouldSendMessage, recordMessageSent, cleanupThrottleState, getThrottleStats } from '../messageThrottle';
+
+describe('messageThrottle', () => {
+    let now: number;
+    let user = 0;
+    let userId: string;
+
+    beforeEach(() => {
+        // Each test starts 10 minutes later, so earlier users are idle
+        now = 1_800_000_000_000 + user * 600_000;
+        jest.spyOn(Date, 'now').mockImplementation(() => now);
+        userId = `whatsapp:+4917000000${user++}`;
+    });
+
+    afterEach(() => {
+        jest.restoreAllMocks();
+    });
+
+    it('sends the first message immediately', () => {
+        expect(shouldSendMessage(userId, 'Hallo')).toBe(0);
+    });
+
+    it('delays messages within the minimum interval', () => {
+        recordMessageSent(userId, 'Erste Nachricht');
+        now += 500;
+        expect(shouldSendMessage(userId, 'Zweite Nachricht')).toBe(1500);
+        now += 1500;
+        expect(shouldSendMessage(userId, 'Zweite Nachricht')).toBe(0);
+    });
+
+    it('drops identical messages within the dedup window', () => {
+        recordMessageSent(userId, 'Ihr Angebot: 49,99 €');
+        now += 9_999;
+        expect(shouldSendMessage(userId, 'Ihr Angebot: 49,99 €')).toBe(-1);
+        now += 1;
+        expect(shouldSendMessage(userId, 'Ihr Angebot: 49,99 €')).toBe(0);
+    });
+
+    it('compares only the first 200 characters', () => {
+        const prefix = 'x'.repeat(200);
+        recordMessageSent(userId, `${prefix}A`);
+        now += 3000;
+        expect(shouldSendMessage(userId, `${prefix}B`)).toBe(-1);
+    });
+
+    it('remembers every message sent within the window', () => {
+        for (let i = 0; i < 5; i++) {
+            recordMessageSent(userId, `Nachricht ${i}`);
+            now += 2000;
+        }
+        expect(shouldSendMessage(userId, 'Nachricht 0')).toBe(0); // sent exactly 10s ago
+        expect(shouldSendMessage(userId, 'Nachricht 1')).toBe(-1);
+        expect(shouldSendMessage(userId, 'Nachricht 4')).toBe(-1);
+    });
+
+    it('evicts idle users without affecting active ones', () => {
+        const idle = `${userId}-idle`;
+        recordMessageSent(idle, 'Hallo');
+        now += 30_000;
+        recordMessageSent(userId, 'Hallo');
+        expect(getThrottleStats().users).toBe(2);
+
+        now += 30_001;
+        cleanupThrottleState();
+
+        expect(getThrottleStats().users).toBe(1);
+        expect(shouldSendMessage(idle, 'Hallo')).toBe(0);
+        now -= 30_001 - 9_000;
+        expect(shouldSendMessage(userId, 'Hallo')).toBe(-1);
+    });
+});
@@ -8,6 +8,7 @@
  * - Max 1 message per 2 seconds per user (configurable)
  * - Queues excess messages with spacing
  * - Deduplication: identical messages within 10s are dropped
+ *   (last THROTTLE_DEDUP_RING_SIZE messages per user, default 8)
  */
 
 import { logger } from '@utils/logger';
@@ -18,29 +19,186 @@ import { logger } from '@utils/logger';
 
 const MIN_INTERVAL_MS = 2000;   // Minimum gap between messages to same user
 const DEDUP_WINDOW_MS = 10000;  // Ignore duplicate messages within this window
+const IDLE_EVICT_MS = 60000;    // Forget users without a send for 1 min
+const RING_SIZE = Number(process.env.THROTTLE_DEDUP_RING_SIZE || 8); // Remembered messages per user (≥ sends per dedup window)
+const INITIAL_CAPACITY = 1024;
 
 // ============================================================================
 // State
 // ============================================================================
 
-interface ThrottleState {
-    lastSentAt: number;
-    recentMessages: Map<string, number>; // hash → timestamp
-}
+/**
+ * Compact per-user throttle state in shared typed-array slabs.
+ *
+ * Each user owns a slot: the last send time plus a fixed ring of
+ * (hash, time) pairs for the dedup window. Times are uint32 ms offsets from
+ * `epoch`, which lies in the past, so 0 means "empty". Every send is also
+ * appended to a FIFO of (slot, time); idle users are evicted by popping
+ * that FIFO, never by sweeping all users.
+ */
+class ThrottleStore {
+    private epoch = 0;
+    private capacity = 0;
+    private lastSent = new Uint32Array(0);
+    private ringHead = new Uint8Array(0);
+    private hashes = new Uint32Array(0);
+    private times = new Uint32Array(0);
+    private slotUsers: string[] = [];
+    private slots = new Map<string, number>();
+    private freeSlots: number[] = [];
+    private nextSlot = 0;
+    // Send FIFO (ring buffer) for eviction
+    private sendSlots = new Uint32Array(INITIAL_CAPACITY);
+    private sendTimes = new Uint32Array(INITIAL_CAPACITY);
+    private sendHead = 0;
+    private sendCount = 0;
+
+    constructor(private readonly ringSize: number) {
+        this.grow(INITIAL_CAPACITY);
+    }
+
+    get users(): number {
+        return this.slots.size;
+    }
+
+    get bytes(): number {
+        return this.lastSent.byteLength + this.ringHead.byteLength + this.hashes.byteLength +
+            this.times.byteLength + this.sendSlots.byteLength + this.sendTimes.byteLength;
+    }
+
+    /** ms since the last send to this user (Infinity if unknown). */
+    sinceLastSent(userId: string, now: number): number {
+        const slot = this.slots.get(userId);
+        if (slot === undefined) return Infinity;
+        return this.toOffset(now) - this.lastSent[slot];
+    }
+
+    /** ms since `hash` was last sent to this user (Infinity if not in the ring). */
+    sinceSent(userId: string, hash: number, now: number): number {
+        const slot = this.slots.get(userId);
+        if (slot === undefined) return Infinity;
+        const base = slot * this.ringSize;
+        let latest = 0;
+        for (let i = base; i < base + this.ringSize; i++) {
+            if (this.hashes[i] === hash && this.times[i] > latest) latest = this.times[i];
+        }
+        return latest === 0 ? Infinity : this.toOffset(now) - latest;
+    }
+
+    record(userId: string, hash: number, now: number): void {
+        const offset = this.toOffset(now);
+        let slot = this.slots.get(userId);
+        if (slot === undefined) {
+            slot = this.allocate();
+            this.slots.set(userId, slot);
+            this.slotUsers[slot] = userId;
+        }
+
+        this.lastSent[slot] = offset;
+        const i = slot * this.ringSize + this.ringHead[slot];
+        this.hashes[i] = hash;
+        this.times[i] = offset;
+        this.ringHead[slot] = (this.ringHead[slot] + 1) % this.ringSize;
+        this.pushSend(slot, offset);
+
+        this.evictIdle(now);
+    }
+
+    /** Drop users whose last send is older than IDLE_EVICT_MS. Amortized O(1) per send. */
+    evictIdle(now: number): void {
+        const cutoff = this.toOffset(now) - IDLE_EVICT_MS;
+        while (this.sendCount > 0 && this.sendTimes[this.sendHead] < cutoff) {
+            const slot = this.sendSlots[this.sendHead];
+            const time = this.sendTimes[this.sendHead];
+            this.sendHead = (this.sendHead + 1) % this.sendSlots.length;
+            this.sendCount--;
+            // Only the user's latest send frees the slot
+            if (this.lastSent[slot] === time) {
+                this.slots.delete(this.slotUsers[slot]);
+                this.release(slot);
+            }
+        }
+    }
 
-const userThrottles = new Map<string, ThrottleState>();
+    private pushSend(slot: number, offset: number): void {
+        if (this.sendCount === this.sendSlots.length) {
+            // Unwrap into arrays twice the size
+            const size = this.sendSlots.length * 2;
+            const slots = new Uint32Array(size);
+            const times = new Uint32Array(size);
+            for (let i = 0; i < this.sendCount; i++) {
+                const j = (this.sendHead + i) % this.sendSlots.length;
+                slots[i] = this.sendSlots[j];
+                times[i] = this.sendTimes[j];
+            }
+            this.sendSlots = slots;
+            this.sendTimes = times;
+            this.sendHead = 0;
+        }
+        const tail = (this.sendHead + this.sendCount) % this.sendSlots.length;
+        this.sendSlots[tail] = slot;
+        this.sendTimes[tail] = offset;
+        this.sendCount++;
+    }
+
+    private allocate(): number {
+        const slot = this.freeSlots.pop() ?? this.nextSlot++;
+        if (slot >= this.capacity) this.grow(this.capacity * 2);
+        return slot;
+    }
+
+    private release(slot: number): void {
+        this.lastSent[slot] = 0;
+        this.ringHead[slot] = 0;
+        this.hashes.fill(0, slot * this.ringSize, (slot + 1) * this.ringSize);
+        this.times.fill(0, slot * this.ringSize, (slot + 1) * this.ringSize);
+        this.slotUsers[slot] = '';
+        this.freeSlots.push(slot);
+    }
 
-function getState(userId: string): ThrottleState {
-    if (!userThrottles.has(userId)) {
-        userThrottles.set(userId, {
-            lastSentAt: 0,
-            recentMessages: new Map(),
-        });
+    private grow(capacity: number): void {
+        const resize = <T extends Uint32Array | Uint8Array>(old: T, size: number, make: (n: number) => T): T => {
+            const next = make(size);
+            next.set(old);
+            return next;
+        };
+        this.lastSent = resize(this.lastSent, capacity, n => new Uint32Array(n));
+        this.ringHead = resize(this.ringHead, capacity, n => new Uint8Array(n));
+        this.hashes = resize(this.hashes, capacity * this.ringSize, n => new Uint32Array(n));
+        this.times = resize(this.times, capacity * this.ringSize, n => new Uint32Array(n));
+        this.capacity = capacity;
+    }
+
+    /**
+     * Time as a uint32 offset (> 0). If the clock moved backwards or the
+     * offset would overflow (~49 days), the store is reset — all state is
+     * at most a minute old and would be evicted anyway.
+     */
+    private toOffset(now: number): number {
+        if (this.epoch === 0 || now <= this.epoch || now - this.epoch >= 0xFFFF0000) {
+            this.reset(now - IDLE_EVICT_MS - 1);
+        }
+        return now - this.epoch;
+    }
+
+    private reset(epoch: number): void {
+        this.epoch = epoch;
+        this.slots.clear();
+        this.slotUsers = [];
+        this.freeSlots = [];
+        this.nextSlot = 0;
+        this.sendHead = 0;
+        this.sendCount = 0;
+        this.lastSent.fill(0);
+        this.ringHead.fill(0);
+        this.hashes.fill(0);
+        this.times.fill(0);
     }
-    return userThrottles.get(userId)!;
 }
 
-function simpleHash(str: string): string {
+const store = new ThrottleStore(RING_SIZE);
+
+function simpleHash(str: string): number {
     // Quick hash for dedup — not cryptographic
     let hash = 0;
     for (let i = 0; i < str.length; i++) {
@@ -48,7 +206,7 @@ function simpleHash(str: string): string {
         hash = ((hash << 5) - hash) + char;
         hash = hash & hash;
     }
-    return String(Math.abs(hash));
+    return Math.abs(hash);
 }
 
 // ============================================================================
@@ -64,19 +222,17 @@ export function shouldSendMessage(
     userId: string,
     messageText: string
 ): number {
-    const state = getState(userId);
     const now = Date.now();
 
     // 1. Deduplication: check for identical recent messages
     const msgHash = simpleHash(messageText.substring(0, 200));
-    const lastSent = state.recentMessages.get(msgHash);
-    if (lastSent && now - lastSent < DEDUP_WINDOW_MS) {
+    if (store.sinceSent(userId, msgHash, now) < DEDUP_WINDOW_MS) {
         logger.debug('[Throttle] Duplicate message suppressed', { userId, hash: msgHash });
         return -1; // Drop
     }
 
     // 2. Rate limiting: enforce minimum interval
-    const elapsed = now - state.lastSentAt;
+    const elapsed = store.sinceLastSent(userId, now);
     if (elapsed < MIN_INTERVAL_MS) {
         const delay = MIN_INTERVAL_MS - elapsed;
         logger.debug('[Throttle] Rate limiting applied', { userId, delay });
@@ -90,21 +246,8 @@ export function shouldSendMessage(
  * Record that a message was sent (call AFTER actually sending).
  */
 export function recordMessageSent(userId: string, messageText: string): void {
-    const state = getState(userId);
-    const now = Date.now();
-
-    state.lastSentAt = now;
-
-    const msgHash = simpleHash(messageText.substring(0, 200));
-    state.recentMessages.set(msgHash, now);
-
-    // Cleanup old entries (prevent memory leak)
-    if (state.recentMessages.size > 50) {
-        const cutoff = now - DEDUP_WINDOW_MS;
-        for (const [hash, ts] of state.recentMessages.entries()) {
-            if (ts < cutoff) state.recentMessages.delete(hash);
-        }
-    }
+    // Overwrites the oldest ring entry; idle users are evicted as a side effect
+    store.record(userId, simpleHash(messageText.substring(0, 200)), Date.now());
 }
 
 /**
@@ -136,10 +279,10 @@ export async function throttledSend(
 // ============================================================================
 
 export function cleanupThrottleState(): void {
-    const cutoff = Date.now() - 60000; // Remove users inactive for 1 min
-    for (const [userId, state] of userThrottles.entries()) {
-        if (state.lastSentAt < cutoff) {
-            userThrottles.delete(userId);
-        }
-    }
+    // Remove users inactive for 1 min (oldest first, stops at the first active user)
+    store.evictIdle(Date.now());
+}
+
+export function getThrottleStats(): { users: number; bytes: number; ringSize: number } {
+    return { users: store.users, bytes: store.bytes, ringSize: RING_SIZE };
 }
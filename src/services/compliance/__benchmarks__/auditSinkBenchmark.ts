@@ -0,0 +1,82 @@
+/**
+ * Audit Sink Benchmark
+ *
+ * Entries per second written to Postgres: one awaited INSERT per entry (the
+ * previous auditLog() behaviour) vs. the buffered AuditSink (spill file +
+ * multi-row INSERTs). Writes to a scratch table that is dropped afterwards,
+ * never to the WORM-protected audit_log.
+ *
+ * Usage: DATABASE_URL=postgres://localhost:5432/postgres LOG_LEVEL=warn \
+ *   ts-node -r tsconfig-paths/register src/services/compliance/__benchmarks__/auditSinkBenchmark.ts [entries]
+ */
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { randomUUID } from 'crypto';
+import { getDb, closePool } from '@core/database';
+import { AuditSink, AuditRow } from '../auditSink';
+
+const ENTRIES = Number(process.argv[2] || 10_000);
+const TABLE = 'audit_log_benchmark';
+const COLUMNS = [
+  'id', 'action', 'entity_type', 'entity_id', 'user_id',
+  'merchant_id', 'changes', 'metadata', 'ip', 'created_at',
+];
+
+function buildRow(i: number): AuditRow {
+  return [
+    randomUUID(),
+    'order.status_changed',
+    'order',
+    `order-${i}`,
+    'user-1',
+    'merchant-1',
+    JSON.stringify({ status: { before: 'pending', after: 'confirmed' } }),
+    JSON.stringify({ source: 'benchmark' }),
+    '127.0.0.1',
+    new Date().toISOString(),
+  ];
+}
+
+function report(label: string, startNs: bigint): void {
+  const seconds = Number(process.hrtime.bigint() - startNs) / 1e9;
+  console.log(`${label.padEnd(24)} ${seconds.toFixed(2).padStart(8)}s ${Math.round(ENTRIES / seconds).toLocaleString().padStart(10)} entries/s`);
+}
+
+async function run(): Promise<void> {
+  const pool = getDb();
+  await pool.query(`DROP TABLE IF EXISTS ${TABLE}`);
+  await pool.query(`CREATE TABLE ${TABLE} (
+    id UUID PRIMARY KEY, action TEXT NOT NULL, entity_type TEXT NOT NULL, entity_id TEXT NOT NULL,
+    user_id TEXT NOT NULL, merchant_id TEXT NOT NULL, changes JSONB, metadata JSONB, ip TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+  )`);
+
+  console.log(`Audit sink benchmark: ${ENTRIES} entries`);
+  try {
+    let start = process.hrtime.bigint();
+    const insert = `INSERT INTO ${TABLE} (${COLUMNS.join(', ')}) VALUES (${COLUMNS.map((_, i) => `$${i + 1}`).join(', ')})`;
+    for (let i = 0; i < ENTRIES; i++) await pool.query(insert, buildRow(i));
+    report('inline INSERT', start);
+
+    const spillDir = fs.mkdtempSync(path.join(os.tmpdir(), 'audit-bench-'));
+    const sink = new AuditSink({ name: 'benchmark', table: TABLE, columns: COLUMNS, spillDir });
+    start = process.hrtime.bigint();
+    for (let i = 0; i < ENTRIES; i++) await sink.enqueue(buildRow(i));
+    await sink.close();
+    report('buffered sink', start);
+    fs.rmSync(spillDir, { recursive: true, force: true });
+
+    const { rows } = await pool.query(`SELECT count(*)::int AS n FROM ${TABLE}`);
+    console.log(`rows written: ${rows[0].n} (expected ${ENTRIES * 2})`);
+  } finally {
+    await pool.query(`DROP TABLE IF EXISTS ${TABLE}`);
+    await closePool();
+  }
+}
+
+run().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,185 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+jest.mock('@utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+jest.mock('@core/database', () => ({ getDb: jest.fn() }));
+
+import { AuditSink, AuditRow } from '../auditSink';
+
+describe('AuditSink', () => {
+  let spillDir: string;
+  let written: AuditRow[][];
+  let sinks: AuditSink[];
+
+  const makeSink = (options: Partial<ConstructorParameters<typeof AuditSink>[0]> = {}) => {
+    const sink = new AuditSink({
+      name: 'test_audit',
+      table: 'test_audit',
+      columns: ['id', 'value'],
+      maxBatch: 3,
+      flushIntervalMs: 10,
+      spillDir,
+      writeBatch: async (rows) => { written.push(rows); },
+      ...options,
+    });
+    sinks.push(sink);
+    return sink;
+  };
+
+  const segments = () => fs.readdirSync(spillDir).filter(f => f.endsWith('.ndjson'));
+
+  beforeEach(() => {
+    spillDir = fs.mkdtempSync(path.join(os.tmpdir(), 'audit-sink-'));
+    written = [];
+    sinks = [];
+  });
+
+  afterEach(async () => {
+    for (const sink of sinks) await sink.close();
+    fs.rmSync(spillDir, { recursive: true, force: true });
+  });
+
+  it('writes full batches as one multi-row write', async () => {
+    const sink = makeSink();
+    for (let i = 0; i < 7; i++) await sink.enqueue([`id-${i}`, i]);
+    await sink.flush();
+
+    expect(written.map(batch => batch.length)).toEqual([3, 3, 1]);
+    expect(written.flat().map(row => row[0])).toEqual(['id-0', 'id-1', 'id-2', 'id-3', 'id-4', 'id-5', 'id-6']);
+  });
+
+  it('flushes on the interval', async () => {
+    const sink = makeSink({ maxBatch: 100 });
+    await sink.enqueue(['a', 1]);
+    expect(written).toHaveLength(0);
+
+    await new Promise(resolve => setTimeout(resolve, 50));
+    expect(written).toEqual([[['a', 1]]]);
+    expect(sink.getStats().queued).toBe(0);
+  });
+
+  it('waits for the database in sync mode', async () => {
+    const sink = makeSink({ maxBatch: 100, flushIntervalMs: 60_000 });
+    await sink.enqueue(['a', 1]);
+    await sink.enqueue(['b', 2], { sync: true });
+
+    expect(written).toEqual([[['a', 1], ['b', 2]]]);
+  });
+
+  it('fsyncs the spill before acknowledging a sync entry', async () => {
+    const fsync = jest.spyOn(fs, 'fsyncSync');
+    try {
+      const sink = makeSink({ maxBatch: 100, flushIntervalMs: 60_000 });
+      await sink.enqueue(['a', 1]);
+      expect(fsync).not.toHaveBeenCalled();
+
+      await sink.enqueue(['b', 2], { sync: true });
+      // Segment file, then its directory entry
+      expect(fsync).toHaveBeenCalledTimes(2);
+    } finally {
+      fsync.mockRestore();
+    }
+  });
+
+  it('requires AUDIT_SPILL_DIR in production', () => {
+    const env = { NODE_ENV: process.env.NODE_ENV, AUDIT_SPILL_DIR: process.env.AUDIT_SPILL_DIR };
+    process.env.NODE_ENV = 'production';
+    delete process.env.AUDIT_SPILL_DIR;
+    try {
+      expect(() => makeSink({ spillDir: undefined })).toThrow('AUDIT_SPILL_DIR');
+      process.env.AUDIT_SPILL_DIR = spillDir;
+      expect(() => makeSink({ spillDir: undefined })).not.toThrow();
+    } finally {
+      for (const [key, value] of Object.entries(env)) {
+        if (value === undefined) delete process.env[key];
+        else process.env[key] = value;
+      }
+    }
+  });
+
+  it('spills entries and removes segments once written', async () => {
+    const sink = makeSink({ maxBatch: 100, flushIntervalMs: 60_000 });
+    await sink.enqueue(['a', 1]);
+
+    const [segment] = segments();
+    expect(fs.readFileSync(path.join(spillDir, segment), 'utf8')).toBe('["a",1]\n');
+
+    await sink.flush();
+    expect(segments()).toHaveLength(0);
+  });
+
+  it('keeps rows and segments when a write fails, and retries', async () => {
+    let fail = true;
+    const sink = makeSink({
+      maxBatch: 100,
+      flushIntervalMs: 60_000,
+      writeBatch: async (rows) => {
+        if (fail) throw new Error('connection refused');
+        written.push(rows);
+      },
+    });
+    await sink.enqueue(['a', 1]);
+
+    expect(await sink.flush()).toBe(false);
+    expect(sink.getStats()).toMatchObject({ queued: 1, failures: 1 });
+    expect(segments()).toHaveLength(1);
+
+    fail = false;
+    expect(await sink.flush()).toBe(true);
+    expect(written).toEqual([[['a', 1]]]);
+    expect(segments()).toHaveLength(0);
+  });
+
+  it('replays segments left behind by a dead process', async () => {
+    // PID 2^22 + 1 is above Linux pid_max, so it is never alive
+    fs.writeFileSync(path.join(spillDir, 'test_audit-4194305-deadbeef-1.ndjson'), '["x",1]\n["y",2]\n["z",');
+
+    const sink = makeSink({ flushIntervalMs: 60_000 });
+    expect(sink.getStats()).toMatchObject({ replayed: 2, queued: 2 });
+
+    await sink.flush();
+    expect(written.flat()).toEqual([['x', 1], ['y', 2]]);
+    expect(segments()).toHaveLength(0);
+  });
+
+  it('spills to an overflow segment instead of blocking when the ring is full', async () => {
+    let fail = true;
+    const sink = makeSink({
+      capacity: 2,
+      maxBatch: 100,
+      flushIntervalMs: 60_000,
+      writeBatch: async (rows) => {
+        if (fail) throw new Error('connection refused');
+        written.push(rows);
+      },
+    });
+    await sink.enqueue(['a', 1]);
+    await sink.enqueue(['b', 2]);
+    expect(await sink.flush()).toBe(false);
+
+    await sink.enqueue(['c', 3]);
+    await sink.enqueue(['d', 4]);
+    expect(sink.getStats()).toMatchObject({ queued: 2, overflowed: 2, overflowing: true });
+    expect(segments()).toHaveLength(2);
+
+    fail = false;
+    expect(await sink.flush()).toBe(true);
+    expect(await sink.flush()).toBe(true);
+    expect(written.flat().map(row => row[0])).toEqual(['a', 'b', 'c', 'd']);
+    expect(segments()).toHaveLength(0);
+  });
+
+  it('rejects instead of blocking when the ring is full and there is no spill', async () => {
+    const sink = makeSink({
+      capacity: 1,
+      flushIntervalMs: 60_000,
+      spillDir: null,
+      writeBatch: async () => { throw new Error('connection refused'); },
+    });
+    await sink.enqueue(['a', 1]);
+
+    await expect(sink.enqueue(['b', 2])).rejects.toThrow('is full');
+    expect(sink.getStats()).toMatchObject({ queued: 1 });
+  });
+});
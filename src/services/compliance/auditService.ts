@@ -61,6 +61,28 @@ export interface AuditEntry {
 // ---------------------------------------------------------------------------
 import { db } from '@core/database';
 import { randomUUID } from 'crypto';
+import { AuditSink } from './auditSink';
+
+/**
+ * Actions that must be in the database before the caller continues (GoBD).
+ * Everything else is written in batches by the sink.
+ */
+const SYNC_ACTIONS = new Set<AuditAction>([
+  'invoice.created',
+  'invoice.cancelled',
+  'gdpr.data_exported',
+  'gdpr.data_deleted',
+  'gdpr.consent_recorded',
+]);
+
+const auditSink = new AuditSink({
+  name: 'audit_log',
+  table: 'audit_log',
+  columns: [
+    'id', 'action', 'entity_type', 'entity_id', 'user_id',
+    'merchant_id', 'changes', 'metadata', 'ip', 'created_at',
+  ],
+});
 
 // ---------------------------------------------------------------------------
 // Audit Service
@@ -69,6 +91,9 @@ import { randomUUID } from 'crypto';
 /**
  * Record an audit entry. This is append-only (WORM semantics).
  * Entries should never be updated or deleted.
+ *
+ * Entries are spilled to local disk and written in batches; GoBD-critical
+ * actions (or `options.sync`) wait until the entry is in the database.
  */
 export async function auditLog(
   action: AuditAction,
@@ -80,9 +105,11 @@ export async function auditLog(
     changes?: Record<string, { before: unknown; after: unknown }>;
     metadata?: Record<string, unknown>;
     ip?: string;
+    sync?: boolean;
   }
 ): Promise<void> {
   const entry: AuditEntry = {
+    id: randomUUID(),
     action,
     entityType,
     entityId,
@@ -95,23 +122,20 @@ export async function auditLog(
   };
 
   try {
-    await db.run(
-        `INSERT INTO audit_log (
-            id, action, entity_type, entity_id, user_id, 
-            merchant_id, changes, metadata, ip, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-        [
-            randomUUID(),
-            entry.action,
-            entry.entityType,
-            entry.entityId,
-            entry.userId,
-            entry.merchantId,
-            entry.changes ? JSON.stringify(entry.changes) : null,
-            entry.metadata ? JSON.stringify(entry.metadata) : null,
-            entry.ip || null,
-            entry.timestamp
-        ]
+    await auditSink.enqueue(
+      [
+        entry.id,
+        entry.action,
+        entry.entityType,
+        entry.entityId,
+        entry.userId,
+        entry.merchantId,
+        entry.changes ? JSON.stringify(entry.changes) : null,
+        entry.metadata ? JSON.stringify(entry.metadata) : null,
+        entry.ip || null,
+        entry.timestamp,
+      ],
+      { sync: options?.sync ?? SYNC_ACTIONS.has(action) }
     );
 
     logger.info('[Audit] Entry recorded', {
@@ -133,6 +157,13 @@ export async function auditLog(
   }
 }
 
+/**
+ * Buffered audit writer statistics (entries queued, flushed, replayed, ...)
+ */
+export function getAuditSinkStats() {
+  return auditSink.getStats();
+}
+
 /**
  * Query audit entries (admin only).
  */
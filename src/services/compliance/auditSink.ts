@@ -0,0 +1,489 @@
+/**
+ * Buffered Audit Sink
+ *
+ * Append-only writer for audit tables. Instead of one awaited INSERT per
+ * event, entries go into an in-memory ring and are written as multi-row
+ * INSERTs when the batch is full or the flush interval elapses.
+ *
+ * Durability:
+ * - every entry is appended to a local spill segment (NDJSON) before it is
+ *   acknowledged; a segment is deleted only after all its rows are in the
+ *   database
+ * - on startup, segments left behind by a crashed process are replayed
+ * - rows carry their primary key and are inserted with ON CONFLICT (id)
+ *   DO NOTHING, so a replay never duplicates entries
+ * - `sync: true` waits until the entry is in the database (GoBD-critical
+ *   actions such as invoice creation); its spill write is fsynced first,
+ *   so it survives a power loss even if that flush fails
+ * - the spill directory (AUDIT_SPILL_DIR) must outlive the process: in
+ *   production it is required, and docker-compose / the Helm chart mount a
+ *   volume there
+ *
+ * When the ring is full (Postgres down or too slow), entries are not held in
+ * memory: they go, fsynced, to an overflow segment only and are loaded into
+ * the ring after the next successful flush. Without a spill directory a full
+ * ring rejects the entry, so callers never wait on the database.
+ */
+
+import * as fs from 'fs';
+import * as path from 'path';
+import { randomBytes } from 'crypto';
+import { logger } from '@utils/logger';
+import { getDb } from '@core/database';
+
+// ---------------------------------------------------------------------------
+// Configuration
+// ---------------------------------------------------------------------------
+
+const DEFAULT_MAX_BATCH = Number(process.env.AUDIT_MAX_BATCH || 500);
+const DEFAULT_FLUSH_INTERVAL_MS = Number(process.env.AUDIT_FLUSH_INTERVAL_MS || 250);
+const DEFAULT_CAPACITY = Number(process.env.AUDIT_BUFFER_CAPACITY || 10_000);
+const DEV_SPILL_DIR = path.join(process.cwd(), 'data', 'audit-spill');
+const MAX_RETRY_DELAY_MS = 30_000;
+
+/** Identifies this process' segments, so a restarted process with a reused PID still replays */
+const INSTANCE_ID = randomBytes(4).toString('hex');
+
+export type AuditRow = unknown[];
+
+export interface AuditSinkOptions {
+  /** Used for spill file names and log lines */
+  name: string;
+  table: string;
+  /** Column order of every row; must include the primary key `id` */
+  columns: string[];
+  maxBatch?: number;
+  flushIntervalMs?: number;
+  capacity?: number;
+  /** Directory for spill segments; null disables spilling */
+  spillDir?: string | null;
+  /** Writes one batch; defaults to a multi-row INSERT on the Postgres pool */
+  writeBatch?: (rows: AuditRow[]) => Promise<void>;
+}
+
+/**
+ * Multi-row INSERT of `rows` into `table`, ignoring rows whose id exists
+ */
+export function postgresBatchWriter(table: string, columns: string[]): (rows: AuditRow[]) => Promise<void> {
+  const head = `INSERT INTO ${table} (${columns.join(', ')}) VALUES `;
+  return async (rows) => {
+    const params: unknown[] = [];
+    const tuples = rows.map(row => `(${row.map(value => {
+      params.push(value);
+      return `$${params.length}`;
+    }).join(', ')})`);
+    await getDb().query(`${head}${tuples.join(', ')} ON CONFLICT (id) DO NOTHING`, params);
+  };
+}
+
+/**
+ * AUDIT_SPILL_DIR, or ./data/audit-spill outside production. A spill inside
+ * the container filesystem is gone after a redeploy, so production refuses
+ * to start without an explicit (mounted) directory.
+ */
+function defaultSpillDir(): string {
+  if (process.env.AUDIT_SPILL_DIR) return process.env.AUDIT_SPILL_DIR;
+  if (process.env.NODE_ENV === 'production') {
+    throw new Error('AUDIT_SPILL_DIR must be set in production (a persistent volume for the audit spill)');
+  }
+  return DEV_SPILL_DIR;
+}
+
+const sinks = new Set<AuditSink>();
+
+// ---------------------------------------------------------------------------
+// Sink
+// ---------------------------------------------------------------------------
+
+export class AuditSink {
+  private readonly name: string;
+  private readonly maxBatch: number;
+  private readonly flushIntervalMs: number;
+  private capacity: number;
+  private readonly spillDir: string | null;
+  private readonly writeBatch: (rows: AuditRow[]) => Promise<void>;
+
+  /** Ring buffer of pending rows */
+  private ring: Array<AuditRow | undefined>;
+  private head = 0;
+  private size = 0;
+
+  /** Sequence numbers: rows enqueued / rows confirmed in the database */
+  private enqueuedSeq = 0;
+  private flushedSeq = 0;
+
+  private segmentFd: number | null = null;
+  private segmentPath: string | null = null;
+  private segmentCounter = 0;
+  /** Whether the current segment's directory entry has been fsynced */
+  private segmentDirSynced = false;
+  /** Closed segments whose rows are not all confirmed yet: [path, last seq] */
+  private pendingSegments: Array<[string, number]> = [];
+  /** Segment holding rows that did not fit into the ring; while open, every new row goes there */
+  private overflowFd: number | null = null;
+  private overflowPath: string | null = null;
+
+  private flushing: Promise<boolean> | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private consecutiveFailures = 0;
+  private readonly stats = { enqueued: 0, flushed: 0, batches: 0, failures: 0, replayed: 0, spillErrors: 0, overflowed: 0 };
+
+  constructor(options: AuditSinkOptions) {
+    this.name = options.name;
+    this.maxBatch = options.maxBatch ?? DEFAULT_MAX_BATCH;
+    this.flushIntervalMs = options.flushIntervalMs ?? DEFAULT_FLUSH_INTERVAL_MS;
+    this.capacity = options.capacity ?? DEFAULT_CAPACITY;
+    this.spillDir = options.spillDir === undefined ? defaultSpillDir() : options.spillDir;
+    this.writeBatch = options.writeBatch ?? postgresBatchWriter(options.table, options.columns);
+    this.ring = new Array(this.capacity);
+
+    this.replaySpill();
+    sinks.add(this);
+  }
+
+  /**
+   * Queue one row. Resolves once the row is spilled locally, or - with
+   * `sync` - once it is in the database. A failed sync flush is logged and
+   * the row stays queued (and spilled) for retry. With a full ring the row
+   * is only written to the overflow segment; rejects if that is impossible
+   * (no spill directory, or the write failed).
+   */
+  async enqueue(row: AuditRow, options: { sync?: boolean } = {}): Promise<void> {
+    // Once overflowing, later rows follow into the overflow segment to keep their order
+    if (this.size >= this.capacity || this.overflowFd !== null) {
+      this.overflow(row);
+      if (options.sync) {
+        logger.error(`[AuditSink:${this.name}] CRITICAL: buffer full, synchronous entry kept in spill for retry`);
+      }
+      return;
+    }
+
+    this.spill(row, options.sync === true);
+    this.push(row);
+    const seq = ++this.enqueuedSeq;
+    this.stats.enqueued++;
+
+    if (this.size >= this.maxBatch) {
+      void this.flush();
+    } else {
+      this.schedule(this.flushIntervalMs);
+    }
+
+    if (options.sync) {
+      while (this.flushedSeq < seq) {
+        if (!(await this.flush())) {
+          logger.error(`[AuditSink:${this.name}] CRITICAL: synchronous flush failed, entry kept in spill for retry`, { seq });
+          return;
+        }
+      }
+    }
+  }
+
+  /**
+   * Write everything queued so far. Returns false if a batch failed
+   * (the rows stay queued and a retry is scheduled).
+   */
+  async flush(): Promise<boolean> {
+    while (this.flushing) await this.flushing;
+    if (this.size === 0) return true;
+
+    this.flushing = this.drain();
+    try {
+      return await this.flushing;
+    } finally {
+      this.flushing = null;
+    }
+  }
+
+  /**
+   * Flush and release the spill segment (shutdown)
+   */
+  async close(): Promise<boolean> {
+    // A successful flush may load overflow rows into the ring
+    let ok = await this.flush();
+    while (ok && this.size > 0) ok = await this.flush();
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = null;
+    if (ok) this.rotateSegment();
+    // Left on disk for the next process to replay
+    this.closeOverflow();
+    this.releaseSegments();
+    sinks.delete(this);
+    return ok;
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      name: this.name,
+      queued: this.size,
+      pendingSegments: this.pendingSegments.length,
+      overflowing: this.overflowFd !== null,
+    };
+  }
+
+  // -------------------------------------------------------------------------
+  // Ring
+  // -------------------------------------------------------------------------
+
+  private push(row: AuditRow): void {
+    this.ring[(this.head + this.size) % this.capacity] = row;
+    this.size++;
+  }
+
+  private peek(count: number): AuditRow[] {
+    const rows: AuditRow[] = [];
+    for (let i = 0; i < count; i++) rows.push(this.ring[(this.head + i) % this.capacity]!);
+    return rows;
+  }
+
+  private drop(count: number): void {
+    for (let i = 0; i < count; i++) this.ring[(this.head + i) % this.capacity] = undefined;
+    this.head = (this.head + count) % this.capacity;
+    this.size -= count;
+  }
+
+  // -------------------------------------------------------------------------
+  // Flushing
+  // -------------------------------------------------------------------------
+
+  private schedule(delayMs: number): void {
+    if (this.timer) return;
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      void this.flush();
+    }, delayMs);
+    this.timer.unref();
+  }
+
+  private retryDelay(): number {
+    return Math.min(MAX_RETRY_DELAY_MS, this.flushIntervalMs * 2 ** this.consecutiveFailures);
+  }
+
+  private async drain(): Promise<boolean> {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    // Rows arriving while we write go to a fresh segment
+    this.rotateSegment();
+
+    let remaining = this.size;
+    while (remaining > 0) {
+      const count = Math.min(remaining, this.maxBatch);
+      const rows = this.peek(count);
+      try {
+        await this.writeBatch(rows);
+      } catch (err: any) {
+        this.stats.failures++;
+        this.consecutiveFailures++;
+        const retryMs = this.retryDelay();
+        logger.error(`[AuditSink:${this.name}] CRITICAL: batch write failed, retrying`, {
+          error: err?.message,
+          rows: count,
+          queued: this.size,
+          retryMs,
+        });
+        this.schedule(retryMs);
+        return false;
+      }
+      this.drop(count);
+      this.flushedSeq += count;
+      remaining -= count;
+      this.consecutiveFailures = 0;
+      this.stats.batches++;
+      this.stats.flushed += count;
+    }
+
+    this.releaseSegments();
+    this.loadOverflow();
+    if (this.size > 0) this.schedule(this.flushIntervalMs);
+    return true;
+  }
+
+  // -------------------------------------------------------------------------
+  // Spill segments
+  // -------------------------------------------------------------------------
+
+  /** Append `row` to the current segment; `durable` fsyncs it (and a new segment's directory entry) */
+  private spill(row: AuditRow, durable: boolean): void {
+    if (!this.spillDir) return;
+    try {
+      if (this.segmentFd === null) {
+        fs.mkdirSync(this.spillDir, { recursive: true });
+        this.segmentPath = path.join(
+          this.spillDir,
+          `${this.name}-${process.pid}-${INSTANCE_ID}-${++this.segmentCounter}.ndjson`
+        );
+        this.segmentFd = fs.openSync(this.segmentPath, 'a');
+        this.segmentDirSynced = false;
+      }
+      fs.writeSync(this.segmentFd, JSON.stringify(row) + '\n');
+      if (durable) {
+        fs.fsyncSync(this.segmentFd);
+        if (!this.segmentDirSynced) {
+          const dirFd = fs.openSync(this.spillDir, 'r');
+          try {
+            fs.fsyncSync(dirFd);
+          } finally {
+            fs.closeSync(dirFd);
+          }
+          this.segmentDirSynced = true;
+        }
+      }
+    } catch (err: any) {
+      this.stats.spillErrors++;
+      logger.error(`[AuditSink:${this.name}] Spill write failed, entry is memory-only until flushed`, { error: err?.message });
+    }
+  }
+
+  /**
+   * Append `row` to the overflow segment only (it is not in the ring, so
+   * the file is its single copy and is always fsynced). Throws if the row
+   * cannot be kept.
+   */
+  private overflow(row: AuditRow): void {
+    if (!this.spillDir) {
+      throw new Error(`Audit buffer ${this.name} is full and has no spill directory`);
+    }
+    try {
+      if (this.overflowFd === null) {
+        fs.mkdirSync(this.spillDir, { recursive: true });
+        this.overflowPath = path.join(
+          this.spillDir,
+          `${this.name}-${process.pid}-${INSTANCE_ID}-${++this.segmentCounter}.ndjson`
+        );
+        this.overflowFd = fs.openSync(this.overflowPath, 'a');
+        const dirFd = fs.openSync(this.spillDir, 'r');
+        try {
+          fs.fsyncSync(dirFd);
+        } finally {
+          fs.closeSync(dirFd);
+        }
+        logger.warn(`[AuditSink:${this.name}] Buffer full, spilling new entries to overflow segment`, {
+          file: this.overflowPath,
+          queued: this.size,
+        });
+      }
+      fs.writeSync(this.overflowFd, JSON.stringify(row) + '\n');
+      fs.fsyncSync(this.overflowFd);
+    } catch (err: any) {
+      this.stats.spillErrors++;
+      throw new Error(`Audit buffer ${this.name} is full and the overflow write failed: ${err?.message}`);
+    }
+    this.stats.overflowed++;
+    this.schedule(this.retryDelay());
+  }
+
+  /** Move the overflow segment's rows into the ring (after a successful flush) */
+  private loadOverflow(): void {
+    if (this.overflowFd === null) return;
+    const file = this.overflowPath!;
+    this.closeOverflow();
+    this.loadSegment(file);
+  }
+
+  private closeOverflow(): void {
+    if (this.overflowFd === null) return;
+    try {
+      fs.closeSync(this.overflowFd);
+    } catch {
+      // already closed
+    }
+    this.overflowFd = null;
+    this.overflowPath = null;
+  }
+
+  private rotateSegment(): void {
+    if (this.segmentFd === null) return;
+    try {
+      fs.closeSync(this.segmentFd);
+    } catch {
+      // already closed
+    }
+    this.pendingSegments.push([this.segmentPath!, this.enqueuedSeq]);
+    this.segmentFd = null;
+    this.segmentPath = null;
+  }
+
+  /** Delete closed segments whose rows are all confirmed */
+  private releaseSegments(): void {
+    while (this.pendingSegments.length > 0 && this.pendingSegments[0][1] <= this.flushedSeq) {
+      const [file] = this.pendingSegments.shift()!;
+      try {
+        fs.rmSync(file, { force: true });
+      } catch (err: any) {
+        logger.warn(`[AuditSink:${this.name}] Could not remove spill segment`, { file, error: err?.message });
+      }
+    }
+  }
+
+  /**
+   * Queue rows from segments of processes that are gone. Their files stay
+   * until the rows are flushed, so a crash during replay loses nothing.
+   */
+  private replaySpill(): void {
+    if (!this.spillDir || !fs.existsSync(this.spillDir)) return;
+
+    const pattern = new RegExp(`^${this.name}-(\\d+)-([0-9a-f]+)-\\d+\\.ndjson$`);
+    for (const file of fs.readdirSync(this.spillDir).sort()) {
+      const match = file.match(pattern);
+      if (!match) continue;
+      const pid = Number(match[1]);
+      if (pid !== process.pid && isProcessAlive(pid)) continue;
+      if (pid === process.pid && match[2] === INSTANCE_ID) continue;
+
+      const replayed = this.loadSegment(path.join(this.spillDir, file));
+      this.stats.replayed += replayed;
+      logger.warn(`[AuditSink:${this.name}] Replaying spilled audit entries`, { file, entries: replayed });
+    }
+    if (this.size > 0) this.schedule(0);
+  }
+
+  /**
+   * Queue the rows of a closed segment; the file is deleted once they are
+   * flushed. Returns the number of rows read.
+   */
+  private loadSegment(file: string): number {
+    let loaded = 0;
+    for (const line of fs.readFileSync(file, 'utf8').split('\n')) {
+      if (!line) continue;
+      try {
+        this.push(JSON.parse(line));
+        // Replay may exceed the ring capacity - grow instead of dropping
+        if (this.size === this.capacity) this.grow();
+        this.enqueuedSeq++;
+        loaded++;
+      } catch {
+        // Torn last line from a crash mid-write
+        logger.warn(`[AuditSink:${this.name}] Skipping unreadable spill line`, { file });
+      }
+    }
+    this.pendingSegments.push([file, this.enqueuedSeq]);
+    return loaded;
+  }
+
+  private grow(): void {
+    const rows = this.peek(this.size);
+    this.capacity *= 2;
+    this.ring = new Array(this.capacity);
+    rows.forEach((row, i) => { this.ring[i] = row; });
+    this.head = 0;
+  }
+}
+
+function isProcessAlive(pid: number): boolean {
+  try {
+    process.kill(pid, 0);
+    return true;
+  } catch (err: any) {
+    return err?.code === 'EPERM';
+  }
+}
+
+/**
+ * Flush and close every sink (call on graceful shutdown, before the DB pool closes)
+ */
+export async function closeAuditSinks(): Promise<void> {
+  await Promise.all(Array.from(sinks).map(sink => sink.close()));
+}
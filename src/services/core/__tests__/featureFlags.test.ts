@@ -0,0 +1,153 @@
+jest.mock('../../../utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+
+import {
+    isEnabled,
+    getAllFlags,
+    registerFlag,
+    setRolloutPercentage,
+    clearFlagOverride,
+    getFlagInfo,
+    reloadFlags,
+    getFeatureFlagStats,
+    startFeatureFlagSync,
+    stopFeatureFlagSync,
+} from '../featureFlags';
+
+/** Bucket formula of the previous implementation — rollouts must not reshuffle users. */
+function legacyBucket(key: string): number {
+    let hash = 0;
+    for (let i = 0; i < key.length; i++) {
+        hash = ((hash << 5) - hash) + key.charCodeAt(i);
+        hash = hash & hash;
+    }
+    return Math.abs(hash) % 100;
+}
+
+function fakeRedis() {
+    const handlers: Record<string, (...args: any[]) => void> = {};
+    const subscriber = {
+        on: jest.fn((event: string, fn: (...args: any[]) => void) => { handlers[event] = fn; }),
+        subscribe: jest.fn().mockResolvedValue(1),
+        quit: jest.fn().mockResolvedValue('OK'),
+    };
+    return {
+        handlers,
+        subscriber,
+        hgetall: jest.fn().mockResolvedValue({}),
+        hset: jest.fn().mockResolvedValue(1),
+        hdel: jest.fn().mockResolvedValue(1),
+        publish: jest.fn().mockResolvedValue(1),
+        duplicate: jest.fn(() => subscriber),
+    };
+}
+
+const flush = () => new Promise(resolve => setImmediate(resolve));
+
+describe('featureFlags', () => {
+    afterEach(async () => {
+        await stopFeatureFlagSync();
+        clearFlagOverride('AI_TRIPLE_LOCK');
+        delete process.env.FF_ROLLOUT_TEST;
+    });
+
+    it('keeps the previous rollout buckets', () => {
+        registerFlag({ name: 'ROLLOUT_TEST', description: 'test', defaultEnabled: false, rolloutPercentage: 50 });
+
+        for (const userId of ['+491701234567', '+491709999999', '+4915112345678', 'user-a', 'user-b']) {
+            expect(isEnabled('ROLLOUT_TEST', { userId })).toBe(legacyBucket(userId + 'ROLLOUT_TEST') < 50);
+        }
+    });
+
+    it('computes each bucket once', () => {
+        registerFlag({ name: 'ROLLOUT_TEST', description: 'test', defaultEnabled: false, rolloutPercentage: 30 });
+        const before = getFeatureFlagStats();
+
+        for (let i = 0; i < 10; i++) isEnabled('ROLLOUT_TEST', { userId: 'cached-user' });
+
+        const after = getFeatureFlagStats();
+        expect(after.bucketCacheMisses - before.bucketCacheMisses).toBe(1);
+        expect(after.bucketCacheHits - before.bucketCacheHits).toBe(9);
+    });
+
+    it('re-evaluates after a rollout change', () => {
+        registerFlag({ name: 'ROLLOUT_TEST', description: 'test', defaultEnabled: false, rolloutPercentage: 0 });
+        const version = getFeatureFlagStats().version;
+        expect(isEnabled('ROLLOUT_TEST', { userId: 'someone' })).toBe(false);
+
+        setRolloutPercentage('ROLLOUT_TEST', 150);
+
+        expect(getFeatureFlagStats().version).toBe(version + 1);
+        expect(isEnabled('ROLLOUT_TEST', { userId: 'someone' })).toBe(true);
+        expect(getAllFlags({ userId: 'someone' }).ROLLOUT_TEST).toBe(true);
+    });
+
+    it('honours targeting lists and env overrides', () => {
+        registerFlag({
+            name: 'ROLLOUT_TEST', description: 'test', defaultEnabled: false, rolloutPercentage: 0,
+            enabledMerchants: ['merchant-1'], enabledUsers: ['+4917000'],
+        });
+        expect(isEnabled('ROLLOUT_TEST', { merchantId: 'merchant-1' })).toBe(true);
+        expect(isEnabled('ROLLOUT_TEST', { userId: '+4917000' })).toBe(true);
+        expect(isEnabled('ROLLOUT_TEST', { merchantId: 'merchant-2' })).toBe(false);
+
+        process.env.FF_ROLLOUT_TEST = 'false';
+        reloadFlags();
+        expect(isEnabled('ROLLOUT_TEST', { merchantId: 'merchant-1' })).toBe(false);
+        expect(isEnabled('UNKNOWN_FLAG')).toBe(false);
+    });
+
+    it('publishes local changes and applies remote ones', async () => {
+        const redis = fakeRedis();
+        redis.hgetall.mockResolvedValueOnce({
+            ROLLOUT_TEST: JSON.stringify({ name: 'ROLLOUT_TEST', description: 'persisted', defaultEnabled: true }),
+        });
+        await startFeatureFlagSync(redis);
+
+        expect(isEnabled('ROLLOUT_TEST')).toBe(true);
+        expect(redis.subscriber.subscribe).toHaveBeenCalledWith('feature-flags:changes');
+
+        setRolloutPercentage('ROLLOUT_TEST', 20);
+        await flush();
+        expect(redis.hset).toHaveBeenCalledWith('feature-flags:state', 'ROLLOUT_TEST', expect.stringContaining('"rolloutPercentage":20'));
+        const [channel, message] = redis.publish.mock.calls[0];
+
+        // Our own message is ignored, another pod's change is applied
+        redis.handlers.message(channel, message);
+        expect(getFeatureFlagStats().remoteUpdates).toBe(0);
+        redis.handlers.message(channel, JSON.stringify({
+            origin: 'other-pod',
+            change: { type: 'register', flag: { name: 'ROLLOUT_TEST', description: 'remote', defaultEnabled: false } },
+        }));
+        expect(getFeatureFlagStats().remoteUpdates).toBe(1);
+        expect(isEnabled('ROLLOUT_TEST')).toBe(false);
+    });
+
+    it('persists only the changed fields of a built-in flag and clears them', async () => {
+        const redis = fakeRedis();
+        await startFeatureFlagSync(redis);
+
+        setRolloutPercentage('AI_TRIPLE_LOCK', 10);
+        await flush();
+        expect(redis.hset).toHaveBeenCalledWith('feature-flags:state', 'AI_TRIPLE_LOCK', '{"rolloutPercentage":10}');
+
+        clearFlagOverride('AI_TRIPLE_LOCK');
+        await flush();
+        expect(redis.hdel).toHaveBeenCalledWith('feature-flags:state', 'AI_TRIPLE_LOCK');
+        expect(getFlagInfo('AI_TRIPLE_LOCK')?.rolloutPercentage).toBe(0);
+        expect(JSON.parse(redis.publish.mock.calls[1][1]).change).toEqual({ type: 'clear', flag: 'AI_TRIPLE_LOCK' });
+    });
+
+    it('applies changes published while the stored state is read after it', async () => {
+        const redis = fakeRedis();
+        redis.hgetall.mockImplementationOnce(async () => {
+            redis.handlers.message('feature-flags:changes', JSON.stringify({
+                origin: 'other-pod',
+                change: { type: 'rollout', flag: 'AI_TRIPLE_LOCK', percentage: 40 },
+            }));
+            return { AI_TRIPLE_LOCK: '{"rolloutPercentage":10}' };
+        });
+        await startFeatureFlagSync(redis);
+
+        expect(getFlagInfo('AI_TRIPLE_LOCK')?.rolloutPercentage).toBe(40);
+    });
+});
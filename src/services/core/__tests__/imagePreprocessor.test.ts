@@ -0,0 +1,86 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import * as fs from 'fs';
+import * as path from 'path';
+import sharp from 'sharp';
+import { detectImageMimeType, findDocumentBounds, preprocessDocumentImage } from '../imagePreprocessor';
+
+const FIXTURE = path.join(__dirname, '../../../../fahrzeugschein.jpeg');
+
+/** Dark background with a bright rectangle (the "document") */
+function syntheticPhoto(width: number, height: number, doc: { left: number; top: number; width: number; height: number }): Uint8Array {
+    const gray = new Uint8Array(width * height).fill(40);
+    for (let y = doc.top; y < doc.top + doc.height; y++) {
+        for (let x = doc.left; x < doc.left + doc.width; x++) gray[y * width + x] = 220;
+    }
+    return gray;
+}
+
+describe('findDocumentBounds', () => {
+    it('should find a bright document on a dark background', () => {
+        const gray = syntheticPhoto(200, 150, { left: 40, top: 30, width: 100, height: 80 });
+        const bounds = findDocumentBounds(gray, 200, 150)!;
+
+        expect(bounds).not.toBeNull();
+        expect(bounds.left).toBeLessThanOrEqual(40);
+        expect(bounds.top).toBeLessThanOrEqual(30);
+        expect(bounds.left + bounds.width).toBeGreaterThanOrEqual(140);
+        expect(bounds.top + bounds.height).toBeGreaterThanOrEqual(110);
+        expect(bounds.width).toBeLessThan(120);
+    });
+
+    it('should not crop uniform images or tiny bright spots', () => {
+        expect(findDocumentBounds(new Uint8Array(200 * 150).fill(128), 200, 150)).toBeNull();
+        expect(findDocumentBounds(syntheticPhoto(200, 150, { left: 90, top: 70, width: 20, height: 10 }), 200, 150)).toBeNull();
+        expect(findDocumentBounds(syntheticPhoto(200, 150, { left: 2, top: 2, width: 196, height: 146 }), 200, 150)).toBeNull();
+    });
+});
+
+describe('preprocessDocumentImage', () => {
+    it('should process a photo once and serve repeats from the cache', async () => {
+        const input = fs.readFileSync(FIXTURE);
+
+        const [a, b] = await Promise.all([preprocessDocumentImage(input), preprocessDocumentImage(input)]);
+        expect(b).toBe(a);
+        expect(a.cached).toBe(false);
+        expect(a.mimeType).toBe('image/jpeg');
+        expect(a.bytes).toBeLessThanOrEqual(input.length);
+
+        const again = await preprocessDocumentImage(Buffer.from(input));
+        expect(again.cached).toBe(true);
+        expect(again.hash).toBe(a.hash);
+        expect(again.buffer).toBe(a.buffer);
+    });
+
+    it('should shrink large photos below the target size', async () => {
+        const big = await sharp(fs.readFileSync(FIXTURE)).resize(3000).jpeg({ quality: 95 }).toBuffer();
+
+        const result = await preprocessDocumentImage(big);
+        expect(result.processed).toBe(true);
+        expect(result.bytes).toBeLessThan(big.length);
+        expect(Math.max(result.width!, result.height!)).toBeLessThanOrEqual(1600);
+    });
+
+    it('should pass through bytes it cannot decode', async () => {
+        const garbage = Buffer.from('not an image');
+        const result = await preprocessDocumentImage(garbage);
+        expect(result.buffer).toBe(garbage);
+        expect(result.processed).toBe(false);
+    });
+
+    it('should keep the original type of images it passes through', async () => {
+        const png = await sharp({ create: { width: 32, height: 32, channels: 3, background: '#fff' } }).png().toBuffer();
+        const webp = await sharp(png).webp().toBuffer();
+        expect(detectImageMimeType(png)).toBe('image/png');
+        expect(detectImageMimeType(webp)).toBe('image/webp');
+        expect(detectImageMimeType(fs.readFileSync(FIXTURE))).toBe('image/jpeg');
+
+        // Tiny and already compressed: nothing to gain, original bytes are kept
+        const result = await preprocessDocumentImage(png);
+        expect(result.processed).toBe(false);
+        expect(result.buffer).toBe(png);
+        expect(result.mimeType).toBe('image/png');
+    });
+});
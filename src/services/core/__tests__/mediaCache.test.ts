@@ -0,0 +1,74 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+const CACHE_DIR = fs.mkdtempSync(path.join(os.tmpdir(), 'media-cache-test-'));
+process.env.MEDIA_CACHE_DIR = CACHE_DIR;
+process.env.MEDIA_CACHE_MAX_BYTES = '1000';
+
+// Loaded after the env is set: the cache reads its configuration at import
+const { getOrDownloadMedia, mediaCacheKey, getMediaCacheStats } = require('../mediaCache');
+
+const MESSAGE_SID = 'MM' + 'a'.repeat(32);
+const mediaUrl = (media: string, host = 'api.twilio.com') =>
+    `https://${host}/2010-04-01/Accounts/AC123/Messages/${MESSAGE_SID}/Media/ME${media.repeat(32)}`;
+
+afterAll(() => fs.rmSync(CACHE_DIR, { recursive: true, force: true }));
+
+describe('mediaCache', () => {
+    it('should key Twilio media by MessageSid and MediaSid', () => {
+        expect(mediaCacheKey(mediaUrl('1'))).toBe(`${MESSAGE_SID}/ME${'1'.repeat(32)}`);
+        expect(mediaCacheKey(mediaUrl('1', 'media.twiliocdn.com') + '?x=1')).toBe(mediaCacheKey(mediaUrl('1')));
+        expect(mediaCacheKey('https://example.com/a.jpg?sig=abc')).toBe('https://example.com/a.jpg');
+    });
+
+    it('should download each attachment once and serve repeats from disk', async () => {
+        const download = jest.fn(async () => Buffer.from('image-one'));
+
+        const [a, b] = await Promise.all([
+            getOrDownloadMedia(mediaUrl('1'), download),
+            getOrDownloadMedia(mediaUrl('1'), download),
+        ]);
+        const c = await getOrDownloadMedia(mediaUrl('1') + '?retry=2', download);
+
+        expect(download).toHaveBeenCalledTimes(1);
+        expect(a.toString()).toBe('image-one');
+        expect(b).toBe(a);
+        expect(c.toString()).toBe('image-one');
+        expect(getMediaCacheStats()).toMatchObject({ hits: 1, deduped: 1 });
+    });
+
+    it('should not cache failed downloads', async () => {
+        const failing = jest.fn(async () => { throw new Error('503'); });
+        await expect(getOrDownloadMedia(mediaUrl('2'), failing)).rejects.toThrow('503');
+
+        const download = jest.fn(async () => Buffer.from('image-two'));
+        expect((await getOrDownloadMedia(mediaUrl('2'), download)).toString()).toBe('image-two');
+        expect(download).toHaveBeenCalledTimes(1);
+    });
+
+    it('should evict least recently used blobs beyond the size limit', async () => {
+        const payload = (fill: string) => async () => Buffer.alloc(400, fill);
+        await getOrDownloadMedia(mediaUrl('3'), payload('3'));
+        await getOrDownloadMedia(mediaUrl('4'), payload('4'));
+        await getOrDownloadMedia(mediaUrl('3'), payload('x')); // hit → 3 is now newest
+        await getOrDownloadMedia(mediaUrl('5'), payload('5'));
+
+        const stats = getMediaCacheStats();
+        expect(stats.bytes).toBeLessThanOrEqual(1000);
+        expect(stats.evictions).toBeGreaterThan(0);
+        expect(fs.readdirSync(path.join(CACHE_DIR, 'blobs'))).toHaveLength(stats.blobs);
+
+        const again = jest.fn(payload('4'));
+        await getOrDownloadMedia(mediaUrl('4'), again);
+        expect(again).toHaveBeenCalledTimes(1);
+
+        const kept = jest.fn(payload('x'));
+        expect((await getOrDownloadMedia(mediaUrl('5'), kept))[0]).toBe('5'.charCodeAt(0));
+        expect(kept).not.toHaveBeenCalled();
+    });
+});
@@ -0,0 +1,200 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { createHash } from 'crypto';
+import * as fs from 'fs';
+import * as path from 'path';
+import { classifyMessage } from '../messageClassifier';
+import { WORDS_SHA256 } from '../messageClassifierTables';
+import { detectAbusive, detectIntent, detectNoVehicleDocument } from '../messageParser';
+import { detectLanguageFromText, detectSmalltalk } from '../languageService';
+import { detectAbusive as detectTurnAbusive, detectIntent as detectTurnIntent } from '../nluService';
+import corpus from './fixtures/messageCorpus.json';
+
+// Reference detectors: the plain linear scans the classifier replaced, with
+// their word lists and patterns pinned as they were (messageParser,
+// languageService, nluService), so a list edit shows up as a disagreement
+const has = (t: string, words: string[]) => words.some((w) => t.includes(w));
+
+const ABUSIVE_WORDS = [
+    'hurensohn', 'arschloch', 'fotze', 'verpiss', 'scheiss', 'scheiße',
+    'wichser', 'missgeburt', 'bastard', 'vollidiot',
+    'fuck', 'bitch', 'shit', 'idiot', 'asshole', 'moron', 'retard',
+    'orospu', 'siktir', 'amk', 'piç', 'gerizekalı', 'aptal', 'salak',
+    'kûre', 'bêşeref', 'bênamûs', 'kêmasî',
+    'kurwa', 'cholera', 'dupek', 'idiota', 'debil', 'spierdalaj',
+];
+const TURN_ABUSIVE_WORDS = [
+    'hurensohn', 'arschloch', 'fotze', 'verpiss', 'scheiss', 'scheiße',
+    'fuck', 'bitch', 'shit', 'idiot', 'dummkopf',
+];
+const GERMAN_HINTS = [
+    'hallo', 'moin', 'servus', 'grüß', 'danke', 'tschau', 'bitte',
+    'guten', 'morgen', 'abend', 'tag', 'brauche', 'suche', 'möchte',
+];
+const ENGLISH_HINTS = [
+    'hello', 'hi', 'hey', 'thanks', 'thank you', 'cheers',
+    'good', 'morning', 'evening', 'need', 'looking', 'want',
+];
+const GREETINGS = ['hallo', 'hello', 'hi', 'hey', 'moin', 'servus', 'guten tag', 'guten morgen', 'good morning'];
+const THANKS = ['danke', 'thanks', 'thank you', 'vielen dank', 'thx'];
+const BOT_QUESTIONS = ['bist du ein bot', 'are you a bot', 'wer bist du', 'who are you'];
+const STATUS_QUESTIONS = ['status', 'wie weit', 'wie lange', 'where is', 'how long', 'tracking', 'lieferstatus'];
+const ABORT_TOKENS = ['abbrechen', 'stornieren', 'storno', 'cancel', 'nicht mehr', 'kein bedarf'];
+const ORDER_TOKENS = ['brauche', 'suche', 'möchte', 'want', 'need', 'looking for', 'part for', 'teil für'];
+const VEHICLE_BRANDS = ['bmw', 'audi', 'vw', 'volkswagen', 'mercedes', 'benz', 'ford', 'opel', 'skoda', 'seat', 'toyota', 'honda', 'hyundai', 'kia'];
+const OEM_PATTERNS = [/oem[:\s]+([A-Z0-9\-]+)/i, /teilenummer[:\s]+([A-Z0-9\-]+)/i];
+const YEAR = /\b(19|20)\d{2}\b/;
+
+const INTENTS: Record<string, RegExp[]> = {
+    abort_order: [
+        /abbrechen/i, /cancel/i, /stopp/i, /stop/i, /aufhören/i,
+        /nicht mehr/i, /kein interesse/i, /egal/i, /vergiss/i
+    ],
+    continue_order: [
+        /noch ein teil/i, /weiteres teil/i, /another part/i,
+        /dasselbe fahrzeug/i, /same vehicle/i, /noch was/i
+    ],
+    status_question: [
+        /status/i, /bestellung/i, /order/i, /wo ist/i, /where is/i,
+        /lieferung/i, /delivery/i, /tracking/i
+    ],
+    new_order: [
+        /neues fahrzeug/i, /new vehicle/i, /anderes auto/i,
+        /different car/i, /von vorne/i, /start over/i
+    ],
+    greeting: [
+        /^(hallo|hello|hi|hey|moin|servus|guten\s?(tag|morgen|abend))$/i
+    ],
+    send_vehicle_doc: [
+        /fahrzeugschein/i, /zulassung/i, /registration/i, /dokument/i
+    ],
+    request_part: [
+        /brauche/i, /suche/i, /need/i, /looking for/i, /want/i, /möchte/i
+    ],
+    describe_symptoms: [
+        /klackert/i, /quietscht/i, /noise/i, /problem/i, /kaputt/i, /defekt/i
+    ],
+    general_question: [
+        /was kostet/i, /how much/i, /preis/i, /price/i
+    ],
+};
+
+const NO_DOC_PATTERNS = [
+    /habe? ?(ich )?keine?n? ?(fahrzeugschein|schein|dokument)/i,
+    /habe? ?(ich )?nicht/i,
+    /don'?t have/i,
+    /no document/i,
+    /kein bild/i,
+    /kann nicht senden/i,
+    /can'?t send/i
+];
+
+function referenceIntent(text: string) {
+    const t = text.trim().toLowerCase();
+    for (const [intent, patterns] of Object.entries(INTENTS)) {
+        if (patterns.some((p) => p.test(t))) return intent;
+    }
+    return 'other';
+}
+
+function referenceTurnIntent(text: string) {
+    const t = text.toLowerCase().trim();
+    if (!t) return { intent: 'unknown' };
+    for (const p of OEM_PATTERNS) {
+        const m = text.match(p);
+        if (m) return { intent: 'oem_direct', extractedOem: m[1] };
+    }
+    if (has(t, STATUS_QUESTIONS)) return { intent: 'status_question' };
+    if (has(t, ABORT_TOKENS)) return { intent: 'abort_order' };
+    if (has(t, ORDER_TOKENS)) return { intent: 'new_order' };
+    if (has(t, VEHICLE_BRANDS) || YEAR.test(t)) return { intent: 'continue_order' };
+    return { intent: 'unknown' };
+}
+
+function reference(text: string) {
+    const t = text.toLowerCase().trim();
+    return {
+        abusive: has(t, ABUSIVE_WORDS),
+        intent: referenceIntent(text),
+        noVehicleDocument: NO_DOC_PATTERNS.some((p) => p.test(t)),
+        language: has(t, GERMAN_HINTS) ? 'de' : has(t, ENGLISH_HINTS) ? 'en' : null,
+        smalltalk: has(t, GREETINGS) ? 'greeting'
+            : has(t, THANKS) ? 'thanks'
+                : has(t, BOT_QUESTIONS) ? 'bot_question'
+                    : null,
+        turnIntent: referenceTurnIntent(text),
+        turnAbusive: has(t, TURN_ABUSIVE_WORDS),
+    };
+}
+
+describe('messageClassifier', () => {
+    it('should be generated from the current word lists', () => {
+        const words = fs.readFileSync(path.join(__dirname, '..', 'messageClassifierWords.json'));
+        // Fails after editing messageClassifierWords.json without running
+        // scripts/generate_classifier_tables.py
+        expect(createHash('sha256').update(words).digest('hex')).toBe(WORDS_SHA256);
+    });
+
+    it.each(corpus.messages.map((m) => [m]))('should agree with the reference detectors on %j', (text) => {
+        expect(classifyMessage(text)).toEqual(reference(text));
+    });
+
+    it('should back the public detectors', () => {
+        const text = 'Ich habe keinen Fahrzeugschein, du Idiot';
+        const result = classifyMessage(text);
+        expect(detectAbusive(text)).toBe(result.abusive);
+        expect(detectIntent(text)).toBe(result.intent);
+        expect(detectNoVehicleDocument(text)).toBe(result.noVehicleDocument);
+        expect(detectLanguageFromText(text)).toBe(result.language);
+        expect(detectSmalltalk(text)).toBe(result.smalltalk);
+        expect(detectTurnIntent(text, false)).toEqual(result.turnIntent);
+        expect(detectTurnIntent(text, true)).toEqual({ intent: 'new_order' });
+        expect(detectTurnAbusive(text)).toBe(result.turnAbusive);
+    });
+
+    it('should keep the bot turn on its own abuse list', () => {
+        for (const word of ['amk', 'debil', 'salak', 'aptal', 'cholera']) {
+            expect(classifyMessage(`du ${word}`)).toMatchObject({ abusive: true, turnAbusive: false });
+        }
+        expect(classifyMessage('du dummkopf')).toMatchObject({ abusive: false, turnAbusive: true });
+    });
+
+    it('should keep detectIntent priority when several intents match', () => {
+        expect(classifyMessage('Ich möchte die Bestellung abbrechen').intent).toBe('abort_order');
+        expect(classifyMessage('Hallo, wo ist meine Bestellung?').intent).toBe('status_question');
+        expect(classifyMessage('  HALLO ').intent).toBe('greeting');
+    });
+
+    it('should try a pattern at every occurrence of its trigger', () => {
+        // First "can" / "hab" do not continue into the pattern, the later ones do
+        expect(classifyMessage('can you wait? I can\'t send it').noVehicleDocument).toBe(true);
+        expect(classifyMessage('hab gleich, habe ich nicht').noVehicleDocument).toBe(true);
+        expect(classifyMessage('cancel').noVehicleDocument).toBe(false);
+    });
+
+    it('should report overlapping keywords from different lists', () => {
+        const result = classifyMessage('thank you, hi');
+        expect(result.smalltalk).toBe('greeting');
+        expect(result.language).toBe('en');
+    });
+
+    it('should report the no-document signal alongside an intent at the same position', () => {
+        const result = classifyMessage('Habe keinen Fahrzeugschein');
+        expect(result.noVehicleDocument).toBe(true);
+        expect(result.intent).toBe('send_vehicle_doc');
+    });
+
+    it('should extract pasted OEM numbers with their original case', () => {
+        expect(classifyMessage('OEM: 1K0615301AA').turnIntent).toEqual({ intent: 'oem_direct', extractedOem: '1K0615301AA' });
+        expect(classifyMessage('Golf 2015').turnIntent).toEqual({ intent: 'continue_order' });
+    });
+
+    it('should handle empty text', () => {
+        expect(classifyMessage('')).toEqual({
+            abusive: false, intent: 'other', noVehicleDocument: false, language: null, smalltalk: null,
+            turnIntent: { intent: 'unknown' }, turnAbusive: false,
+        });
+    });
+});
@@ -0,0 +1,204 @@
+jest.mock('@utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+jest.mock('@core/botResponses', () => ({ t: (key: string, lang: string | null) => `${key}:${lang ?? 'de'}` }));
+
+import { DeadlineHeap, SessionTimeoutScheduler } from '../sessionTimeout';
+
+const HOUR = 60 * 60 * 1000;
+// Far enough ahead that the real timer never fires during a test
+const T0 = Date.now() + 365 * 24 * HOUR;
+
+/** Minimal in-memory stand-in for the ioredis commands the scheduler uses. */
+function fakeRedis() {
+    const zset = new Map<string, number>();
+    const hash = new Map<string, string>();
+    const multi = () => {
+        const ops: Array<() => void> = [];
+        const chain = {
+            zadd: (_k: string, score: number, member: string) => { ops.push(() => zset.set(member, score)); return chain; },
+            zrem: (_k: string, member: string) => { ops.push(() => zset.delete(member)); return chain; },
+            hset: (_k: string, field: string, value: string) => { ops.push(() => hash.set(field, value)); return chain; },
+            hdel: (_k: string, field: string) => { ops.push(() => hash.delete(field)); return chain; },
+            exec: async () => { ops.forEach(op => op()); return []; },
+        };
+        return chain;
+    };
+    return {
+        zset,
+        hash,
+        multi,
+        zrange: async () => [...zset].flatMap(([member, score]) => [member, String(score)]),
+        hgetall: async () => Object.fromEntries(hash),
+        eval: async (_script: string, _n: number, _key: string, member: string, now: number) => {
+            const score = zset.get(member);
+            if (score === undefined || score > now) return 0;
+            zset.delete(member);
+            return 1;
+        },
+    };
+}
+
+const flush = () => new Promise(resolve => setImmediate(resolve));
+
+describe('DeadlineHeap', () => {
+    it('pops keys in deadline order after updates and removals', () => {
+        const heap = new DeadlineHeap();
+        const deadlines = [50, 10, 40, 30, 20, 60, 5];
+        deadlines.forEach((d, i) => heap.upsert(`k${i}`, d));
+        heap.upsert('k6', 70); // 5 → 70
+        heap.upsert('k0', 1);  // 50 → 1
+        heap.remove('k3');
+
+        const order: string[] = [];
+        for (let key = heap.popDue(100); key; key = heap.popDue(100)) order.push(key);
+        expect(order).toEqual(['k0', 'k1', 'k4', 'k2', 'k5', 'k6']);
+    });
+
+    it('collects only due keys without removing them', () => {
+        const heap = new DeadlineHeap();
+        for (let i = 0; i < 100; i++) heap.upsert(`k${i}`, i);
+        expect(heap.collectDue(9).sort()).toEqual(Array.from({ length: 10 }, (_, i) => `k${i}`).sort());
+        expect(heap.size).toBe(100);
+    });
+});
+
+describe('SessionTimeoutScheduler', () => {
+    it('sends one follow-up per inactive session and re-arms for the cooldown', async () => {
+        const scheduler = new SessionTimeoutScheduler(null, 2);
+        const sent: string[] = [];
+        await scheduler.start(async waId => { sent.push(waId); });
+
+        scheduler.recordActivity('a', 'order-a', 'en', T0);
+        scheduler.recordActivity('b', 'order-b', null, T0 + HOUR);
+        expect(scheduler.getTimedOutSessions(T0 + 24 * HOUR - 1).map(s => s.waId)).toEqual([]);
+
+        expect(await scheduler.runDueFollowUps(T0 + 25 * HOUR + 1)).toBe(2);
+        expect(sent.sort()).toEqual(['a', 'b']);
+        expect(await scheduler.runDueFollowUps(T0 + 30 * HOUR)).toBe(0);
+        expect(scheduler.getStats().nextDeadline).toBe(T0 + 25 * HOUR + 1 + 48 * HOUR);
+        scheduler.stop();
+    });
+
+    it('pushes the deadline out on new activity', () => {
+        const scheduler = new SessionTimeoutScheduler();
+        scheduler.recordActivity('a', 'order-a', null, T0);
+        scheduler.recordActivity('a', 'order-a', null, T0 + 20 * HOUR);
+
+        expect(scheduler.getTimedOutSessions(T0 + 25 * HOUR)).toEqual([]);
+        expect(scheduler.getTimedOutSessions(T0 + 44 * HOUR)).toEqual([
+            { waId: 'a', orderId: 'order-a', language: null, inactiveMs: 24 * HOUR },
+        ]);
+    });
+
+    it('limits concurrent sends', async () => {
+        const scheduler = new SessionTimeoutScheduler(null, 3);
+        let active = 0;
+        let peak = 0;
+        await scheduler.start(async () => {
+            peak = Math.max(peak, ++active);
+            await flush();
+            active--;
+        });
+        for (let i = 0; i < 20; i++) scheduler.recordActivity(`wa-${i}`, `order-${i}`, null, T0);
+
+        expect(await scheduler.runDueFollowUps(T0 + 25 * HOUR)).toBe(20);
+        expect(peak).toBe(3);
+        scheduler.stop();
+    });
+
+    it('retries a failed send later', async () => {
+        const scheduler = new SessionTimeoutScheduler();
+        const send = jest.fn().mockRejectedValueOnce(new Error('twilio down')).mockResolvedValue(undefined);
+        await scheduler.start(send);
+        scheduler.recordActivity('a', 'order-a', null, T0);
+
+        expect(await scheduler.runDueFollowUps(T0 + 25 * HOUR)).toBe(0);
+        expect(await scheduler.runDueFollowUps(T0 + 25 * HOUR + 30 * 60 * 1000)).toBe(0);
+        expect(await scheduler.runDueFollowUps(T0 + 26 * HOUR)).toBe(1);
+        expect(scheduler.getStats()).toMatchObject({ followUpsSent: 1, followUpsFailed: 1 });
+        scheduler.stop();
+    });
+
+    it('gives up after the maximum number of failed sends', async () => {
+        const scheduler = new SessionTimeoutScheduler();
+        const send = jest.fn().mockRejectedValue(new Error('63016: outside the allowed window'));
+        await scheduler.start(send);
+        scheduler.recordActivity('a', 'order-a', null, T0);
+
+        for (let now = T0 + 24 * HOUR; now < T0 + 48 * HOUR; now += HOUR) {
+            await scheduler.runDueFollowUps(now);
+        }
+
+        expect(send).toHaveBeenCalledTimes(3);
+        expect(scheduler.getStats()).toMatchObject({ sessions: 0, nextDeadline: null, followUpsFailed: 3 });
+        scheduler.stop();
+    });
+
+    it('drops restored sessions that are past the retention window instead of sending', async () => {
+        const redis = fakeRedis();
+        new SessionTimeoutScheduler(redis).recordActivity('a', 'order-a', null, T0);
+        await flush();
+
+        const after = new SessionTimeoutScheduler(redis);
+        const send = jest.fn().mockResolvedValue(undefined);
+        await after.start(send);
+
+        expect(await after.runDueFollowUps(T0 + 8 * 24 * HOUR)).toBe(0);
+        expect(send).not.toHaveBeenCalled();
+        await flush();
+        expect(redis.zset.size + redis.hash.size).toBe(0);
+        after.stop();
+    });
+
+    it('restores deadlines from Redis after a restart', async () => {
+        const redis = fakeRedis();
+        const before = new SessionTimeoutScheduler(redis);
+        before.recordActivity('a', 'order-a', 'en', T0);
+        await flush();
+        expect(redis.zset.get('a')).toBe(T0 + 24 * HOUR);
+
+        const after = new SessionTimeoutScheduler(redis);
+        const send = jest.fn().mockResolvedValue(undefined);
+        await after.start(send);
+
+        expect(await after.runDueFollowUps(T0 + 25 * HOUR)).toBe(1);
+        expect(send).toHaveBeenCalledWith('a', 'session_timeout:en');
+        await flush();
+        expect(redis.zset.get('a')).toBe(T0 + 25 * HOUR + 48 * HOUR);
+        after.stop();
+    });
+
+    it('lets only one replica send a due follow-up', async () => {
+        const redis = fakeRedis();
+        const sendA = jest.fn().mockResolvedValue(undefined);
+        const sendB = jest.fn().mockResolvedValue(undefined);
+        const replicaA = new SessionTimeoutScheduler(redis);
+        replicaA.recordActivity('a', 'order-a', null, T0);
+        await flush();
+        const replicaB = new SessionTimeoutScheduler(redis);
+        await replicaA.start(sendA);
+        await replicaB.start(sendB);
+
+        await Promise.all([replicaA.runDueFollowUps(T0 + 25 * HOUR), replicaB.runDueFollowUps(T0 + 25 * HOUR)]);
+
+        expect(sendA.mock.calls.length + sendB.mock.calls.length).toBe(1);
+        expect(replicaA.getStats().claimedElsewhere + replicaB.getStats().claimedElsewhere).toBe(1);
+        replicaA.stop();
+        replicaB.stop();
+    });
+
+    it('drops sessions once the next follow-up would be past the retention window', async () => {
+        const scheduler = new SessionTimeoutScheduler();
+        const send = jest.fn().mockResolvedValue(undefined);
+        await scheduler.start(send);
+        scheduler.recordActivity('a', 'order-a', null, T0);
+
+        for (let now = T0 + 24 * HOUR; now < T0 + 10 * 24 * HOUR; now += HOUR) {
+            await scheduler.runDueFollowUps(now);
+        }
+
+        // 24h, 72h, 120h — the next one (168h) falls outside the 7-day window
+        expect(send).toHaveBeenCalledTimes(3);
+        expect(scheduler.getStats().sessions).toBe(0);
+        scheduler.stop();
+    });
+});
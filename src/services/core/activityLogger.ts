@@ -6,6 +6,7 @@
 import * as db from './database';
 import { logger } from "@utils/logger";
 import { randomUUID } from 'crypto';
+import { AuditSink } from '../compliance/auditSink';
 
 export interface ActivityLogEntry {
     id: string;
@@ -74,6 +75,15 @@ export const ENTITY_TYPES = {
 
 export type EntityType = typeof ENTITY_TYPES[keyof typeof ENTITY_TYPES];
 
+const activitySink = new AuditSink({
+    name: 'admin_activity_log',
+    table: 'admin_activity_log',
+    columns: [
+        'id', 'admin_username', 'action_type', 'entity_type', 'entity_id', 'entity_name',
+        'old_value', 'new_value', 'ip_address', 'user_agent', 'timestamp',
+    ],
+});
+
 /**
  * Log an administrative action
  */
@@ -92,24 +102,20 @@ export async function logActivity(params: {
     const timestamp = new Date().toISOString();
 
     try {
-        await db.run(
-            `INSERT INTO admin_activity_log 
-             (id, admin_username, action_type, entity_type, entity_id, entity_name, old_value, new_value, ip_address, user_agent, timestamp)
-             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-            [
-                id,
-                params.adminUsername,
-                params.actionType,
-                params.entityType,
-                params.entityId || null,
-                params.entityName || null,
-                params.oldValue ? JSON.stringify(params.oldValue) : null,
-                params.newValue ? JSON.stringify(params.newValue) : null,
-                params.ipAddress || null,
-                params.userAgent || null,
-                timestamp
-            ]
-        );
+        // Batched write; the entry is spilled to disk until it is in the database
+        await activitySink.enqueue([
+            id,
+            params.adminUsername,
+            params.actionType,
+            params.entityType,
+            params.entityId || null,
+            params.entityName || null,
+            params.oldValue ? JSON.stringify(params.oldValue) : null,
+            params.newValue ? JSON.stringify(params.newValue) : null,
+            params.ipAddress || null,
+            params.userAgent || null,
+            timestamp
+        ]);
         logger.info(`📝 Activity logged: ${params.actionType} by ${params.adminUsername}`);
     } catch (error: any) {
         logger.error('Failed to log activity:', error.message);
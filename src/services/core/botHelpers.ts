@@ -9,9 +9,7 @@
 import { ConversationStatus } from "@adapters/supabaseService";
 import { logger } from "@utils/logger";
 import { generateChatCompletion } from "../intelligence/geminiService";
-import { ORCHESTRATOR_PROMPT } from "../../prompts/orchestratorPrompt";
-import { GENERAL_QA_SYSTEM_PROMPT } from "../../prompts/generalQaPrompt";
-import { COLLECT_PART_BRAIN_PROMPT } from "../../prompts/collectPartBrainPrompt";
+import { promptMessages } from "../../prompts/promptRegistry";
 import { t } from "./botResponses";
 import type { ParsedUserMessage, SmalltalkType } from "./nluService";
 
@@ -68,10 +66,7 @@ export async function callOrchestrator(payload: any): Promise<OrchestratorResult
         });
 
         const raw = await generateChatCompletion({
-            messages: [
-                { role: "system", content: ORCHESTRATOR_PROMPT },
-                { role: "user", content: userContent },
-            ],
+            messages: promptMessages("orchestrator", userContent, payload.conversation?.language),
             temperature: 0,
             responseFormat: "json_object",
         });
@@ -334,18 +329,16 @@ export async function answerGeneralQuestion(params: {
     knownVehicleSummary: string;
 }): Promise<string> {
     try {
-        const generalQaMessages = [
-            { role: "system" as const, content: GENERAL_QA_SYSTEM_PROMPT },
-            {
-                role: "user" as const,
-                content: JSON.stringify({
-                    userQuestion: params.userText,
-                    language: params.language,
-                    missingVehicleInfo: params.missingVehicleInfo,
-                    knownVehicleSummary: params.knownVehicleSummary,
-                }),
-            },
-        ];
+        const generalQaMessages = promptMessages(
+            "generalQa",
+            JSON.stringify({
+                userQuestion: params.userText,
+                language: params.language,
+                missingVehicleInfo: params.missingVehicleInfo,
+                knownVehicleSummary: params.knownVehicleSummary,
+            }),
+            params.language
+        );
         return await generateChatCompletion({ messages: generalQaMessages, temperature: 0.3 });
     } catch (err: any) {
         logger.error("General QA failed", { error: err?.message });
@@ -378,10 +371,7 @@ export async function runCollectPartBrain(params: {
         };
 
         const raw = await generateChatCompletion({
-            messages: [
-                { role: "system", content: COLLECT_PART_BRAIN_PROMPT },
-                { role: "user", content: JSON.stringify(payload) },
-            ],
+            messages: promptMessages("collectPartBrain", JSON.stringify(payload), params.language),
             responseFormat: "json_object",
             temperature: 0,
         });
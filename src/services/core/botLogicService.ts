@@ -36,6 +36,7 @@ import { isEnabled, FF } from './featureFlags';
 import { getMerchantByPhone } from '../adapters/phoneMerchantMapper';
 import { escalateToDealer, notifyDealerNewOrder } from './escalationService';
 import { withConversationLock } from './lockService';
+import { classifyMessage } from './messageClassifier';
 
 // Lazy accessor so tests can mock `supabaseService` after this module was loaded.
 function getSupa() {
@@ -77,9 +78,9 @@ export {
 
 // Local imports for use in this file
 import {
-  type ParsedUserMessage, type MessageIntent,
-  detectLanguageSelection, detectLanguageFromText, detectSmalltalk, detectAbusive,
-  sanitizeText, extractVinHsnTsn, hasVehicleHints, detectIntent,
+  type ParsedUserMessage, type MessageIntent, type IntentResult,
+  detectLanguageSelection, detectLanguageFromText, detectSmalltalk,
+  sanitizeText, extractVinHsnTsn, hasVehicleHints,
   parseUserMessage, pickLanguageFromChoice,
 } from './nluService';
 
@@ -262,7 +263,9 @@ export async function handleIncomingBotMessage(
         : null;
 
     // Intent + mögliche offene Orders vor dem Erstellen ermitteln
-    const intentResult = detectIntent(userText, hasVehicleImage);
+    // (one classifier pass supplies the turn intent and the abuse check below)
+    const classification = classifyMessage(userText);
+    const intentResult: IntentResult = hasVehicleImage ? { intent: "new_order" } : classification.turnIntent;
     const intent: MessageIntent = intentResult.intent;
     let activeOrders: any[] = [];
     if (typeof listActiveOrdersByContact === "function") {
@@ -487,7 +490,7 @@ export async function handleIncomingBotMessage(
 
     // Early abuse detection: if the message is insulting, short-circuit and don't advance the flow.
     try {
-      if (detectAbusive(userText)) {
+      if (classification.turnAbusive) {
         const reply = t('abuse_warning', language);
         return { reply, orderId: order.id };
       }
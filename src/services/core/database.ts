@@ -6,12 +6,13 @@ import { logger } from "@utils/logger";
 import * as crypto from 'crypto';
 import { runMigrations } from './migrations';
 import { seedDemoData } from './seedDemoData';
+import { traceIo } from './stateMachine/tracing';
 
 // Retry helper for transient errors (DNS EAI_AGAIN, connection timeouts)
 async function withRetry<T>(fn: () => Promise<T>, label: string, maxRetries = 3): Promise<T> {
     for (let attempt = 1; attempt <= maxRetries; attempt++) {
         try {
-            return await fn();
+            return await traceIo('db', fn);
         } catch (err: any) {
             const isTransient = err?.code === 'EAI_AGAIN' || err?.code === 'ECONNREFUSED' || err?.code === 'ETIMEDOUT';
             if (isTransient && attempt < maxRetries) {
@@ -127,7 +128,7 @@ export async function run(sql: string, params: any[] = []): Promise<void> {
  */
 export async function runRaw(sql: string, params: any[] = []): Promise<void> {
     try {
-        await pool.query(sql, params);
+        await traceIo('db', () => pool.query(sql, params));
     } catch (error) {
         logger.error("[DB] Error in runRaw():", error);
         throw error;
@@ -8,6 +8,17 @@
  * - User/Merchant targeting
  * - Percentage-based rollout
  * - Flag override via env vars
+ * - Compiled rules + LRU-cached rollout buckets (hot path is O(1))
+ * - Optional Redis pub/sub sync of runtime changes across pods
+ *
+ * Flags are compiled (Sets for targeting lists, env overrides resolved) on
+ * first use. registerFlag()/setRolloutPercentage() bump a version, which
+ * invalidates the compiled rules. Rollout buckets depend only on the
+ * user/session key and flag name, so they stay valid across versions.
+ *
+ * With sync, runtime changes are also stored in Redis as overrides: the
+ * changed fields of a flag defined below, the whole definition of a flag
+ * registered at runtime. clearFlagOverride() drops one again.
  */
 
 import { logger } from '../../utils/logger';
@@ -31,6 +42,34 @@ export interface FlagContext {
     sessionId?: string;
 }
 
+export interface FeatureFlagStats {
+    version: number;
+    compiledFlags: number;
+    bucketCacheEntries: number;
+    bucketCacheHits: number;
+    bucketCacheMisses: number;
+    syncing: boolean;
+    remoteUpdates: number;
+}
+
+interface CompiledFlag {
+    envOverride: boolean | undefined;
+    defaultEnabled: boolean;
+    rolloutPercentage: number;
+    enabledUsers: Set<string> | null;
+    enabledMerchants: Set<string> | null;
+}
+
+type FlagChange =
+    | { type: 'register'; flag: FeatureFlag }
+    | { type: 'rollout'; flag: string; percentage: number }
+    | { type: 'clear'; flag: string };
+
+const BUCKET_CACHE_SIZE = Number(process.env.FEATURE_FLAG_CACHE_SIZE || 10_000);
+const SYNC_CHANNEL = 'feature-flags:changes';
+const SYNC_STATE_KEY = 'feature-flags:state';
+const INSTANCE_ID = `${process.pid}-${Math.random().toString(36).slice(2, 10)}`;
+
 // ============================================================================
 // Flag Definitions
 // ============================================================================
@@ -87,47 +126,103 @@ const FLAGS: Record<string, FeatureFlag> = {
     }
 };
 
+/** Definitions as shipped, before any runtime change */
+const BUILTIN_FLAGS: Record<string, FeatureFlag> = Object.fromEntries(
+    Object.entries(FLAGS).map(([name, flag]) => [name, { ...flag }])
+);
+
+const OVERRIDABLE_FIELDS = ['description', 'defaultEnabled', 'rolloutPercentage', 'enabledMerchants', 'enabledUsers'] as const;
+
 // ============================================================================
-// Core Functions
+// Compiled Rules & Bucket Cache
 // ============================================================================
 
+let flagsVersion = 0;
+let compiledVersion = -1;
+let compiled = new Map<string, CompiledFlag>();
+
+// Rollout key → flag name → bucket (0-99). Insertion order is recency order.
+const bucketCache = new Map<string, Map<string, number>>();
+const cacheStats = { hits: 0, misses: 0, remoteUpdates: 0 };
+
+function parseEnvOverride(flagName: string): boolean | undefined {
+    const envValue = process.env[`FF_${flagName}`];
+    if (envValue === undefined) return undefined;
+    return envValue === '1' || envValue.toLowerCase() === 'true';
+}
+
+function compileFlags(): Map<string, CompiledFlag> {
+    if (compiledVersion === flagsVersion) return compiled;
+
+    const next = new Map<string, CompiledFlag>();
+    for (const flag of Object.values(FLAGS)) {
+        const envOverride = parseEnvOverride(flag.name);
+        if (envOverride !== undefined) {
+            logger.debug('Feature flag override from env', { flag: flag.name, enabled: envOverride });
+        }
+        next.set(flag.name, {
+            envOverride,
+            defaultEnabled: flag.defaultEnabled,
+            rolloutPercentage: flag.rolloutPercentage ?? 0,
+            enabledUsers: flag.enabledUsers?.length ? new Set(flag.enabledUsers) : null,
+            enabledMerchants: flag.enabledMerchants?.length ? new Set(flag.enabledMerchants) : null,
+        });
+    }
+    compiled = next;
+    compiledVersion = flagsVersion;
+    return compiled;
+}
+
+function bumpVersion(): void {
+    flagsVersion++;
+}
+
 /**
- * Check if a feature flag is enabled for the given context.
+ * Stable rollout bucket (0-99) for a user/session key, computed once per
+ * (key, flag) and kept in a bounded LRU.
  */
-export function isEnabled(flagName: string, ctx?: FlagContext): boolean {
-    // Check for environment override first (highest priority)
-    const envKey = `FF_${flagName}`;
-    const envValue = process.env[envKey];
-    if (envValue !== undefined) {
-        const enabled = envValue === '1' || envValue.toLowerCase() === 'true';
-        logger.debug(`Feature flag override from env`, { flag: flagName, enabled });
-        return enabled;
+function rolloutBucket(key: string, flagName: string): number {
+    let buckets = bucketCache.get(key);
+    if (buckets) {
+        bucketCache.delete(key);
+        bucketCache.set(key, buckets);
+        const bucket = buckets.get(flagName);
+        if (bucket !== undefined) {
+            cacheStats.hits++;
+            return bucket;
+        }
+    } else {
+        buckets = new Map<string, number>();
+        bucketCache.set(key, buckets);
+        if (bucketCache.size > BUCKET_CACHE_SIZE) {
+            bucketCache.delete(bucketCache.keys().next().value as string);
+        }
     }
+    cacheStats.misses++;
+    const bucket = simpleHash(key + flagName) % 100;
+    buckets.set(flagName, bucket);
+    return bucket;
+}
 
-    const flag = FLAGS[flagName];
-    if (!flag) {
-        logger.warn('Unknown feature flag requested', { flag: flagName });
-        return false;
-    }
+function evaluate(flagName: string, flag: CompiledFlag, ctx?: FlagContext): boolean {
+    // Environment override has the highest priority
+    if (flag.envOverride !== undefined) return flag.envOverride;
 
     // Check user-specific enable list
-    if (ctx?.userId && flag.enabledUsers?.includes(ctx.userId)) {
+    if (ctx?.userId && flag.enabledUsers?.has(ctx.userId)) {
         return true;
     }
 
     // Check merchant-specific enable list
-    if (ctx?.merchantId && flag.enabledMerchants?.includes(ctx.merchantId)) {
+    if (ctx?.merchantId && flag.enabledMerchants?.has(ctx.merchantId)) {
         return true;
     }
 
-    // Check percentage rollout
-    if (flag.rolloutPercentage !== undefined && flag.rolloutPercentage > 0) {
-        // Use deterministic hash for consistent behavior per user
+    // Check percentage rollout (deterministic per user for consistent behavior)
+    if (flag.rolloutPercentage >= 100) return true;
+    if (flag.rolloutPercentage > 0) {
         const key = ctx?.userId || ctx?.sessionId || 'default';
-        const hash = simpleHash(key + flagName);
-        const bucket = hash % 100;
-
-        if (bucket < flag.rolloutPercentage) {
+        if (rolloutBucket(key, flagName) < flag.rolloutPercentage) {
             return true;
         }
     }
@@ -135,13 +230,32 @@ export function isEnabled(flagName: string, ctx?: FlagContext): boolean {
     return flag.defaultEnabled;
 }
 
+// ============================================================================
+// Core Functions
+// ============================================================================
+
+/**
+ * Check if a feature flag is enabled for the given context.
+ */
+export function isEnabled(flagName: string, ctx?: FlagContext): boolean {
+    const flag = compileFlags().get(flagName);
+    if (!flag) {
+        // Unknown flags may still be forced on/off via env
+        const envOverride = parseEnvOverride(flagName);
+        if (envOverride !== undefined) return envOverride;
+        logger.warn('Unknown feature flag requested', { flag: flagName });
+        return false;
+    }
+    return evaluate(flagName, flag, ctx);
+}
+
 /**
  * Get all flag statuses for debugging/monitoring.
  */
 export function getAllFlags(ctx?: FlagContext): Record<string, boolean> {
     const result: Record<string, boolean> = {};
-    for (const flagName of Object.keys(FLAGS)) {
-        result[flagName] = isEnabled(flagName, ctx);
+    for (const [flagName, flag] of compileFlags()) {
+        result[flagName] = evaluate(flagName, flag, ctx);
     }
     return result;
 }
@@ -157,26 +271,192 @@ export function getFlagInfo(flagName: string): FeatureFlag | null {
  * Register a custom flag at runtime.
  */
 export function registerFlag(flag: FeatureFlag): void {
-    FLAGS[flag.name] = flag;
+    applyChange({ type: 'register', flag });
     logger.info('Feature flag registered', { flag: flag.name });
+    publishChange({ type: 'register', flag: FLAGS[flag.name] });
 }
 
 /**
  * Update rollout percentage for a flag.
  */
 export function setRolloutPercentage(flagName: string, percentage: number): void {
-    const flag = FLAGS[flagName];
-    if (!flag) {
+    if (!FLAGS[flagName]) {
         logger.warn('Cannot update unknown flag', { flag: flagName });
         return;
     }
 
     const clampedPercentage = Math.max(0, Math.min(100, percentage));
-    flag.rolloutPercentage = clampedPercentage;
+    applyChange({ type: 'rollout', flag: flagName, percentage: clampedPercentage });
     logger.info('Feature flag rollout updated', {
         flag: flagName,
         percentage: clampedPercentage
     });
+    publishChange({ type: 'rollout', flag: flagName, percentage: clampedPercentage });
+}
+
+/**
+ * Drop runtime changes to a flag: a built-in flag goes back to its shipped
+ * definition, a runtime-registered one is removed.
+ */
+export function clearFlagOverride(flagName: string): void {
+    applyChange({ type: 'clear', flag: flagName });
+    logger.info('Feature flag override cleared', { flag: flagName });
+    publishChange({ type: 'clear', flag: flagName });
+}
+
+/**
+ * Re-read FF_* env overrides and recompile all flags.
+ */
+export function reloadFlags(): void {
+    bumpVersion();
+}
+
+export function getFeatureFlagStats(): FeatureFlagStats {
+    return {
+        version: flagsVersion,
+        compiledFlags: compiled.size,
+        bucketCacheEntries: bucketCache.size,
+        bucketCacheHits: cacheStats.hits,
+        bucketCacheMisses: cacheStats.misses,
+        syncing: syncSubscriber !== null,
+        remoteUpdates: cacheStats.remoteUpdates,
+    };
+}
+
+function applyChange(change: FlagChange): void {
+    if (change.type === 'register') {
+        FLAGS[change.flag.name] = { ...change.flag };
+    } else if (change.type === 'clear') {
+        if (BUILTIN_FLAGS[change.flag]) FLAGS[change.flag] = { ...BUILTIN_FLAGS[change.flag] };
+        else delete FLAGS[change.flag];
+    } else {
+        const flag = FLAGS[change.flag];
+        if (!flag) return;
+        flag.rolloutPercentage = change.percentage;
+    }
+    bumpVersion();
+}
+
+// ============================================================================
+// Cross-pod Sync (Redis pub/sub, optional)
+// ============================================================================
+
+let syncPublisher: any | null = null;
+let syncSubscriber: any | null = null;
+/** Remote changes received while the stored state is being restored */
+let pendingChanges: FlagChange[] | null = null;
+
+/**
+ * What the shared state keeps for a flag: the fields that differ from the
+ * built-in definition, the whole definition of a runtime-registered flag,
+ * or null if nothing differs.
+ */
+function flagOverride(name: string): Partial<FeatureFlag> | null {
+    const flag = FLAGS[name];
+    const builtin = BUILTIN_FLAGS[name];
+    if (!flag) return null;
+    if (!builtin) return flag;
+
+    const override: Partial<FeatureFlag> = {};
+    for (const field of OVERRIDABLE_FIELDS) {
+        if (JSON.stringify(flag[field]) !== JSON.stringify(builtin[field])) {
+            (override as any)[field] = flag[field];
+        }
+    }
+    return Object.keys(override).length > 0 ? override : null;
+}
+
+async function persistOverride(redis: any, name: string): Promise<void> {
+    const override = flagOverride(name);
+    if (override) await redis.hset(SYNC_STATE_KEY, name, JSON.stringify(override));
+    else await redis.hdel(SYNC_STATE_KEY, name);
+}
+
+/** Apply a stored override on top of the built-in definition */
+function restoreOverride(name: string, override: Partial<FeatureFlag>): void {
+    FLAGS[name] = { ...BUILTIN_FLAGS[name], ...override, name } as FeatureFlag;
+    bumpVersion();
+}
+
+function publishChange(change: FlagChange): void {
+    if (!syncPublisher) return;
+    const name = change.type === 'register' ? change.flag.name : change.flag;
+    const redis = syncPublisher;
+    Promise.resolve()
+        .then(async () => {
+            // Persist the override so pods started later pick it up too
+            await persistOverride(redis, name);
+            await redis.publish(SYNC_CHANNEL, JSON.stringify({ origin: INSTANCE_ID, change }));
+        })
+        .catch((err: any) => {
+            logger.warn('[FeatureFlags] Failed to publish flag change', { flag: name, error: err?.message });
+        });
+}
+
+function applyRemoteChange(change: FlagChange): void {
+    applyChange(change);
+    cacheStats.remoteUpdates++;
+    logger.info('[FeatureFlags] Applied remote flag change', {
+        type: change.type,
+        flag: change.type === 'register' ? change.flag.name : change.flag,
+    });
+}
+
+function handleSyncMessage(channel: string, raw: string): void {
+    if (channel !== SYNC_CHANNEL) return;
+    try {
+        const { origin, change } = JSON.parse(raw) as { origin: string; change: FlagChange };
+        if (origin === INSTANCE_ID) return;
+        if (pendingChanges) pendingChanges.push(change);
+        else applyRemoteChange(change);
+    } catch (err: any) {
+        logger.warn('[FeatureFlags] Ignoring malformed flag change', { error: err?.message });
+    }
+}
+
+/**
+ * Share runtime flag changes across all API and worker pods.
+ * Subscribes to changes, then restores the stored overrides; changes that
+ * arrive meanwhile are applied after them, so none is lost or reverted.
+ * Uses a duplicated connection for the subscription (a subscribed ioredis
+ * client cannot issue other commands). No-op without Redis.
+ */
+export async function startFeatureFlagSync(redis: any | null): Promise<void> {
+    if (!redis || syncSubscriber) return;
+    syncPublisher = redis;
+    pendingChanges = [];
+    try {
+        const subscriber = redis.duplicate();
+        subscriber.on('message', handleSyncMessage);
+        subscriber.on('error', (err: any) => {
+            logger.warn('[FeatureFlags] Sync subscriber error', { error: err?.message });
+        });
+        await subscriber.subscribe(SYNC_CHANNEL);
+        syncSubscriber = subscriber;
+
+        const state: Record<string, string> = await redis.hgetall(SYNC_STATE_KEY) || {};
+        for (const [name, raw] of Object.entries(state)) {
+            restoreOverride(name, JSON.parse(raw) as Partial<FeatureFlag>);
+        }
+        for (const change of pendingChanges) applyRemoteChange(change);
+        logger.info('[FeatureFlags] Sync started', { restored: Object.keys(state).length });
+    } catch (err: any) {
+        logger.warn('[FeatureFlags] Sync unavailable, flags are local to this pod', { error: err?.message });
+    } finally {
+        pendingChanges = null;
+    }
+}
+
+export async function stopFeatureFlagSync(): Promise<void> {
+    const subscriber = syncSubscriber;
+    syncSubscriber = null;
+    syncPublisher = null;
+    if (!subscriber) return;
+    try {
+        await subscriber.quit();
+    } catch (err: any) {
+        logger.warn('[FeatureFlags] Failed to close sync subscriber', { error: err?.message });
+    }
 }
 
 // ============================================================================
@@ -0,0 +1,357 @@
+/**
+ * 🖼️ Image Preprocessor — shrink vehicle document photos before Vision OCR
+ *
+ * WhatsApp photos of a Fahrzeugschein arrive at full camera resolution.
+ * Gemini Vision only needs the document, readable, in grayscale. Before the
+ * vision call each image is:
+ *   1. auto-rotated (EXIF)
+ *   2. cropped to the document (bright region on a darker background)
+ *   3. downsized to IMAGE_PREPROCESS_MAX_EDGE
+ *   4. converted to grayscale
+ *   5. JPEG-compressed down to IMAGE_PREPROCESS_TARGET_BYTES
+ *
+ * Results are cached by SHA-256 of the input bytes, and concurrent requests
+ * for the same photo share one run, so a resent photo is processed once.
+ * Pipelines run in a bounded pool (IMAGE_PREPROCESS_CONCURRENCY) — sharp
+ * already executes on libvips threads, the pool only caps how many
+ * full-resolution images are decoded at once.
+ *
+ * sharp is loaded lazily; if it cannot be loaded (e.g. missing native
+ * binary for the platform) images pass through unchanged.
+ */
+
+import { createHash } from "crypto";
+import * as os from "os";
+import { logger } from "@utils/logger";
+
+// ============================================================================
+// CONFIGURATION
+// ============================================================================
+
+const ENABLED = process.env.IMAGE_PREPROCESS_ENABLED !== "false";
+const MAX_EDGE = Number(process.env.IMAGE_PREPROCESS_MAX_EDGE || 1600);
+const TARGET_BYTES = Number(process.env.IMAGE_PREPROCESS_TARGET_BYTES || 300_000);
+const CONCURRENCY = Number(process.env.IMAGE_PREPROCESS_CONCURRENCY || Math.max(1, Math.min(4, os.cpus().length)));
+
+const CACHE_MAX_ENTRIES = 200;
+const CACHE_MAX_BYTES = 64 * 1024 * 1024;
+
+/** Long edge of the thumbnail used to find the document */
+const ANALYSIS_EDGE = 256;
+/** JPEG qualities tried in order until the target size is met */
+const QUALITY_STEPS = [80, 70, 60, 50, 40];
+/** Below this edge length text gets unreadable — stop shrinking */
+const MIN_EDGE = 800;
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+export interface PreprocessedImage {
+    buffer: Buffer;
+    mimeType: string;
+    /** SHA-256 of the original bytes */
+    hash: string;
+    originalBytes: number;
+    bytes: number;
+    width?: number;
+    height?: number;
+    cropped: boolean;
+    /** false → original bytes passed through (sharp missing, failed, or no gain) */
+    processed: boolean;
+    cached: boolean;
+}
+
+export interface DocumentBounds {
+    left: number;
+    top: number;
+    width: number;
+    height: number;
+}
+
+// ============================================================================
+// SHARP (lazy)
+// ============================================================================
+
+let sharpModule: any | null | undefined;
+
+function loadSharp(): any | null {
+    if (sharpModule !== undefined) return sharpModule;
+    try {
+        sharpModule = require("sharp");
+    } catch {
+        sharpModule = null;
+        logger.warn("[ImagePreprocessor] sharp not installed — images are sent unprocessed");
+    }
+    return sharpModule;
+}
+
+/**
+ * MIME type of an image from its magic bytes (for images passed through as-is)
+ */
+export function detectImageMimeType(input: Buffer): string {
+    if (input.length >= 8 && input.readUInt32BE(0) === 0x89504e47) return "image/png";
+    if (input.length >= 12 && input.toString("ascii", 0, 4) === "RIFF" && input.toString("ascii", 8, 12) === "WEBP") {
+        return "image/webp";
+    }
+    if (input.length >= 12 && input.toString("ascii", 4, 8) === "ftyp") {
+        const brand = input.toString("ascii", 8, 12);
+        if (brand.startsWith("hei") || brand.startsWith("hev") || brand === "mif1" || brand === "msf1") return "image/heic";
+    }
+    if (input.length >= 6 && input.toString("ascii", 0, 3) === "GIF") return "image/gif";
+    return "image/jpeg";
+}
+
+// ============================================================================
+// DOCUMENT DETECTION
+// ============================================================================
+
+/**
+ * Otsu threshold of an 8-bit grayscale buffer
+ */
+function otsuThreshold(gray: Uint8Array): number {
+    const histogram = new Uint32Array(256);
+    for (let i = 0; i < gray.length; i++) histogram[gray[i]]++;
+
+    let sumAll = 0;
+    for (let v = 0; v < 256; v++) sumAll += v * histogram[v];
+
+    let sumBackground = 0;
+    let weightBackground = 0;
+    let best = 0;
+    let threshold = 127;
+    for (let v = 0; v < 256; v++) {
+        weightBackground += histogram[v];
+        if (weightBackground === 0) continue;
+        const weightForeground = gray.length - weightBackground;
+        if (weightForeground === 0) break;
+
+        sumBackground += v * histogram[v];
+        const meanBackground = sumBackground / weightBackground;
+        const meanForeground = (sumAll - sumBackground) / weightForeground;
+        const between = weightBackground * weightForeground * (meanBackground - meanForeground) ** 2;
+        if (between > best) {
+            best = between;
+            threshold = v;
+        }
+    }
+    return threshold;
+}
+
+/**
+ * Bounding box of the bright document in a grayscale thumbnail: rows and
+ * columns where at least a third of the pixels are above the Otsu
+ * threshold, padded by 2%. Returns null when the result would not remove
+ * a meaningful border (photo is already the document) or looks implausible.
+ */
+export function findDocumentBounds(gray: Uint8Array, width: number, height: number): DocumentBounds | null {
+    if (width < 16 || height < 16 || gray.length < width * height) return null;
+
+    const threshold = otsuThreshold(gray);
+    const rowCounts = new Uint32Array(height);
+    const colCounts = new Uint32Array(width);
+    for (let y = 0; y < height; y++) {
+        const offset = y * width;
+        for (let x = 0; x < width; x++) {
+            if (gray[offset + x] > threshold) {
+                rowCounts[y]++;
+                colCounts[x]++;
+            }
+        }
+    }
+
+    const span = (counts: Uint32Array, length: number, other: number): [number, number] | null => {
+        const min = other / 3;
+        let start = 0;
+        while (start < length && counts[start] < min) start++;
+        let end = length - 1;
+        while (end > start && counts[end] < min) end--;
+        return end > start ? [start, end] : null;
+    };
+
+    const rows = span(rowCounts, height, width);
+    const cols = span(colCounts, width, height);
+    if (!rows || !cols) return null;
+
+    const padX = Math.round(width * 0.02);
+    const padY = Math.round(height * 0.02);
+    const left = Math.max(0, cols[0] - padX);
+    const top = Math.max(0, rows[0] - padY);
+    const right = Math.min(width - 1, cols[1] + padX);
+    const bottom = Math.min(height - 1, rows[1] + padY);
+
+    const bounds = { left, top, width: right - left + 1, height: bottom - top + 1 };
+    const coverage = (bounds.width * bounds.height) / (width * height);
+    // < 20%: probably a glare spot, not the document; > 90%: nothing to crop
+    if (coverage < 0.2 || coverage > 0.9) return null;
+    return bounds;
+}
+
+// ============================================================================
+// PIPELINE
+// ============================================================================
+
+async function runPipeline(input: Buffer, hash: string): Promise<PreprocessedImage> {
+    const passThrough: PreprocessedImage = {
+        buffer: input,
+        mimeType: detectImageMimeType(input),
+        hash,
+        originalBytes: input.length,
+        bytes: input.length,
+        cropped: false,
+        processed: false,
+        cached: false,
+    };
+
+    const sharp = loadSharp();
+    if (!sharp) return passThrough;
+
+    try {
+        // Decode once: EXIF-rotated, single-channel raw pixels shared by
+        // analysis, crop and every encode attempt
+        const { data: pixels, info } = await sharp(input, { failOn: "none" })
+            .rotate()
+            .toColourspace("b-w")
+            .raw()
+            .toBuffer({ resolveWithObject: true });
+        const raw = { raw: { width: info.width, height: info.height, channels: info.channels } };
+
+        const thumb = await sharp(pixels, raw)
+            .resize(ANALYSIS_EDGE, ANALYSIS_EDGE, { fit: "inside" })
+            .toColourspace("b-w")
+            .raw()
+            .toBuffer({ resolveWithObject: true });
+
+        const bounds = findDocumentBounds(new Uint8Array(thumb.data), thumb.info.width, thumb.info.height);
+        let crop: DocumentBounds | null = null;
+        if (bounds) {
+            const sx = info.width / thumb.info.width;
+            const sy = info.height / thumb.info.height;
+            const left = Math.floor(bounds.left * sx);
+            const top = Math.floor(bounds.top * sy);
+            crop = {
+                left,
+                top,
+                width: Math.min(info.width - left, Math.ceil(bounds.width * sx)),
+                height: Math.min(info.height - top, Math.ceil(bounds.height * sy)),
+            };
+        }
+
+        let edge = MAX_EDGE;
+        let output: { data: Buffer; info: { width: number; height: number } } | null = null;
+        while (!output || (output.data.length > TARGET_BYTES && edge >= MIN_EDGE)) {
+            for (const quality of QUALITY_STEPS) {
+                let pipeline = sharp(pixels, raw);
+                if (crop) pipeline = pipeline.extract(crop);
+                output = await pipeline
+                    .resize(edge, edge, { fit: "inside", withoutEnlargement: true })
+                    .jpeg({ quality, mozjpeg: true })
+                    .toBuffer({ resolveWithObject: true });
+                if (output!.data.length <= TARGET_BYTES) break;
+            }
+            edge = Math.floor(edge * 0.8);
+        }
+
+        // Already small and compressed better than we can: keep the original
+        if (output!.data.length >= input.length && !crop) return passThrough;
+
+        return {
+            buffer: output!.data,
+            mimeType: "image/jpeg",
+            hash,
+            originalBytes: input.length,
+            bytes: output!.data.length,
+            width: output!.info.width,
+            height: output!.info.height,
+            cropped: !!crop,
+            processed: true,
+            cached: false,
+        };
+    } catch (err: any) {
+        logger.warn("[ImagePreprocessor] Preprocessing failed, sending original", { error: err?.message, hash });
+        return passThrough;
+    }
+}
+
+// ============================================================================
+// POOL + CACHE
+// ============================================================================
+
+let active = 0;
+const waiting: Array<() => void> = [];
+
+async function withPoolSlot<T>(fn: () => Promise<T>): Promise<T> {
+    if (active >= CONCURRENCY) {
+        // Woken with the finishing caller's slot — `active` is not touched in between
+        await new Promise<void>(resolve => waiting.push(resolve));
+    } else {
+        active++;
+    }
+    try {
+        return await fn();
+    } finally {
+        const next = waiting.shift();
+        if (next) next();
+        else active--;
+    }
+}
+
+const cache = new Map<string, PreprocessedImage>();
+let cacheBytes = 0;
+const inFlight = new Map<string, Promise<PreprocessedImage>>();
+
+function remember(result: PreprocessedImage): void {
+    cache.set(result.hash, result);
+    cacheBytes += result.bytes;
+    while (cache.size > CACHE_MAX_ENTRIES || cacheBytes > CACHE_MAX_BYTES) {
+        const oldest = cache.keys().next().value!;
+        cacheBytes -= cache.get(oldest)!.bytes;
+        cache.delete(oldest);
+    }
+}
+
+/**
+ * Prepare a vehicle document photo for the vision model.
+ * Never throws — on any problem the original bytes are returned.
+ */
+export async function preprocessDocumentImage(input: Buffer): Promise<PreprocessedImage> {
+    const hash = createHash("sha256").update(input).digest("hex");
+
+    const hit = cache.get(hash);
+    if (hit) {
+        cache.delete(hash);
+        cache.set(hash, hit);
+        return { ...hit, cached: true };
+    }
+
+    if (!ENABLED) {
+        return {
+            buffer: input, mimeType: detectImageMimeType(input), hash, originalBytes: input.length,
+            bytes: input.length, cropped: false, processed: false, cached: false,
+        };
+    }
+
+    let pending = inFlight.get(hash);
+    if (!pending) {
+        const start = Date.now();
+        pending = withPoolSlot(() => runPipeline(input, hash))
+            .then(result => {
+                remember(result);
+                if (result.processed) {
+                    logger.info("[ImagePreprocessor] Prepared document image", {
+                        hash: hash.substring(0, 12),
+                        originalBytes: result.originalBytes,
+                        bytes: result.bytes,
+                        width: result.width,
+                        height: result.height,
+                        cropped: result.cropped,
+                        latencyMs: Date.now() - start,
+                    });
+                }
+                return result;
+            })
+            .finally(() => inFlight.delete(hash));
+        inFlight.set(hash, pending);
+    }
+    return pending;
+}
@@ -5,6 +5,8 @@
  * Extracted from botLogicService.ts for better maintainability.
  */
 
+import { classifyMessage } from "./messageClassifier";
+
 // ============================================================================
 // TYPES
 // ============================================================================
@@ -33,20 +35,8 @@ export function detectLanguageSelection(text: string): SupportedLanguage | null
  * Detect language from message content using keyword analysis
  */
 export function detectLanguageFromText(text: string): SupportedLanguage | null {
-    const t = text?.toLowerCase() ?? "";
-
-    const germanHints = [
-        "hallo", "moin", "servus", "grüß", "danke", "tschau", "bitte",
-        "guten", "morgen", "abend", "tag", "brauche", "suche", "möchte"
-    ];
-    const englishHints = [
-        "hello", "hi", "hey", "thanks", "thank you", "cheers",
-        "good", "morning", "evening", "need", "looking", "want"
-    ];
-
-    if (germanHints.some((w) => t.includes(w))) return "de";
-    if (englishHints.some((w) => t.includes(w))) return "en";
-    return null;
+    // Hint lists: germanHints / englishHints in messageClassifierWords.json
+    return classifyMessage(text).language;
 }
 
 // ============================================================================
@@ -57,21 +47,8 @@ export function detectLanguageFromText(text: string): SupportedLanguage | null {
  * Detect if message is smalltalk (greeting, thanks, etc.)
  */
 export function detectSmalltalk(text: string): SmalltalkType | null {
-    const t = text.toLowerCase().trim();
-
-    // Greetings
-    const greetings = ["hallo", "hello", "hi", "hey", "moin", "servus", "guten tag", "guten morgen", "good morning"];
-    if (greetings.some(g => t.includes(g))) return "greeting";
-
-    // Thanks
-    const thanks = ["danke", "thanks", "thank you", "vielen dank", "thx"];
-    if (thanks.some(th => t.includes(th))) return "thanks";
-
-    // Bot questions
-    const botQuestions = ["bist du ein bot", "are you a bot", "wer bist du", "who are you"];
-    if (botQuestions.some(q => t.includes(q))) return "bot_question";
-
-    return null;
+    // Greetings before thanks before bot questions (messageClassifierWords.json)
+    return classifyMessage(text).smalltalk;
 }
 
 // ============================================================================
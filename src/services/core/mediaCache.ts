@@ -0,0 +1,269 @@
+/**
+ * 🗄️ Media Cache — content-addressed on-disk cache for Twilio attachments
+ *
+ * BullMQ retries and OCR fallbacks used to download the same WhatsApp media
+ * again for every handler that needed it. Attachments are now stored once
+ * per pod:
+ *
+ *   <MEDIA_CACHE_DIR>/blobs/<sha256>        content, named by its hash
+ *   <MEDIA_CACHE_DIR>/refs/<sha256(key)>    key → blob hash
+ *
+ * The key is "<MessageSid>/<MediaSid>" for Twilio media URLs (stable across
+ * api.twilio.com redirects and query strings), the URL itself otherwise.
+ * Identical content under different keys shares one blob.
+ *
+ * - LRU eviction once the blobs exceed MEDIA_CACHE_MAX_BYTES (mtime is
+ *   refreshed on hit so the order survives restarts)
+ * - concurrent requests for the same key share one download
+ * - all disk work is async (fs/promises), so eviction never blocks the
+ *   event loop
+ *
+ * Any disk problem degrades to a plain download; the cache never fails a request.
+ */
+
+import { createHash, randomBytes } from "crypto";
+import * as fsp from "fs/promises";
+import * as os from "os";
+import * as path from "path";
+import { logger } from "@utils/logger";
+
+// ============================================================================
+// CONFIGURATION
+// ============================================================================
+
+const ENABLED = process.env.MEDIA_CACHE_ENABLED !== "false";
+const CACHE_DIR = process.env.MEDIA_CACHE_DIR || path.join(os.tmpdir(), "twilio-media-cache");
+const MAX_BYTES = Number(process.env.MEDIA_CACHE_MAX_BYTES || 512 * 1024 * 1024);
+
+const BLOB_DIR = path.join(CACHE_DIR, "blobs");
+const REF_DIR = path.join(CACHE_DIR, "refs");
+
+// ============================================================================
+// STATE
+// ============================================================================
+
+/** Blob hash → size, in LRU order (oldest first) */
+const blobs = new Map<string, number>();
+/** Cache key → blob hash */
+const refs = new Map<string, string>();
+/** Blob hash → keys pointing at it (to drop refs on eviction) */
+const keysByBlob = new Map<string, Set<string>>();
+const inFlight = new Map<string, Promise<Buffer>>();
+
+let totalBytes = 0;
+let ready: boolean | null = null;
+let initializing: Promise<boolean> | null = null;
+
+const stats = { hits: 0, misses: 0, deduped: 0, evictions: 0, errors: 0 };
+
+function sha256(data: string | Buffer): string {
+    return createHash("sha256").update(data).digest("hex");
+}
+
+function blobPath(hash: string): string {
+    return path.join(BLOB_DIR, hash);
+}
+
+function refPath(key: string): string {
+    return path.join(REF_DIR, sha256(key));
+}
+
+/**
+ * Cache key for a media URL: "<MessageSid>/<MediaSid>" for Twilio media,
+ * the URL without query string otherwise
+ */
+export function mediaCacheKey(mediaUrl: string): string {
+    const match = mediaUrl.match(/\/Messages\/(MM[0-9a-fA-F]{32})\/Media\/(ME[0-9a-fA-F]{32})/);
+    if (match) return `${match[1]}/${match[2]}`;
+    return mediaUrl.split("?")[0];
+}
+
+// ============================================================================
+// INDEX
+// ============================================================================
+
+function link(key: string, hash: string): void {
+    refs.set(key, hash);
+    let keys = keysByBlob.get(hash);
+    if (!keys) {
+        keys = new Set();
+        keysByBlob.set(hash, keys);
+    }
+    keys.add(key);
+}
+
+/** Load the cache once per process; concurrent callers share the load */
+function init(): Promise<boolean> {
+    initializing ??= load();
+    return initializing;
+}
+
+/**
+ * Create the directories and load what a previous process left behind.
+ * Refs are keyed by hash(key), so only those already known in this process
+ * are reverse-mapped; orphaned ref files are resolved lazily on lookup.
+ */
+async function load(): Promise<boolean> {
+    try {
+        await fsp.mkdir(BLOB_DIR, { recursive: true });
+        await fsp.mkdir(REF_DIR, { recursive: true });
+
+        const existing: Array<{ hash: string; size: number; mtimeMs: number }> = [];
+        for (const name of await fsp.readdir(BLOB_DIR)) {
+            const file = blobPath(name);
+            if (!/^[0-9a-f]{64}$/.test(name)) {
+                // Leftover temp file from an interrupted write
+                await fsp.rm(file, { force: true });
+                continue;
+            }
+            const stat = await fsp.stat(file);
+            existing.push({ hash: name, size: stat.size, mtimeMs: stat.mtimeMs });
+        }
+        existing.sort((a, b) => a.mtimeMs - b.mtimeMs);
+        for (const blob of existing) {
+            blobs.set(blob.hash, blob.size);
+            totalBytes += blob.size;
+        }
+        ready = true;
+        if (existing.length > 0) {
+            logger.info("[MediaCache] Loaded existing cache", { dir: CACHE_DIR, blobs: existing.length, bytes: totalBytes });
+        }
+        await evict();
+    } catch (err: any) {
+        ready = false;
+        logger.warn("[MediaCache] Cache directory unavailable — downloading without cache", { dir: CACHE_DIR, error: err?.message });
+    }
+    return ready;
+}
+
+async function lookup(key: string): Promise<string | null> {
+    let hash = refs.get(key);
+    if (!hash) {
+        try {
+            hash = (await fsp.readFile(refPath(key), "utf8")).trim();
+        } catch {
+            return null;
+        }
+        if (!blobs.has(hash)) {
+            await fsp.rm(refPath(key), { force: true }).catch(() => undefined);
+            return null;
+        }
+        link(key, hash);
+    }
+    return blobs.has(hash) ? hash : null;
+}
+
+function touch(hash: string): void {
+    const size = blobs.get(hash);
+    if (size === undefined) return;
+    blobs.delete(hash);
+    blobs.set(hash, size);
+    const now = new Date();
+    fsp.utimes(blobPath(hash), now, now).catch(() => undefined);
+}
+
+/**
+ * Drop a blob and its refs. The index is updated before the first await,
+ * so concurrent callers never see (or forget) the blob twice.
+ */
+async function forget(hash: string): Promise<void> {
+    const size = blobs.get(hash);
+    if (size === undefined) return;
+    blobs.delete(hash);
+    totalBytes -= size;
+    const keys = keysByBlob.get(hash) ?? new Set<string>();
+    keysByBlob.delete(hash);
+    for (const key of keys) refs.delete(key);
+
+    try {
+        await Promise.all([...keys].map(key => fsp.rm(refPath(key), { force: true })));
+        await fsp.rm(blobPath(hash), { force: true });
+    } catch (err: any) {
+        stats.errors++;
+        logger.warn("[MediaCache] Failed to remove blob", { hash, error: err?.message });
+    }
+}
+
+async function evict(): Promise<void> {
+    // Always keep the most recent blob, even if it alone exceeds the budget
+    while (totalBytes > MAX_BYTES && blobs.size > 1) {
+        stats.evictions++;
+        await forget(blobs.keys().next().value!);
+    }
+}
+
+async function store(key: string, data: Buffer): Promise<void> {
+    const hash = sha256(data);
+    if (!blobs.has(hash)) {
+        // Write-then-rename so readers never see a partial blob
+        const tmp = `${blobPath(hash)}.${process.pid}.${randomBytes(4).toString("hex")}.tmp`;
+        await fsp.writeFile(tmp, data);
+        await fsp.rename(tmp, blobPath(hash));
+        blobs.set(hash, data.length);
+        totalBytes += data.length;
+    } else {
+        touch(hash);
+    }
+    await fsp.writeFile(refPath(key), hash);
+    link(key, hash);
+    await evict();
+}
+
+// ============================================================================
+// PUBLIC API
+// ============================================================================
+
+/**
+ * Return the media for `mediaUrl` from the cache, calling `download` at most
+ * once per key and pod (concurrent callers share the same download).
+ * Download errors are not cached and propagate to every waiting caller.
+ */
+export async function getOrDownloadMedia(mediaUrl: string, download: () => Promise<Buffer>): Promise<Buffer> {
+    if (!ENABLED || !(await init())) return download();
+
+    const key = mediaCacheKey(mediaUrl);
+    const pending = inFlight.get(key);
+    if (pending) {
+        stats.deduped++;
+        return pending;
+    }
+
+    const run = (async () => {
+        const hash = await lookup(key);
+        if (hash) {
+            try {
+                const data = await fsp.readFile(blobPath(hash));
+                touch(hash);
+                stats.hits++;
+                return data;
+            } catch {
+                // Removed behind our back — drop it and download again
+                await forget(hash);
+            }
+        }
+
+        stats.misses++;
+        const data = await download();
+        try {
+            await store(key, data);
+        } catch (err: any) {
+            stats.errors++;
+            logger.warn("[MediaCache] Failed to store media", { key, error: err?.message });
+        }
+        return data;
+    })().finally(() => inFlight.delete(key));
+
+    inFlight.set(key, run);
+    return run;
+}
+
+export function getMediaCacheStats() {
+    return {
+        ...stats,
+        enabled: ENABLED && ready !== false,
+        dir: CACHE_DIR,
+        blobs: blobs.size,
+        bytes: totalBytes,
+        maxBytes: MAX_BYTES,
+    };
+}
@@ -0,0 +1,275 @@
+/**
+ * 🔎 Message Classifier
+ *
+ * Single pass over a message for every cheap signal the bot needs before
+ * routing it. detectAbusive / detectIntent / detectNoVehicleDocument
+ * (messageParser.ts), detectLanguageFromText / detectSmalltalk
+ * (languageService.ts) and the turn detectors in nluService.ts all read
+ * their answer from here:
+ *
+ *   - keyword lists (abuse, language hints, smalltalk, turn-intent tokens,
+ *     vehicle brands) → one Aho-Corasick walk over the lowered text, tables
+ *     generated by scripts/generate_classifier_tables.py from
+ *     messageClassifierWords.json
+ *   - INTENT_PATTERNS + NO_VEHICLE_DOC_PATTERNS → the same walk reports where
+ *     each pattern's literal prefix (its "trigger") occurs, and only the
+ *     patterns of that trigger are tried, sticky, at that position
+ *
+ * The linear scans these replace are kept as test oracles in
+ * __tests__/messageClassifier.test.ts.
+ */
+
+import type { IntentType } from "./messageParser";
+import type { SmalltalkType, SupportedLanguage } from "./languageService";
+import type { IntentResult } from "./nluService";
+import {
+    ALPHABET, CLASS_COUNT, OUTPUTS, STATE_COUNT, TRANSITIONS_B64, TRIGGERS, TRIGGER_IDS, TRIGGER_OFFSETS,
+} from "./messageClassifierTables";
+
+export interface MessageClassification {
+    abusive: boolean;
+    intent: IntentType;
+    noVehicleDocument: boolean;
+    language: SupportedLanguage | null;
+    smalltalk: SmalltalkType | null;
+    /** Order-level intent of a bot turn (nluService.detectIntent without an image) */
+    turnIntent: IntentResult;
+    /** Abuse check of a bot turn (nluService.detectAbusive, its own shorter list) */
+    turnAbusive: boolean;
+}
+
+// ============================================================================
+// Patterns
+// ============================================================================
+
+// Priority order: the first intent with a matching pattern wins.
+// Every unanchored pattern starts with a literal listed in patternTriggers.
+export const INTENT_PATTERNS: Record<IntentType, RegExp[]> = {
+    abort_order: [
+        /abbrechen/i, /cancel/i, /stopp/i, /stop/i, /aufhören/i,
+        /nicht mehr/i, /kein interesse/i, /egal/i, /vergiss/i
+    ],
+    continue_order: [
+        /noch ein teil/i, /weiteres teil/i, /another part/i,
+        /dasselbe fahrzeug/i, /same vehicle/i, /noch was/i
+    ],
+    status_question: [
+        /status/i, /bestellung/i, /order/i, /wo ist/i, /where is/i,
+        /lieferung/i, /delivery/i, /tracking/i
+    ],
+    new_order: [
+        /neues fahrzeug/i, /new vehicle/i, /anderes auto/i,
+        /different car/i, /von vorne/i, /start over/i
+    ],
+    greeting: [
+        /^(hallo|hello|hi|hey|moin|servus|guten\s?(tag|morgen|abend))$/i
+    ],
+    send_vehicle_doc: [
+        /fahrzeugschein/i, /zulassung/i, /registration/i, /dokument/i
+    ],
+    request_part: [
+        /brauche/i, /suche/i, /need/i, /looking for/i, /want/i, /möchte/i
+    ],
+    describe_symptoms: [
+        /klackert/i, /quietscht/i, /noise/i, /problem/i, /kaputt/i, /defekt/i
+    ],
+    general_question: [
+        /was kostet/i, /how much/i, /preis/i, /price/i
+    ],
+    smalltalk: [],
+    other: []
+};
+
+export const NO_VEHICLE_DOC_PATTERNS = [
+    /habe? ?(ich )?keine?n? ?(fahrzeugschein|schein|dokument)/i,
+    /habe? ?(ich )?nicht/i,
+    /don'?t have/i,
+    /no document/i,
+    /kein bild/i,
+    /kann nicht senden/i,
+    /can'?t send/i
+];
+
+/** OEM numbers pasted directly (matched on the original text to keep its case) */
+export const OEM_DIRECT_PATTERNS = [/oem[:\s]+([A-Z0-9\-]+)/i, /teilenummer[:\s]+([A-Z0-9\-]+)/i];
+
+export const YEAR_PATTERN = /\b(19|20)\d{2}\b/;
+
+// Word-list bits — must match LIST_BITS in generate_classifier_tables.py
+const ABUSIVE_BIT = 1 << 0;
+const GERMAN_BIT = 1 << 1;
+const ENGLISH_BIT = 1 << 2;
+const GREETING_BIT = 1 << 3;
+const THANKS_BIT = 1 << 4;
+const BOT_QUESTION_BIT = 1 << 5;
+const STATUS_BIT = 1 << 6;
+const ABORT_BIT = 1 << 7;
+const ORDER_BIT = 1 << 8;
+const VEHICLE_BRAND_BIT = 1 << 9;
+const OEM_MARKER_BIT = 1 << 10;
+const TURN_ABUSIVE_BIT = 1 << 11;
+
+// ============================================================================
+// Aho-Corasick automaton (decoded once at module load)
+// ============================================================================
+
+const CHAR_CLASS = new Uint8Array(0x10000);
+for (let i = 0; i < ALPHABET.length; i++) {
+    CHAR_CLASS[ALPHABET.charCodeAt(i)] = i + 1;
+}
+
+const TRANSITIONS = (() => {
+    const bytes = Buffer.from(TRANSITIONS_B64, "base64");
+    const table = new Uint16Array(STATE_COUNT * CLASS_COUNT);
+    if (bytes.length !== table.length * 2) {
+        throw new Error("messageClassifierTables.ts is corrupt — rerun scripts/generate_classifier_tables.py");
+    }
+    for (let i = 0; i < table.length; i++) table[i] = bytes.readUInt16LE(i * 2);
+    return table;
+})();
+
+const STATE_OUTPUTS = Uint16Array.from(OUTPUTS);
+const STATE_TRIGGER_OFFSETS = Uint16Array.from(TRIGGER_OFFSETS);
+const STATE_TRIGGER_IDS = Uint16Array.from(TRIGGER_IDS);
+const TRIGGER_LENGTHS = Uint8Array.from(TRIGGERS, trigger => trigger.length);
+
+// ============================================================================
+// Trigger → candidate patterns
+// ============================================================================
+
+/** Marks a NO_VEHICLE_DOC_PATTERNS candidate (intents use their priority index) */
+const NO_DOC = -1;
+
+interface Candidate {
+    /** Sticky copy of the pattern, tried at the trigger's start */
+    regex: RegExp;
+    intent: number;
+}
+
+// Intents in priority order; intents without patterns never match
+const INTENT_ORDER = (Object.entries(INTENT_PATTERNS) as [IntentType, RegExp[]][])
+    .filter(([, patterns]) => patterns.length > 0);
+
+/**
+ * Literal text every match of `source` starts with: the characters before
+ * the first regex metacharacter, minus one if that is a quantifier. A
+ * top-level alternation has no common prefix ("").
+ */
+function literalPrefix(source: string): string {
+    let prefix = "";
+    for (const ch of source) {
+        if ("\\^$.|?*+()[]{}".includes(ch)) {
+            if (ch === "?" || ch === "*" || ch === "{") prefix = prefix.slice(0, -1);
+            if (ch === "|") prefix = "";
+            break;
+        }
+        prefix += ch;
+    }
+    return prefix.toLowerCase();
+}
+
+const CANDIDATES: Candidate[][] = TRIGGERS.map(() => []);
+/** ^-anchored patterns: tried once on the whole text */
+const ANCHORED: Candidate[] = [];
+
+function addCandidate(pattern: RegExp, intent: number): void {
+    if (pattern.source.startsWith("^")) {
+        ANCHORED.push({ regex: pattern, intent });
+        return;
+    }
+    const prefix = literalPrefix(pattern.source);
+    const trigger = TRIGGERS.indexOf(prefix);
+    if (trigger < 0) {
+        throw new Error(
+            `No trigger for /${pattern.source}/ — add "${prefix}" to patternTriggers ` +
+            "in messageClassifierWords.json and rerun scripts/generate_classifier_tables.py"
+        );
+    }
+    CANDIDATES[trigger].push({ regex: new RegExp(pattern.source, `${pattern.flags.replace("g", "")}y`), intent });
+}
+
+INTENT_ORDER.forEach(([, patterns], i) => patterns.forEach(p => addCandidate(p, i)));
+NO_VEHICLE_DOC_PATTERNS.forEach(p => addCandidate(p, NO_DOC));
+
+// ============================================================================
+// Scan
+// ============================================================================
+
+interface ScanResult {
+    /** Bitmask of every word list with at least one keyword contained in the text */
+    mask: number;
+    /** Index into INTENT_ORDER of the best matching intent, INTENT_ORDER.length if none */
+    best: number;
+    noVehicleDocument: boolean;
+}
+
+function tryCandidate(candidate: Candidate, t: string, start: number, result: ScanResult): void {
+    if (candidate.intent === NO_DOC ? result.noVehicleDocument : candidate.intent >= result.best) return;
+    candidate.regex.lastIndex = start;
+    if (!candidate.regex.test(t)) return;
+    if (candidate.intent === NO_DOC) result.noVehicleDocument = true;
+    else result.best = candidate.intent;
+}
+
+/**
+ * One walk over `t`: keyword bits, plus the patterns whose trigger ends at
+ * each position, tried at the trigger's start.
+ */
+function scan(t: string): ScanResult {
+    const result: ScanResult = { mask: 0, best: INTENT_ORDER.length, noVehicleDocument: false };
+    for (const candidate of ANCHORED) tryCandidate(candidate, t, 0, result);
+
+    let state = 0;
+    for (let i = 0; i < t.length; i++) {
+        state = TRANSITIONS[state * CLASS_COUNT + CHAR_CLASS[t.charCodeAt(i)]];
+        result.mask |= STATE_OUTPUTS[state];
+        for (let k = STATE_TRIGGER_OFFSETS[state]; k < STATE_TRIGGER_OFFSETS[state + 1]; k++) {
+            const trigger = STATE_TRIGGER_IDS[k];
+            const start = i + 1 - TRIGGER_LENGTHS[trigger];
+            for (const candidate of CANDIDATES[trigger]) tryCandidate(candidate, t, start, result);
+        }
+    }
+    return result;
+}
+
+function turnIntent(text: string, t: string, mask: number): IntentResult {
+    if (!t) return { intent: "unknown" };
+
+    if (mask & OEM_MARKER_BIT) {
+        for (const p of OEM_DIRECT_PATTERNS) {
+            const m = text.match(p);
+            if (m) return { intent: "oem_direct", extractedOem: m[1] };
+        }
+    }
+    if (mask & STATUS_BIT) return { intent: "status_question" };
+    if (mask & ABORT_BIT) return { intent: "abort_order" };
+    if (mask & ORDER_BIT) return { intent: "new_order" };
+    if (mask & VEHICLE_BRAND_BIT || YEAR_PATTERN.test(t)) return { intent: "continue_order" };
+    return { intent: "unknown" };
+}
+
+// ============================================================================
+// Public API
+// ============================================================================
+
+/**
+ * Classify a message in one pass over its lowered text.
+ */
+export function classifyMessage(text: string): MessageClassification {
+    const original = text ?? "";
+    const t = original.toLowerCase().trim();
+    const { mask, best, noVehicleDocument } = scan(t);
+
+    return {
+        abusive: (mask & ABUSIVE_BIT) !== 0,
+        intent: best < INTENT_ORDER.length ? INTENT_ORDER[best][0] : "other",
+        noVehicleDocument,
+        language: mask & GERMAN_BIT ? "de" : mask & ENGLISH_BIT ? "en" : null,
+        smalltalk: mask & GREETING_BIT ? "greeting"
+            : mask & THANKS_BIT ? "thanks"
+                : mask & BOT_QUESTION_BIT ? "bot_question"
+                    : null,
+        turnIntent: turnIntent(original, t, mask),
+        turnAbusive: (mask & TURN_ABUSIVE_BIT) !== 0,
+    };
+}
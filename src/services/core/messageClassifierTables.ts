@@ -0,0 +1,26 @@
+/**
+ * GENERATED by scripts/generate_classifier_tables.py — do not edit.
+ * Source: messageClassifierWords.json (126 keywords, 55 triggers, 819 states)
+ */
+
+export const WORDS_SHA256 = "1bfef0c6accc7a69c6e5a32ff9ecc349091828bc4b1f39c07ee220198747a681";
+
+/** Characters with their own class; class = index + 1, 0 = any other char */
+export const ALPHABET = " abcdefghijklmnopqrstuvwxyz\u00df\u00e7\u00ea\u00ee\u00f6\u00fb\u00fc\u0131\u015f";
+
+export const STATE_COUNT = 819;
+export const CLASS_COUNT = 37;
+
+/** Dense DFA, row-major [state * CLASS_COUNT + class], Uint16 little-endian */
+export const TRANSITIONS_B64 =
+    "AAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAPUAAACJABYBLwASAX8BdADpAmEAHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCAwAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMA0QIBAFIAAACJABYBLwAFAGcAdADpAmEAHwBjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAGAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgEHALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwAIAFIAAACJABYBLwASAWcA6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7ADkAoQCoAPEAEwB3AAEA9QAAAIkAFgEvAAkAfwF0AOkCYQAfAM0AAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAEoBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQANAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwAOAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7ADkAoQCoACIAEwB3AAEA9QAAAIkADwAvABIBowB0AOkCYQAfAM0AAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEQAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5ABEAqAAEAhMAdwABAFIAAACJABYBLwASARgB6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3ABIAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAAAETAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwI5AKEAqAALARMAdwABAFIAAACJABYBLwASARQAdADpAmEAHwDNAEgAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekC6QEfABUAAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAXABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAMkCGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAGQATAHcAAQAyAQAAiQAWAS8AEgFAAHQA6QJhAB8AzQAAABgA1wEAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAhoAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwAnAgEAUgAAAIkAFgEvABIBZwAbAOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMQBOQChAKgACwETAHcAAQAcAAAAiQAWAS8AEgFnAHQA6QL1Ah8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHQDNAAAAGAAoAAAAAADIAgAAdgAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAeAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3ACEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAIgATAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAABARMAJAIBACMAAACJAPIALwASAWcAdADpAmEAHwDNAAAADAEoAAAA9gDIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAkAM0AAAAYACgAAAAAAMgCJgAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhACUAaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoACcAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHQE5AKEAqABVARMAdwBfASkAAACJABYBLwASAXQCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAKgBTAG4BEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcAKwBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqAAAARMAdwABAPUAAACJABYBLwASAaMAdADpAmEALADNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAC0AEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPIBOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QIuAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAwwAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN8BEwB3AAEAMAAAAIkAFgEvABIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhADEAzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAMgBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwAzAE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgANAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA1AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAnkAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6ADkAoQCoAOYBEwB3AAEASwAAAIkAFgHSARIBZwB0AOkC4gAfAM0ANgAYACgAAAAAAMgCAAAAAI0AAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QI3AB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwA4AAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAADoAOQChAKgA5gETAHcAAQBLAAAAiQAWAdIBEgFnAHQA6QLiAB8AzQAAABgAKAAAAAAAyAIAAAAAjQAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAOwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQBYADwA6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD0AOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgGfAXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMA4QABAFIAAACJABYBcgBCAmcAgQDpAj4AVwBrAdQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQA/AEoBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMALUCAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgArgATAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJAEEALwCtAmcA6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAANgBQgAvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBDAAAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEARACOARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADJADkAoQCoAK4AEwB3AAEARQAAAIkAFgEvABIB2wJ0AOkCYQAfAM0AqQAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwGiAncAAQBSAAAAiQAWAS8AEgFGAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwBHAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACtADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQBJAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwCiAFIAAABKABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAD0BTAAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AE0AqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDTAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AE4AUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAAAETAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAFAAAACJABYBLwASAX8BdADpAmEAHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAFEAAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADJADkAoQCoAK4AEwB3AAEAVAAAAIkAFgEvABIB2wJ0AOkCYQAfAM0AqQAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwGiAncAAQBSAAAAiQAWAS8AEgFVAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwBWAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACtADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAFgAaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBZAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7ADkAoQCoAPEAEwB3AAEAUAAAAIkAFgEvABIBWgB0AOkCYQAfAM0AAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQBbAC8A+QFnAOsB6QJoAB8AzQAAABgAgAEAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABcABMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQC/AAAAiQAWAS8AEgFnAOsB6QJeAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAcQJiABMA2QABAFIAAACJABYBLwAHAV8AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvAGAAZwDrAekCaABqAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwDRAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAGMAAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGQAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMA4QABAFIAAACJABYBcgBCAmcAgQDpAmUAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBmAEoBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgArgATAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBxAmIAEwB3AAEAUgAAAIkAFgEvABIBaQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAGoAzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAawDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADEATkAoQCoAAsBEwB3AAEAswAAAIkAFgEvABIBZwB0AOkC9QIfAM0AbAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAABuABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAG8AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBwAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAnEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgA3wETAHcAAQAwAAAAcwAWAS8AEgFdAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAA+wI5AKEAqAC2ARMAdwABAAICAACJAOICLwASAWcAdADpAmEAHwDNAJ0AGAAoAAAAAADIAgAAAACYAAAAAACKAAAAAAAAAAAAAADEATkAoQCoAAsBEwB3AAEAdQAAAIkAFgEvABIBZwB0AOkC9QIfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAHYAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJ5AB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAdwABAHoAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAHsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAfAATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQDJAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAAB9ABYBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAB+ADkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQB/AHIAJANnAPwC6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAgAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMQBOQChAKgACwETAHcAAQB1AAAAiQAWAS8AEgFnAHQA6QL1Ah8AggAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgwA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwDhAAEAUgAAAIkAhAByAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJAIYAXAJCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACHADkAoQCoAAsBEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiAAWAXIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+wI5AKEAqAC2ARMAdwABAAICAACJAOICLwASAWcAdADpAmEAHwDNAJ0AGAAoAAAAAADIAgAAAACYAAAAAACKAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QKLAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqACMABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwDRAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAGMAAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AkwBnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAjgAAAAAACgA5AKEAqACPABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCkAAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAkQATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALAZIA0QIBAFIAAACJABYBLwASAWcAdADpAmEAHwBjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7AjkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBFAB0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJQAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBlQBCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN8BEwB3AAEAMAAAAHMAFgEvABIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAJYAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAJcAzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgGZABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJoAOQChAKgA3wETAHcAAQAwAAAAiQAWAS8AEgFdAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAmwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQBYAGkB6AAYACgAAAAAAMgCAAAAAAAAnAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAp4AHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYAJ8AAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAAOQChAKgAVQETAHcAXwEpAAAAiQAWAS8AEgF0AnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgAeAWcAgQDpAgsABAPNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AKIAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAAAETAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJAKQALwD5AWcA6wHpAmgAHwDNAAAAGACAAQAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAKUAEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QKmAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAApwA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgArgATAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBDQISAWcAqgDpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADEATkAoQCoAKsAEwB3AAEAdQAAAIkAFgEvABIBZwB0AOkC9QIfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAArAAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+wI5AKEAqAC2ARMAdwABAAICAACJAOICLwASAWcAdADpAmEAHwDNAJ0AGAAoAAAAAADIAgAAAACYAAAAAACKAAAAAAAAAAAAAAAKANwAoQCoAAsBEwDhAAEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoArwChAKgACwEAAyQCAQBSAAAAiQB8Ai8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgA5AKEAqADmARMAdwABALAAAACJABYB0gESAWcAdADpAuIAHwDNAAAAGAAoAAAAAADIAgAAAACNAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAsQAvABIBZwB0AOkCYQA9AUwAAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxAE5AKEAqAALARMAdwABALMAAACJABYBLwASAWcAdADpAvUCHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTALQAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAB2AAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QK1AB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAtgBiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC3ADkAoQCoAK4AEwB3AAEAoQIAAIkAFgEvABIB2wJ0AOkCYQAfAM0AqQAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQC4AHIAygBnAIEA6QILAE0CzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuQA5AKEAqAALARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgC6AIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgAWA6EAqAALARMAdwABAFIAAACJALwAcgBCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkAvQAvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgG+AHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASARgB6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvAMAAZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8gE5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAsIAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAADDACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAGQATAHcAAQAyAQAAiQAWAS8AEgFAAHQA6QJhAB8AzQDEABgA1wEAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAxQDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAADHAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAsgAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAygBnAIEA6QILAE0CzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAlwITARMAdwABAK0BAADLABYBLwASAUMCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoAMwAEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQC3AQAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAzwCoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcA0ABSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0QA5AKEAqAAiABMAdwABAPUAAACJABYBLwASAaMAdADpAmEAHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKABYDoQCoAAsBEwB3AAEAUgAAAIkAvAByAEICZwCBAOkCCwBXAM0A0gAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChANUBCwEVAncAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADUABMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAzAEAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8A1gAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADXABMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAzAEAAIkAFgEvANgAZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAgAQoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqADaABMAdwABAFIAAACJABYBLwASAQQBdADpAsYAHwDNANUAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvANsAZwB0AOkCeQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgCYAaEAqADdABMAdwABAEsAAACJABYB0gESAWcAdADpAuIAHwDNAAAAGAAoAAAAAADIAgAAAACNAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvAN4AZwB0AOkCYQBpAs0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAN8AEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAA6AEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwDhAAEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4wA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A5AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQDlANUBCwEVAncAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwDmAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7ADkAoQCoAOcAEwB3AAEA9QAAAIkAFgEvABIBowB0AOkCYQAfAM0AAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAAQETACQCAQBSAAAAiQDyAC8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAPYAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AOkAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AOoAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgA6wATAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAABARMAJAIBAFIAAACJAPIALwASAWcAdADpAmEAHwDNAAAADAEoAAAA9gDIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkA7QCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcA7gBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqAAAARMAdwABAPUAAACJABYBLwASAaMAdADpAmEAHwDvAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAPAAEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQDMAQAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJAPIALwASAWcAdADpAmEAHwDNAAAADAEoAAAA9gDIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkA8wAvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgH0AHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASARgB6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+AA5AKEAqADxABMAdwABAPUAAACJABYBLwASAX8BdADpAmEAHwDNAAIAGAAoADwB/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKABYDoQCoAAsBEwB3AAEAUgAAAIkAvAByAPkAZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAJcCEwETAHcAAQCtAQAA+gAWAS8AEgFDAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAPwA+wI5AKEAqAC2ARMAdwABAAICAACJAOICLwASAWcAdADpAmEA+wDNAJ0AGAAoAAAAAADIAgAAAACYAAAAAACKAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAP0AyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAf4AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekCaAAfAM0A/wAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAABARMAJAIBAFIAAACJAPIALwASAWcAdADpAmEAHwDNAAAADAEoAAAA9gDIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCAgEfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAAMBzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBBQHrAekCaAAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAAYBBAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAACoByQA5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEACAEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQCuAVMACwETAHcAAQBSAAAAiQAWAS8ACQFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMACgEBAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAANARMAdwABADIBAACJABYBLwASAUAAdADpAmEAHwDNAAAAGADXAQAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvAA4BZwB0AOkCGgAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQAPAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AK4BUwALARMAdwABAFIAAACJABYBLwAQAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwARAQEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABQBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AggIMAY4CAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChABUBCwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgEYAesB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAAAZARYBLwASAWcA6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAGgEAAIkA4gIvABIBZwB0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAMCOQChAFMACwETAHcAAQBSAAAAiQAWAS8AGwFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAHAEBAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAwAEKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAHgFnAIEA6QILAAQDzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAlwITARMAdwABAK0BAACJABYBLwASAUMCdADpAmEAHwAfAQAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWASQBEgFnAHQA6QJhAB8AIQEAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIgE5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwAjAQEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqADfARMAdwABADAAAACJABYBLwASASUBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAA7AAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAvwAAAIkAFgEvABIBZwDrAekCJgEfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAHECYgATACcBAQBSAAAAiQAWAS8ABwFfAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAoARMAdwABAFIAAACJABYBLwASAQQBdADpAsYAHwDNANUAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvACkBZwB0AOkCeQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBKwESAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN8BEwB3AAEAMAAAAIkAFgEvABIBLAF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQC/AAAAiQAWAS8AEgFnAOsB6QItAR8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAcQJiABMA2QABAFIAAACJABYBLwAuAV8AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEALwEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQCuAVMACwETAHcAAQBSAAAAiQAWAS8AMAFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAMQEBAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMAMwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJADQBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoADUBEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8ANgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAADcBCgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQA4AQsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAADkBOQChAKgArgATAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgA6AWcAgQDpAgsATQLNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCXAhMBEwB3AAEArQEAADsBFgEvABIBQwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPsCOQChAKgAzAATAHcAAQACAgAAiQDiAi8AEgFnAHQA6QJhAB8AzQCdABgAKAAAAAAAyAIAAAAAmAAAAAAAigAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAD4B6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAA/AWoBOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgGfAXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAQAELARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADJADkAoQCoAK4AEwB3AAEAoQIAAIkAFgEvABIB2wJ0AOkCYQAfAM0AQQEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABCAQoAOQChAKgACwETAHcAAQBSAAAAiQAWAQ0CEgFnAKoA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABDARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEARAEAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8ARQFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAEYBCgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAEcBoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAADoAOQChAKgA5gETAHcAAQBLAAAAiQAWAdIBEgFIAXQA6QLiAB8AzQAAABgAKAAAAAAAyAIAAAAAjQAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwBJAQAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABLAQoAOQChAKgACwETANECAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AYwAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAATAHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBTQF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAB8AzQBOARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAE8BCgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAABQATkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABRAQoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgBSAaEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6ADkAoQCoAOYBEwB3AAEASwAAAIkAFgHSARIBUwF0AOkC4gAfAM0AAAAYACgAAAAAAMgCAAAAAI0AAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAB8AVAEAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEANwIAAIkAFgEvABIBZwB0AOkCVgEfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABXAQoAOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgBYAaEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6ADkAoQCoAOYBEwB3AAEAWQEAAIkAFgHSARIBZwB0AOkC4gAfAM0AAAAYACgAAAAAAMgCAAAAAI0AAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAFoBTAAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBbAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAXAFqATkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIBnwF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAF0BCwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAF4BGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAQgEKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgENAhIBZwCqAOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAeQETAHcAAQD1AAAAiQAWAS8AEgFgAXQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAGEBCgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwD5AWcA6wHpAmgAHwDNAAAAGACAAQAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAABiATkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAQgJnAIEA6QJjAVcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABkARMAdwABAFIAAACJABYBLwASAWcAdADpAmEADADNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAZQEKADkAoQCoAAsBEwDRAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAGMAAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAGYByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekCaAAfAM0AaAEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABPAQoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAagE5AKEAqADLARMAdwD3AFIAAACJABYBLwASAZ8BdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwDhAAEAUgAAAIkAFgFyAEICZwCBAOkCtAJXAGsB1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQBsARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAbQHNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAABvAQoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJAHQBLwASAWcAdADpAmEAHwDNAAAAGABwAQAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdATkAoQCoAHEBEwB3AF8BKQAAAIkAFgEvABIBdAJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQByAQAAiQAWAS8AEgFnAHQA6QJWAR8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwBzAQAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoADkCEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHUBOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgB2AWcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCXAhMBEwB3AQEArQEAAIkAFgEvABIBQwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAETAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAnkAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkA8gAvABIBZwB0AOkCegEfAM0AAAAMASgAAAD2AMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAewETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAHwBCgA5AKEAqAALARMA0QIBAFIAAACJABYBLwASAWcAdADpAmEAHwBjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAfQEAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAH4BzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvAPkBZwDrAekCaAAfAM0AAAAYAIABAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAACBAR0BOQChAKgAVQETAHcAXwEpAAAAiQAWAS8AEgF0AnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJAIIBDAMSAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkAFgEvABIBgwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AhAEYAesB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAhQEBAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIcBOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAIgBqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AKIAUgAAAIkBFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPsCOQChAKgAtgETAHcAAQCKAQAAiQDiAi8AEgFnAHQA6QJhAB8AzQCdABgAKAAAAAAAyAIAAAAAmAAAAAAAigAAAAAAAAAAAAAAAwI5AKEAUwALARMAdwABAFIAAACJABYBLwCLAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwCMAQEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwCOARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBjwEkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsCOQChAKgAkAETAHcAAQBSAAAAiQAWAS8AEgEUAHQA6QJhAB8AzQBIABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpApEBHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQCSAc0AeQIYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AkwHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAE5AKEAqADLARMAdwD3AFIAAACJABYBLwASAZ8BdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwDhAAEAUgAAAIkAFgFyAEICZwCBAOkCtAJXAJUB1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQCWARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAlwHNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAADoAOQChAKgA5gETAHcAAQBLAAAAiQAWAdIBEgFnAHQA6QKZAR8AzQAAABgAKAAAAAAAyAIAAAAAjQAAAAAAAAAAAAAAAAAAAAAA4wA5AKEAqACaARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAmwGoAAsBEwDRAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAGMAAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcAnAFSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqACdARMAdwABAPUAAACJABYBLwASAaMAdADpAmEAHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAEBEwAkAgEAUgAAAIkA8gAvAJ4BZwB0AOkCYQAfAM0AAAAMASgAAAD2AMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcAEwLpAqABHwDNAAAAGAAoAAAA9QHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBxAmIAEwB3AAEAUgAAAIkAFgEvAKEBaQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCiAQAAiQAWAS8AEgGnAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AK4BUwCjARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCpAEfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgApQETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMA0QIBAFIAAACJABYBLwCmAWcAdADpAmEAHwBjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAYAwoAOQAsAqgABAITAHcAAQDyAgAAiQAWAS8AEgFnAOsB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgCpAWcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAqgGXAhMBEwB3AAEArQEAAIkAFgEvABIBQwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgAqwETAHcAogBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJAKwBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQCuAVMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwCvAVIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7ADkAoQCoAAABEwB3AAEA9QAAAIkAFgEvABIBowB0AOkCYQAfALABAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAACxAeAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBsgESAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoALMBEwB3AAEAMAAAAIkAFgEvABIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCtAFSAAAAiQAWAS8AEgFnAHQA6QLgAR8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAPUAAACJABYBLwASAX8BdADpArUBHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQC3AQAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwC4AWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAuQEKADkAoQCoABMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAugGhAKgACwETAHcAAQAbAgAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgA5AKEAqAC7ARMAdwABACEDAACJABYB0gESAWcAdADpAuIAHwDNAAAAGAAoAAAAAADIAgAAAACNAAAAAAAAAAAAAAAAAAAAAAAKADkAoQC8AQsBEwAkAgEAUgAAAIkAFgEvAOcBZwB0AOkCYQBpAs0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL0BOQChAKgArgATAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgDKAGcAgQDpAr4BTQLNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAEoBvwF3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsCOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgEUAHQA6QJhAB8AzQBIABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALAcEBdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7AjkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBwgF0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QLDAR8AFQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEA6gFiABMAdwABAFIAAACJABYBLwASAWkAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAEICZwCBAOkCxQFXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgASgETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAAwAxgEAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAMcB4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsByAF3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsCOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgHJAXQA6QJhAB8AzQBIABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAsoBHwAVAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQDqAWIAEwB3AAEAUgAAAIkAFgEvABIBaQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQDMAQAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJAM0BLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAzgEKADkAoQCoAAYCEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwHPAXcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwI5AKEAqAALARMAdwABAFIAAACJABYBLwASARQAdADpAmEAHwDNAEgAGAAoAAAAAADIAgAAAAAAAAAAAAAAANABAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkC0QEfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqADfARMAdwABADAAAACJABYBLwASAV0AdADpAmEAHwDNAAAAGADTAQAAAADIAgAAAAAAAAAA7AAAAAAAAAAAAAAAAAAdATkAoQCoAFUBEwB3AF8BKQAAAIkAFgEvABIBdAJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChANUBCwEVAncAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqACuABMAdwABANYBAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBogJ3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB0BOQChAKgAVQETAHcAXwEpAAAAiQAWAS8AEgF0AnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+wI5AKEAqAC2ARMAdwABAAICAACJAOICLwASAWcAdADpAmEA2QHNAJ0AGAAoAAAAAADIAgAAAACYAAAAAACKAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYANoBAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAANsBOQChAKgAVQETAHcAXwEpAAAAiQAWAS8AEgF0AnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMA3AEBAFIAAACJABYBcgAeAWcAgQDpAgsABAPNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN0BEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8A3gFnAHQA6QJ5AB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkC4AEfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQDhAagAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqADiARMAdwCiAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQDjAQsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgA5AETAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgCvAKEAqAALAQADJAIBAFIAAACJAHwCLwASAWcAdADpAmEA5QHNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8A5wFnAHQA6QJhAGkCzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADoAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AyQIYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAOoBYgATAHcAAQBSAAAAiQAWAS8AEgFpAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqAByAhMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADEATkAoQCoAOwBEwB3AAEAdQAAAIkAFgEvABIBZwB0AOkC9QIfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQDtAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIB7wF0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoAOQChAPABBAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8QE5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAMoAZwCBAOkCCwBNAs0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAQgJnAIEA6QILAFcA8wHUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekCaAAfAM0AAAAYACgAAAD1AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgH2AXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwD3AQAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD4ATkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAOEAAQBSAAAAiQAWAXIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEA+gETARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7ATkAoQCoAK4AEwB3AAEAoQIAAIkAFgEvABIB2wJ0AOkCYQAfAM0AqQAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAygBnAIEA6QILAE0CzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAP0BGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvAP4BZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAP8BEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI5AKEAqACuABMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAAQIAAIkAFgFyAMoAZwCBAOkCCwBNAs0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwI5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAQUCEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqADfARMAdwABADAAAACJABYBLwASAV0AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAA7AAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvAAcCZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAIAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBCQISAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN8BEwB3AAEAMAAAAIkAFgEKAhIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAKgACwITAHcAAQAwAAAAiQAWAS8AEgFdAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAgwCHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkA4QGoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgA3wETAHcAAQAwAAAAiQAWAQ4CEgFdAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAACgA5AKEAqADfARMAdwABADAAAAAPAhYBLwASAV0AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAA7AAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBEAJ0AOkCYQAfAM0AnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnABEC6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxAE5AKEAqADsARICdwABAHUAAACJABYBLwASAWcAdADpAvUCHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7AjkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBFAB0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMQBOQChAKgA7AETAHcAAQB1AAAAiQAWAS8AEgFnABQC6QL1Ah8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxAE5AKEAqAALARMAdwABAHUAAACJABYBLwASAWcAdADpAvUCHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7AjkAoQCoAAsBEwB3ABYCUgAAAIkAFgEvABIBFAB0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgA8QATAHcAAQD1AAAAiQAWAS8AEgF/AXQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAABcCAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAhgCHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABkCEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETANECAQBSAAAAiQAWAS8AGgJnAHQA6QJhAB8AYwAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABwCZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AHQIAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqAAeAhMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAzAEAAIkAFgEvABIBZwB0AOkCHwIfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAIAITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMA0QIBAFIAAACJABYBLwASAWcAdADpAmEAIQJjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAiAmkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAIwITAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8gE5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAsIAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAjkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAmAnIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAKAIAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhACkCzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAKgJpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAYAwoAOQAsAqgABAITAHcAAQDyAgAAiQAWAS8AEgFnAOsB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwAtAlIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAALgK7ADkAoQCoAAABEwB3AAEA9QAAAIkAFgEvABIBowB0AOkCYQAfAM0AAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgALwITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAZgIAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBADACAACJABYBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvADECZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAyAgoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwAzAgAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoADQCEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQA1AgAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJADYCLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAzgEKADkAoQCoAAYCEwB3AAEAjQEAAIkAFgEvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AOAIAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqAA5AhMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAzAEAAIkAFgEvABIBZwB0AOkCOgIfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAOwITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMA0QIBAFIAAACJABYBLwASAWcAdADpAmEAPAJjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAPQKFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8APgIAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqAA/AhMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAQAIAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQBBAi8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAM4BCgA5AKEAqAAGAhMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCXAhMBEwB3AAEArQEAAIkAFgEvABIBQwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAYAwoAOQAsAqgABAITAHcAAQDyAgAAiQAWAS8AEgFnAOsB6QJoAB8ARAIAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwBFAlIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD4ADkAoQCoAEYCEwB3AAEA9QAAAIkAFgEvABIBfwF0AOkCYQAfAM0AAgAYACgAPAH8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQDyAC8AEgFnAHQA6QJHAh8AzQAAAAwBKAAAAPYAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAEgCCgA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwBJAukCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEoCOQChAKgACwETAHcAAQB1AAAAiQAWAS8AEgFnAHQA6QL1Ah8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAksCVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAEoBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMAEwCAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAADHAeAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEATgJpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAE8CEwB3AFkAbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPIBOQChAKgACwETACQCAQBSAAAAiQBQAi8AEgFnAHQA6QLCAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgBRAqEAqAALARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6ADkAoQCoAFICEwB3AAEASwAAAIkAFgHSARIBZwB0AOkC4gAfAM0AAAAYACgAAAAAAMgCAAAAAI0AAAAAAAAAAAAAAAAAAABTAgoAOQChAKgACwETACQCAQBSAAAAiQAWAS8A5wFnAHQA6QJhAGkCzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALAVQCdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAABVAjkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBFAB0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAVgJSAAAAiQAWAXIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAPUAAACJABYBLwASAX8BdADpAlcCHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAFgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAWQITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQDJAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAHwDNAFoCDAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwBbAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAMICzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABdAhMAdwABADAAAABzABYBLwASAV0AdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAA7AAAAAAAAAAAAAAAXgIKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkC4AEfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAF8CKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABgAhMAdwABADIBAACJABYBLwASAUAAdADpAmEAHwDNAAAAGADXAQAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAmECUgAAAIkAFgEvABIBZwB0AOkCGgAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgA8QATAHcAAQBiAgAAiQAWAS8AEgF/AXQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AGMCUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AKIAUgAAAIkAZAIvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAZQITAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAABnAjkAoQCoAFUBEwB3AF8BKQAAAIkAFgEvABIBdAJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAHgFnAIEA6QILAGgCzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAUDhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAWABpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGoC6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGoBOQChAKgAawITAHcA9wBSAAAAiQAWAS8AEgGfAXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAMwBAACJAGwCLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAjQEAAIkAbQIvABIBFwF0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQBuAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwBvAmcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwBwAgEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqAByAhMAdwABAKECAACJABYBLwASAdsCdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAK8AoQCoAAsBAAMkAgEAUgAAAIkAfAIvABIBZwB0AOkCcwIfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAYgATAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAHUCCgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAdgIAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAHcCzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwB4AugAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAABqATkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIBnwF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AegJnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAewIBAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgAfAM0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQB9AgAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwCOARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAfgIoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAH8CEwB3AAEAMgEAAIkAFgEvABIBQAB0AOkCYQAfAM0AAAAYANcBAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QKAAh8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAJwIBAFIAAACJABYBLwASAWcAGwDpAmEAHwDNAAAAGAAoAAAAgQLIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAgwITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAhALNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAhQKFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwGGAncAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhwI5AKEAqAALARMAdwABAFIAAACJABYBLwASARQAdADpAmEAHwDNAEgAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AIgCUgAAAIkAFgFyAEICZwCBAOkCCwBXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgA8QATAHcAAQD1AAAAiQAWAS8AEgF/AXQA6QKJAh8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqABiABMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAACKAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAIsCEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AyQIYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQCMAgwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAjQIBAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAHgAEwB3AAEAUgAAAIkAFgEvABIBBAF0AOkCxgDCAs0A1QAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAACPAh0BOQChAKgAVQETAHcAXwEpAAAAiQAWAS8AEgF0AnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAkAIoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAJECEwB3AAEAMgEAAIkAFgEvABIBQAB0AOkCYQAfAM0AAAAYANcBAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCkgJSAAAAiQAWAS8AEgFnAHQA6QIaAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAJMCAACJABYBLwASAX8BdADpAmEAHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAlAJTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcAogBSAAAAiQCVAi8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqACWAhMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgAmAITAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgCvAKEAqAALAQADJAIBAFIAAACJAHwCLwASAWcAdADpApkCHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAJoCEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETANECAQBSAAAAiQAWAS8AEgFnAHQA6QJhAJsCYwAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAJwChQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACdAjkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAAQBSAAAAiQAWAXIAQgJnAIEA6QILAFcAzQCeAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEA1QELARUCdwABAFIAAACJABYBLwASAWcAdADpAmEAHwCfAgAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIBoAJ0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8AEgFnAOsB6QJoAB8AzQAAABgAKAAAAPUByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALAaICdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7AjkAoQCoAAsBowJ3AAEAUgAAAIkAFgEvABIBFAB0AOkCYQAfAM0ASAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsCOQChAKgApAITAHcAAQBSAAAAiQAWAS8AEgEUAHQA6QJhAB8AzQBIABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAqUCHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAKYCEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETANECAQBSAAAAiQAWAS8ApwJnAHQA6QJhAB8AYwAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwCoAgAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAqQLgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQCqAqgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqwI5AKEAqAALARMAdwCiAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKANwAoQCoAAsBEwB3AAEAUgAAAIkAFgFyAKkBZwCBAOkCrAJXAM0A1AEYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgASgETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAAwAzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAK4CCgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAACvAigAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAGQATAHcAAQAyAQAAiQAWAS8AEgGwAnQA6QJhAB8AzQAAABgA1wEAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJAEEALwCtAmcA6wHpArECHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBxAmIAEwB3AAEAUgAAAIkAFgEvALICaQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAswITAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAUARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAHwDNAIICDAGOAgAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAEoBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAMALUCAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAC2AuAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAbcCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekCaAAfAM0AAAC4AigAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAuQITAHcAAQAyAQAAiQAWAS8AEgFAAHQA6QJhAB8AzQAAABgA1wEAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAroCHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwAnAgEAUgAAAIkAFgEvABIBZwAbAOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3AChAKgACwETAHcAvAJSAAAAiQAWAXIAQgJnAIEA6QILAFcAzQDUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuwA5AKEAqADxABMAdwABAPUAAACJABYBLwASAX8BdADpAr0CHwDNAAIAGAAoAAAA/AHIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAL4CAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAvwITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQDJAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAHwDNAMACDAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwDBAgEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAMICzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQA5AMMCqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAHwBpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AMQCUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAxQITAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAABARMAJAIBAMYCAACJAPIALwASAWcAdADpAmEAHwDNAAAADAEoAAAA9gDIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvAMcCZwB0AOkCYQAkAM0AAAAYACgAAAAAAMgCJgAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQCtAQAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAMkCGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAygIvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMsCOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAzALNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQDNAmkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcAWQBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHOAhgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AOkAqAALARMAdwABAFIAAACJABYBLwDPAmcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwDQAgEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAeAATAHcAAQBSAAAAiQAWAS8AEgEEAXQA6QLGAB8AzQDVABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJQI5AKEAqAB4ABMAdwABANICAACJABYBLwASAQQBdADpAsYAHwDNANUAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQDTAs0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8A1ALoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAagE5AKEAqADLARMAdwD3AFIAAACJABYBLwASAZ8BdADpAtUCzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADWAjkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA3ACIAagACwETAHcAAQBSAAAAiQAWAXIAQgJnAIEA6QILAFcA1wLUARgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwD3ANgCAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIB2QJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgABAITAHcAAQBSAAAAiQAWAS8A2gJnAOsB6QJoAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAQCEwB3AAEAUgAAANwCFgEvABcDZwDrAekCaAAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPsCOQChAKgAtgETAHcAAQACAgAAiQDiAi8AEgFnAHQA6QJhAB8AzQDdAhgAKAAAAAAAyAIAAAAAmAAAAAAAigAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYB3gISAWcAdADpAp4AHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAN8CEwB3AAEAMAAAAIkAFgEvABIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8A4AJnAHQA6QLgAR8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDhAgAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOMCOQChAKgACwETAHcAAQCNAQAAiQAWAS8AEgEXAXQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgDcAOQCqAALARMAdwABAFIAAACJABYBcgBCAmcAgQDpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AKIAUgAAAOUCFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPsCOQChAKgA5gITAHcAAQACAgAAiQDiAi8AEgFnAHQA6QJhAB8AzQCdABgAKAAAAAAAyAIAAAAAmAAAAAAAigAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBALcBAACJABYBLwASAWcAdADpAucCHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAGIAEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQAfAOgCAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAOoCGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEA6wIAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMA7AITAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAACJABYBLwASAWcAdADpAmEAHwDtAgAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHuAs0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQDvAqgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqAE5AKEAqAALARMAdwDwAlIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADRADkAoQCoACIAEwB3AAEA9QAAAIkAFgEvABIBowB0AOkCYQAfAPECAgAYACgAAAD8AcgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEA8wLNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAPQCEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAGkB6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPIBOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QLCAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAAQAxMAdwABABMDAACJABYBLwASAfYCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAPcCoQCoAAQCEwB3AAEAUgAAAIkAFgEvABIBZwDrAekCaAAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAADoAOQChAKgA5gETAHcAAQBLAAAAiQD4AtIBEgFnAHQA6QLiAB8AzQAAABgAKAAAAAAAyAIAAAAAjQAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAD5AhMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwAkAgEAUgAAAIkAFgH6AhIBZwB0AOkCYQAfAM0AAAAMASgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgA3wETAHcAAQAwAAAAiQAWAS8AEgFdAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAACgDcAKEAqAALARMAdwABAFIAAACJABYBcgAkA2cA/ALpAgsAVwDNANQBGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADEATkAoQCoAAsBEwB3AAEAdQAAAIkAFgEvABIBZwB0AOkC9QIfAIIA/QIYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8A/gIAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgD/AgAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsCOQChAKgAAQMTAHcAAQBSAAAAiQAWAS8AEgEUAHQA6QJhAB8AzQBIABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAFIAAAACAxYBLwASAWcAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAD7AjkAoQCoALYBEwB3AAEAAgIAAIkA4gIvABIBZwB0AOkCYQAfAAMDnQAYACgAAAAAAMgCAAAAAJgAAAAAAIoAAAAAAAAAAAAAAOAAOQChAKgAywETAHcA9wBSAAAAiQAWAS8AEgH0AXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAUDhQA5ACAAqADBABMAdwBPAG0AAADuARYBLwASAWcAsgDpAmEAWABpAegAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAAYDFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPsCOQChAKgAtgETAHcAAQACAgAAiQDiAi8AEgEHA3QA6QJhAB8AzQCdABgAKAAAAAAAyAIAAAAAmAAAAAAAigAAAAAAAAAAAAAACgA5AKEAqAAEAhMAdwABAFIAAACJABYBLwASAWcA6wHpAmgACAPNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACFADkAIACoAMEAEwB3AE8AbQAAAO4BFgEvABIBZwCyAOkCYQAfAAkD6AAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGoBOQChAKgACgMTAHcA9wBSAAAAiQAWAS8AEgGfAXQA6QKGAc4AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAJAIBAMwBAACJABYBLwASAWcAdADpAmEAHwALAwAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgA3wETAHcAAQAwAAAAiQAWAS8AEgFdAHQA6QJhAB8AzQANAxgAKAAAAAAAyAIAAAAAAAAAAOwAAAAAAAAAAAAAAAAACgA5AA4DqAALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3AA8DUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAAAETAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AzQACABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMA0QIBABEDAACJABYBLwASAWcAdADpAmEAHwBjAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQBTAAsBEwB3AAEAUgAAAIkAFgEvABIBZwB0AOkCYQASA80AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgAwQATAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5ABQDUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoABUDEwB3AKIAUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgCYAaEAqADdABMAdwABAEsAAACJABYB0gESAWcAdADpAuIAHwDNAAAAGAAoAAAAAADIAgAAAACNAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChABkDCwETAHcAAQBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyQA5AKEAqACuABMAdwABAKECAACJABYBLwASARoDdADpAmEAHwDNAKkAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAGwOoAAQCEwB3AAEAUgAAANwCFgEvABcDZwDrAekCaAAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgBOQChAKgACwETAHcAogBSAAAAiQAWAS8AEgFnAHQA6QJhAB8AzQAcAxgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAALARMAdwABAFIAAACJABYBHQMSAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAB4DEwB3AAEAMAAAAIkAFgEvABIBXQB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAADsAAAAAAAAAAAAAAAAAAoAOQChAKgACwETACQCAQBSAAAAiQAWAS8AHwNnAHQA6QLgAR8AzQAAAAwBKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwAgAwAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADgADkAoQCoAMsBEwB3APcAUgAAAIkAFgEvABIB9AF0AOkChgHOAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAFMACwETAHcAAQBSAAAAiQAiAy8AEgFnAHQA6QJhAD0BTAAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5AKEAIwMLARMAdwABAI0BAACJABYBLwASARcBdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAADJADkAoQCoAK4AEwB3AAEAoQIAAIkAFgEvABIB2wJ0AOkCYQAfAM0AqQAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAJcCEwETAHcAAQCtAQAAiQAWAS8AJQNDAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAACYDCgA5AKEAqAATARMAdwABAK0BAACJABYBLwASASsCdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgEvACcDZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAOQChAKgAEwETAHcAAQAoAwAAiQAWAS8AEgErAnQA6QJhAB8AzQAAABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgA5ACkDUwALARMAdwABAFIAAACJABYBLwASAWcAdADpAmEAHwDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAACoATkAoQCoAAsBEwB3ACoDUgAAAIkAFgEvABIBZwB0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAALsAOQChAKgAAAETAHcAAQD1AAAAiQAWAS8AEgGjAHQA6QJhAB8AKwMCABgAKAAAAPwByAIAAAAAAAAAAAAAAAAAAAAAAAAAACwD4AA5AKEAqADLARMAdwD3AFIAAACJABYBLwASAfQBdADpAoYBzgDNAAAAGAAoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoAAsBEwB3AAEAUgAAAIkAFgGyARIBZwB0AOkCYQAtA80AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUAOQAgAKgALgMTAHcATwBtAAAA7gEWAS8AEgFnALIA6QJhAB8AaQHoABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8gE5AKEAqAALARMAJAIBAFIAAACJABYBLwAvA2cAdADpAsIAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQAwAxMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMkAOQChAKgAMQMTAHcAAQChAgAAiQAWAS8AEgHbAnQA6QJhAB8AzQCpABgAKAAAAAAAyAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgCvAKEAqAALAQADJAIBAFIAAACJAHwCLwAyA2cAdADpAmEAHwDNAAAADAEoAAAAAADIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKADkAoQCoABMBEwB3AAEArQEAAIkAFgEvABIBKwJ0AOkCYQAfAM0AAAAYACgAAAAAAMgCAAAAAAAAAAAAAAAAAAAAAAAA";
+
+/** Word-list bits reported when entering each state */
+export const OUTPUTS: readonly number[] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 2049, 0, 0, 0, 0, 0, 0, 0, 0, 2049, 0, 0, 0, 0, 2049, 0, 0, 0, 0, 0, 0, 2049, 0, 0, 0, 0, 0, 0, 2049, 0, 2049, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 2049, 0, 0, 2049, 0, 0, 0, 2049, 0, 12, 2049, 0, 0, 0, 0, 2049, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 10, 0, 10, 0, 0, 0, 0, 10, 0, 0, 2, 0, 0, 0, 18, 0, 0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 2, 0, 0, 2, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 258, 0, 0, 0, 258, 0, 0, 0, 0, 258, 0, 0, 0, 12, 12, 12, 0, 0, 0, 0, 20, 0, 0, 0, 20, 0, 0, 0, 4, 0, 0, 4, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 260, 0, 0, 0, 0, 0, 0, 4, 0, 0, 260, 0, 0, 0, 10, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 0, 128, 0, 0, 0, 0, 0, 0, 0, 128, 128, 0, 0, 0, 0, 128, 0, 0, 0, 0, 0, 0, 0, 0, 128, 0, 0, 0, 0, 0, 0, 0, 0, 0, 128, 0, 0, 0, 256, 0, 0, 0, 0, 0, 0, 256, 0, 0, 0, 0, 0, 0, 256, 0, 512, 0, 0, 512, 512, 0, 0, 0, 0, 0, 0, 512, 0, 0, 0, 0, 0, 0, 512, 0, 0, 512, 0, 512, 0, 0, 512, 0, 0, 0, 512, 0, 512, 0, 0, 0, 0, 512, 0, 0, 512, 0, 0, 0, 0, 0, 512, 0, 512, 0, 1024, 0, 0, 0, 0, 0, 0, 1024, 0, 0, 0, 0, 0, 2048, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0];
+
+/** Pattern triggers, in messageClassifierWords.json order */
+export const TRIGGERS: readonly string[] = ["abbrechen", "cancel", "stopp", "stop", "aufh\u00f6ren", "nicht mehr", "kein interesse", "egal", "vergiss", "noch ein teil", "weiteres teil", "another part", "dasselbe fahrzeug", "same vehicle", "noch was", "status", "bestellung", "order", "wo ist", "where is", "lieferung", "delivery", "tracking", "neues fahrzeug", "new vehicle", "anderes auto", "different car", "von vorne", "start over", "fahrzeugschein", "zulassung", "registration", "dokument", "brauche", "suche", "need", "looking for", "want", "m\u00f6chte", "klackert", "quietscht", "noise", "problem", "kaputt", "defekt", "was kostet", "how much", "preis", "price", "hab", "don", "no document", "kein bild", "kann nicht senden", "can"];
+
+/** Triggers ending in state s: TRIGGER_IDS[TRIGGER_OFFSETS[s] .. TRIGGER_OFFSETS[s + 1]) */
+export const TRIGGER_OFFSETS: readonly number[] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 15, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 25, 25, 25, 26, 26, 26, 26, 26, 26, 26, 26, 27, 27, 27, 28, 28, 28, 28, 28, 29, 29, 29, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 35, 36, 36, 36, 36, 36, 36, 36, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 38, 38, 38, 38, 38, 38, 38, 38, 38, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 40, 40, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 41, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 43, 43, 43, 44, 44, 44, 44, 44, 44, 45, 45, 45, 45, 45, 46, 46, 46, 46, 47, 47, 47, 47, 47, 47, 47, 47, 48, 48, 48, 48, 49, 49, 49, 50, 50, 50, 51, 52, 53, 53, 53, 53, 53, 53, 53, 53, 53, 54, 54, 54, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 56];
+export const TRIGGER_IDS: readonly number[] = [33, 34, 38, 35, 37, 15, 19, 22, 15, 0, 54, 1, 5, 36, 3, 2, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 18, 20, 21, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53];
@@ -5,6 +5,9 @@
  * Extracted from botLogicService.ts for better maintainability.
  */
 import { logger } from "@utils/logger";
+import { classifyMessage, INTENT_PATTERNS, NO_VEHICLE_DOC_PATTERNS } from "./messageClassifier";
+
+export { INTENT_PATTERNS, NO_VEHICLE_DOC_PATTERNS };
 
 // ============================================================================
 // TYPES
@@ -58,105 +61,38 @@ export interface ParsedUserMessage {
 // ABUSE DETECTION
 // ============================================================================
 
-const ABUSIVE_WORDS = [
-    // German
-    "hurensohn", "arschloch", "fotze", "verpiss", "scheiss", "scheiße",
-    "wichser", "missgeburt", "bastard", "vollidiot",
-    // English
-    "fuck", "bitch", "shit", "idiot", "asshole", "moron", "retard",
-    // Turkish (B5 FIX: multilingual abuse detection)
-    "orospu", "siktir", "amk", "piç", "gerizekalı", "aptal", "salak",
-    // Kurdish
-    "kûre", "bêşeref", "bênamûs", "kêmasî",
-    // Polish
-    "kurwa", "cholera", "dupek", "idiota", "debil", "spierdalaj",
-];
-
 /**
  * Detects obviously abusive or insulting messages.
  * Returns true when the message should be treated as abuse.
+ *
+ * Word list: "abusive" in messageClassifierWords.json, incl. Turkish, Kurdish
+ * and Polish entries (B5 FIX multilingual abuse detection).
  */
 export function detectAbusive(text: string): boolean {
     if (!text) return false;
-    const t = text.toLowerCase();
-    return ABUSIVE_WORDS.some((w) => t.includes(w));
+    return classifyMessage(text).abusive;
 }
 
 // ============================================================================
 // INTENT DETECTION
 // ============================================================================
 
-const INTENT_PATTERNS: Record<IntentType, RegExp[]> = {
-    abort_order: [
-        /abbrechen/i, /cancel/i, /stopp/i, /stop/i, /aufhören/i,
-        /nicht mehr/i, /kein interesse/i, /egal/i, /vergiss/i
-    ],
-    continue_order: [
-        /noch ein teil/i, /weiteres teil/i, /another part/i,
-        /dasselbe fahrzeug/i, /same vehicle/i, /noch was/i
-    ],
-    status_question: [
-        /status/i, /bestellung/i, /order/i, /wo ist/i, /where is/i,
-        /lieferung/i, /delivery/i, /tracking/i
-    ],
-    new_order: [
-        /neues fahrzeug/i, /new vehicle/i, /anderes auto/i,
-        /different car/i, /von vorne/i, /start over/i
-    ],
-    greeting: [
-        /^(hallo|hello|hi|hey|moin|servus|guten\s?(tag|morgen|abend))$/i
-    ],
-    send_vehicle_doc: [
-        /fahrzeugschein/i, /zulassung/i, /registration/i, /dokument/i
-    ],
-    request_part: [
-        /brauche/i, /suche/i, /need/i, /looking for/i, /want/i, /möchte/i
-    ],
-    describe_symptoms: [
-        /klackert/i, /quietscht/i, /noise/i, /problem/i, /kaputt/i, /defekt/i
-    ],
-    general_question: [
-        /was kostet/i, /how much/i, /preis/i, /price/i
-    ],
-    smalltalk: [],
-    other: []
-};
-
 /**
  * Detect user intent from message text
  */
 export function detectIntent(text: string): IntentType {
-    const t = text.trim().toLowerCase();
-
-    for (const [intent, patterns] of Object.entries(INTENT_PATTERNS)) {
-        if (patterns.some(p => p.test(t))) {
-            return intent as IntentType;
-        }
-    }
-
-    return "other";
+    return classifyMessage(text).intent;
 }
 
 // ============================================================================
 // VEHICLE DOCUMENT DETECTION
 // ============================================================================
 
-const NO_VEHICLE_DOC_PATTERNS = [
-    /habe? ?(ich )?keine?n? ?(fahrzeugschein|schein|dokument)/i,
-    /habe? ?(ich )?nicht/i,
-    /don'?t have/i,
-    /no document/i,
-    /kein bild/i,
-    /kann nicht senden/i,
-    /can'?t send/i
-];
-
 /**
  * Detect if user indicates they don't have a vehicle document
  */
 export function detectNoVehicleDocument(text: string): boolean {
-    const t = text.toLowerCase();
-    return NO_VEHICLE_DOC_PATTERNS.some(p => p.test(t));
+    return classifyMessage(text).noVehicleDocument;
 }
 
 // ============================================================================
@@ -8,7 +8,9 @@
 
 import { logger } from "@utils/logger";
 import { generateChatCompletion } from "../intelligence/geminiService";
-import { TEXT_NLU_PROMPT } from "../../prompts/textNluPrompt";
+import { promptMessages } from "../../prompts/promptRegistry";
+import { classifyMessage, YEAR_PATTERN } from "./messageClassifier";
+import wordLists from "./messageClassifierWords.json";
 
 // ============================================================================
 // Types
@@ -111,14 +113,10 @@ export function detectSmalltalk(text: string): SmalltalkType | null {
     return null;
 }
 
+/** "turnAbusive" list in messageClassifierWords.json */
 export function detectAbusive(text: string): boolean {
     if (!text) return false;
-    const t = text.toLowerCase();
-    const abusive = [
-        "hurensohn", "arschloch", "fotze", "verpiss", "scheiss", "scheiße",
-        "fuck", "bitch", "shit", "idiot", "dummkopf",
-    ];
-    return abusive.some((w) => t.includes(w));
+    return classifyMessage(text).turnAbusive;
 }
 
 // ============================================================================
@@ -146,51 +144,23 @@ export function extractVinHsnTsn(text: string): { vin?: string; hsn?: string; ts
 
 export function hasVehicleHints(text: string): boolean {
     const t = text.toLowerCase();
-    const brands = ["bmw", "audi", "vw", "volkswagen", "mercedes", "benz", "ford", "opel", "skoda", "seat", "toyota", "honda", "hyundai", "kia"];
-    const yearPattern = /\b(19|20)\d{2}\b/;
-    return brands.some((b) => t.includes(b)) || yearPattern.test(t);
+    return wordLists.vehicleBrands.some((b) => t.includes(b)) || YEAR_PATTERN.test(t);
 }
 
 // ============================================================================
 // Intent Detection
 // ============================================================================
 
+/**
+ * Order-level intent of a bot turn. Token lists (statusQuestions,
+ * abortTokens, orderTokens, vehicleBrands) live in messageClassifierWords.json;
+ * precedence: OEM number > status > abort > new order > vehicle hints.
+ */
 export function detectIntent(text: string, hasVehicleImage: boolean): IntentResult {
-    const t = (text || "").toLowerCase().trim();
-
     if (hasVehicleImage) {
         return { intent: "new_order" };
     }
-    if (!t) {
-        return { intent: "unknown" };
-    }
-
-    // OEM direct
-    const oemPatterns = [/oem[:\s]+([A-Z0-9\-]+)/i, /teilenummer[:\s]+([A-Z0-9\-]+)/i];
-    for (const p of oemPatterns) {
-        const m = text.match(p);
-        if (m) {
-            return { intent: "oem_direct", extractedOem: m[1] };
-        }
-    }
-
-    // Status
-    const statusQuestions = ["status", "wie weit", "wie lange", "where is", "how long", "tracking", "lieferstatus"];
-    if (statusQuestions.some((q) => t.includes(q))) return { intent: "status_question" };
-
-    // Abort
-    const abortTokens = ["abbrechen", "stornieren", "storno", "cancel", "nicht mehr", "kein bedarf"];
-    if (abortTokens.some((a) => t.includes(a))) return { intent: "abort_order" };
-
-    // Vehicle data / new order
-    const vehicleTokens = ["brauche", "suche", "möchte", "want", "need", "looking for", "part for", "teil für"];
-    if (vehicleTokens.some((v) => t.includes(v))) return { intent: "new_order" };
-
-    if (hasVehicleHints(text)) {
-        return { intent: "continue_order" };
-    }
-
-    return { intent: "unknown" };
+    return classifyMessage(text).turnIntent;
 }
 
 // ============================================================================
@@ -205,10 +175,7 @@ export async function parseUserMessage(text: string): Promise<ParsedUserMessage>
 
         const sanitized = sanitizeText(text);
         const rawText = await generateChatCompletion({
-            messages: [
-                { role: "system", content: TEXT_NLU_PROMPT },
-                { role: "user", content: sanitized },
-            ],
+            messages: promptMessages("textNlu", sanitized),
             responseFormat: "json_object",
             temperature: 0,
         });
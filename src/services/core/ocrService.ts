@@ -5,6 +5,7 @@
  * Extracted from botLogicService.ts for modularity.
  */
 import { generateVisionCompletion } from "../intelligence/geminiService";
+import { preprocessDocumentImage } from "./imagePreprocessor";
 import { logger } from "@utils/logger";
 
 // ============================================================================
@@ -70,13 +71,14 @@ const OCR_SYSTEM_AND_USER_PROMPT =
  * Extract vehicle data from a document image using Gemini Vision
  */
 export async function extractVehicleDataFromImage(imageBuffer: Buffer): Promise<VehicleOcrResult> {
-    const base64 = imageBuffer.toString("base64");
+    const prepared = await preprocessDocumentImage(imageBuffer);
+    const base64 = prepared.buffer.toString("base64");
 
     try {
         const content = await generateVisionCompletion({
             prompt: OCR_SYSTEM_AND_USER_PROMPT,
             imageBase64: base64,
-            mimeType: "image/jpeg",
+            mimeType: prepared.mimeType,
             temperature: 0,
         });
 
@@ -2,69 +2,454 @@
  * ⏰ SESSION TIMEOUT — Proactive follow-up for inactive conversations
  *
  * P1 #9: Sends a "Sind Sie noch da?" message after 24h inactivity.
- * Runs as a periodic check (every hour).
+ *
+ * Sessions are kept in an indexed min-heap keyed on their next deadline, so
+ * recordActivity() is O(log n) and a single timer is armed for the earliest
+ * deadline — no periodic full scans. Due follow-ups are sent with bounded
+ * concurrency. After a follow-up the session is re-armed for the cooldown;
+ * once it is past the retention window it is dropped. A failed send is
+ * retried after RETRY_DELAY_MS, at most MAX_SEND_ATTEMPTS times and never
+ * past the retention window.
+ *
+ * Persistence (optional, Redis):
+ *   ZSET session-timeout:deadlines   waId → next deadline (ms)
+ *   HASH session-timeout:sessions    waId → JSON session state
+ * Deadlines survive restarts; removing a still-due member (CLAIM_SCRIPT)
+ * claims the session so only one replica sends the follow-up.
  *
  * Usage: import { startSessionTimeoutChecker } from './sessionTimeout';
- *        startSessionTimeoutChecker(); // Call once at startup
+ *        startSessionTimeoutChecker(sendMessage, { redis }); // Call once at startup
  */
 
 import { logger } from '@utils/logger';
 import { t } from '@core/botResponses';
 
-// In-memory tracking of last activity per waId
-const lastActivity = new Map<string, { timestamp: number; orderId: string; language: string | null }>();
+const TIMEOUT_MS = Number(process.env.SESSION_TIMEOUT_MS || 24 * 60 * 60 * 1000); // 24 hours
+const FOLLOWUP_COOLDOWN_MS = Number(process.env.SESSION_FOLLOWUP_COOLDOWN_MS || 48 * 60 * 60 * 1000); // Don't send again for 48h
+const RETENTION_MS = 7 * 24 * 60 * 60 * 1000; // Forget sessions after 7 days of inactivity
+const RETRY_DELAY_MS = Number(process.env.SESSION_TIMEOUT_RETRY_MS || 60 * 60 * 1000); // Failed sends retry after 1h
+const MAX_SEND_ATTEMPTS = Number(process.env.SESSION_TIMEOUT_MAX_ATTEMPTS || 3); // Then give the session up
+const DISPATCH_CONCURRENCY = Number(process.env.SESSION_TIMEOUT_CONCURRENCY || 10);
+const MAX_TIMER_MS = 2_147_483_647; // setTimeout limit (~24.8 days)
+
+const REDIS_DEADLINES_KEY = 'session-timeout:deadlines';
+const REDIS_SESSIONS_KEY = 'session-timeout:sessions';
+// Remove the member only if it is still due — a newer deadline written by
+// another replica (fresh activity) must not be claimed.
+const CLAIM_SCRIPT = `
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if score and tonumber(score) <= tonumber(ARGV[2]) then
+    return redis.call('ZREM', KEYS[1], ARGV[1])
+end
+return 0`;
+
+interface SessionEntry {
+    timestamp: number;
+    orderId: string;
+    language: string | null;
+    followUpAt?: number;
+    /** Failed sends of the current follow-up; reset by new activity */
+    failedAttempts?: number;
+}
+
+export interface TimedOutSession {
+    waId: string;
+    orderId: string;
+    language: string | null;
+    inactiveMs: number;
+}
+
+export interface SessionTimeoutStats {
+    backend: 'redis' | 'memory';
+    sessions: number;
+    nextDeadline: number | null;
+    followUpsSent: number;
+    followUpsFailed: number;
+    claimedElsewhere: number;
+    redisErrors: number;
+}
+
+/**
+ * Binary min-heap of (key, deadline) with a key → index map, so a key's
+ * deadline can be updated or removed in O(log n).
+ */
+export class DeadlineHeap {
+    private keys: string[] = [];
+    private deadlines: number[] = [];
+    private index = new Map<string, number>();
+
+    get size(): number {
+        return this.keys.length;
+    }
+
+    has(key: string): boolean {
+        return this.index.has(key);
+    }
+
+    peek(): { key: string; deadline: number } | undefined {
+        return this.keys.length > 0 ? { key: this.keys[0], deadline: this.deadlines[0] } : undefined;
+    }
+
+    upsert(key: string, deadline: number): void {
+        const i = this.index.get(key);
+        if (i === undefined) {
+            this.keys.push(key);
+            this.deadlines.push(deadline);
+            this.index.set(key, this.keys.length - 1);
+            this.siftUp(this.keys.length - 1);
+            return;
+        }
+        const previous = this.deadlines[i];
+        this.deadlines[i] = deadline;
+        if (deadline < previous) this.siftUp(i);
+        else this.siftDown(i);
+    }
+
+    remove(key: string): boolean {
+        const i = this.index.get(key);
+        if (i === undefined) return false;
+        const last = this.keys.length - 1;
+        if (i !== last) this.swap(i, last);
+        this.keys.pop();
+        this.deadlines.pop();
+        this.index.delete(key);
+        if (i < this.keys.length) {
+            this.siftDown(i);
+            this.siftUp(i);
+        }
+        return true;
+    }
+
+    /** Remove and return the earliest key if its deadline is <= now. */
+    popDue(now: number): string | undefined {
+        if (this.keys.length === 0 || this.deadlines[0] > now) return undefined;
+        const key = this.keys[0];
+        this.remove(key);
+        return key;
+    }
+
+    /** Keys with deadline <= now, without removing them. Visits only due nodes. */
+    collectDue(now: number): string[] {
+        const due: string[] = [];
+        const stack = this.keys.length > 0 ? [0] : [];
+        while (stack.length > 0) {
+            const i = stack.pop()!;
+            if (i >= this.keys.length || this.deadlines[i] > now) continue;
+            due.push(this.keys[i]);
+            stack.push(2 * i + 1, 2 * i + 2);
+        }
+        return due;
+    }
+
+    clear(): void {
+        this.keys = [];
+        this.deadlines = [];
+        this.index.clear();
+    }
+
+    private siftUp(i: number): void {
+        while (i > 0) {
+            const parent = (i - 1) >> 1;
+            if (this.deadlines[parent] <= this.deadlines[i]) break;
+            this.swap(i, parent);
+            i = parent;
+        }
+    }
+
+    private siftDown(i: number): void {
+        const n = this.keys.length;
+        for (;;) {
+            const left = 2 * i + 1;
+            const right = left + 1;
+            let smallest = i;
+            if (left < n && this.deadlines[left] < this.deadlines[smallest]) smallest = left;
+            if (right < n && this.deadlines[right] < this.deadlines[smallest]) smallest = right;
+            if (smallest === i) return;
+            this.swap(i, smallest);
+            i = smallest;
+        }
+    }
+
+    private swap(a: number, b: number): void {
+        [this.keys[a], this.keys[b]] = [this.keys[b], this.keys[a]];
+        [this.deadlines[a], this.deadlines[b]] = [this.deadlines[b], this.deadlines[a]];
+        this.index.set(this.keys[a], a);
+        this.index.set(this.keys[b], b);
+    }
+}
+
+type SendMessage = (waId: string, message: string) => Promise<void>;
+
+export class SessionTimeoutScheduler {
+    private sessions = new Map<string, SessionEntry>();
+    private heap = new DeadlineHeap();
+    private timer: NodeJS.Timeout | null = null;
+    private armedFor: number | null = null;
+    private sendMessage: SendMessage | null = null;
+    private dispatching: Promise<number> | null = null;
+    private stats = { followUpsSent: 0, followUpsFailed: 0, claimedElsewhere: 0, redisErrors: 0 };
+
+    /**
+     * @param redis ioredis-compatible client, or null for in-memory only
+     */
+    constructor(private redis: any | null = null, private readonly concurrency: number = DISPATCH_CONCURRENCY) { }
+
+    /** Attach a Redis client after construction (e.g. from the worker). */
+    setRedis(redis: any | null): void {
+        this.redis = redis;
+    }
+
+    recordActivity(waId: string, orderId: string, language: string | null, now: number = Date.now()): void {
+        const entry: SessionEntry = { timestamp: now, orderId, language };
+        this.sessions.set(waId, entry);
+        // New activity clears the follow-up flag and pushes the deadline out
+        this.schedule(waId, entry, now + TIMEOUT_MS);
+    }
+
+    getTimedOutSessions(now: number = Date.now()): TimedOutSession[] {
+        return this.heap.collectDue(now).map(waId => {
+            const entry = this.sessions.get(waId)!;
+            return { waId, orderId: entry.orderId, language: entry.language, inactiveMs: now - entry.timestamp };
+        });
+    }
+
+    markFollowUpSent(waId: string, now: number = Date.now()): void {
+        const entry = this.sessions.get(waId);
+        if (!entry) return;
+        entry.followUpAt = now;
+        delete entry.failedAttempts;
+        const next = now + FOLLOWUP_COOLDOWN_MS;
+        if (next >= entry.timestamp + RETENTION_MS) this.drop(waId);
+        else this.schedule(waId, entry, next);
+    }
+
+    /** Drop sessions inactive for more than 7 days. O(n); not needed periodically. */
+    cleanupOldEntries(now: number = Date.now()): void {
+        const cutoff = now - RETENTION_MS;
+        for (const [waId, entry] of this.sessions) {
+            if (entry.timestamp < cutoff) this.drop(waId);
+        }
+    }
+
+    /**
+     * Load persisted deadlines from Redis and arm the timer. Sessions this
+     * process already knows about are kept as they are (they are newer).
+     */
+    async start(sendMessage: SendMessage): Promise<void> {
+        this.sendMessage = sendMessage;
+        if (this.redis) {
+            try {
+                const [deadlines, raw] = await Promise.all([
+                    this.redis.zrange(REDIS_DEADLINES_KEY, 0, -1, 'WITHSCORES') as Promise<string[]>,
+                    this.redis.hgetall(REDIS_SESSIONS_KEY) as Promise<Record<string, string>>,
+                ]);
+                let restored = 0;
+                for (let i = 0; i < deadlines.length; i += 2) {
+                    const waId = deadlines[i];
+                    if (this.sessions.has(waId) || !raw?.[waId]) continue;
+                    this.sessions.set(waId, JSON.parse(raw[waId]) as SessionEntry);
+                    this.heap.upsert(waId, Number(deadlines[i + 1]));
+                    restored++;
+                }
+                logger.info('[SessionTimeout] Restored deadlines from Redis', { restored });
+            } catch (err: any) {
+                this.stats.redisErrors++;
+                logger.warn('[SessionTimeout] Failed to restore deadlines, starting empty', { error: err?.message });
+            }
+        }
+        this.arm();
+    }
+
+    stop(): void {
+        if (this.timer) clearTimeout(this.timer);
+        this.timer = null;
+        this.armedFor = null;
+        this.sendMessage = null;
+    }
+
+    /**
+     * Send follow-ups for every due session, at most `concurrency` at a time.
+     * Resolves with the number of follow-ups sent.
+     */
+    runDueFollowUps(now: number = Date.now()): Promise<number> {
+        if (!this.dispatching) {
+            this.dispatching = this.dispatchDue(now).finally(() => {
+                this.dispatching = null;
+                this.arm();
+            });
+        }
+        return this.dispatching;
+    }
+
+    getStats(): SessionTimeoutStats {
+        return {
+            backend: this.redis ? 'redis' : 'memory',
+            sessions: this.sessions.size,
+            nextDeadline: this.heap.peek()?.deadline ?? null,
+            ...this.stats,
+        };
+    }
+
+    /** Forget all state (tests). Does not touch Redis. */
+    reset(): void {
+        this.stop();
+        this.sessions.clear();
+        this.heap.clear();
+        this.stats = { followUpsSent: 0, followUpsFailed: 0, claimedElsewhere: 0, redisErrors: 0 };
+    }
+
+    private async dispatchDue(now: number): Promise<number> {
+        const due: string[] = [];
+        for (let waId = this.heap.popDue(now); waId !== undefined; waId = this.heap.popDue(now)) due.push(waId);
+        if (due.length === 0 || !this.sendMessage) {
+            for (const waId of due) this.heap.upsert(waId, now + RETRY_DELAY_MS);
+            return 0;
+        }
+
+        logger.info('[SessionTimeout] Found inactive sessions', { count: due.length });
+        const send = this.sendMessage;
+        let sent = 0;
+        let next = 0;
+        const worker = async () => {
+            while (next < due.length) {
+                if (await this.followUp(due[next++], send, now)) sent++;
+            }
+        };
+        await Promise.all(Array.from({ length: Math.min(this.concurrency, due.length) }, worker));
+        return sent;
+    }
+
+    private async followUp(waId: string, send: SendMessage, now: number): Promise<boolean> {
+        const entry = this.sessions.get(waId);
+        if (!entry) return false;
+        const activityAt = entry.timestamp;
+        if (now - activityAt >= RETENTION_MS) {
+            // e.g. restored from Redis after a long outage
+            this.drop(waId);
+            return false;
+        }
 
-const TIMEOUT_MS = 24 * 60 * 60 * 1000; // 24 hours
-const CHECK_INTERVAL_MS = 60 * 60 * 1000; // Check every hour
-const FOLLOWUP_COOLDOWN_MS = 48 * 60 * 60 * 1000; // Don't send again for 48h
+        if (!await this.claim(waId, now)) {
+            // Another replica sends this one and re-arms it in Redis
+            this.stats.claimedElsewhere++;
+            this.sessions.delete(waId);
+            return false;
+        }
 
-// Track which waIds already got a follow-up (prevent spam)
-const followUpSent = new Map<string, number>();
+        try {
+            await send(waId, getTimeoutMessage(entry.language));
+            this.stats.followUpsSent++;
+            logger.info('[SessionTimeout] Follow-up sent', { waId, orderId: entry.orderId });
+        } catch (err: any) {
+            this.stats.followUpsFailed++;
+            logger.error('[SessionTimeout] Failed to send follow-up', { waId, error: err?.message });
+            if (this.sessions.get(waId)?.timestamp === activityAt) this.retryLater(waId, entry, now);
+            return false;
+        }
+
+        // New activity during the send already re-armed the session
+        if (this.sessions.get(waId)?.timestamp === activityAt) this.markFollowUpSent(waId, now);
+        return true;
+    }
+
+    private retryLater(waId: string, entry: SessionEntry, now: number): void {
+        entry.failedAttempts = (entry.failedAttempts ?? 0) + 1;
+        const next = now + RETRY_DELAY_MS;
+        if (entry.failedAttempts >= MAX_SEND_ATTEMPTS || next - entry.timestamp >= RETENTION_MS) {
+            logger.warn('[SessionTimeout] Giving up on follow-up', { waId, attempts: entry.failedAttempts });
+            this.drop(waId);
+            return;
+        }
+        this.schedule(waId, entry, next);
+    }
+
+    /** Removing the due member is the claim: only one replica sends. */
+    private async claim(waId: string, now: number): Promise<boolean> {
+        if (!this.redis) return true;
+        try {
+            return await this.redis.eval(CLAIM_SCRIPT, 1, REDIS_DEADLINES_KEY, waId, now) === 1;
+        } catch (err: any) {
+            this.stats.redisErrors++;
+            logger.warn('[SessionTimeout] Redis claim failed, sending anyway', { waId, error: err?.message });
+            return true;
+        }
+    }
+
+    private schedule(waId: string, entry: SessionEntry, deadline: number): void {
+        this.heap.upsert(waId, deadline);
+        this.persist(waId, entry, deadline);
+        if (this.sendMessage && (this.armedFor === null || deadline < this.armedFor)) this.arm();
+    }
+
+    private drop(waId: string): void {
+        this.sessions.delete(waId);
+        this.heap.remove(waId);
+        if (!this.redis) return;
+        this.redis.multi()
+            .zrem(REDIS_DEADLINES_KEY, waId)
+            .hdel(REDIS_SESSIONS_KEY, waId)
+            .exec()
+            .catch((err: any) => this.onRedisError('drop', err));
+    }
+
+    private persist(waId: string, entry: SessionEntry, deadline: number): void {
+        if (!this.redis) return;
+        this.redis.multi()
+            .zadd(REDIS_DEADLINES_KEY, deadline, waId)
+            .hset(REDIS_SESSIONS_KEY, waId, JSON.stringify(entry))
+            .exec()
+            .catch((err: any) => this.onRedisError('persist', err));
+    }
+
+    private onRedisError(op: string, err: any): void {
+        this.stats.redisErrors++;
+        logger.warn(`[SessionTimeout] Redis ${op} failed`, { error: err?.message });
+    }
+
+    /** Arm a single timer for the earliest deadline. */
+    private arm(): void {
+        if (this.timer) clearTimeout(this.timer);
+        this.timer = null;
+        this.armedFor = null;
+        const head = this.heap.peek();
+        if (!head || !this.sendMessage || this.dispatching) return;
+
+        const delay = Math.min(Math.max(head.deadline - Date.now(), 0), MAX_TIMER_MS);
+        this.armedFor = head.deadline;
+        this.timer = setTimeout(() => {
+            this.timer = null;
+            this.armedFor = null;
+            this.runDueFollowUps().catch((err: any) => {
+                logger.error('[SessionTimeout] Checker error', { error: err?.message });
+            });
+        }, delay);
+        this.timer.unref?.();
+    }
+}
+
+const scheduler = new SessionTimeoutScheduler();
 
 /**
  * Record activity for a conversation.
  * Call this from botWorker or botLogicService on every incoming message.
  */
 export function recordActivity(waId: string, orderId: string, language: string | null): void {
-    lastActivity.set(waId, {
-        timestamp: Date.now(),
-        orderId,
-        language,
-    });
-    // Clear follow-up flag on new activity
-    followUpSent.delete(waId);
+    scheduler.recordActivity(waId, orderId, language);
 }
 
 /**
- * Get all conversations that have been inactive for > 24h.
- * Returns only conversations that haven't already received a follow-up.
+ * Get all conversations whose follow-up is due (inactive > 24h and not
+ * within the follow-up cooldown).
  */
-export function getTimedOutSessions(): Array<{ waId: string; orderId: string; language: string | null; inactiveMs: number }> {
-    const now = Date.now();
-    const timedOut: Array<{ waId: string; orderId: string; language: string | null; inactiveMs: number }> = [];
-
-    for (const [waId, data] of lastActivity.entries()) {
-        const inactiveMs = now - data.timestamp;
-        const lastFollowUp = followUpSent.get(waId) || 0;
-
-        if (inactiveMs > TIMEOUT_MS && (now - lastFollowUp) > FOLLOWUP_COOLDOWN_MS) {
-            timedOut.push({
-                waId,
-                orderId: data.orderId,
-                language: data.language,
-                inactiveMs,
-            });
-        }
-    }
-
-    return timedOut;
+export function getTimedOutSessions(): TimedOutSession[] {
+    return scheduler.getTimedOutSessions();
 }
 
 /**
  * Mark a session as having received a follow-up.
  */
 export function markFollowUpSent(waId: string): void {
-    followUpSent.set(waId, Date.now());
+    scheduler.markFollowUpSent(waId);
 }
 
 /**
@@ -75,56 +460,40 @@ export function getTimeoutMessage(language: string | null): string {
 }
 
 /**
- * Start the periodic session timeout checker.
- * The checker calls the provided `sendMessage` callback for each timed-out session.
+ * Start the session timeout scheduler.
+ * Calls the provided `sendMessage` callback for each timed-out session.
  *
  * @param sendMessage — Callback to send a WhatsApp message (waId, message) => Promise
+ * @param options.redis — Optional ioredis client to persist deadlines across restarts
  */
 export function startSessionTimeoutChecker(
-    sendMessage: (waId: string, message: string) => Promise<void>
-): NodeJS.Timeout {
-    const intervalId = setInterval(async () => {
-        try {
-            const timedOut = getTimedOutSessions();
-            if (timedOut.length === 0) return;
-
-            logger.info('[SessionTimeout] Found inactive sessions', { count: timedOut.length });
-
-            for (const session of timedOut) {
-                try {
-                    const message = getTimeoutMessage(session.language);
-                    await sendMessage(session.waId, message);
-                    markFollowUpSent(session.waId);
-                    logger.info('[SessionTimeout] Follow-up sent', { waId: session.waId, orderId: session.orderId });
-                } catch (err: any) {
-                    logger.error('[SessionTimeout] Failed to send follow-up', {
-                        waId: session.waId,
-                        error: err?.message,
-                    });
-                }
-            }
-        } catch (err: any) {
-            logger.error('[SessionTimeout] Checker error', { error: err?.message });
-        }
-    }, CHECK_INTERVAL_MS);
+    sendMessage: SendMessage,
+    options: { redis?: any | null } = {}
+): SessionTimeoutScheduler {
+    if (options.redis !== undefined) scheduler.setRedis(options.redis);
+    scheduler.start(sendMessage).catch((err: any) => {
+        logger.error('[SessionTimeout] Failed to start checker', { error: err?.message });
+    });
+    logger.info('[SessionTimeout] Checker started', {
+        timeoutMs: TIMEOUT_MS,
+        concurrency: DISPATCH_CONCURRENCY,
+        persistent: !!options.redis,
+    });
+    return scheduler;
+}
+
+export function stopSessionTimeoutChecker(): void {
+    scheduler.stop();
+}
 
-    logger.info('[SessionTimeout] Checker started (interval: 1h, timeout: 24h)');
-    return intervalId;
+export function getSessionTimeoutStats(): SessionTimeoutStats {
+    return scheduler.getStats();
 }
 
 /**
- * Clean up old entries to prevent memory leaks.
- * Called automatically; removes entries older than 7 days.
+ * Clean up old entries. Sessions are dropped automatically once their last
+ * follow-up falls outside the 7-day window; this is a manual safety net.
  */
 export function cleanupOldEntries(): void {
-    const cutoff = Date.now() - (7 * 24 * 60 * 60 * 1000);
-    for (const [waId, data] of lastActivity.entries()) {
-        if (data.timestamp < cutoff) {
-            lastActivity.delete(waId);
-            followUpSent.delete(waId);
-        }
-    }
+    scheduler.cleanupOldEntries();
 }
-
-// Auto-cleanup every 6 hours
-setInterval(cleanupOldEntries, 6 * 60 * 60 * 1000);
@@ -40,3 +40,4 @@ registerHandler(doneHandler);
 
 // Re-export core interfaces
 export * from './stateMachine';
+export { getStateMachineProfile, logStateMachineProfile } from './tracing';
@@ -13,6 +13,7 @@
 
 import { ConversationStatus } from '../../adapters/supabaseService';
 import { logger } from '../../../utils/logger';
+import { traceTransition } from './tracing';
 
 // ============================================================================
 // Types
@@ -98,7 +99,7 @@ export async function executeState(
     });
 
     try {
-        const result = await handler.handle(ctx);
+        const result = await traceTransition(status, handler.name, () => handler.handle(ctx));
 
         logger.info('State handler complete', {
             handler: handler.name,
@@ -0,0 +1,78 @@
+/**
+ * State Machine Tracing Tests
+ */
+
+jest.mock('../../../utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+
+import { traceIo, traceTransition, getStateMachineProfile, logStateMachineProfile, resetStateMachineProfile } from './tracing';
+import { executeState, registerHandler, createHandler } from './stateMachine';
+import { withGeminiBudget, acquireBudgetToken } from '../../intelligence/geminiBudget';
+import { logger } from '../../../utils/logger';
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('stateMachine tracing', () => {
+    beforeEach(() => {
+        resetStateMachineProfile();
+        (logger.info as jest.Mock).mockClear();
+    });
+
+    it('records wall time, I/O time per kind and budget tokens', async () => {
+        await withGeminiBudget(8, () => traceTransition('collect_part', 'CollectPartHandler', async () => {
+            // Two overlapping DB calls count once
+            await Promise.all([traceIo('db', () => sleep(30)), traceIo('db', () => sleep(30))]);
+            acquireBudgetToken();
+            acquireBudgetToken();
+            await traceIo('llm', () => sleep(20));
+            return { reply: 'ok', nextStatus: 'oem_lookup' as const };
+        }));
+
+        const profile = getStateMachineProfile().states.collect_part;
+        expect(profile.handler).toBe('CollectPartHandler');
+        expect(profile.count).toBe(1);
+        expect(profile.ioCalls).toEqual({ db: 2, llm: 1, scraper: 0 });
+        expect(profile.ioMs.db).toBeGreaterThanOrEqual(25);
+        expect(profile.ioMs.db).toBeLessThan(55);
+        expect(profile.ioMs.llm).toBeGreaterThanOrEqual(15);
+        expect(profile.wallMs).toBeGreaterThanOrEqual(profile.ioMs.db + profile.ioMs.llm - 1);
+        expect(profile.budgetTokens).toBe(2);
+        expect(profile.transitions).toEqual({ oem_lookup: 1 });
+    });
+
+    it('passes I/O through outside a transition', async () => {
+        await expect(traceIo('scraper', async () => 42)).resolves.toBe(42);
+        expect(getStateMachineProfile().states).toEqual({});
+    });
+
+    it('traces handlers run by executeState, including failures', async () => {
+        registerHandler(createHandler('FailingDone', ['done'], async () => {
+            throw new Error('boom');
+        }));
+        registerHandler(createHandler('QuickVehicle', ['collect_vehicle'], async () => ({
+            reply: 'ok',
+            nextStatus: 'confirm_vehicle',
+        })));
+        const ctx = { orderId: 'order-1', order: {}, orderData: {}, language: 'de' as const, userText: 'x', parsed: {} };
+
+        await executeState('done', { ...ctx, currentStatus: 'done' });
+        await executeState('collect_vehicle', { ...ctx, currentStatus: 'collect_vehicle' });
+        await executeState('collect_vehicle', { ...ctx, currentStatus: 'collect_vehicle' });
+
+        const { states } = getStateMachineProfile();
+        expect(states.done).toMatchObject({ count: 1, errors: 1, transitions: { error: 1 } });
+        expect(states.collect_vehicle).toMatchObject({ count: 2, errors: 0, transitions: { confirm_vehicle: 2 } });
+        expect(Object.values(states.collect_vehicle.histogram).reduce((a, b) => a + b, 0)).toBe(2);
+    });
+
+    it('logs only the transitions since the previous window', async () => {
+        const quick = async () => ({ reply: 'ok', nextStatus: 'collect_part' as const });
+        await traceTransition('collect_vehicle', 'QuickVehicle', quick);
+        logStateMachineProfile();
+        await traceTransition('collect_vehicle', 'QuickVehicle', quick);
+        logStateMachineProfile();
+
+        const calls = (logger.info as jest.Mock).mock.calls.filter(([message]) => message === '[StateMachine] Transition profile');
+        expect(calls.map(([, meta]) => meta.states.collect_vehicle.count)).toEqual([1, 1]);
+        expect(getStateMachineProfile().states.collect_vehicle.count).toBe(2);
+    });
+});
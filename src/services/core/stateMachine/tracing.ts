@@ -0,0 +1,273 @@
+/**
+ * STATE MACHINE TRACING
+ *
+ * Records every state transition executed by executeState():
+ * - handler and from → to status
+ * - wall time of the handler
+ * - awaited I/O time per kind (db, llm, scraper), measured as the union of
+ *   in-flight intervals so parallel calls are not double counted
+ * - Gemini budget tokens consumed (see geminiBudget.ts)
+ *
+ * I/O is attributed through AsyncLocalStorage: the data layers wrap their
+ * calls in traceIo(kind, fn), which is a no-op outside a transition.
+ *
+ * Aggregated per state since process start (served by /api/bot/state-machine/profile)
+ * and per 10-minute window (logged as "[StateMachine] Transition profile",
+ * which scripts/state_profile_report.py aggregates).
+ */
+
+import { AsyncLocalStorage } from 'async_hooks';
+import type { ConversationStatus } from '../../adapters/wawiAdapter';
+import { getBudgetStats } from '../../intelligence/geminiBudget';
+import { logger } from '../../../utils/logger';
+
+// ============================================================================
+// Types
+// ============================================================================
+
+export type IoKind = 'db' | 'llm' | 'scraper';
+const IO_KINDS: IoKind[] = ['db', 'llm', 'scraper'];
+
+/** Histogram upper bounds (ms of handler wall time) */
+export const LATENCY_BUCKETS_MS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, Infinity];
+
+interface IoClock {
+    inFlight: number;
+    since: number;
+    totalMs: number;
+    calls: number;
+}
+
+interface TransitionTrace {
+    io: Record<IoKind, IoClock>;
+}
+
+export interface TransitionRecord {
+    state: ConversationStatus;
+    handler: string;
+    nextStatus: ConversationStatus | null;
+    wallMs: number;
+    ioMs: Record<IoKind, number>;
+    ioCalls: Record<IoKind, number>;
+    budgetTokens: number;
+    error: boolean;
+}
+
+interface StateProfile {
+    handler: string;
+    count: number;
+    errors: number;
+    wallMs: number;
+    maxWallMs: number;
+    histogram: number[];
+    ioMs: Record<IoKind, number>;
+    ioCalls: Record<IoKind, number>;
+    budgetTokens: number;
+    transitions: Map<string, number>;
+}
+
+// ============================================================================
+// I/O attribution
+// ============================================================================
+
+const traceStorage = new AsyncLocalStorage<TransitionTrace>();
+
+function now(): number {
+    return performance.now();
+}
+
+/**
+ * Await `fn` and account its duration as `kind` I/O of the current
+ * transition (if any).
+ */
+export async function traceIo<T>(kind: IoKind, fn: () => Promise<T>): Promise<T> {
+    const trace = traceStorage.getStore();
+    if (!trace) return fn();
+
+    const clock = trace.io[kind];
+    clock.calls++;
+    if (clock.inFlight++ === 0) clock.since = now();
+    try {
+        return await fn();
+    } finally {
+        if (--clock.inFlight === 0) clock.totalMs += now() - clock.since;
+    }
+}
+
+/**
+ * Run a state handler and record the transition.
+ */
+export async function traceTransition<T extends { nextStatus: ConversationStatus }>(
+    state: ConversationStatus,
+    handler: string,
+    fn: () => Promise<T>
+): Promise<T> {
+    const trace: TransitionTrace = {
+        io: {
+            db: { inFlight: 0, since: 0, totalMs: 0, calls: 0 },
+            llm: { inFlight: 0, since: 0, totalMs: 0, calls: 0 },
+            scraper: { inFlight: 0, since: 0, totalMs: 0, calls: 0 },
+        },
+    };
+    const budgetBefore = getBudgetStats()?.usedCalls ?? 0;
+    const start = now();
+    let nextStatus: ConversationStatus | null = null;
+    let error = false;
+
+    try {
+        const result = await traceStorage.run(trace, fn);
+        nextStatus = result.nextStatus;
+        return result;
+    } catch (err) {
+        error = true;
+        throw err;
+    } finally {
+        const end = now();
+        const ioMs = {} as Record<IoKind, number>;
+        const ioCalls = {} as Record<IoKind, number>;
+        for (const kind of IO_KINDS) {
+            const clock = trace.io[kind];
+            // Still in flight (fire-and-forget call): count up to now
+            ioMs[kind] = clock.totalMs + (clock.inFlight > 0 ? end - clock.since : 0);
+            ioCalls[kind] = clock.calls;
+        }
+        recordTransition({
+            state,
+            handler,
+            nextStatus,
+            wallMs: end - start,
+            ioMs,
+            ioCalls,
+            budgetTokens: Math.max(0, (getBudgetStats()?.usedCalls ?? 0) - budgetBefore),
+            error,
+        });
+    }
+}
+
+// ============================================================================
+// Aggregation
+// ============================================================================
+
+const emptyIo = (): Record<IoKind, number> => ({ db: 0, llm: 0, scraper: 0 });
+
+const emptyProfile = (handler: string): StateProfile => ({
+    handler,
+    count: 0,
+    errors: 0,
+    wallMs: 0,
+    maxWallMs: 0,
+    histogram: new Array(LATENCY_BUCKETS_MS.length).fill(0),
+    ioMs: emptyIo(),
+    ioCalls: emptyIo(),
+    budgetTokens: 0,
+    transitions: new Map(),
+});
+
+/** Since process start */
+const totals = new Map<string, StateProfile>();
+/** Since the last periodic log line */
+let windowProfiles = new Map<string, StateProfile>();
+let windowStart = Date.now();
+const startedAt = new Date().toISOString();
+
+function add(map: Map<string, StateProfile>, record: TransitionRecord, bucket: number): void {
+    let profile = map.get(record.state);
+    if (!profile) {
+        profile = emptyProfile(record.handler);
+        map.set(record.state, profile);
+    }
+    profile.count++;
+    if (record.error) profile.errors++;
+    profile.wallMs += record.wallMs;
+    profile.maxWallMs = Math.max(profile.maxWallMs, record.wallMs);
+    profile.histogram[bucket]++;
+    for (const kind of IO_KINDS) {
+        profile.ioMs[kind] += record.ioMs[kind];
+        profile.ioCalls[kind] += record.ioCalls[kind];
+    }
+    profile.budgetTokens += record.budgetTokens;
+    const next = record.error ? 'error' : String(record.nextStatus);
+    profile.transitions.set(next, (profile.transitions.get(next) ?? 0) + 1);
+}
+
+export function recordTransition(record: TransitionRecord): void {
+    let bucket = 0;
+    while (record.wallMs > LATENCY_BUCKETS_MS[bucket]) bucket++;
+    add(totals, record, bucket);
+    add(windowProfiles, record, bucket);
+}
+
+const round = (ms: number) => Math.round(ms * 10) / 10;
+
+function summarize(map: Map<string, StateProfile>) {
+    const result: Record<string, {
+        handler: string;
+        count: number;
+        errors: number;
+        wallMs: number;
+        avgWallMs: number;
+        maxWallMs: number;
+        histogram: Record<string, number>;
+        ioMs: Record<IoKind, number>;
+        ioCalls: Record<IoKind, number>;
+        budgetTokens: number;
+        transitions: Record<string, number>;
+    }> = {};
+    for (const [state, profile] of map) {
+        const histogram: Record<string, number> = {};
+        LATENCY_BUCKETS_MS.forEach((le, i) => {
+            if (profile.histogram[i] > 0) histogram[le === Infinity ? '+Inf' : String(le)] = profile.histogram[i];
+        });
+        const ioMs = emptyIo();
+        for (const kind of IO_KINDS) ioMs[kind] = round(profile.ioMs[kind]);
+        result[state] = {
+            handler: profile.handler,
+            count: profile.count,
+            errors: profile.errors,
+            wallMs: round(profile.wallMs),
+            avgWallMs: round(profile.wallMs / profile.count),
+            maxWallMs: round(profile.maxWallMs),
+            histogram,
+            ioMs,
+            ioCalls: { ...profile.ioCalls },
+            budgetTokens: profile.budgetTokens,
+            transitions: Object.fromEntries(profile.transitions),
+        };
+    }
+    return result;
+}
+
+/**
+ * Per-state profile since process start (JSON export for botHealth).
+ */
+export function getStateMachineProfile() {
+    return {
+        since: startedAt,
+        generatedAt: new Date().toISOString(),
+        latencyBucketsMs: LATENCY_BUCKETS_MS.map(le => (le === Infinity ? '+Inf' : le)),
+        states: summarize(totals),
+    };
+}
+
+/**
+ * Log the profile since the previous call and start a new window.
+ * This log line is what scripts/state_profile_report.py aggregates.
+ */
+export function logStateMachineProfile(): void {
+    if (windowProfiles.size === 0) return;
+    const states = summarize(windowProfiles);
+    const windowSeconds = Math.round((Date.now() - windowStart) / 1000);
+    windowProfiles = new Map();
+    windowStart = Date.now();
+    logger.info('[StateMachine] Transition profile', { windowSeconds, states });
+}
+
+/** Forget all recorded transitions (tests). */
+export function resetStateMachineProfile(): void {
+    totals.clear();
+    windowProfiles = new Map();
+    windowStart = Date.now();
+}
+
+// Auto-log every 10 minutes
+setInterval(logStateMachineProfile, 10 * 60 * 1000).unref();
@@ -8,6 +8,7 @@ import fetch from "node-fetch";
 import * as fs from "fs/promises";
 import { fetchWithTimeoutAndRetry } from "@utils/httpClient";
 import { logger } from "@utils/logger";
+import { getOrDownloadMedia } from "./mediaCache";
 
 // ============================================================================
 // CONFIGURATION
@@ -57,20 +58,22 @@ export async function downloadFromTwilio(mediaUrl: string): Promise<Buffer> {
     const authHeader = "Basic " + Buffer.from(`${TWILIO_ACCOUNT_SID}:${TWILIO_AUTH_TOKEN}`).toString("base64");
 
     try {
-        const res = await fetchWithTimeoutAndRetry(mediaUrl, {
-            headers: {
-                Authorization: authHeader
-            },
-            timeoutMs: MEDIA_DOWNLOAD_TIMEOUT_MS,
-            retry: MEDIA_DOWNLOAD_RETRY_COUNT
+        return await getOrDownloadMedia(mediaUrl, async () => {
+            const res = await fetchWithTimeoutAndRetry(mediaUrl, {
+                headers: {
+                    Authorization: authHeader
+                },
+                timeoutMs: MEDIA_DOWNLOAD_TIMEOUT_MS,
+                retry: MEDIA_DOWNLOAD_RETRY_COUNT
+            });
+
+            if (!res.ok) {
+                throw new Error(`Failed to download image: ${res.status} ${res.statusText}`);
+            }
+
+            const arrayBuffer = await res.arrayBuffer();
+            return Buffer.from(arrayBuffer);
         });
-
-        if (!res.ok) {
-            throw new Error(`Failed to download image: ${res.status} ${res.statusText}`);
-        }
-
-        const arrayBuffer = await res.arrayBuffer();
-        return Buffer.from(arrayBuffer);
     } catch (err: any) {
         logger.error("[Twilio] Media download failed", {
             error: err?.message,
@@ -10,7 +10,9 @@ import fetch from "node-fetch";
 import * as fs from "fs/promises";
 import { logger } from "@utils/logger";
 import { generateVisionCompletion } from "../intelligence/geminiService";
+import { preprocessDocumentImage } from "./imagePreprocessor";
 import { fetchWithTimeoutAndRetry } from "../../utils/httpClient";
+import { getOrDownloadMedia } from "./mediaCache";
 
 // ============================================================================
 // Types
@@ -73,18 +75,20 @@ export async function downloadFromTwilio(mediaUrl: string): Promise<Buffer> {
     const authHeader =
         "Basic " + Buffer.from(`${TWILIO_ACCOUNT_SID}:${TWILIO_AUTH_TOKEN}`).toString("base64");
 
-    const res = await fetchWithTimeoutAndRetry(mediaUrl, {
-        headers: { Authorization: authHeader },
-        timeoutMs: Number(process.env.MEDIA_DOWNLOAD_TIMEOUT_MS || 10000),
-        retry: Number(process.env.MEDIA_DOWNLOAD_RETRY_COUNT || 2),
-    });
+    return getOrDownloadMedia(mediaUrl, async () => {
+        const res = await fetchWithTimeoutAndRetry(mediaUrl, {
+            headers: { Authorization: authHeader },
+            timeoutMs: Number(process.env.MEDIA_DOWNLOAD_TIMEOUT_MS || 10000),
+            retry: Number(process.env.MEDIA_DOWNLOAD_RETRY_COUNT || 2),
+        });
 
-    if (!res.ok) {
-        throw new Error(`Failed to download image: ${res.status} ${res.statusText}`);
-    }
+        if (!res.ok) {
+            throw new Error(`Failed to download image: ${res.status} ${res.statusText}`);
+        }
 
-    const arrayBuffer = await res.arrayBuffer();
-    return Buffer.from(arrayBuffer);
+        const arrayBuffer = await res.arrayBuffer();
+        return Buffer.from(arrayBuffer);
+    });
 }
 
 // ============================================================================
@@ -92,7 +96,8 @@ export async function downloadFromTwilio(mediaUrl: string): Promise<Buffer> {
 // ============================================================================
 
 export async function extractVehicleDataFromImage(imageBuffer: Buffer): Promise<VehicleOcrResult> {
-    const base64 = imageBuffer.toString("base64");
+    const prepared = await preprocessDocumentImage(imageBuffer);
+    const base64 = prepared.buffer.toString("base64");
 
     const systemPrompt =
         "You are an expert OCR and data extractor for German vehicle registration documents (Zulassungsbescheinigung Teil I, old Fahrzeugschein). " +
@@ -134,7 +139,7 @@ Fülle unbekannte Felder mit null. rawText soll den gesamten erkannten Text enth
         const content = await generateVisionCompletion({
             prompt: fullPrompt,
             imageBase64: base64,
-            mimeType: "image/jpeg",
+            mimeType: prepared.mimeType,
             temperature: 0,
         });
 
@@ -0,0 +1,50 @@
+/**
+ * Consensus Engine Benchmark
+ *
+ * Measures calculateConsensus() cost for candidate lists of 10–500 entries
+ * with a realistic mix of exact, composite and unknown source names.
+ *
+ * Usage: LOG_LEVEL=warn ts-node -r tsconfig-paths/register src/services/intelligence/__benchmarks__/consensusBenchmark.ts [iterations]
+ */
+
+import { calculateConsensus } from '../consensusEngine';
+import { OEMCandidate } from '../sources/baseSource';
+
+const SIZES = [10, 25, 50, 100, 250, 500];
+const ITERATIONS = Number(process.argv[2] || 5_000);
+
+const SOURCES = [
+  'tecdoc_catalog', 'vag_etka', 'web_scrape:7zap', 'autodoc_web', 'web_scrape:autodoc',
+  'enterprise-database', 'realoem', 'Kfzteile24', 'Pkwteile', 'Oscaro', 'google_search',
+  'ebay_oem_mining', 'gemini_grounded', 'web_scrape:partsouq', 'web_scrape:amayama',
+];
+
+function buildCandidates(count: number): OEMCandidate[] {
+  // ~1 OEM per 4 candidates, capped — mirrors a fan-out where most sources agree
+  const oemCount = Math.min(Math.max(2, Math.floor(count / 4)), 40);
+  return Array.from({ length: count }, (_, i) => ({
+    oem: `5Q0615301${String.fromCharCode(65 + (i * 7) % oemCount)}`,
+    source: SOURCES[i % SOURCES.length],
+    confidence: 0.5 + ((i * 13) % 50) / 100,
+    meta: { priority: [10, 8, 3, 1][i % 4] },
+  }));
+}
+
+function run(): void {
+  console.log(`Consensus benchmark: ${ITERATIONS} iterations per size`);
+  console.log('candidates   µs/call   calls/s');
+  for (const size of SIZES) {
+    const candidates = buildCandidates(size);
+    // Warm-up so the JIT has compiled the scoring loop
+    for (let i = 0; i < 200; i++) calculateConsensus(candidates);
+
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < ITERATIONS; i++) calculateConsensus(candidates);
+    const elapsedUs = Number(process.hrtime.bigint() - start) / 1000;
+    const perCall = elapsedUs / ITERATIONS;
+
+    console.log(`${String(size).padStart(10)} ${perCall.toFixed(2).padStart(9)} ${Math.round(1e6 / perCall).toLocaleString().padStart(9)}`);
+  }
+}
+
+run();
@@ -1,16 +1,73 @@
 /**
  * OEM Benchmark Runner
  *
- * Runs the APEX pipeline against verified test cases and produces
- * an accuracy report broken down by brand and pipeline phase.
+ * Runs the APEX pipeline against verified test cases (testCases.json) on a
+ * pool of concurrent workers and reports accuracy by brand and phase,
+ * latency percentiles per pipeline phase, Gemini budget calls per case and
+ * the learned-OEM hit rate (phase 1 database hits; pass 2+ re-runs the cases
+ * against what pass 1 learned).
  *
- * Usage: npm run benchmark:oem
- *   or:  ts-node src/services/intelligence/__benchmarks__/oemBenchmark.ts
+ * Offline and deterministic: Gemini and ScraperAPI are answered by the
+ * load-replay stand-in (services/testing/loadReplayStandIns.ts) from the
+ * responses recorded in oemFixtures.json, with their recorded latency, and
+ * the OEM database is a private copy per run. Phase 3 uses the Gemini
+ * adversary (Claude is not recorded). Record or refresh the fixtures with
+ * --record (needs GEMINI_API_KEY); a prompt change shows up as fixture
+ * misses, which fail the run until the fixtures are re-recorded.
+ *
+ * Until oemFixtures.json is recorded, Gemini is answered from
+ * oemStandInFixtures.json instead: hand-written answers that return each
+ * case's expected OEM, with the stand-in's seeded latency distribution. Such
+ * runs measure the pipeline (phases, budget calls, latency), not Gemini's
+ * accuracy: their accuracy is reported but not gated, and recorded as null.
+ *
+ * Every run is compared with the median of the last 5 comparable runs in
+ * oemBenchmarkHistory.jsonl (same fixtures, cases, workers and latency
+ * scale): a slower p50/p95, more budget calls per case or lower accuracy
+ * fails the benchmark. --update-history appends the run (CI on main).
+ *
+ * Usage: npm run benchmark:oem -- [--workers 4] [--passes 2] [--latency-scale 1]
+ *          [--tolerance 0.15] [--record] [--update-history]
+ *   or:  ts-node -r tsconfig-paths/register src/services/intelligence/__benchmarks__/oemBenchmark.ts
  */
 
 import * as path from 'path';
 import * as fs from 'fs';
+import * as os from 'os';
+import { createHash } from 'crypto';
+import { execSync } from 'child_process';
+import { AsyncLocalStorage } from 'async_hooks';
 import { logger } from '@utils/logger';
+import { onSpanFinish } from '@utils/apm';
+import { withGeminiBudget, getBudgetStats } from '../geminiBudget';
+import {
+  StandInServer, RecordedResponse, ResponseFixture, LatencySpec, DEFAULT_LATENCY,
+} from '../../testing/loadReplayStandIns';
+import { summarize, LatencySummary } from '../../testing/loadReplay';
+
+const TEST_CASES_PATH = path.join(__dirname, 'testCases.json');
+const FIXTURES_PATH = path.join(__dirname, 'oemFixtures.json');
+const STAND_IN_FIXTURES_PATH = path.join(__dirname, 'oemStandInFixtures.json');
+const HISTORY_PATH = path.join(__dirname, 'oemBenchmarkHistory.jsonl');
+// oemDatabase.ts default location, relative to this directory
+const DEFAULT_OEM_DATA_PATH = path.join(__dirname, '../../../../../oem-data');
+
+/** Budget per case, as the bot worker grants per message */
+const GEMINI_BUDGET = parseInt(process.env.GEMINI_BUDGET_PER_REQUEST || '8', 10);
+const HISTORY_BASELINE_RUNS = 5;
+const BUDGET_TOLERANCE = 0.05;
+const ACCURACY_TOLERANCE_POINTS = 2;
+/** Latency regressions below this are noise, whatever the tolerance */
+const LATENCY_NOISE_MS = 50;
+
+/** APM spans of the pipeline phases (apexPipeline.ts) → report name */
+const PHASE_SPANS: Record<string, string> = {
+  'apex.phase1_db_lookup': 'p1_database',
+  'apex.phase2_gemini_search': 'p2_gemini_search',
+  'apex.phase2c_direct_fallback': 'p2c_direct_fallback',
+  'apex.phase2b_reverse_verify': 'p2b_reverse_verify',
+  'apex.phase3_claude_adversary': 'p3_adversary',
+};
 
 interface TestCase {
   id: string;
@@ -22,8 +79,21 @@ interface TestCase {
   notes?: string;
 }
 
+export interface OemBenchmarkOptions {
+  workers?: number;
+  passes?: number;
+  /** Multiplier for recorded latencies (0 = CPU time only) */
+  latencyScale?: number;
+  tolerance?: number;
+  /** Call the live APIs and (re)write oemFixtures.json */
+  record?: boolean;
+  /** Append this run to oemBenchmarkHistory.jsonl */
+  updateHistory?: boolean;
+}
+
 interface BenchmarkResult {
   testId: string;
+  pass: number;
   make: string;
   expectedOem: string;
   resolvedOem: string | null;
@@ -31,9 +101,34 @@ interface BenchmarkResult {
   confidence: number;
   pipelinePhase: string;
   latencyMs: number;
+  phaseMs: Record<string, number>;
+  budgetCalls: number;
   error?: string;
 }
 
+interface HistoryEntry {
+  timestamp: string;
+  commit: string | null;
+  fixtures: string;
+  cases: number;
+  workers: number;
+  latencyScale: number;
+  /** null for stand-in runs, whose answers are the expected OEMs */
+  accuracy: number | null;
+  p50Ms: number;
+  p95Ms: number;
+  budgetCallsPerCase: number;
+  dbHitRate: number;
+}
+
+interface StandInFixtures {
+  note: string;
+  /** Answers for prompts containing `match` (first match wins) */
+  gemini: ResponseFixture[];
+  /** Answer for every other prompt (adversary, reverse verification) */
+  defaultGemini: string;
+}
+
 interface BenchmarkReport {
   timestamp: string;
   totalTests: number;
@@ -41,7 +136,18 @@ interface BenchmarkReport {
   failed: number;
   errors: number;
   accuracy: number;
+  /** False for stand-in runs: accuracy then only checks the pipeline plumbing */
+  accuracyGated: boolean;
   averageLatencyMs: number;
+  workers: number;
+  /** Pass 1, per phase and "total" */
+  latencyMs: Record<string, LatencySummary & { count: number }>;
+  budgetCallsPerCase: number;
+  maxBudgetCalls: number;
+  /** Phase 1 database hits / cases, per pass */
+  dbHitRate: number[];
+  fixtureMisses: number;
+  regressions: string[];
   byBrand: Record<string, { total: number; passed: number; accuracy: number }>;
   byPhase: Record<string, { total: number; passed: number; accuracy: number }>;
   results: BenchmarkResult[];
@@ -51,82 +157,271 @@ function normalizeOem(oem: string): string {
   return oem.replace(/[\s\-\.]/g, '').toUpperCase();
 }
 
-export async function runOemBenchmark(): Promise<BenchmarkReport> {
-  // Load test cases
-  const testCasesPath = path.join(__dirname, 'testCases.json');
-  const testCases: TestCase[] = JSON.parse(fs.readFileSync(testCasesPath, 'utf-8'));
+// ============================================================================
+// Per-case phase timings
+// ============================================================================
 
-  logger.info(`[Benchmark] Starting OEM benchmark with ${testCases.length} test cases`);
+const casePhases = new AsyncLocalStorage<Record<string, number>>();
 
-  const results: BenchmarkResult[] = [];
-  const byBrand: Record<string, { total: number; passed: number; accuracy: number }> = {};
-  const byPhase: Record<string, { total: number; passed: number; accuracy: number }> = {};
+onSpanFinish(span => {
+  const phase = PHASE_SPANS[span.name];
+  const phaseMs = casePhases.getStore();
+  if (phase && phaseMs) phaseMs[phase] = (phaseMs[phase] ?? 0) + span.durationMs;
+});
 
-  for (const tc of testCases) {
-    const start = Date.now();
-    let result: BenchmarkResult;
+async function runCase(tc: TestCase, pass: number): Promise<BenchmarkResult> {
+  const start = Date.now();
+  const phaseMs: Record<string, number> = {};
+  let budgetCalls = 0;
 
-    try {
-      // Dynamic import to avoid circular deps during module init
-      const { runApexPipeline } = await import('../apexPipeline');
+  try {
+    // Dynamic import: the environment must point at the fixtures before the pipeline loads
+    const { resolveOemApex } = await import('../apexPipeline');
 
-      const pipelineResult = await runApexPipeline({
+    const pipelineResult = await casePhases.run(phaseMs, () => withGeminiBudget(GEMINI_BUDGET, async () => {
+      const result = await resolveOemApex({
+        orderId: `benchmark-${tc.id}`,
         vehicle: {
           make: tc.make,
           model: tc.model,
-          year: tc.year,
+          year: parseInt(tc.year, 10) || undefined,
         },
         partQuery: {
           rawText: tc.part,
-          normalizedName: tc.part,
         },
-      } as any);
-
-      const resolvedOem = pipelineResult?.primaryOEM || pipelineResult?.oemNumber || null;
-      const match = resolvedOem
-        ? normalizeOem(resolvedOem) === normalizeOem(tc.expectedOem)
-        : false;
-
-      result = {
-        testId: tc.id,
-        make: tc.make,
-        expectedOem: tc.expectedOem,
-        resolvedOem,
-        match,
-        confidence: pipelineResult?.overallConfidence || 0,
-        pipelinePhase: pipelineResult?.winningPhase || 'unknown',
-        latencyMs: Date.now() - start,
-      };
-    } catch (err: any) {
-      result = {
-        testId: tc.id,
-        make: tc.make,
-        expectedOem: tc.expectedOem,
-        resolvedOem: null,
-        match: false,
-        confidence: 0,
-        pipelinePhase: 'error',
-        latencyMs: Date.now() - start,
-        error: err?.message,
-      };
+      });
+      budgetCalls = getBudgetStats()?.usedCalls ?? 0;
+      return result;
+    }, `benchmark-${tc.id}`));
+
+    const resolvedOem = pipelineResult.primaryOEM || null;
+    return {
+      testId: tc.id,
+      pass,
+      make: tc.make,
+      expectedOem: tc.expectedOem,
+      resolvedOem,
+      match: resolvedOem ? normalizeOem(resolvedOem) === normalizeOem(tc.expectedOem) : false,
+      confidence: pipelineResult.overallConfidence || 0,
+      pipelinePhase: pipelineResult.apexPhase || 'error',
+      latencyMs: Date.now() - start,
+      phaseMs,
+      budgetCalls,
+    };
+  } catch (err: any) {
+    return {
+      testId: tc.id,
+      pass,
+      make: tc.make,
+      expectedOem: tc.expectedOem,
+      resolvedOem: null,
+      match: false,
+      confidence: 0,
+      pipelinePhase: 'error',
+      latencyMs: Date.now() - start,
+      phaseMs,
+      budgetCalls,
+      error: err?.message,
+    };
+  }
+}
+
+/** Run `fn` over `items` with at most `workers` in flight; results keep the input order */
+async function runPool<T, R>(items: T[], workers: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  await Promise.all(Array.from({ length: Math.min(workers, items.length) }, async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
     }
+  }));
+  return results;
+}
 
-    results.push(result);
+// ============================================================================
+// Fixtures and environment
+// ============================================================================
 
+function loadRecordings(): Record<string, RecordedResponse> {
+  return fs.existsSync(FIXTURES_PATH) ? JSON.parse(fs.readFileSync(FIXTURES_PATH, 'utf-8')) : {};
+}
+
+function saveRecordings(recordings: Record<string, RecordedResponse>): void {
+  // Sorted keys keep re-recordings diffable
+  const sorted = Object.fromEntries(Object.keys(recordings).sort().map(key => [key, recordings[key]]));
+  fs.writeFileSync(FIXTURES_PATH, JSON.stringify(sorted, null, 2) + '\n');
+}
+
+function scaleLatency(spec: LatencySpec, scale: number): LatencySpec {
+  switch (spec.kind) {
+    case 'fixed': return { kind: 'fixed', ms: spec.ms * scale };
+    case 'uniform': return { kind: 'uniform', min: spec.min * scale, max: spec.max * scale };
+    case 'normal': return { kind: 'normal', mean: spec.mean * scale, sd: spec.sd * scale };
+    case 'lognormal': return { kind: 'lognormal', median: spec.median * scale, sigma: spec.sigma };
+  }
+}
+
+/** Stand-in answers (oemStandInFixtures.json) with the default latencies scaled */
+function createStandInFixtureServer(latencyScale: number): StandInServer {
+  const fixtures: StandInFixtures = JSON.parse(fs.readFileSync(STAND_IN_FIXTURES_PATH, 'utf-8'));
+  return new StandInServer({
+    llmFixtures: fixtures.gemini,
+    defaultLlmResponse: fixtures.defaultGemini,
+    latency: {
+      gemini: scaleLatency(DEFAULT_LATENCY.gemini, latencyScale),
+      scraper: scaleLatency(DEFAULT_LATENCY.scraper, latencyScale),
+    },
+  });
+}
+
+/**
+ * Point the pipeline at the stand-in and make the run reproducible: no Claude,
+ * no client-side Gemini quota, and a private copy of the OEM database so
+ * learned OEMs never leak from one run into the next.
+ */
+function prepareEnvironment(standIns: StandInServer): string {
+  Object.assign(process.env, standIns.getEnv());
+  delete process.env.ANTHROPIC_API_KEY;
+  process.env.GEMINI_RATE_LIMIT_PER_MIN = '1000000';
+
+  const dataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'oem-benchmark-'));
+  const sourceDb = path.join(process.env.OEM_DATA_PATH || DEFAULT_OEM_DATA_PATH, 'oem-database.sqlite');
+  if (fs.existsSync(sourceDb)) fs.copyFileSync(sourceDb, path.join(dataDir, 'oem-database.sqlite'));
+  process.env.OEM_DATA_PATH = dataDir;
+  // An index elsewhere would be a snapshot of a different database
+  delete process.env.OEM_INDEX_PATH;
+  return dataDir;
+}
+
+function fingerprint(...files: string[]): string {
+  const hash = createHash('sha256');
+  for (const file of files) hash.update(fs.existsSync(file) ? fs.readFileSync(file) : '');
+  return hash.digest('hex').slice(0, 12);
+}
+
+// ============================================================================
+// History
+// ============================================================================
+
+function readHistory(): HistoryEntry[] {
+  if (!fs.existsSync(HISTORY_PATH)) return [];
+  return fs.readFileSync(HISTORY_PATH, 'utf-8')
+    .split('\n')
+    .filter(line => line.trim())
+    .map(line => JSON.parse(line));
+}
+
+function median(values: number[]): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+/** Regressions of `entry` against the median of the last comparable runs */
+function findRegressions(entry: HistoryEntry, history: HistoryEntry[], tolerance: number): string[] {
+  const baseline = history
+    .filter(h => h.fixtures === entry.fixtures && h.cases === entry.cases &&
+      h.workers === entry.workers && h.latencyScale === entry.latencyScale)
+    .slice(-HISTORY_BASELINE_RUNS);
+  if (baseline.length === 0) return [];
+
+  const regressions: string[] = [];
+  for (const metric of ['p50Ms', 'p95Ms'] as const) {
+    const base = median(baseline.map(h => h[metric]));
+    const limit = base + Math.max(base * tolerance, LATENCY_NOISE_MS);
+    if (entry[metric] > limit) {
+      regressions.push(`${metric} ${entry[metric]}ms > ${Math.round(limit)}ms (baseline ${Math.round(base)}ms)`);
+    }
+  }
+
+  const calls = median(baseline.map(h => h.budgetCallsPerCase));
+  if (entry.budgetCallsPerCase > calls * (1 + BUDGET_TOLERANCE)) {
+    regressions.push(`budget calls/case ${entry.budgetCallsPerCase} > ${(calls * (1 + BUDGET_TOLERANCE)).toFixed(2)} (baseline ${calls})`);
+  }
+
+  const accuracies = baseline.map(h => h.accuracy).filter((a): a is number => a !== null);
+  if (entry.accuracy !== null && accuracies.length > 0) {
+    const accuracy = median(accuracies);
+    if (entry.accuracy < accuracy - ACCURACY_TOLERANCE_POINTS) {
+      regressions.push(`accuracy ${entry.accuracy}% < ${accuracy - ACCURACY_TOLERANCE_POINTS}% (baseline ${accuracy}%)`);
+    }
+  }
+  return regressions;
+}
+
+function gitCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+// ============================================================================
+// Benchmark
+// ============================================================================
+
+export async function runOemBenchmark(options: OemBenchmarkOptions = {}): Promise<BenchmarkReport> {
+  const workers = options.workers ?? 4;
+  const passes = Math.max(1, options.passes ?? 2);
+  const latencyScale = options.latencyScale ?? 1;
+  const tolerance = options.tolerance ?? 0.15;
+
+  // Load test cases
+  const testCases: TestCase[] = JSON.parse(fs.readFileSync(TEST_CASES_PATH, 'utf-8'));
+
+  const recordings = loadRecordings();
+  const replay = options.record || Object.keys(recordings).length > 0;
+  const fixturesPath = replay ? FIXTURES_PATH : STAND_IN_FIXTURES_PATH;
+  if (!replay) {
+    logger.warn(`[Benchmark] No recorded responses in ${FIXTURES_PATH} — answering from ${STAND_IN_FIXTURES_PATH}; accuracy reflects the pipeline, not Gemini`);
+  }
+  const standIns = replay
+    ? new StandInServer({ recordings, record: options.record, recordedLatencyScale: latencyScale })
+    : createStandInFixtureServer(latencyScale);
+  await standIns.start();
+  const dataDir = prepareEnvironment(standIns);
+
+  logger.info(`[Benchmark] Starting OEM benchmark with ${testCases.length} test cases`, {
+    workers,
+    passes,
+    latencyScale,
+    mode: options.record ? 'record' : replay ? 'replay' : 'stand-in',
+  });
+
+  const passResults: BenchmarkResult[][] = [];
+  try {
+    for (let pass = 1; pass <= passes; pass++) {
+      passResults.push(await runPool(testCases, workers, async tc => {
+        const result = await runCase(tc, pass);
+        // Progress log
+        const icon = result.match ? '✅' : result.error ? '❌' : '⚠️';
+        logger.info(`${icon} [${tc.id}#${pass}] ${tc.make} ${tc.model} — ${tc.part} → ${result.resolvedOem || 'NONE'} (expected: ${tc.expectedOem}, ${result.pipelinePhase}, ${result.latencyMs}ms, ${result.budgetCalls} calls)`);
+        return result;
+      }));
+    }
+  } finally {
+    await standIns.stop();
+    fs.rmSync(dataDir, { recursive: true, force: true });
+  }
+  if (options.record) saveRecordings(recordings);
+
+  // Accuracy and latency are measured on the cold pass; later passes show the learning cache
+  const results = passResults[0];
+  const byBrand: Record<string, { total: number; passed: number; accuracy: number }> = {};
+  const byPhase: Record<string, { total: number; passed: number; accuracy: number }> = {};
+  for (const result of results) {
     // Track by brand
-    if (!byBrand[tc.make]) byBrand[tc.make] = { total: 0, passed: 0, accuracy: 0 };
-    byBrand[tc.make].total++;
-    if (result.match) byBrand[tc.make].passed++;
+    if (!byBrand[result.make]) byBrand[result.make] = { total: 0, passed: 0, accuracy: 0 };
+    byBrand[result.make].total++;
+    if (result.match) byBrand[result.make].passed++;
 
     // Track by phase
     const phase = result.pipelinePhase;
     if (!byPhase[phase]) byPhase[phase] = { total: 0, passed: 0, accuracy: 0 };
     byPhase[phase].total++;
     if (result.match) byPhase[phase].passed++;
-
-    // Progress log
-    const icon = result.match ? '✅' : result.error ? '❌' : '⚠️';
-    logger.info(`${icon} [${tc.id}] ${tc.make} ${tc.model} — ${tc.part} → ${result.resolvedOem || 'NONE'} (expected: ${tc.expectedOem})`);
   }
 
   // Calculate accuracies
@@ -137,9 +432,18 @@ export async function runOemBenchmark(): Promise<BenchmarkReport> {
     phase.accuracy = phase.total > 0 ? Math.round((phase.passed / phase.total) * 100) : 0;
   }
 
+  // Latency per phase (cases that ran the phase) and end to end
+  const latencyMs: BenchmarkReport['latencyMs'] = {};
+  for (const phase of Object.values(PHASE_SPANS)) {
+    const samples = results.filter(r => phase in r.phaseMs).map(r => r.phaseMs[phase]);
+    if (samples.length > 0) latencyMs[phase] = { count: samples.length, ...summarize(samples) };
+  }
+  latencyMs.total = { count: results.length, ...summarize(results.map(r => r.latencyMs)) };
+
   const passed = results.filter(r => r.match).length;
   const errors = results.filter(r => r.error).length;
   const totalLatency = results.reduce((sum, r) => sum + r.latencyMs, 0);
+  const totalBudgetCalls = results.reduce((sum, r) => sum + r.budgetCalls, 0);
 
   const report: BenchmarkReport = {
     timestamp: new Date().toISOString(),
@@ -148,18 +452,52 @@ export async function runOemBenchmark(): Promise<BenchmarkReport> {
     failed: testCases.length - passed - errors,
     errors,
     accuracy: Math.round((passed / testCases.length) * 100),
+    accuracyGated: replay,
     averageLatencyMs: Math.round(totalLatency / testCases.length),
+    workers,
+    latencyMs,
+    budgetCallsPerCase: Math.round((totalBudgetCalls / testCases.length) * 100) / 100,
+    maxBudgetCalls: Math.max(...results.map(r => r.budgetCalls)),
+    dbHitRate: passResults.map(pass =>
+      Math.round((pass.filter(r => r.pipelinePhase === 'database').length / pass.length) * 100) / 100),
+    fixtureMisses: standIns.getRecordingMisses(),
+    regressions: [],
     byBrand,
     byPhase,
-    results,
+    results: passResults.flat(),
   };
 
+  // Compare with (and optionally extend) the history; recorded runs hit the live APIs
+  if (!options.record) {
+    const entry: HistoryEntry = {
+      timestamp: report.timestamp,
+      commit: gitCommit(),
+      fixtures: fingerprint(fixturesPath, TEST_CASES_PATH),
+      cases: testCases.length,
+      workers,
+      latencyScale,
+      accuracy: report.accuracyGated ? report.accuracy : null,
+      p50Ms: latencyMs.total.p50,
+      p95Ms: latencyMs.total.p95,
+      budgetCallsPerCase: report.budgetCallsPerCase,
+      dbHitRate: report.dbHitRate[0],
+    };
+    report.regressions = findRegressions(entry, readHistory(), tolerance);
+    if (options.updateHistory) fs.appendFileSync(HISTORY_PATH, JSON.stringify(entry) + '\n');
+  }
+
   // Summary
   logger.info('\n' + '═'.repeat(60));
   logger.info(`OEM Benchmark Report — ${report.timestamp}`);
   logger.info('═'.repeat(60));
   logger.info(`Total: ${report.totalTests} | ✅ ${report.passed} | ⚠️ ${report.failed} | ❌ ${report.errors}`);
-  logger.info(`Accuracy: ${report.accuracy}% | Avg Latency: ${report.averageLatencyMs}ms`);
+  logger.info(`Accuracy: ${report.accuracy}%${report.accuracyGated ? '' : ' (stand-in, not gated)'} | Avg Latency: ${report.averageLatencyMs}ms | Workers: ${workers}`);
+  logger.info(`Budget calls/case: ${report.budgetCallsPerCase} (max ${report.maxBudgetCalls}) | DB hit rate per pass: ${report.dbHitRate.map(r => `${Math.round(r * 100)}%`).join(' → ')}`);
+  logger.info('─'.repeat(60));
+  logger.info('Latency (ms):');
+  for (const [phase, stats] of Object.entries(latencyMs)) {
+    logger.info(`  ${phase}: p50 ${stats.p50} | p95 ${stats.p95} | p99 ${stats.p99} | max ${stats.max} (${stats.count} cases)`);
+  }
   logger.info('─'.repeat(60));
   logger.info('By Brand:');
   for (const [brand, stats] of Object.entries(byBrand)) {
@@ -170,6 +508,13 @@ export async function runOemBenchmark(): Promise<BenchmarkReport> {
   for (const [phase, stats] of Object.entries(byPhase)) {
     logger.info(`  ${phase}: ${stats.accuracy}% (${stats.passed}/${stats.total})`);
   }
+  logger.info('─'.repeat(60));
+  if (report.fixtureMisses > 0) {
+    logger.error(`${report.fixtureMisses} requests had no recorded response — prompts changed, re-record with --record`);
+  }
+  for (const regression of report.regressions) {
+    logger.error(`Regression: ${regression}`);
+  }
   logger.info('═'.repeat(60));
 
   // Save report to file
@@ -180,13 +525,29 @@ export async function runOemBenchmark(): Promise<BenchmarkReport> {
   return report;
 }
 
+function parseArgs(argv: string[]): OemBenchmarkOptions {
+  const value = (name: string) => {
+    const i = argv.indexOf(`--${name}`);
+    return i >= 0 && argv[i + 1] !== undefined ? Number(argv[i + 1]) : undefined;
+  };
+  return {
+    workers: value('workers'),
+    passes: value('passes'),
+    latencyScale: value('latency-scale'),
+    tolerance: value('tolerance'),
+    record: argv.includes('--record'),
+    updateHistory: argv.includes('--update-history'),
+  };
+}
+
 // Run if called directly
 if (require.main === module) {
   // Load env for direct execution
   require('dotenv').config();
-  runOemBenchmark()
+  runOemBenchmark(parseArgs(process.argv.slice(2)))
     .then(report => {
-      process.exit(report.accuracy >= 70 ? 0 : 1);
+      const ok = (!report.accuracyGated || report.accuracy >= 70) && report.fixtureMisses === 0 && report.regressions.length === 0;
+      process.exit(ok ? 0 : 1);
     })
     .catch(err => {
       console.error('Benchmark failed:', err);
@@ -0,0 +1,73 @@
+/**
+ * VIN Decoder Benchmark
+ *
+ * Throughput in VINs/second for a synthetic fleet import (known and unknown
+ * WMIs, ~20% duplicates, some lower-case / spaced input):
+ *   - decodeVIN() over distinct inputs (cache misses)
+ *   - decodeVIN() over the same inputs again (cache hits)
+ *   - decodeVINBatch() over the whole list
+ *
+ * Usage: LOG_LEVEL=warn ts-node -r tsconfig-paths/register src/services/intelligence/__benchmarks__/vinDecoderBenchmark.ts [fleetSize]
+ */
+
+import { decodeVIN, decodeVINBatch } from '../vinDecoder';
+
+const FLEET_SIZE = Number(process.argv[2] || 50_000);
+const ROUNDS = 5;
+
+const WMIS = ['WVW', 'WAU', 'TMB', 'VSS', 'WBA', 'WDD', 'JHM', 'VF1', 'ZFA', 'YV1', 'WVX', 'XYZ'];
+const VIN_CHARS = 'ABCDEFGHJKLMNPRSTUVWXYZ0123456789';
+
+function buildFleet(size: number): string[] {
+  let seed = 42;
+  const next = (n: number) => {
+    seed = (seed * 16807) % 2147483647;
+    return seed % n;
+  };
+
+  const fleet: string[] = [];
+  for (let i = 0; i < size; i++) {
+    if (i > 0 && next(5) === 0) {
+      fleet.push(fleet[next(i)]);
+      continue;
+    }
+    let vin = WMIS[next(WMIS.length)];
+    for (let k = 0; k < 14; k++) vin += VIN_CHARS[next(VIN_CHARS.length)];
+    if (next(10) === 0) vin = vin.toLowerCase();
+    if (next(20) === 0) vin = `${vin.slice(0, 9)} ${vin.slice(9)}`;
+    fleet.push(vin);
+  }
+  return fleet;
+}
+
+function measure(label: string, count: number, fn: () => void): void {
+  fn(); // warm-up
+  const start = process.hrtime.bigint();
+  for (let r = 0; r < ROUNDS; r++) fn();
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  const perSecond = Math.round((count * ROUNDS) / seconds);
+  console.log(`${label.padEnd(28)} ${perSecond.toLocaleString().padStart(12)} VINs/s`);
+}
+
+function run(): void {
+  const fleet = buildFleet(FLEET_SIZE);
+  console.log(`VIN decoder benchmark: ${FLEET_SIZE} VINs, ${ROUNDS} rounds`);
+
+  // Fresh suffix per round so every call misses the decode cache
+  let round = 0;
+  measure('decodeVIN (cache miss)', fleet.length, () => {
+    const suffix = ' '.repeat(++round);
+    for (const vin of fleet) decodeVIN(vin + suffix);
+  });
+
+  const hot = fleet.slice(0, 500);
+  measure('decodeVIN (cache hit)', hot.length * 100, () => {
+    for (let i = 0; i < 100; i++) for (const vin of hot) decodeVIN(vin);
+  });
+
+  measure('decodeVINBatch', fleet.length, () => {
+    decodeVINBatch(fleet);
+  });
+}
+
+run();
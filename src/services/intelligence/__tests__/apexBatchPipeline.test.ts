@@ -0,0 +1,145 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+jest.mock('../apexPipeline', () => ({
+    DB_ACCEPT_THRESHOLD: 0.93,
+    validateApexCandidate: jest.fn(async (_req: any, candidate: any) => ({
+        finalOem: candidate.oem,
+        finalConfidence: candidate.confidence,
+        claudeVerdict: 'CONFIRMED',
+    })),
+}));
+
+jest.mock('../deepOemResolver', () => ({
+    decodeVehicle: jest.fn(async (vehicle: any) => ({ vehicle, vinDecoded: false })),
+    performDeepResolution: jest.fn(async (req: any) => ({
+        candidates: req.partQuery.rawText === 'Zahnriemensatz'
+            ? [{ oem: '14400RBBE01', source: 'motorcode', confidence: 0.95 }]
+            : [],
+        enrichedRequest: req,
+    })),
+}));
+
+jest.mock('../sources/databaseSource', () => ({
+    resolveDatabaseCandidatesBatch: jest.fn((reqs: any[]) => reqs.map(r =>
+        r.partQuery.rawText.startsWith('Bremsscheibe')
+            ? [{ oem: '45251TV0E01', source: 'enterprise-database', confidence: 0.96 }]
+            : []
+    )),
+}));
+
+jest.mock('../geminiService', () => {
+    const { acquireBudgetToken } = jest.requireActual('../geminiBudget');
+    return {
+        generateChatCompletion: jest.fn(async ({ messages }: any) => {
+            if (!acquireBudgetToken()) return '{}';
+            const ids = [...messages[1].content.matchAll(/^(\d+): /gm)].map((m: RegExpMatchArray) => Number(m[1]));
+            return JSON.stringify({ results: ids.map(id => ({ id, oem: `1234${String(id).padStart(4, '0')}`, confidence: 0.7 })) });
+        }),
+    };
+});
+
+jest.mock('../oemMetrics', () => ({ recordOemResolution: jest.fn() }));
+jest.mock('../oemLearner', () => ({ learnFromResolution: jest.fn() }));
+
+import { resolveOemApexBatch, BatchPartRequest, MAX_BATCH_PARTS } from '../apexBatchPipeline';
+import { generateChatCompletion } from '../geminiService';
+import { resolveDatabaseCandidatesBatch } from '../sources/databaseSource';
+import { decodeVehicle } from '../deepOemResolver';
+import { validateApexCandidate } from '../apexPipeline';
+
+const vehicle = { make: 'Honda', model: 'Civic', year: 2018 };
+
+function partList(n: number, text = 'Querlenker'): BatchPartRequest[] {
+    return Array.from({ length: n }, (_, i) => ({ id: `pos-${i}`, rawText: `${text} ${i}` }));
+}
+
+describe('resolveOemApexBatch', () => {
+    beforeEach(() => jest.clearAllMocks());
+
+    it('should settle deep and database hits without calling Gemini', async () => {
+        const summary = await resolveOemApexBatch(vehicle, [
+            { id: 'a', rawText: 'Zahnriemensatz' },
+            { id: 'b', rawText: 'Bremsscheibe vorne' },
+        ]);
+
+        expect(decodeVehicle).toHaveBeenCalledTimes(1);
+        expect(resolveDatabaseCandidatesBatch).toHaveBeenCalledTimes(1);
+        expect(generateChatCompletion).not.toHaveBeenCalled();
+        expect(summary.results.map(r => [r.id, r.phase, r.primaryOEM])).toEqual([
+            ['a', 'deep', '14400RBBE01'],
+            ['b', 'database', '45251TV0E01'],
+        ]);
+        expect(summary.stats.resolved).toBe(2);
+    });
+
+    it('should group misses into one Gemini prompt per 25 parts', async () => {
+        const summary = await resolveOemApexBatch(vehicle, partList(60));
+
+        expect(generateChatCompletion).toHaveBeenCalledTimes(3);
+        expect(summary.stats.geminiCalls).toBe(3);
+        expect(summary.stats.byPhase.gemini_batch).toBe(60);
+        expect(summary.results[59]).toMatchObject({ id: 'pos-59', primaryOEM: '12340059', phase: 'gemini_batch' });
+        // Ungrounded suggestions stay capped
+        expect(summary.results.every(r => r.confidence <= 0.8)).toBe(true);
+    });
+
+    it('should validate every Gemini suggestion before accepting it', async () => {
+        (validateApexCandidate as jest.Mock).mockImplementationOnce(async (_req: any, candidate: any) => ({
+            finalOem: undefined,
+            finalConfidence: candidate.confidence * 0.4,
+            claudeVerdict: 'REJECTED',
+        }));
+        const summary = await resolveOemApexBatch(vehicle, partList(2));
+
+        expect(validateApexCandidate).toHaveBeenCalledTimes(2);
+        expect((validateApexCandidate as jest.Mock).mock.calls[0][1]).toMatchObject({ source: 'gemini_batch', confidence: 0.7 });
+        expect(summary.results[0]).toMatchObject({ phase: 'not_found', notes: 'Rejected by validation (REJECTED)' });
+        expect(summary.results[0].primaryOEM).toBeUndefined();
+        expect(summary.results[1]).toMatchObject({ phase: 'gemini_batch', primaryOEM: '12340001' });
+    });
+
+    it('should report not_found once the Gemini budget is used up', async () => {
+        const summary = await resolveOemApexBatch(vehicle, partList(75), { geminiBudget: 1 });
+
+        expect(summary.stats.geminiCalls).toBe(1);
+        expect(summary.stats.byPhase.gemini_batch).toBe(25);
+        expect(summary.stats.byPhase.not_found).toBe(50);
+        expect(summary.results.filter(r => r.phase === 'not_found')
+            .every(r => r.notes === 'Gemini budget exhausted or unavailable')).toBe(true);
+    });
+
+    it('should emit every part through onResult and keep request order', async () => {
+        const seen: string[] = [];
+        const parts = [{ id: 'x', rawText: 'Bremsscheibe hinten' }, ...partList(3)];
+        const summary = await resolveOemApexBatch(vehicle, parts, { onResult: r => seen.push(r.id) });
+
+        expect(seen.sort()).toEqual(parts.map(p => p.id).sort());
+        expect(summary.results.map(r => r.id)).toEqual(parts.map(p => p.id));
+    });
+
+    it('should stop scheduling work once the caller aborts', async () => {
+        const disconnect = new AbortController();
+        const seen: string[] = [];
+        const parts = [{ id: 'x', rawText: 'Bremsscheibe hinten' }, ...partList(30)];
+        const summary = await resolveOemApexBatch(vehicle, parts, {
+            signal: disconnect.signal,
+            onResult: r => {
+                seen.push(r.id);
+                disconnect.abort();
+            },
+        });
+
+        // The database hit settled before the disconnect; no Gemini prompt starts after it
+        expect(generateChatCompletion).not.toHaveBeenCalled();
+        expect(seen).toEqual(['x']);
+        expect(summary.results).toHaveLength(31);
+        expect(summary.results[0]).toMatchObject({ phase: 'database', primaryOEM: '45251TV0E01' });
+        expect(summary.results[30]).toMatchObject({ phase: 'not_found', notes: 'Cancelled: client disconnected' });
+    });
+
+    it('should reject oversized batches', async () => {
+        await expect(resolveOemApexBatch(vehicle, partList(MAX_BATCH_PARTS + 1))).rejects.toThrow('Batch too large');
+    });
+});
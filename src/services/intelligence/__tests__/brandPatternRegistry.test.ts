@@ -0,0 +1,29 @@
+import { validateOemPattern, validateOemPatternInt } from '../brandPatternRegistry';
+
+describe('brandPatternRegistry', () => {
+    it('should match any of a brand\'s strong patterns', () => {
+        expect(validateOemPattern('5Q0 698 151 A', 'VW')).toBe(1.0);
+        expect(validateOemPattern('34116860264', 'BMW')).toBe(1.0);
+        expect(validateOemPattern('1234567', 'MINI')).toBe(1.0);
+        expect(validateOemPattern('12345678', 'Honda')).toBe(1.0);
+    });
+
+    it('should not let one member pattern match a prefix of another', () => {
+        // Anchors apply to the whole alternation: 12 digits is neither 7 nor 11
+        expect(validateOemPattern('341168602641', 'BMW')).toBe(0.2);
+        expect(validateOemPattern('12345678', 'BMW')).toBe(0.5);
+    });
+
+    it('should resolve composite brand names via partial alias match', () => {
+        expect(validateOemPattern('A2054201220', 'MERCEDES-BENZ')).toBe(1.0);
+        expect(validateOemPattern('5Q0698151A', 'VW Nutzfahrzeuge')).toBe(1.0);
+        // Repeated lookups hit the resolved-brand cache with the same result
+        expect(validateOemPattern('A2054201220', 'MERCEDES-BENZ')).toBe(1.0);
+    });
+
+    it('should stay neutral for unknown brands, also when cached', () => {
+        expect(validateOemPattern('ABC123', 'Tesla')).toBe(0.5);
+        expect(validateOemPattern('ABC123', 'Tesla')).toBe(0.5);
+        expect(validateOemPatternInt('ABC123', 'Tesla')).toBe(1);
+    });
+});
@@ -0,0 +1,65 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { calculateConsensus, getSourceGroup } from '../consensusEngine';
+
+describe('getSourceGroup', () => {
+    it('should resolve exact source names', () => {
+        expect(getSourceGroup('vag_etka')).toBe('group_7zap');
+        expect(getSourceGroup('enterprise-database-fts')).toBe('group_database');
+        expect(getSourceGroup('Gemini-Vision')).toBe('group_ai');
+    });
+
+    it('should resolve composite names to the first contained key', () => {
+        expect(getSourceGroup('web_scrape:7zap_mobile')).toBe('group_7zap');
+        expect(getSourceGroup('realoem_v2')).toBe('group_realoem');
+        expect(getSourceGroup('cached:tecdoc_catalog')).toBe('group_tecdoc');
+        // Memoized lookups return the same group
+        expect(getSourceGroup('realoem_v2')).toBe('group_realoem');
+    });
+
+    it('should give unknown sources their own group', () => {
+        expect(getSourceGroup('web_scrape:partsouq')).toBe('group_web_scrape:partsouq');
+    });
+});
+
+describe('calculateConsensus', () => {
+    it('should count sources scraping the same site as one group', () => {
+        const result = calculateConsensus([
+            { oem: '5Q0615301F', source: 'vag_etka', confidence: 0.9, meta: { priority: 10 } },
+            { oem: '5Q0615301F', source: 'web_scrape:7zap', confidence: 0.8, meta: { priority: 10 } },
+            { oem: '5Q0615301F', source: '7zap_web', confidence: 0.7 },
+        ]);
+        expect(result.primaryOEM).toBe('5Q0615301F');
+        expect(result.sourceCount).toBe(1);
+        expect(result.sources).toEqual(['vag_etka', 'web_scrape:7zap', '7zap_web']);
+        expect(result.agreementScore).toBeCloseTo(1 / 3);
+        expect(result.confidence).toBeCloseTo(0.8);
+    });
+
+    it('should prefer the OEM backed by more independent, higher-priority sources', () => {
+        const result = calculateConsensus([
+            { oem: '5Q0615301F', source: 'tecdoc_catalog', confidence: 0.9, meta: { priority: 10 } },
+            { oem: '5Q0615301F', source: 'Kfzteile24', confidence: 0.8, meta: { priority: 3 } },
+            { oem: '5Q0615301G', source: 'Oscaro', confidence: 0.8, meta: { priority: 3 } },
+        ]);
+        expect(result.primaryOEM).toBe('5Q0615301F');
+        expect(result.sourceCount).toBe(2);
+        expect(result.sources).toEqual(['tecdoc_catalog', 'Kfzteile24']);
+        expect(result.confidence).toBeCloseTo(0.9);
+    });
+
+    it('should keep the first-seen OEM on equal scores', () => {
+        const result = calculateConsensus([
+            { oem: 'AAA', source: 'foo', confidence: 0.8 },
+            { oem: 'BBB', source: 'bar', confidence: 0.8 },
+        ]);
+        expect(result.primaryOEM).toBe('AAA');
+        expect(result.agreementScore).toBe(0.5);
+    });
+
+    it('should return an empty result without candidates', () => {
+        expect(calculateConsensus([])).toMatchObject({ primaryOEM: null, confidence: 0, sourceCount: 0 });
+    });
+});
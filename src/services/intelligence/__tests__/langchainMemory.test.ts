@@ -0,0 +1,68 @@
+import { SessionHistoryStore, appendToState } from '../langchainMemory';
+
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+describe('SessionHistoryStore', () => {
+    it('should keep a fixed window and compact older turns into the summary', () => {
+        const store = new SessionHistoryStore({ windowSize: 4 });
+        for (let i = 0; i < 6; i++) {
+            store.append('s1', { role: i % 2 === 0 ? 'user' : 'assistant', content: `msg ${i}` });
+        }
+
+        const state = store.get('s1')!;
+        expect(state.messages.map(m => m.content)).toEqual(['msg 2', 'msg 3', 'msg 4', 'msg 5']);
+        expect(state.summary).toBe('Kunde: msg 0\nBot: msg 1');
+        expect(store.stats().compactions).toBeGreaterThan(0);
+    });
+
+    it('should evict least recently used sessions when over the byte budget', () => {
+        const store = new SessionHistoryStore({ maxBytes: 2000, windowSize: 10 });
+        const text = 'x'.repeat(300);
+
+        store.append('a', { role: 'user', content: text });
+        store.append('b', { role: 'user', content: text });
+        store.get('a'); // touch a, b becomes least recently used
+        store.append('c', { role: 'user', content: text });
+        store.append('d', { role: 'user', content: text });
+
+        const stats = store.stats();
+        expect(stats.bytesUsed).toBeLessThanOrEqual(2000);
+        expect(stats.evictions).toBeGreaterThan(0);
+        expect(store.peek('b')).toBeUndefined();
+        expect(store.peek('d')).toBeDefined();
+    });
+
+    it('should expire idle sessions lazily without a sweep timer', () => {
+        const store = new SessionHistoryStore({ sessionTimeoutMs: 1000 });
+        store.append('old', { role: 'user', content: 'hi' }, 0);
+        store.append('new', { role: 'user', content: 'hi' }, 5000);
+
+        expect(store.peek('old')).toBeUndefined();
+        expect(store.stats(5000).activeSessions).toBe(1);
+        expect(store.stats(5000).expirations).toBe(1);
+    });
+
+    it('should track bytes and message counts consistently on delete', () => {
+        const store = new SessionHistoryStore();
+        store.append('s', { role: 'user', content: 'Golf 7' });
+        store.append('s', { role: 'assistant', content: 'Welches Baujahr?' });
+        expect(store.stats().totalMessages).toBe(2);
+
+        store.delete('s');
+        expect(store.stats().totalMessages).toBe(0);
+        expect(store.stats().bytesUsed).toBe(0);
+    });
+});
+
+describe('appendToState', () => {
+    it('should cap the summary length and keep the newest context', () => {
+        let state = { summary: null as string | null, messages: [] as any[] };
+        for (let i = 0; i < 200; i++) {
+            state = appendToState(state, { role: 'user', content: `Nachricht Nummer ${i} ${'a'.repeat(50)}` }, 2);
+        }
+        expect(state.summary!.length).toBeLessThanOrEqual(1500);
+        expect(state.summary).toContain('Nachricht Nummer 197');
+    });
+});
@@ -0,0 +1,141 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+jest.mock('../verifiedOemData', () => ({ ALL_VERIFIED_OEMS: [] }));
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+
+const dataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'oem-index-'));
+process.env.OEM_DATA_PATH = dataDir;
+process.env.OEM_INDEX_POLL_MS = '20';
+process.env.OEM_SUPERSESSION_SYNC_MS = '0';
+
+// Env is read at module load
+const { oemDatabase } = require('../oemDatabase');
+const { buildOemIndex } = require('../oemIndexBuilder');
+
+const record = (oem: string, partDescription: string, confidence = 0.95) => ({
+    oem,
+    brand: 'VW',
+    model: 'Golf 7',
+    modelCode: '5G',
+    partCategory: 'brake',
+    partDescription,
+    sources: ['test'],
+    confidence,
+    lastVerified: new Date().toISOString(),
+    hitCount: 0,
+});
+
+async function waitFor(condition: () => boolean, timeoutMs = 3000): Promise<void> {
+    const deadline = Date.now() + timeoutMs;
+    while (!condition()) {
+        if (Date.now() > deadline) throw new Error('Timed out waiting for condition');
+        await new Promise(resolve => setTimeout(resolve, 10));
+    }
+}
+
+describe('OEM read-only index', () => {
+    afterAll(() => {
+        oemDatabase.close();
+        fs.rmSync(dataDir, { recursive: true, force: true });
+    });
+
+    it('should read from the writable database until an index is published', () => {
+        oemDatabase.upsert(record('5Q0615301F', 'Bremsscheibe vorne'));
+
+        expect(oemDatabase.getIndexVersion()).toBeNull();
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' }).map((r: any) => r.oem)).toEqual(['5Q0615301F']);
+    });
+
+    it('should switch to the index and serve lookups, FTS and supersessions from it', async () => {
+        oemDatabase.registerSupersession('5Q0615301F', '5Q0615301G', 'VW');
+        const built = buildOemIndex({ source: path.join(dataDir, 'oem-database.sqlite'), out: dataDir, keep: 2 });
+        expect(built.records).toBe(1);
+        expect(built.supersessions).toBe(1);
+
+        await waitFor(() => oemDatabase.getIndexVersion() === built.version);
+
+        expect(oemDatabase.lookup({ brand: 'VW', model: '5G', category: 'brake' })[0].oem).toBe('5Q0615301F');
+        expect(oemDatabase.search('Bremsscheibe', 5).map((r: any) => r.oem)).toEqual(['5Q0615301F']);
+        expect(oemDatabase.resolveSupersession('5Q0615301F')).toBe('5Q0615301G');
+        expect(oemDatabase.lookupMany({ brand: 'VW', categories: ['brake'] }).get('brake')).toHaveLength(1);
+    });
+
+    it('should pick up supersessions other processes add while reading from the index', () => {
+        const Database = require('better-sqlite3');
+        const other = new Database(path.join(dataDir, 'oem-database.sqlite'));
+        other.prepare(`INSERT INTO supersessions (old_oem, new_oem, brand, source) VALUES (?, ?, 'VW', 'test')`)
+            .run('5Q0615301G', '5Q0615301H');
+        other.close();
+
+        expect(oemDatabase.getIndexVersion()).not.toBeNull();
+        expect(oemDatabase.resolveSupersession('5Q0615301F')).toBe('5Q0615301H');
+    });
+
+    it('should read writes made since the build from the writable database', () => {
+        const indexVersion = oemDatabase.getIndexVersion();
+        oemDatabase.upsert(record('5Q0615601A', 'Bremsscheibe hinten', 0.99));
+        oemDatabase.upsert({ ...record('5Q0615301F', 'Bremsscheibe vorne 340mm'), model: 'Passat B8', modelCode: '3G' });
+
+        expect(oemDatabase.getIndexVersion()).toBe(indexVersion);
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' }).map((r: any) => r.oem)).toEqual(['5Q0615601A', '5Q0615301F']);
+        // The index still has 5Q0615301F as a Golf part; the rewritten row no longer matches
+        expect(oemDatabase.lookup({ brand: 'VW', model: '5G', category: 'brake' }).map((r: any) => r.oem)).toEqual(['5Q0615601A']);
+        expect(oemDatabase.lookupMany({ brand: 'VW', categories: ['brake'] }).get('brake')).toHaveLength(2);
+        expect(oemDatabase.search('hinten', 5).map((r: any) => r.oem)).toEqual(['5Q0615601A']);
+        expect(oemDatabase.getByOEM('5Q0615301F').partDescription).toBe('Bremsscheibe vorne 340mm');
+    });
+
+    it('should republish the index when the writable database changed, then hot-swap', async () => {
+        const version = oemDatabase.refreshIndex();
+        expect(version).not.toBeNull();
+        expect(oemDatabase.getIndexVersion()).toBe(version);
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' })).toHaveLength(2);
+        expect(oemDatabase.getByOEM('5Q0615301F').model).toBe('Passat B8');
+
+        const built = buildOemIndex({ source: path.join(dataDir, 'oem-database.sqlite'), out: dataDir, keep: 1 });
+        await waitFor(() => oemDatabase.getIndexVersion() === built.version);
+
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' })).toHaveLength(2);
+        expect(built.removed).toHaveLength(2);
+        expect(fs.readdirSync(dataDir).filter(f => /^oem-index-.*\.sqlite$/.test(f))).toEqual([built.file]);
+    });
+
+    it('should rebuild on a worker thread and hot-swap, one build at a time', async () => {
+        const current = oemDatabase.getIndexVersion();
+        oemDatabase.upsert(record('5Q0615601A', 'Bremsscheibe hinten 272mm', 0.99));
+
+        let ticks = 0;
+        const timer = setInterval(() => ticks++, 1);
+        const [version, again] = await Promise.all([
+            oemDatabase.refreshIndexInBackground(),
+            oemDatabase.refreshIndexInBackground(),
+        ]);
+        clearInterval(timer);
+
+        expect(version).not.toBeNull();
+        expect(version).not.toBe(current);
+        expect(again).toBe(version);
+        expect(oemDatabase.getIndexVersion()).toBe(version);
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' })).toHaveLength(2);
+        expect(oemDatabase.getByOEM('5Q0615601A').partDescription).toBe('Bremsscheibe hinten 272mm');
+        // The event loop kept running during the build
+        expect(ticks).toBeGreaterThan(0);
+        expect(await oemDatabase.refreshIndexInBackground()).toBeNull();
+    }, 20000);
+
+    it('should ignore a manifest whose file does not match', async () => {
+        const current = oemDatabase.getIndexVersion();
+        const manifestPath = path.join(dataDir, 'oem-index.json');
+        const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+        fs.writeFileSync(manifestPath, JSON.stringify({ ...manifest, version: 'bogus' }));
+
+        await new Promise(resolve => setTimeout(resolve, 100));
+
+        expect(oemDatabase.getIndexVersion()).toBe(current);
+        expect(oemDatabase.lookup({ brand: 'VW', category: 'brake' })).toHaveLength(2);
+    });
+});
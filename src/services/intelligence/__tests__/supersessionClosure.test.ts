@@ -0,0 +1,115 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { SupersessionClosure } from '../supersessionClosure';
+import { checkSupersession, registerSupersession, resolveToCurrentOEM } from '../supersessionTracker';
+
+/** Reference: the hop-by-hop walk oemDatabase.resolveSupersession used to run */
+function walk(edges: Array<[string, string]>, oem: string, maxDepth: number): string {
+    let current = oem;
+    for (let depth = 0; depth < maxDepth; depth++) {
+        const edge = edges.find(([from, to]) => from === current && from !== to);
+        if (!edge) break;
+        current = edge[1];
+    }
+    return current;
+}
+
+describe('SupersessionClosure', () => {
+    it('should map every OEM of a chain to the terminal with its depth', () => {
+        const closure = SupersessionClosure.fromEdges([['A', 'B'], ['B', 'C'], ['C', 'D']]);
+        expect(closure.resolve('A')).toEqual({ current: 'D', depth: 3 });
+        expect(closure.resolve('C')).toEqual({ current: 'D', depth: 1 });
+        expect(closure.resolve('D')).toEqual({ current: 'D', depth: 0 });
+        expect(closure.resolve('X')).toEqual({ current: 'X', depth: 0 });
+        expect(closure.chain('B')).toEqual(['B', 'C', 'D']);
+    });
+
+    it('should relink existing chains when links are learned out of order', () => {
+        const closure = new SupersessionClosure();
+        closure.add('C', 'D');
+        closure.add('A', 'B');
+        expect(closure.resolve('A')).toEqual({ current: 'B', depth: 1 });
+
+        closure.add('B', 'C');
+        expect(closure.resolve('A')).toEqual({ current: 'D', depth: 3 });
+
+        closure.add('D', 'E');
+        expect(closure.resolve('A')).toEqual({ current: 'E', depth: 4 });
+        expect(closure.resolve('C')).toEqual({ current: 'E', depth: 2 });
+    });
+
+    it('should keep the first successor of an OEM', () => {
+        const closure = new SupersessionClosure();
+        expect(closure.add('A', 'B')).toBe(true);
+        expect(closure.add('A', 'C')).toBe(false);
+        expect(closure.resolve('A').current).toBe('B');
+    });
+
+    it('should mark cycles and fall back to the bounded walk for them', () => {
+        const edges: Array<[string, string]> = [['A', 'B'], ['B', 'C'], ['C', 'A'], ['X', 'A']];
+        const closure = SupersessionClosure.fromEdges(edges);
+        expect(closure.resolve('X').depth).toBe(-1);
+        expect(closure.resolveWithin('X', 5)).toBe(walk(edges, 'X', 5));
+    });
+
+    it('should agree with the hop-by-hop walk on random link sets', () => {
+        let seed = 7;
+        const random = (n: number) => {
+            seed = (seed * 16807) % 2147483647;
+            return seed % n;
+        };
+
+        for (let round = 0; round < 300; round++) {
+            const nodes = 2 + random(10);
+            const edges: Array<[string, string]> = Array.from({ length: random(16) }, () =>
+                [`N${random(nodes)}`, `N${random(nodes)}`] as [string, string]
+            );
+
+            const bulk = SupersessionClosure.fromEdges(edges);
+            const incremental = new SupersessionClosure();
+            edges.forEach(([from, to]) => incremental.add(from, to));
+
+            for (let i = 0; i < nodes; i++) {
+                for (const maxDepth of [1, 5, 20]) {
+                    const expected = walk(edges, `N${i}`, maxDepth);
+                    expect(bulk.resolveWithin(`N${i}`, maxDepth)).toBe(expected);
+                    expect(incremental.resolveWithin(`N${i}`, maxDepth)).toBe(expected);
+                }
+            }
+        }
+    });
+});
+
+describe('supersessionTracker', () => {
+    it('should resolve intermediate revisions of known chains', () => {
+        expect(resolveToCurrentOEM('5Q0 698 151 C')).toBe('5Q0698151D');
+        const result = checkSupersession('5Q0698151C');
+        expect(result.found).toBe(true);
+        expect(result.isOutdated).toBe(true);
+        expect(result.supersessionChain?.chain).toEqual(['5Q0698151C', '5Q0698151D']);
+    });
+
+    it('should follow learned links appended to a known chain', () => {
+        registerSupersession('5Q0698151D', '5Q0698151E');
+        expect(checkSupersession('5Q0698151').currentOEM).toBe('5Q0698151E');
+        expect(checkSupersession('5Q0698151E').isOutdated).toBe(false);
+    });
+
+    it('should let a newer registration replace the current OEM consistently', () => {
+        registerSupersession('7P0 615 301', '7P0615301A');
+        registerSupersession('7P0615301', '7P0615301B');
+        expect(resolveToCurrentOEM('7P0615301')).toBe('7P0615301B');
+        expect(resolveToCurrentOEM('7P0615301A')).toBe('7P0615301B');
+        for (const oem of ['7P0615301', '7P0615301A']) {
+            const result = checkSupersession(oem);
+            expect(result.currentOEM).toBe('7P0615301B');
+            expect(result.supersessionChain?.current).toBe(result.currentOEM);
+        }
+
+        // Pointing the current OEM back into its own chain is refused
+        registerSupersession('7P0615301B', '7P0615301');
+        expect(resolveToCurrentOEM('7P0615301')).toBe('7P0615301B');
+    });
+});
@@ -0,0 +1,72 @@
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import { decodeVIN, decodeVINBatch, decodeVinNhtsa, decodeVinEnriched, extractVAGMotorcode } from '../vinDecoder';
+
+describe('decodeVIN', () => {
+    it('should decode WMI, year and VAG engine code', () => {
+        const result = decodeVIN('wvwzzzaufkw000001');
+        expect(result).toMatchObject({ valid: true, vin: 'WVWZZZAUFKW000001', brand: 'VOLKSWAGEN', group: 'VAG', year: 2019, isVAG: true });
+        expect(extractVAGMotorcode('WVWZZZ AUFKW000001')).toBe('CHPA');
+        expect(extractVAGMotorcode('WVWZZZCWXKW000001')).toBe('CUNA');
+    });
+
+    it('should fall back to the two-character WMI prefix', () => {
+        expect(decodeVIN('WBZ12345678901234')).toMatchObject({ brand: 'BMW', group: 'BMW' });
+        expect(decodeVIN('XYZ12345678901234').brand).toBeNull();
+    });
+
+    it('should report length errors', () => {
+        expect(decodeVIN('').errors).toEqual(['VIN ist leer']);
+        expect(decodeVIN('WVW-ZZZ-123').errors).toEqual(['VIN muss 17 Zeichen haben (gefunden: 9)']);
+    });
+
+    it('should hand out independent copies of cached results', () => {
+        const first = decodeVIN('WAUZZZ8V5JA000002');
+        first.brand = 'CHANGED';
+        first.errors.push('x');
+        const second = decodeVIN('WAUZZZ8V5JA000002');
+        expect(second.brand).toBe('AUDI');
+        expect(second.errors).toEqual([]);
+    });
+});
+
+describe('decodeVINBatch', () => {
+    it('should return the same results as decodeVIN in input order', () => {
+        const vins = ['WVWZZZAUFKW000001', 'wbaxx12345j000003', 'TOO-SHORT', 'WVWZZZAUFKW000001', 'XYZ12345678901234'];
+        const batch = decodeVINBatch(vins);
+        expect(batch).toEqual(vins.map(v => decodeVIN(v)));
+        expect(batch[0]).not.toBe(batch[3]);
+    });
+});
+
+describe('decodeVinNhtsa', () => {
+    const originalFetch = global.fetch;
+    afterEach(() => { global.fetch = originalFetch; });
+
+    it('should call NHTSA once per VIN and share concurrent requests', async () => {
+        const fetchMock = jest.fn(async () => ({
+            ok: true,
+            json: async () => ({ Results: [{ Make: 'HONDA', Model: 'Civic', ModelYear: '2018' }] }),
+        }));
+        global.fetch = fetchMock as any;
+
+        const [a, b] = await Promise.all([decodeVinNhtsa('JHMFC1F30JX000004'), decodeVinNhtsa('jhmfc1f30jx000004')]);
+        const enriched = await decodeVinEnriched('JHMFC1F30JX000004');
+
+        expect(fetchMock).toHaveBeenCalledTimes(1);
+        expect(a?.model).toBe('Civic');
+        expect(b).toBe(a);
+        expect(enriched.nhtsa?.year).toBe(2018);
+    });
+
+    it('should cache failures too', async () => {
+        const fetchMock = jest.fn(async () => ({ ok: false, status: 503 }));
+        global.fetch = fetchMock as any;
+
+        expect(await decodeVinNhtsa('WDD2050041R000005')).toBeNull();
+        expect(await decodeVinNhtsa('WDD2050041R000005')).toBeNull();
+        expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+});
@@ -0,0 +1,380 @@
+/**
+ * 📦 APEX BATCH PIPELINE — many parts, one vehicle
+ *
+ * B2B / fleet customers send part lists (50–500 positions) for a single
+ * vehicle. Running resolveOemApex() per part decodes the same VIN, opens
+ * the same DB query plan and spends one or more Gemini calls per part.
+ *
+ * Batch flow:
+ *   1. Decode the vehicle once (VIN → make/year/motorcode)
+ *   2. Per part: PR-code / motorcode tables (in-memory, no I/O)
+ *   3. One multi-category SQL query for all remaining parts (Phase 1)
+ *   4. Misses grouped into batched Gemini prompts (GEMINI_BATCH_SIZE parts
+ *      per call) under a geminiBudget scope; each suggestion then goes
+ *      through the same reverse verification + adversary check as the
+ *      single-part direct fallback (validateApexCandidate), on its own
+ *      VALIDATION_GEMINI_BUDGET so validation never starves later prompts
+ *
+ * Results are emitted per part through `onResult` as soon as each stage
+ * settles them, so the route can stream NDJSON back to the client.
+ */
+
+import { OEMResolverRequest, OEMCandidate } from "./types";
+import { logger } from "@utils/logger";
+import { resolveDatabaseCandidatesBatch } from "./sources/databaseSource";
+import { decodeVehicle, performDeepResolution } from "./deepOemResolver";
+import { DB_ACCEPT_THRESHOLD, validateApexCandidate } from "./apexPipeline";
+import { withGeminiBudget } from "./geminiBudget";
+import { isAftermarketNumber } from "./aftermarketFilter";
+import { recordOemResolution } from "./oemMetrics";
+import { learnFromResolution } from "./oemLearner";
+
+// ============================================================================
+// Configuration
+// ============================================================================
+
+export const MAX_BATCH_PARTS = 500;
+
+/** Parts per Gemini prompt */
+const GEMINI_BATCH_SIZE = parseInt(process.env.OEM_BATCH_GEMINI_SIZE || '25', 10);
+
+/** Gemini prompts in flight at once */
+const GEMINI_BATCH_CONCURRENCY = parseInt(process.env.OEM_BATCH_GEMINI_CONCURRENCY || '3', 10);
+
+/** Default Gemini call budget for one batch request */
+const DEFAULT_BATCH_GEMINI_BUDGET = parseInt(process.env.OEM_BATCH_GEMINI_BUDGET || '20', 10);
+
+/** Gemini calls per suggestion for validation (reverse verification + Gemini adversary) */
+const VALIDATION_GEMINI_BUDGET = 2;
+
+// ============================================================================
+// Types
+// ============================================================================
+
+export interface BatchPartRequest {
+    /** Client reference (position number, article id…) — echoed back */
+    id: string;
+    rawText: string;
+    suspectedNumber?: string | null;
+    position?: OEMResolverRequest["partQuery"]["position"];
+}
+
+export type BatchResolutionPhase = "deep" | "database" | "gemini_batch" | "not_found";
+
+export interface BatchPartResult {
+    id: string;
+    rawText: string;
+    primaryOEM?: string;
+    confidence: number;
+    phase: BatchResolutionPhase;
+    candidates: OEMCandidate[];
+    notes?: string;
+}
+
+export interface BatchResolutionOptions {
+    orderId?: string;
+    /** Max Gemini calls for the whole batch (default OEM_BATCH_GEMINI_BUDGET) */
+    geminiBudget?: number;
+    /** Called once per part, in completion order */
+    onResult?: (result: BatchPartResult) => void;
+    /**
+     * Aborted when the caller went away: no further deep lookups or Gemini
+     * prompts are started, and parts not yet settled come back as not_found
+     * without onResult, metrics or learning
+     */
+    signal?: AbortSignal;
+}
+
+export interface BatchResolutionSummary {
+    results: BatchPartResult[];
+    stats: {
+        parts: number;
+        resolved: number;
+        byPhase: Record<BatchResolutionPhase, number>;
+        geminiCalls: number;
+        latencyMs: number;
+    };
+}
+
+// ============================================================================
+// Main Entry
+// ============================================================================
+
+/**
+ * Resolve many part requests for the same vehicle.
+ * Results are returned in request order; `onResult` sees them as they settle.
+ */
+export async function resolveOemApexBatch(
+    vehicle: OEMResolverRequest["vehicle"],
+    parts: BatchPartRequest[],
+    options: BatchResolutionOptions = {}
+): Promise<BatchResolutionSummary> {
+    if (parts.length > MAX_BATCH_PARTS) {
+        throw new Error(`Batch too large: ${parts.length} parts (max ${MAX_BATCH_PARTS})`);
+    }
+
+    const start = Date.now();
+    const orderId = options.orderId || "batch";
+    const results: BatchPartResult[] = new Array(parts.length);
+    const byPhase: Record<BatchResolutionPhase, number> = { deep: 0, database: 0, gemini_batch: 0, not_found: 0 };
+
+    const settle = (index: number, result: BatchPartResult, req: OEMResolverRequest) => {
+        results[index] = result;
+        byPhase[result.phase]++;
+        recordOemResolution({
+            brand: req.vehicle.make || "UNKNOWN",
+            success: !!result.primaryOEM,
+            confidence: result.confidence,
+            latencyMs: Date.now() - start,
+            sources: [result.phase],
+        });
+        if (result.primaryOEM && result.confidence >= 0.75) {
+            try {
+                learnFromResolution(result.primaryOEM, result.confidence, result.candidates, req);
+            } catch (err: any) {
+                logger.debug("[APEX Batch] Learning failed (non-critical)", { error: err?.message });
+            }
+        }
+        options.onResult?.(result);
+    };
+
+    // ================================================================
+    // 1. Decode the vehicle once
+    // ================================================================
+    const decoded = await decodeVehicle(vehicle);
+    const requests: OEMResolverRequest[] = parts.map(p => ({
+        orderId,
+        vehicle: decoded.vehicle,
+        partQuery: {
+            rawText: p.rawText,
+            suspectedNumber: p.suspectedNumber ?? null,
+            position: p.position,
+        },
+    }));
+
+    logger.info("[APEX Batch] 🚀 Batch started", {
+        orderId,
+        parts: parts.length,
+        brand: decoded.vehicle.make,
+        model: decoded.vehicle.model,
+        vinDecoded: decoded.vinDecoded,
+    });
+
+    // ================================================================
+    // 2. Vehicle-specific tables (PR-code / motorcode) per part
+    // ================================================================
+    const pending: number[] = [];
+    for (let i = 0; i < parts.length && !options.signal?.aborted; i++) {
+        const deep = await performDeepResolution(requests[i], decoded);
+        requests[i] = deep.enrichedRequest;
+        const top = bestCandidate(deep.candidates);
+        if (top && top.confidence >= DB_ACCEPT_THRESHOLD) {
+            settle(i, partResult(parts[i], top, "deep", deep.candidates), requests[i]);
+        } else {
+            pending.push(i);
+        }
+    }
+
+    // ================================================================
+    // 3. Phase 1 for all remaining parts in one query
+    // ================================================================
+    const dbResults = options.signal?.aborted
+        ? pending.map(() => [])
+        : resolveDatabaseCandidatesBatch(pending.map(i => requests[i]));
+    const dbCandidates: OEMCandidate[][] = new Array(parts.length);
+    const misses: number[] = [];
+    pending.forEach((i, k) => {
+        dbCandidates[i] = dbResults[k];
+        const top = bestCandidate(dbResults[k]);
+        if (top && top.confidence >= DB_ACCEPT_THRESHOLD) {
+            settle(i, partResult(parts[i], top, "database", dbResults[k]), requests[i]);
+        } else {
+            misses.push(i);
+        }
+    });
+
+    // ================================================================
+    // 4. Batched Gemini prompts for the misses
+    // ================================================================
+    const chunks: number[][] = [];
+    for (let k = 0; k < misses.length; k += GEMINI_BATCH_SIZE) {
+        chunks.push(misses.slice(k, k + GEMINI_BATCH_SIZE));
+    }
+    const maxCalls = Math.max(0, Math.min(options.geminiBudget ?? DEFAULT_BATCH_GEMINI_BUDGET, chunks.length));
+    let geminiCalls = 0;
+
+    await withGeminiBudget(maxCalls, async () => {
+        let next = 0;
+        const worker = async () => {
+            while (next < chunks.length && !options.signal?.aborted) {
+                const chunk = chunks[next++];
+                const suggestions = await askGeminiForChunk(decoded.vehicle, chunk.map(i => ({ index: i, part: parts[i] })));
+                if (suggestions) geminiCalls++;
+
+                const brand = decoded.vehicle.make || "";
+                await Promise.all(chunk.map(async i => {
+                    const suggestion = suggestions?.get(i);
+                    const suggested = suggestion && toCandidate(suggestion, brand);
+                    if (!suggested) {
+                        settle(i, notFound(parts[i], 0, dbCandidates[i],
+                            suggestions ? "No OEM found with sufficient confidence" : "Gemini budget exhausted or unavailable"
+                        ), requests[i]);
+                        return;
+                    }
+
+                    // Not grounded → same Phase 2b/3 checks as the single-part direct fallback
+                    const validated = await withGeminiBudget(VALIDATION_GEMINI_BUDGET, () =>
+                        validateApexCandidate(requests[i], suggested, [suggested, ...dbCandidates[i]]), orderId);
+                    const candidate: OEMCandidate = {
+                        ...suggested,
+                        confidence: validated.finalConfidence,
+                        meta: { ...suggested.meta, verdict: validated.claudeVerdict },
+                    };
+                    const candidates = [candidate, ...dbCandidates[i]];
+
+                    if (validated.finalOem === candidate.oem) {
+                        settle(i, partResult(parts[i], candidate, "gemini_batch", candidates), requests[i]);
+                    } else {
+                        settle(i, notFound(parts[i], candidate.confidence, candidates,
+                            `Rejected by validation (${validated.claudeVerdict})`
+                        ), requests[i]);
+                    }
+                }));
+            }
+        };
+        await Promise.all(Array.from({ length: Math.min(GEMINI_BATCH_CONCURRENCY, chunks.length) }, worker));
+    }, orderId);
+
+    if (options.signal?.aborted) {
+        for (let i = 0; i < parts.length; i++) {
+            results[i] ??= notFound(parts[i], 0, dbCandidates[i] ?? [], "Cancelled: client disconnected");
+        }
+        logger.info("[APEX Batch] Batch cancelled by the client", { orderId, settled: Object.values(byPhase).reduce((a, b) => a + b, 0) });
+    }
+
+    const resolved = results.filter(r => r.primaryOEM).length;
+    const latencyMs = Date.now() - start;
+
+    logger.info("[APEX Batch] ✅ Batch complete", {
+        orderId,
+        parts: parts.length,
+        resolved,
+        byPhase,
+        geminiCalls,
+        latencyMs,
+    });
+
+    return {
+        results,
+        stats: { parts: parts.length, resolved, byPhase, geminiCalls, latencyMs },
+    };
+}
+
+// ============================================================================
+// Helpers
+// ============================================================================
+
+function bestCandidate(candidates: OEMCandidate[]): OEMCandidate | undefined {
+    let best: OEMCandidate | undefined;
+    for (const c of candidates) {
+        if (!best || c.confidence > best.confidence) best = c;
+    }
+    return best;
+}
+
+function notFound(
+    part: BatchPartRequest,
+    confidence: number,
+    candidates: OEMCandidate[],
+    notes: string
+): BatchPartResult {
+    return {
+        id: part.id,
+        rawText: part.rawText,
+        confidence,
+        phase: "not_found",
+        candidates,
+        notes,
+    };
+}
+
+function partResult(
+    part: BatchPartRequest,
+    top: OEMCandidate,
+    phase: BatchResolutionPhase,
+    candidates: OEMCandidate[]
+): BatchPartResult {
+    return {
+        id: part.id,
+        rawText: part.rawText,
+        primaryOEM: top.oem,
+        confidence: top.confidence,
+        phase,
+        candidates,
+    };
+}
+
+interface GeminiSuggestion {
+    oem: string;
+    confidence: number;
+    description?: string;
+}
+
+/**
+ * One Gemini call for a chunk of parts. Returns null when the call was not
+ * made (budget exhausted) or failed; otherwise part index → suggestion.
+ */
+async function askGeminiForChunk(
+    vehicle: OEMResolverRequest["vehicle"],
+    chunk: Array<{ index: number; part: BatchPartRequest }>
+): Promise<Map<number, GeminiSuggestion> | null> {
+    try {
+        const { generateChatCompletion } = await import("./geminiService");
+        const partLines = chunk.map(({ index, part }) => `${index}: ${part.rawText}`).join("\n");
+
+        const raw = await generateChatCompletion({
+            messages: [
+                { role: "system", content: `Du bist ein Experte für KFZ-Ersatzteile und OEM-Nummern. Finde für JEDES angefragte Teil die korrekte Original-Teilenummer (OEM). Antworte NUR im JSON-Format: {"results": [{"id": NUMMER_DER_ZEILE, "oem": "NUMMER", "confidence": 0.0-1.0, "description": "Beschreibung"}]}. Wenn du dir nicht sicher bist, setze confidence auf 0.5 oder niedriger. ERFINDE NIEMALS eine Nummer — lass das Teil dann weg.` },
+                { role: "user", content: `Fahrzeug: ${vehicle.make || ''} ${vehicle.model || ''} ${vehicle.year || ''} ${vehicle.motorcode || ''}\nTeile:\n${partLines}\n\nWelche OEM-Nummern haben diese Teile?` },
+            ],
+            responseFormat: "json_object",
+            temperature: 0.2,
+        });
+
+        const parsed = JSON.parse(raw || "{}");
+        // Budget exhausted → generateChatCompletion returns "{}" without calling the API
+        if (!Array.isArray(parsed.results)) return null;
+
+        const wanted = new Set(chunk.map(c => c.index));
+        const suggestions = new Map<number, GeminiSuggestion>();
+        for (const r of parsed.results) {
+            const index = Number(r?.id);
+            if (!wanted.has(index) || typeof r.oem !== "string" || r.oem.length < 5) continue;
+            suggestions.set(index, {
+                oem: r.oem.replace(/\s+/g, " ").trim(),
+                confidence: Number(r.confidence) || 0.65,
+                description: r.description,
+            });
+        }
+        return suggestions;
+    } catch (err: any) {
+        logger.warn("[APEX Batch] Gemini chunk failed", { parts: chunk.length, error: err?.message });
+        return null;
+    }
+}
+
+/**
+ * Same guards as the single-part direct fallback before Phase 2b/3:
+ * aftermarket numbers dropped, not grounded → capped at 0.75.
+ */
+function toCandidate(s: GeminiSuggestion, brand: string): OEMCandidate | undefined {
+    if (isAftermarketNumber(s.oem)) return undefined;
+
+    return {
+        oem: s.oem,
+        brand,
+        confidence: Math.min(s.confidence, 0.75),
+        source: "gemini_batch",
+        meta: { description: s.description },
+    };
+}
@@ -52,10 +52,10 @@ import { withSpan } from "@utils/apm";
 // ============================================================================
 
 /** Minimum confidence to accept an OEM without Claude validation */
-const DB_ACCEPT_THRESHOLD = 0.93;
+export const DB_ACCEPT_THRESHOLD = 0.93;
 
 /** Minimum confidence after Claude validation to accept */
-const PIPELINE_ACCEPT_THRESHOLD = 0.70;
+export const PIPELINE_ACCEPT_THRESHOLD = 0.70;
 
 /** Maximum time for entire pipeline (fail-safe) */
 const PIPELINE_TIMEOUT_MS = 25000;
@@ -177,6 +177,72 @@ async function phase2GeminiSearch(req: OEMResolverRequest, dbCandidates: OEMCand
     });
 }
 
+// ============================================================================
+// PHASE 2b: Reverse OEM Verification
+// ============================================================================
+
+/** Reverse verification below this confidence rejects the OEM outright */
+const REVERSE_REJECT_THRESHOLD = 0.40;
+
+async function phase2bReverseVerify(req: OEMResolverRequest, topCandidate: OEMCandidate): Promise<{
+    candidate: OEMCandidate;
+    rejected: boolean;
+}> {
+    try {
+        const reverseResult = await withSpan('apex.phase2b_reverse_verify', { oem: topCandidate.oem }, () =>
+            reverseVerifyOem({
+                oem: topCandidate.oem,
+                expectedBrand: req.vehicle.make || "",
+                expectedModel: req.vehicle.model || "",
+                expectedYear: req.vehicle.year,
+                expectedPart: req.partQuery.rawText,
+            })
+        );
+
+        // Apply confidence adjustment from reverse verification
+        const adjustedConf = clampConfidence(
+            topCandidate.confidence + reverseResult.confidenceAdjustment
+        );
+
+        const candidate: OEMCandidate = {
+            ...topCandidate,
+            confidence: adjustedConf,
+            meta: {
+                ...topCandidate.meta,
+                reverseVerified: reverseResult.verified,
+                reverseMatchScore: reverseResult.matchScore,
+                reverseVehicles: reverseResult.foundVehicles.slice(0, 3),
+                reverseConfAdj: reverseResult.confidenceAdjustment,
+            },
+        };
+
+        logger.info("[APEX P2b] 🔄 Reverse verification", {
+            oem: topCandidate.oem,
+            verified: reverseResult.verified,
+            matchScore: Math.round(reverseResult.matchScore * 100) + "%",
+            confBefore: Math.round(topCandidate.confidence * 100) + "%",
+            confAfter: Math.round(adjustedConf * 100) + "%",
+            adjustment: reverseResult.confidenceAdjustment > 0
+                ? `+${reverseResult.confidenceAdjustment}`
+                : String(reverseResult.confidenceAdjustment),
+        });
+
+        // If reverse verification completely fails the OEM, reject early
+        if (adjustedConf < REVERSE_REJECT_THRESHOLD) {
+            logger.warn("[APEX P2b] Reverse verification REJECTED OEM", {
+                oem: topCandidate.oem,
+                reason: reverseResult.reason,
+            });
+            return { candidate, rejected: true };
+        }
+        return { candidate, rejected: false };
+    } catch (err: any) {
+        logger.debug("[APEX P2b] Reverse verification failed (non-critical)", { error: err?.message });
+        // Continue with original candidate if reverse verification fails
+        return { candidate: topCandidate, rejected: false };
+    }
+}
+
 // ============================================================================
 // PHASE 3: Claude Adversary (Validation)
 // ============================================================================
@@ -322,6 +388,24 @@ async function phase3ClaudeAdversary(
     });
 }
 
+/**
+ * Phase 2b + Phase 3 for a candidate found outside the grounded search
+ * (e.g. an ungrounded Gemini suggestion from apexBatchPipeline). Same
+ * checks the direct fallback goes through in runPipelinePhases.
+ */
+export async function validateApexCandidate(
+    req: OEMResolverRequest,
+    candidate: OEMCandidate,
+    allCandidates: OEMCandidate[]
+): Promise<{ finalOem?: string; finalConfidence: number; claudeVerdict: string }> {
+    const p2b = await phase2bReverseVerify(req, candidate);
+    if (p2b.rejected) {
+        return { finalOem: undefined, finalConfidence: p2b.candidate.confidence, claudeVerdict: "REVERSE_REJECTED" };
+    }
+    const p3 = await phase3ClaudeAdversary(req, p2b.candidate, allCandidates);
+    return { finalOem: p3.finalOem, finalConfidence: p3.finalConfidence, claudeVerdict: p3.claudeVerdict };
+}
+
 // ============================================================================
 // PHASE 4: Self-Learning Flywheel (Feedback Loop)
 // ============================================================================
@@ -442,11 +526,13 @@ async function runPipelinePhases(req: OEMResolverRequest, pipelineStart: number)
                     { role: "user" as const, content: `Fahrzeug: ${req.vehicle.make || ''} ${req.vehicle.model || ''} ${req.vehicle.year || ''} ${req.vehicle.motorcode || ''}\nTeil: ${req.partQuery.rawText}\n\nWelche OEM-Nummer hat dieses Teil?` }
                 ];
 
-                const directResult = await generateChatCompletion({
-                    messages: directPrompt,
-                    responseFormat: "json_object",
-                    temperature: 0.2,
-                });
+                const directResult = await withSpan('apex.phase2c_direct_fallback', { partName: req.partQuery.rawText || '' }, () =>
+                    generateChatCompletion({
+                        messages: directPrompt,
+                        responseFormat: "json_object",
+                        temperature: 0.2,
+                    })
+                );
 
                 if (directResult) {
                     const parsed = JSON.parse(directResult);
@@ -490,63 +576,18 @@ async function runPipelinePhases(req: OEMResolverRequest, pipelineStart: number)
         // PHASE 2b: Reverse OEM Verification
         // Searches the found OEM backwards to check if correct vehicle appears
         // ================================================================
-        let reverseAdjustedCandidate = p2.topCandidate;
-        try {
-            const reverseResult = await reverseVerifyOem({
-                oem: p2.topCandidate.oem,
-                expectedBrand: req.vehicle.make || "",
-                expectedModel: req.vehicle.model || "",
-                expectedYear: req.vehicle.year,
-                expectedPart: req.partQuery.rawText,
-            });
-
-            // Apply confidence adjustment from reverse verification
-            const adjustedConf = clampConfidence(
-                p2.topCandidate.confidence + reverseResult.confidenceAdjustment
-            );
-
-            reverseAdjustedCandidate = {
-                ...p2.topCandidate,
-                confidence: adjustedConf,
-                meta: {
-                    ...p2.topCandidate.meta,
-                    reverseVerified: reverseResult.verified,
-                    reverseMatchScore: reverseResult.matchScore,
-                    reverseVehicles: reverseResult.foundVehicles.slice(0, 3),
-                    reverseConfAdj: reverseResult.confidenceAdjustment,
-                },
+        const p2b = await phase2bReverseVerify(req, p2.topCandidate);
+        const reverseAdjustedCandidate = p2b.candidate;
+        if (p2b.rejected) {
+            phaseResult = {
+                phase: 2,
+                phaseName: "reverse_rejected",
+                oem: undefined,
+                confidence: reverseAdjustedCandidate.confidence,
+                source: "gemini_grounded_reverse_rejected",
+                latencyMs: Date.now() - pipelineStart,
             };
-
-            logger.info("[APEX P2b] 🔄 Reverse verification", {
-                oem: p2.topCandidate.oem,
-                verified: reverseResult.verified,
-                matchScore: Math.round(reverseResult.matchScore * 100) + "%",
-                confBefore: Math.round(p2.topCandidate.confidence * 100) + "%",
-                confAfter: Math.round(adjustedConf * 100) + "%",
-                adjustment: reverseResult.confidenceAdjustment > 0
-                    ? `+${reverseResult.confidenceAdjustment}`
-                    : String(reverseResult.confidenceAdjustment),
-            });
-
-            // If reverse verification completely fails the OEM, reject early
-            if (adjustedConf < 0.40) {
-                logger.warn("[APEX P2b] Reverse verification REJECTED OEM", {
-                    oem: p2.topCandidate.oem,
-                    reason: reverseResult.reason,
-                });
-                phaseResult = {
-                    phase: 2,
-                    phaseName: "reverse_rejected",
-                    oem: undefined,
-                    confidence: adjustedConf,
-                    source: "gemini_grounded_reverse_rejected",
-                    latencyMs: Date.now() - pipelineStart,
-                };
-                return buildResult(undefined, adjustedConf, allCandidates, phaseResult, req);
-            }
-        } catch (err: any) {
-            logger.debug("[APEX P2b] Reverse verification failed (non-critical)", { error: err?.message });
-            // Continue with original candidate if reverse verification fails
+            return buildResult(undefined, reverseAdjustedCandidate.confidence, allCandidates, phaseResult, req);
         }
 
         // ================================================================
@@ -645,6 +686,7 @@ function buildResult(
         primaryOEM: oem,
         candidates,
         overallConfidence: confidence,
+        apexPhase: phase.phaseName,
         notes: oem
             ? `APEX Phase ${phase.phase} (${phase.phaseName}) — ${phase.claudeVerdict || "DB_HIT"}`
             : `APEX: No OEM found with sufficient confidence. Phase ${phase.phase}: ${phase.phaseName}`,
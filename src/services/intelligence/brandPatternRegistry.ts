@@ -186,15 +186,64 @@ const BRAND_PATTERNS: Record<string, BrandPatternConfig> = {
 // Lookup helpers
 // ============================================================================
 
+/** Precompiled form used on the hot path: one regex test per validation */
+interface CompiledBrandPattern {
+    /** All strongPatterns merged into one anchored alternation */
+    strong: RegExp;
+    minLength: number;
+    maxLength: number;
+}
+
+/** Strip the ^…$ anchors of a member pattern so it can join an alternation */
+function unanchored(pattern: RegExp): string {
+    const src = pattern.source;
+    if (src.startsWith('^') && src.endsWith('$') && !src.endsWith('\\$')) {
+        return src.slice(1, -1);
+    }
+    return `.*(?:${src}).*`;
+}
+
+function compile(config: BrandPatternConfig): CompiledBrandPattern {
+    return {
+        strong: new RegExp(`^(?:${config.strongPatterns.map(p => `(?:${unanchored(p)})`).join('|')})$`),
+        minLength: config.lengthRange[0],
+        maxLength: config.lengthRange[1],
+    };
+}
+
 /** Fast reverse index: alias → config */
-const ALIAS_MAP = new Map<string, BrandPatternConfig>();
+const ALIAS_MAP = new Map<string, CompiledBrandPattern>();
 for (const config of Object.values(BRAND_PATTERNS)) {
+    const compiled = compile(config);
     for (const alias of config.aliases) {
-        ALIAS_MAP.set(alias.toUpperCase(), config);
+        ALIAS_MAP.set(alias.toUpperCase(), compiled);
     }
 }
 
-function findConfig(brand: string): BrandPatternConfig | undefined {
+/**
+ * Resolved brand strings (as passed in, including misses) → config.
+ * Bounded LRU: Map insertion order, re-inserted on hit.
+ */
+const BRAND_CACHE_MAX = 512;
+const brandCache = new Map<string, CompiledBrandPattern | null>();
+
+function findConfig(brand: string): CompiledBrandPattern | undefined {
+    const cached = brandCache.get(brand);
+    if (cached !== undefined) {
+        brandCache.delete(brand);
+        brandCache.set(brand, cached);
+        return cached ?? undefined;
+    }
+
+    const resolved = resolveConfig(brand) ?? null;
+    if (brandCache.size >= BRAND_CACHE_MAX) {
+        brandCache.delete(brandCache.keys().next().value as string);
+    }
+    brandCache.set(brand, resolved);
+    return resolved ?? undefined;
+}
+
+function resolveConfig(brand: string): CompiledBrandPattern | undefined {
     const upper = brand.toUpperCase();
 
     // Direct match
@@ -232,12 +281,10 @@ export function validateOemPattern(oem: string, brand: string): number {
     if (!config) return 0.5; // Unknown brand → neutral
 
     // Strong match
-    for (const pattern of config.strongPatterns) {
-        if (pattern.test(normalized)) return 1.0;
-    }
+    if (config.strong.test(normalized)) return 1.0;
 
     // Weak match (length ok but no pattern match)
-    if (normalized.length >= config.lengthRange[0] && normalized.length <= config.lengthRange[1]) {
+    if (normalized.length >= config.minLength && normalized.length <= config.maxLength) {
         return 0.5;
     }
 
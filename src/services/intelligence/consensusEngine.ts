@@ -26,6 +26,105 @@ const DEFAULT_CONFIG: Required<ConsensusConfig> = {
     priorityWeight: 0.3
 };
 
+// ================================================================
+// Source Group Deduplication
+// Sources that scrape the same website are counted as ONE group
+// to prevent fake consensus (e.g., 2 websites counted as 5 sources)
+// ================================================================
+const SOURCE_GROUPS: Record<string, string> = {
+    // 7zap group: vagEtkaSource + webScrapeSource(7zap) scrape same site
+    'vag_etka': 'group_7zap',
+    '7zap_web': 'group_7zap',
+    'web_scrape:7zap': 'group_7zap',
+    // Autodoc group: autodocWebSource + webScrapeSource(autodoc) scrape same site
+    'autodoc_web': 'group_autodoc',
+    'web_scrape:autodoc': 'group_autodoc',
+    // Independent groups (each is unique)
+    'enterprise-database': 'group_database',
+    'enterprise-database-fts': 'group_database',
+    'realoem': 'group_realoem',
+    'web_scrape:realoem': 'group_realoem',
+    'mercedes_epc': 'group_mercedes',
+    'premium_ai_oem_resolver': 'group_ai',
+    'Gemini-Vision': 'group_ai',
+    // OCR group: direct image extraction
+    'Document-OCR': 'group_ocr',
+    // Aftermarket groups
+    'Kfzteile24': 'group_kfzteile24',
+    'Pkwteile': 'group_pkwteile',
+    'Oscaro': 'group_oscaro',
+    'Daparto_Search': 'group_daparto',
+    // NEW: Super-sources (each independent)
+    'google_search': 'group_google',
+    'ebay_oem_mining': 'group_ebay',
+    // 🏆 TecDoc (industry standard — highest priority independent group)
+    'tecdoc_catalog': 'group_tecdoc',
+    // 🌐 Gemini Grounded (AI with live web search — independent)
+    'gemini_grounded': 'group_gemini_grounded',
+    // 🆓 Free fallback (independent from ScraperAPI sources)
+    'direct_fetch_free': 'group_direct_free',
+    // 🔄 Aftermarket reverse cascade
+    'aftermarket_crossref': 'group_aftermarket_crossref',
+};
+
+// Precompiled once: exact lookup plus a trie over all keys. Composite names
+// ("web_scrape:partsouq", "realoem_v2") resolve to the EARLIEST key in
+// SOURCE_GROUPS order contained anywhere in the name; the trie is walked
+// from every offset, and results are memoized per name.
+interface SourceTrieNode {
+    next: Map<string, SourceTrieNode>;
+    /** Index into SOURCE_GROUP_ENTRIES of the key ending here, -1 if none */
+    entry: number;
+}
+
+const SOURCE_GROUP_ENTRIES = Object.entries(SOURCE_GROUPS);
+const SOURCE_GROUP_EXACT = new Map(SOURCE_GROUP_ENTRIES);
+const SOURCE_GROUP_TRIE: SourceTrieNode = { next: new Map(), entry: -1 };
+for (let i = 0; i < SOURCE_GROUP_ENTRIES.length; i++) {
+    const key = SOURCE_GROUP_ENTRIES[i][0];
+    let node = SOURCE_GROUP_TRIE;
+    for (let j = 0; j < key.length; j++) {
+        let child = node.next.get(key[j]);
+        if (!child) {
+            child = { next: new Map(), entry: -1 };
+            node.next.set(key[j], child);
+        }
+        node = child;
+    }
+    if (node.entry === -1) node.entry = i;
+}
+
+const SOURCE_GROUP_MEMO_MAX = 1024;
+const sourceGroupMemo = new Map<string, string>();
+
+/**
+ * Resolves a source name to its independence group.
+ * Unknown sources form their own group.
+ */
+export function getSourceGroup(sourceName: string): string {
+    const exact = SOURCE_GROUP_EXACT.get(sourceName);
+    if (exact) return exact;
+    const memo = sourceGroupMemo.get(sourceName);
+    if (memo) return memo;
+
+    let best = SOURCE_GROUP_ENTRIES.length;
+    for (let start = 0; start < sourceName.length; start++) {
+        let node: SourceTrieNode | undefined = SOURCE_GROUP_TRIE;
+        for (let i = start; i < sourceName.length; i++) {
+            node = node.next.get(sourceName[i]);
+            if (!node) break;
+            if (node.entry !== -1 && node.entry < best) best = node.entry;
+        }
+    }
+    const group = best < SOURCE_GROUP_ENTRIES.length
+        ? SOURCE_GROUP_ENTRIES[best][1]
+        : `group_${sourceName}`;
+
+    if (sourceGroupMemo.size >= SOURCE_GROUP_MEMO_MAX) sourceGroupMemo.clear();
+    sourceGroupMemo.set(sourceName, group);
+    return group;
+}
+
 /**
  * Calculates consensus from multiple OEM candidates
  */
@@ -46,135 +145,98 @@ export function calculateConsensus(
         };
     }
 
-    // ================================================================
-    // Source Group Deduplication
-    // Sources that scrape the same website are counted as ONE group
-    // to prevent fake consensus (e.g., 2 websites counted as 5 sources)
-    // ================================================================
-    const SOURCE_GROUPS: Record<string, string> = {
-        // 7zap group: vagEtkaSource + webScrapeSource(7zap) scrape same site
-        'vag_etka': 'group_7zap',
-        '7zap_web': 'group_7zap',
-        'web_scrape:7zap': 'group_7zap',
-        // Autodoc group: autodocWebSource + webScrapeSource(autodoc) scrape same site
-        'autodoc_web': 'group_autodoc',
-        'web_scrape:autodoc': 'group_autodoc',
-        // Independent groups (each is unique)
-        'enterprise-database': 'group_database',
-        'enterprise-database-fts': 'group_database',
-        'realoem': 'group_realoem',
-        'web_scrape:realoem': 'group_realoem',
-        'mercedes_epc': 'group_mercedes',
-        'premium_ai_oem_resolver': 'group_ai',
-        'Gemini-Vision': 'group_ai',
-        // OCR group: direct image extraction
-        'Document-OCR': 'group_ocr',
-        // Aftermarket groups
-        'Kfzteile24': 'group_kfzteile24',
-        'Pkwteile': 'group_pkwteile',
-        'Oscaro': 'group_oscaro',
-        'Daparto_Search': 'group_daparto',
-        // NEW: Super-sources (each independent)
-        'google_search': 'group_google',
-        'ebay_oem_mining': 'group_ebay',
-        // 🏆 TecDoc (industry standard — highest priority independent group)
-        'tecdoc_catalog': 'group_tecdoc',
-        // 🌐 Gemini Grounded (AI with live web search — independent)
-        'gemini_grounded': 'group_gemini_grounded',
-        // 🆓 Free fallback (independent from ScraperAPI sources)
-        'direct_fetch_free': 'group_direct_free',
-        // 🔄 Aftermarket reverse cascade
-        'aftermarket_crossref': 'group_aftermarket_crossref',
-    };
-
-    function getSourceGroup(sourceName: string): string {
-        // Check exact match first
-        if (SOURCE_GROUPS[sourceName]) return SOURCE_GROUPS[sourceName];
-        // Check prefix match for composite source names like "web_scrape:partsouq"
-        for (const [key, group] of Object.entries(SOURCE_GROUPS)) {
-            if (sourceName.startsWith(key) || sourceName.includes(key)) return group;
+    // Intern OEMs, source names and source groups to dense indices
+    // (first-seen order), so scoring runs over typed arrays
+    const n = candidates.length;
+    const oemIndex = new Map<string, number>();
+    const sourceIndex = new Map<string, number>();
+    const groupIndex = new Map<string, number>();
+    const oems: string[] = [];
+    const sourceNames: string[] = [];
+    const sourceGroupOf: number[] = [];
+
+    const candOem = new Int32Array(n);
+    const candSource = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+        const c = candidates[i];
+        let o = oemIndex.get(c.oem);
+        if (o === undefined) {
+            o = oems.length;
+            oemIndex.set(c.oem, o);
+            oems.push(c.oem);
         }
-        // Unknown source = its own unique group
-        return `group_${sourceName}`;
-    }
-
-    // Group candidates by normalized OEM
-    const oemGroups = new Map<string, OEMCandidate[]>();
-
-    for (const candidate of candidates) {
-        const existing = oemGroups.get(candidate.oem) || [];
-        existing.push(candidate);
-        oemGroups.set(candidate.oem, existing);
+        let s = sourceIndex.get(c.source);
+        if (s === undefined) {
+            s = sourceNames.length;
+            sourceIndex.set(c.source, s);
+            sourceNames.push(c.source);
+            const group = getSourceGroup(c.source);
+            let g = groupIndex.get(group);
+            if (g === undefined) {
+                g = groupIndex.size;
+                groupIndex.set(group, g);
+            }
+            sourceGroupOf.push(g);
+        }
+        candOem[i] = o;
+        candSource[i] = s;
     }
 
-    // Score each OEM group
-    interface ScoredOEM {
-        oem: string;
-        score: number;
-        sourceCount: number;
-        avgConfidence: number;
-        avgPriority: number;
-        sources: string[];
-        candidates: OEMCandidate[];
+    // Per-OEM sums in candidate order, plus the number of unique SOURCE
+    // GROUPS (not individual source names) backing each OEM
+    const oemCount = oems.length;
+    const count = new Int32Array(oemCount);
+    const confidenceSum = new Float64Array(oemCount);
+    const prioritySum = new Float64Array(oemCount);
+    const groupCount = new Int32Array(oemCount);
+    // Last OEM (+1) that counted each group — candidates are visited OEM by OEM
+    const groupStamp = new Int32Array(groupIndex.size);
+
+    const order = candidatesByOem(candOem, oemCount);
+    for (let k = 0; k < n; k++) {
+        const i = order[k];
+        const o = candOem[i];
+        const c = candidates[i];
+        count[o]++;
+        confidenceSum[o] += c.confidence;
+        // Priority tiers: OEM Catalogs = 10, DB = 8, Aftermarket shops = 3, LLM = 1
+        prioritySum[o] += c.meta?.priority || 5;
+        const g = sourceGroupOf[candSource[i]];
+        if (groupStamp[g] !== o + 1) {
+            groupStamp[g] = o + 1;
+            groupCount[o]++;
+        }
     }
 
-    const scoredOems: ScoredOEM[] = [];
-
-    for (const [oem, group] of oemGroups.entries()) {
-        const uniqueSources = [...new Set(group.map(c => c.source))];
-        // Deduplicated: count unique SOURCE GROUPS, not individual source names
-        const uniqueGroups = [...new Set(uniqueSources.map(s => getSourceGroup(s)))];
-        const sourceCount = uniqueGroups.length; // Real independent source count
-
-        // Calculate average confidence
-        const avgConfidence = group.reduce((sum, c) => sum + c.confidence, 0) / group.length;
-
-        // Calculate average priority (from source meta, default 5)
-        // Priority tiers: OEM Catalogs = 10, DB = 8, Aftermarket shops = 3, LLM = 1
-        const avgPriority = group.reduce((sum, c) => {
-            const priority = c.meta?.priority || 5;
-            return sum + priority;
-        }, 0) / group.length;
-
-        // Calculate composite score
-        // Reweighted: Priority 50%, SourceCount 30%, Confidence 20%
-        // This prevents aftermarket shops from outvoting OEM catalogs by count alone
-        const normalizedSourceCount = sourceCount / Math.max(candidates.length, 1);
+    // Score each OEM; ties keep first-seen order
+    // Reweighted: Priority 50%, SourceCount 30%, Confidence 20%
+    // This prevents aftermarket shops from outvoting OEM catalogs by count alone
+    let bestOem = -1;
+    let bestScore = -Infinity;
+    for (let o = 0; o < oemCount; o++) {
+        const avgConfidence = confidenceSum[o] / count[o];
+        const avgPriority = prioritySum[o] / count[o];
+        const normalizedSourceCount = groupCount[o] / Math.max(n, 1);
         const normalizedPriority = avgPriority / 10; // Scale to 0-1
         const score =
             normalizedPriority * 0.50 +
             normalizedSourceCount * 0.30 +
             avgConfidence * 0.20;
-
-        scoredOems.push({
-            oem,
-            score,
-            sourceCount,
-            avgConfidence,
-            avgPriority,
-            sources: uniqueSources,
-            candidates: group
-        });
+        if (score > bestScore || bestOem === -1) {
+            bestScore = score;
+            bestOem = o;
+        }
     }
 
-    // Sort by score (descending)
-    scoredOems.sort((a, b) => b.score - a.score);
-
-    const best = scoredOems[0];
-
-    if (!best) {
-        return {
-            primaryOEM: null,
-            confidence: 0,
-            agreementScore: 0,
-            sourceCount: 0,
-            sources: [],
-            allCandidates: candidates
-        };
-    }
+    const best = {
+        oem: oems[bestOem],
+        sourceCount: groupCount[bestOem],
+        avgConfidence: confidenceSum[bestOem] / count[bestOem],
+        sources: uniqueSourcesOf(bestOem, candOem, candSource, sourceNames),
+    };
 
     // Calculate agreement score (what % of sources agree on this OEM)
-    const totalUniqueSources = new Set(candidates.map(c => c.source)).size;
+    const totalUniqueSources = sourceNames.length;
     const agreementScore = best.sourceCount / totalUniqueSources;
 
     // Calculate final confidence
@@ -209,6 +271,37 @@ export function calculateConsensus(
     };
 }
 
+/**
+ * Candidate indices grouped by OEM (stable counting sort).
+ */
+function candidatesByOem(candOem: Int32Array, oemCount: number): Int32Array {
+    const offsets = new Int32Array(oemCount + 1);
+    for (let i = 0; i < candOem.length; i++) offsets[candOem[i] + 1]++;
+    for (let o = 0; o < oemCount; o++) offsets[o + 1] += offsets[o];
+    const order = new Int32Array(candOem.length);
+    for (let i = 0; i < candOem.length; i++) order[offsets[candOem[i]]++] = i;
+    return order;
+}
+
+/**
+ * Unique source names of one OEM, in first-seen order.
+ */
+function uniqueSourcesOf(
+    oem: number,
+    candOem: Int32Array,
+    candSource: Int32Array,
+    sourceNames: string[]
+): string[] {
+    const seen = new Uint8Array(sourceNames.length);
+    const sources: string[] = [];
+    for (let i = 0; i < candOem.length; i++) {
+        if (candOem[i] !== oem || seen[candSource[i]]) continue;
+        seen[candSource[i]] = 1;
+        sources.push(sourceNames[candSource[i]]);
+    }
+    return sources;
+}
+
 /**
  * Validates an OEM against brand-specific patterns
  */
@@ -45,54 +45,44 @@ export interface DeepResolutionResult {
 }
 
 // ============================================================================
-// Main Deep Resolution Function
+// Vehicle Decoding (once per vehicle)
 // ============================================================================
 
+export interface DecodedVehicle {
+    vehicle: OEMResolverRequest["vehicle"];
+    vinDecoded: boolean;
+}
+
 /**
- * Perform deep OEM resolution using vehicle-specific intelligence
- * Returns high-confidence candidates and enriched request
+ * Decode the VIN (local + NHTSA) and fill in make, year and motorcode.
+ * Part-independent — batch callers decode once and pass the result to
+ * performDeepResolution for every part of the same vehicle.
  */
-export async function performDeepResolution(
-    req: OEMResolverRequest
-): Promise<DeepResolutionResult> {
-    const candidates: OEMCandidate[] = [];
-    const enrichedRequest = { ...req, vehicle: { ...req.vehicle } };
-
-    const metadata: DeepResolutionResult["metadata"] = {
-        vinDecoded: false,
-        suggestions: {},
-    };
+export async function decodeVehicle(
+    vehicle: OEMResolverRequest["vehicle"]
+): Promise<DecodedVehicle> {
+    const enriched = { ...vehicle };
+    let vinDecoded = false;
 
-    logger.info("[Deep OEM] Starting deep resolution", {
-        orderId: req.orderId,
-        hasVIN: !!req.vehicle.vin,
-        hasPRCodes: !!(req.vehicle.prCodes?.length),
-        hasMotorcode: !!req.vehicle.motorcode,
-        partQuery: req.partQuery.rawText.substring(0, 50),
-    });
-
-    // =========================================================================
-    // Step 1: VIN Decoding
-    // =========================================================================
-    if (req.vehicle.vin) {
+    if (vehicle.vin) {
         // Use NHTSA-enriched VIN decoding (local + free US government API)
-        const vinResult = await decodeVinEnriched(req.vehicle.vin);
+        const vinResult = await decodeVinEnriched(vehicle.vin);
 
         if (vinResult.valid) {
-            metadata.vinDecoded = true;
+            vinDecoded = true;
 
             // Enrich request with VIN data if missing
-            if (!enrichedRequest.vehicle.make && vinResult.brand) {
-                enrichedRequest.vehicle.make = vinResult.brand;
+            if (!enriched.make && vinResult.brand) {
+                enriched.make = vinResult.brand;
             }
-            if (!enrichedRequest.vehicle.year && vinResult.year) {
-                enrichedRequest.vehicle.year = vinResult.year;
+            if (!enriched.year && vinResult.year) {
+                enriched.year = vinResult.year;
             }
 
             // NHTSA enrichment: extract engine data from government API
             if (vinResult.nhtsa) {
-                if (!enrichedRequest.vehicle.motorcode && vinResult.nhtsa.engineModel) {
-                    enrichedRequest.vehicle.motorcode = vinResult.nhtsa.engineModel;
+                if (!enriched.motorcode && vinResult.nhtsa.engineModel) {
+                    enriched.motorcode = vinResult.nhtsa.engineModel;
                     logger.info("[Deep OEM] NHTSA engine model extracted", {
                         engine: vinResult.nhtsa.engineModel,
                         cylinders: vinResult.nhtsa.engineCylinders,
@@ -110,16 +100,54 @@ export async function performDeepResolution(
             }
 
             // Extract motorcode for VAG vehicles (fallback if NHTSA didn't provide)
-            if (vinResult.isVAG && !enrichedRequest.vehicle.motorcode) {
-                const motorcode = extractVAGMotorcode(req.vehicle.vin);
+            if (vinResult.isVAG && !enriched.motorcode) {
+                const motorcode = extractVAGMotorcode(vehicle.vin);
                 if (motorcode) {
-                    enrichedRequest.vehicle.motorcode = motorcode;
+                    enriched.motorcode = motorcode;
                     logger.info("[Deep OEM] Motorcode extracted from VIN", { motorcode });
                 }
             }
         }
     }
 
+    return { vehicle: enriched, vinDecoded };
+}
+
+// ============================================================================
+// Main Deep Resolution Function
+// ============================================================================
+
+/**
+ * Perform deep OEM resolution using vehicle-specific intelligence
+ * Returns high-confidence candidates and enriched request
+ */
+export async function performDeepResolution(
+    req: OEMResolverRequest,
+    decodedVehicle?: DecodedVehicle
+): Promise<DeepResolutionResult> {
+    const candidates: OEMCandidate[] = [];
+    const enrichedRequest = { ...req, vehicle: { ...req.vehicle } };
+
+    const metadata: DeepResolutionResult["metadata"] = {
+        vinDecoded: false,
+        suggestions: {},
+    };
+
+    logger.info("[Deep OEM] Starting deep resolution", {
+        orderId: req.orderId,
+        hasVIN: !!req.vehicle.vin,
+        hasPRCodes: !!(req.vehicle.prCodes?.length),
+        hasMotorcode: !!req.vehicle.motorcode,
+        partQuery: req.partQuery.rawText.substring(0, 50),
+    });
+
+    // =========================================================================
+    // Step 1: VIN Decoding (skipped when the caller already decoded the vehicle)
+    // =========================================================================
+    const decoded = decodedVehicle ?? await decodeVehicle(req.vehicle);
+    enrichedRequest.vehicle = { ...decoded.vehicle };
+    metadata.vinDecoded = decoded.vinDecoded;
+
     // =========================================================================
     // Step 2: Detect Part Category
     // =========================================================================
@@ -360,6 +388,7 @@ export function applySupersession(oem: string): {
 
 export default {
     performDeepResolution,
+    decodeVehicle,
     canDoDeepResolution,
     applySupersession,
 };
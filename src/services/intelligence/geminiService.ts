@@ -12,6 +12,7 @@
 import { GoogleGenerativeAI, GenerativeModel, Content, Part } from "@google/generative-ai";
 import { logger } from "../../utils/logger";
 import { acquireBudgetToken, getRemainingBudget } from './geminiBudget';
+import { traceIo } from '../core/stateMachine/tracing';
 
 // ============================================================================
 // Configuration
@@ -20,6 +21,9 @@ import { acquireBudgetToken, getRemainingBudget } from './geminiBudget';
 const GEMINI_API_KEY = process.env.GEMINI_API_KEY || "";
 const DEFAULT_MODEL = process.env.GEMINI_MODEL || "gemini-2.0-flash";
 const REQUEST_TIMEOUT_MS = 10000; // 10 second timeout for all Gemini calls
+// Local stand-in for load tests (see services/testing/loadReplay.ts); unset = Google API
+const GEMINI_BASE_URL = process.env.GEMINI_BASE_URL || "";
+const REQUEST_OPTIONS = GEMINI_BASE_URL ? { baseUrl: GEMINI_BASE_URL } : undefined;
 
 // Verify API key
 if (!GEMINI_API_KEY) {
@@ -33,7 +37,7 @@ const genAI = new GoogleGenerativeAI(GEMINI_API_KEY);
 // M5 FIX: Global Rate Limiter (token bucket)
 // ============================================================================
 
-const RATE_LIMIT_MAX = 30;      // Max requests per window
+const RATE_LIMIT_MAX = parseInt(process.env.GEMINI_RATE_LIMIT_PER_MIN || '30', 10); // Max requests per window
 const RATE_LIMIT_WINDOW_MS = 60_000; // 1 minute window
 const RATE_LIMIT_REFILL_RATE = RATE_LIMIT_MAX / RATE_LIMIT_WINDOW_MS; // ~0.5 tokens/sec
 let rateLimitTokens = RATE_LIMIT_MAX;
@@ -97,13 +101,15 @@ function truncateContent(content: string, maxLen = 8000): string {
  * Convert chat messages to Gemini format
  */
 function convertMessages(messages: ChatMessage[]): { systemInstruction?: string; contents: Content[] } {
-    let systemInstruction: string | undefined;
+    const systemParts: string[] = [];
     const contents: Content[] = [];
 
     for (const msg of messages) {
         if (msg.role === "system") {
-            // Gemini uses systemInstruction instead of system messages
-            systemInstruction = truncateContent(msg.content);
+            // Gemini uses systemInstruction instead of system messages. Several
+            // system messages are joined in order, so the static prompt stays
+            // the leading (cacheable) prefix and later context is not dropped.
+            systemParts.push(truncateContent(msg.content));
         } else {
             contents.push({
                 role: msg.role === "assistant" ? "model" : "user",
@@ -112,6 +118,7 @@ function convertMessages(messages: ChatMessage[]): { systemInstruction?: string;
         }
     }
 
+    const systemInstruction = systemParts.length > 0 ? systemParts.join("\n\n") : undefined;
     return { systemInstruction, contents };
 }
 
@@ -119,7 +126,12 @@ function convertMessages(messages: ChatMessage[]): { systemInstruction?: string;
 // Main Chat Completion
 // ============================================================================
 
-export async function generateChatCompletion(params: {
+export async function generateChatCompletion(params: Parameters<typeof runChatCompletion>[0]): Promise<string> {
+    // Counted as LLM wait time of the current state transition (if any)
+    return traceIo('llm', () => runChatCompletion(params));
+}
+
+async function runChatCompletion(params: {
     messages: ChatMessage[];
     model?: string;
     responseFormat?: "json_object" | "text";
@@ -171,7 +183,7 @@ export async function generateChatCompletion(params: {
                 model,
                 systemInstruction,
                 generationConfig,
-            });
+            }, REQUEST_OPTIONS);
 
             logger.debug("Gemini API call", { attempt, maxAttempts });
 
@@ -229,7 +241,12 @@ export async function generateChatCompletion(params: {
 // Vision Completion (for OCR)
 // ============================================================================
 
-export async function generateVisionCompletion(params: {
+export async function generateVisionCompletion(params: Parameters<typeof runVisionCompletion>[0]): Promise<string> {
+    // Counted as LLM wait time of the current state transition (if any)
+    return traceIo('llm', () => runVisionCompletion(params));
+}
+
+async function runVisionCompletion(params: {
     prompt: string;
     imageBase64: string;
     mimeType?: string;
@@ -264,7 +281,7 @@ export async function generateVisionCompletion(params: {
                     temperature,
                     maxOutputTokens: 4096,
                 },
-            });
+            }, REQUEST_OPTIONS);
 
             // Build image part
             const imagePart: Part = {
@@ -334,7 +351,7 @@ export async function* streamChatCompletion(params: {
         model,
         systemInstruction,
         generationConfig: { temperature },
-    });
+    }, REQUEST_OPTIONS);
 
     const result = await genModel.generateContentStream({ contents });
 
@@ -362,7 +379,12 @@ export interface GroundedResult {
  * Gemini will search the web during inference and return cited results.
  * Cost: 0 extra API keys — uses existing GEMINI_API_KEY.
  */
-export async function generateGroundedCompletion(params: {
+export async function generateGroundedCompletion(params: Parameters<typeof runGroundedCompletion>[0]): Promise<GroundedResult> {
+    // Counted as LLM wait time of the current state transition (if any)
+    return traceIo('llm', () => runGroundedCompletion(params));
+}
+
+async function runGroundedCompletion(params: {
     prompt: string;
     systemInstruction?: string;
     temperature?: number;
@@ -390,7 +412,7 @@ export async function generateGroundedCompletion(params: {
                 maxOutputTokens: 4096,
             },
             tools: [{ googleSearchRetrieval: {} } as any],
-        });
+        }, REQUEST_OPTIONS);
 
         const timeoutPromise = new Promise<never>((_, reject) => {
             setTimeout(() => reject(new Error('Grounded request timed out')), 15000);
@@ -15,10 +15,10 @@
 import { z } from "zod";
 import { logger } from "@utils/logger";
 import { generateChatCompletion } from "./geminiService";
-import { createMemoryForSession, getSessionMessageCount, addMessageToSession, getSessionHistory } from "./langchainMemory";
+import { createMemoryForSession, getSessionMessageCount, appendSessionMessage, getSessionContextAsync } from "./langchainMemory";
 import { agentRateLimiter } from "./langchainRateLimiter";
 import { recordRequest, recordFallback } from "./langchainMetrics";
-import { ORCHESTRATOR_PROMPT } from "../../prompts/orchestratorPrompt";
+import { compilePrompt, recordPromptUsage } from "../../prompts/promptRegistry";
 
 // ============================================================================
 // Output Schema (Zod)
@@ -112,15 +112,20 @@ export async function langchainCallOrchestrator(payload: {
     });
 
     try {
-        // 1. Get conversation history for context
-        const history = getSessionHistory(payload.sessionId);
+        // 1. Get conversation history for context (lazily from Redis when configured)
+        const { summary, history } = await getSessionContextAsync(payload.sessionId);
 
         // 2. Build messages array with proper multi-turn conversation
         // This is the KEY FIX: Send history as actual alternating messages, not embedded JSON
         const messages: Array<{ role: "system" | "user" | "assistant"; content: string }> = [
-            { role: "system", content: ORCHESTRATOR_PROMPT }
+            { role: "system", content: compilePrompt("orchestrator", payload.conversation?.language).text }
         ];
 
+        // Older turns that fell out of the memory window are kept as a compact summary
+        if (summary) {
+            messages.push({ role: "system", content: `Zusammenfassung des bisherigen Gesprächs:\n${summary}` });
+        }
+
         // Add conversation history as actual alternating user/assistant messages
         // This allows Gemini to understand the conversation context properly
         const relevantHistory = history.slice(-10); // Last 10 messages for context
@@ -140,9 +145,10 @@ export async function langchainCallOrchestrator(payload: {
 
         // Add current message as the final user message
         messages.push({ role: "user", content: currentContext });
+        recordPromptUsage("orchestrator", messages, payload.conversation?.language);
 
         // 4. Add current message to memory BEFORE calling Gemini
-        addMessageToSession(payload.sessionId, "user", payload.latestMessage);
+        await appendSessionMessage(payload.sessionId, "user", payload.latestMessage);
 
         logger.info("🧠 [Gemini Agent] Sending multi-turn conversation", {
             sessionId: payload.sessionId,
@@ -199,7 +205,7 @@ export async function langchainCallOrchestrator(payload: {
         }
 
         // 6. Add assistant response to memory
-        addMessageToSession(payload.sessionId, "assistant", parsed.reply);
+        await appendSessionMessage(payload.sessionId, "assistant", parsed.reply);
 
         // 📊 Record success metrics
         recordRequest(true, elapsed);
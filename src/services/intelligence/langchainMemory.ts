@@ -5,11 +5,12 @@
  * - Redis backend for persistence (survives server restarts)
  * - In-memory fallback if Redis unavailable
  * - Session-based isolation per phone number
- * - Auto-expiry and cleanup
+ * - Global byte budget with LRU eviction (no periodic sweep)
+ * - Fixed window per session, older turns compacted into a summary slot
  */
 
 import { BufferMemory, ChatMessageHistory } from "langchain/memory";
-import { HumanMessage, AIMessage, BaseMessage } from "@langchain/core/messages";
+import { HumanMessage, AIMessage, SystemMessage, BaseMessage } from "@langchain/core/messages";
 import { logger } from "@utils/logger";
 
 // ============================================================================
@@ -60,31 +61,301 @@ initRedis().catch(() => { });
 // Configuration
 // ============================================================================
 
-const MAX_MESSAGES_PER_SESSION = 50;
+const MAX_MESSAGES_PER_SESSION = Number(process.env.LANGCHAIN_MEMORY_WINDOW || 20);
 const SESSION_TIMEOUT_MS = 30 * 60 * 1000; // 30 minutes
 const REDIS_KEY_PREFIX = "langchain:memory:";
 const REDIS_TTL_SECONDS = 1800; // 30 minutes
+const MEMORY_BYTE_BUDGET = Number(process.env.LANGCHAIN_MEMORY_MAX_BYTES || 32 * 1024 * 1024); // 32 MB
+const SUMMARY_MAX_CHARS = 1500;
+const SUMMARY_SNIPPET_CHARS = 160;
+const MESSAGE_OVERHEAD_BYTES = 64;
 
 // ============================================================================
-// In-Memory Fallback Store
+// Bounded Session Store (byte budget + LRU)
 // ============================================================================
 
-const inMemoryStore = new Map<string, BaseMessage[]>();
-const sessionActivity = new Map<string, number>();
+export type MemoryRole = "user" | "assistant";
 
-function cleanupOldSessions(): void {
-    const now = Date.now();
-    for (const [sessionId, lastActivity] of sessionActivity.entries()) {
-        if (now - lastActivity > SESSION_TIMEOUT_MS) {
-            inMemoryStore.delete(sessionId);
-            sessionActivity.delete(sessionId);
-            logger.info("[LangChain Memory] Session expired", { sessionId });
+export interface StoredMessage {
+    role: MemoryRole;
+    content: string;
+}
+
+export interface SessionState {
+    /** Compacted digest of turns that fell out of the window */
+    summary: string | null;
+    /** Most recent messages, oldest first, at most `windowSize` entries */
+    messages: StoredMessage[];
+}
+
+interface SessionEntry extends SessionState {
+    lastActivity: number;
+    bytes: number;
+}
+
+export interface SessionStoreOptions {
+    maxBytes: number;
+    windowSize: number;
+    sessionTimeoutMs: number;
+}
+
+function estimateBytes(state: SessionState): number {
+    // JS strings are UTF-16, so two bytes per code unit plus per-object overhead
+    let bytes = MESSAGE_OVERHEAD_BYTES + (state.summary ? state.summary.length * 2 : 0);
+    for (const m of state.messages) {
+        bytes += MESSAGE_OVERHEAD_BYTES + m.content.length * 2;
+    }
+    return bytes;
+}
+
+/**
+ * Fold messages that left the window into the summary slot.
+ * Deterministic and LLM-free: one short snippet per message, capped so the
+ * summary keeps the most recent context when it grows past the limit.
+ */
+export function compactIntoSummary(summary: string | null, overflow: StoredMessage[]): string | null {
+    if (overflow.length === 0) return summary;
+
+    const lines = overflow.map(m => {
+        const text = m.content.replace(/\s+/g, " ").trim();
+        const snippet = text.length > SUMMARY_SNIPPET_CHARS ? `${text.slice(0, SUMMARY_SNIPPET_CHARS)}…` : text;
+        return `${m.role === "user" ? "Kunde" : "Bot"}: ${snippet}`;
+    });
+
+    let next = summary ? `${summary}\n${lines.join("\n")}` : lines.join("\n");
+    if (next.length > SUMMARY_MAX_CHARS) {
+        next = next.slice(next.length - SUMMARY_MAX_CHARS);
+        const firstBreak = next.indexOf("\n");
+        if (firstBreak !== -1) next = next.slice(firstBreak + 1);
+    }
+    return next;
+}
+
+/**
+ * Append a message to a session state, keeping a fixed window and
+ * compacting older turns into the summary slot.
+ */
+export function appendToState(state: SessionState, message: StoredMessage, windowSize: number): SessionState {
+    const messages = [...state.messages, message];
+    if (messages.length <= windowSize) {
+        return { summary: state.summary, messages };
+    }
+    const overflow = messages.splice(0, messages.length - windowSize);
+    return { summary: compactIntoSummary(state.summary, overflow), messages };
+}
+
+/**
+ * Session history store with a global byte budget.
+ *
+ * The backing Map is kept in recency order (touch = delete + re-insert), so
+ * the first entry is always the least recently used session. Eviction and
+ * expiry both pop from the head, which removes the need for a periodic sweep.
+ */
+export class SessionHistoryStore {
+    private sessions = new Map<string, SessionEntry>();
+    private totalBytes = 0;
+    private totalMessages = 0;
+    private evictions = 0;
+    private expirations = 0;
+    private compactions = 0;
+    private readonly options: SessionStoreOptions;
+
+    constructor(options: Partial<SessionStoreOptions> = {}) {
+        this.options = {
+            maxBytes: options.maxBytes ?? MEMORY_BYTE_BUDGET,
+            windowSize: options.windowSize ?? MAX_MESSAGES_PER_SESSION,
+            sessionTimeoutMs: options.sessionTimeoutMs ?? SESSION_TIMEOUT_MS,
+        };
+    }
+
+    get windowSize(): number {
+        return this.options.windowSize;
+    }
+
+    get(sessionId: string, now: number = Date.now()): SessionState | undefined {
+        const entry = this.sessions.get(sessionId);
+        if (!entry) return undefined;
+
+        if (now - entry.lastActivity > this.options.sessionTimeoutMs) {
+            this.remove(sessionId);
+            this.expirations++;
+            return undefined;
+        }
+
+        entry.lastActivity = now;
+        this.sessions.delete(sessionId);
+        this.sessions.set(sessionId, entry);
+        return { summary: entry.summary, messages: entry.messages };
+    }
+
+    /** Read without touching recency (stats, sync legacy accessors) */
+    peek(sessionId: string): SessionState | undefined {
+        const entry = this.sessions.get(sessionId);
+        return entry ? { summary: entry.summary, messages: entry.messages } : undefined;
+    }
+
+    set(sessionId: string, state: SessionState, now: number = Date.now()): void {
+        const previous = this.sessions.get(sessionId);
+        if (state.summary && state.summary !== (previous?.summary ?? null)) this.compactions++;
+        this.remove(sessionId);
+
+        const entry: SessionEntry = {
+            summary: state.summary,
+            messages: state.messages,
+            lastActivity: now,
+            bytes: estimateBytes(state),
+        };
+        this.sessions.set(sessionId, entry);
+        this.totalBytes += entry.bytes;
+        this.totalMessages += entry.messages.length;
+
+        this.expireIdle(now);
+        this.enforceBudget(sessionId);
+    }
+
+    append(sessionId: string, message: StoredMessage, now: number = Date.now()): SessionState {
+        const current = this.get(sessionId, now) ?? { summary: null, messages: [] };
+        const next = appendToState(current, message, this.options.windowSize);
+        this.set(sessionId, next, now);
+        return next;
+    }
+
+    delete(sessionId: string): void {
+        this.remove(sessionId);
+    }
+
+    keys(): string[] {
+        return Array.from(this.sessions.keys());
+    }
+
+    stats(now: number = Date.now()) {
+        const oldest = this.sessions.values().next().value as SessionEntry | undefined;
+        return {
+            activeSessions: this.sessions.size,
+            totalMessages: this.totalMessages,
+            oldestSessionAge: oldest ? now - oldest.lastActivity : null,
+            bytesUsed: this.totalBytes,
+            byteBudget: this.options.maxBytes,
+            evictions: this.evictions,
+            expirations: this.expirations,
+            compactions: this.compactions,
+        };
+    }
+
+    private remove(sessionId: string): void {
+        const entry = this.sessions.get(sessionId);
+        if (!entry) return;
+        this.sessions.delete(sessionId);
+        this.totalBytes -= entry.bytes;
+        this.totalMessages -= entry.messages.length;
+    }
+
+    private expireIdle(now: number): void {
+        for (const [sessionId, entry] of this.sessions) {
+            if (now - entry.lastActivity <= this.options.sessionTimeoutMs) break;
+            this.remove(sessionId);
+            this.expirations++;
+        }
+    }
+
+    private enforceBudget(protectedSessionId: string): void {
+        for (const sessionId of this.sessions.keys()) {
+            if (this.totalBytes <= this.options.maxBytes) break;
+            // The session just written is the most recent; never evict it
+            if (sessionId === protectedSessionId) break;
+            this.remove(sessionId);
+            this.evictions++;
+        }
+    }
+}
+
+const sessionStore = new SessionHistoryStore();
+
+// ============================================================================
+// Redis Serialization
+// ============================================================================
+
+function redisKey(sessionId: string): string {
+    return `${REDIS_KEY_PREFIX}${sessionId}`;
+}
+
+function parseRedisState(raw: string): SessionState {
+    const parsed = JSON.parse(raw);
+    // Legacy format: a bare array of { type, content }
+    const list: any[] = Array.isArray(parsed) ? parsed : parsed?.messages || [];
+    return {
+        summary: Array.isArray(parsed) ? null : parsed?.summary ?? null,
+        messages: list.map((m: any) => ({
+            role: m.role ?? (m.type === "human" ? "user" : "assistant"),
+            content: typeof m.content === "string" ? m.content : JSON.stringify(m.content),
+        })),
+    };
+}
+
+/**
+ * Load a session for this turn. In Redis mode the shared copy is the source of
+ * truth (another pod may have handled the previous turn), so it is read lazily
+ * on every call; the local store only serves as fallback.
+ */
+async function loadSessionState(sessionId: string): Promise<SessionState> {
+    if (useRedis && redisClient) {
+        try {
+            const raw = await redisClient.get(redisKey(sessionId));
+            const state = raw ? parseRedisState(raw) : { summary: null, messages: [] };
+            sessionStore.set(sessionId, state);
+            return state;
+        } catch (error: any) {
+            logger.warn("[LangChain Memory] Redis read failed, using in-memory", {
+                error: error?.message
+            });
+        }
+    }
+
+    return sessionStore.get(sessionId) ?? { summary: null, messages: [] };
+}
+
+async function saveSessionState(sessionId: string, state: SessionState): Promise<void> {
+    sessionStore.set(sessionId, state);
+
+    if (useRedis && redisClient) {
+        try {
+            await redisClient.setex(redisKey(sessionId), REDIS_TTL_SECONDS, JSON.stringify(state));
+        } catch (error: any) {
+            logger.warn("[LangChain Memory] Redis write failed", { error: error?.message });
         }
     }
 }
 
-// Cleanup every 5 minutes
-setInterval(cleanupOldSessions, 5 * 60 * 1000);
+// Serialize read-modify-write cycles per session so fire-and-forget appends
+// (user message followed by assistant reply) cannot overwrite each other.
+const pendingWrites = new Map<string, Promise<void>>();
+
+function enqueueWrite(sessionId: string, task: () => Promise<void>): Promise<void> {
+    const previous = pendingWrites.get(sessionId) || Promise.resolve();
+    const next = previous.then(task, task);
+    pendingWrites.set(sessionId, next);
+    next.finally(() => {
+        if (pendingWrites.get(sessionId) === next) pendingWrites.delete(sessionId);
+    }).catch(() => { });
+    return next;
+}
+
+function toBaseMessages(state: SessionState): BaseMessage[] {
+    const messages: BaseMessage[] = state.summary
+        ? [new SystemMessage(`Zusammenfassung des bisherigen Gesprächs:\n${state.summary}`)]
+        : [];
+    for (const m of state.messages) {
+        messages.push(m.role === "user" ? new HumanMessage(m.content) : new AIMessage(m.content));
+    }
+    return messages;
+}
+
+function toStoredMessage(message: BaseMessage): StoredMessage {
+    return {
+        role: message._getType() === "human" ? "user" : "assistant",
+        content: typeof message.content === "string" ? message.content : JSON.stringify(message.content),
+    };
+}
 
 // ============================================================================
 // Production Chat Message History (Redis + Fallback)
@@ -92,66 +363,23 @@ setInterval(cleanupOldSessions, 5 * 60 * 1000);
 
 export class ProductionChatHistory extends ChatMessageHistory {
     private sessionId: string;
-    private redisKey: string;
 
     constructor(sessionId: string) {
         super();
         this.sessionId = sessionId;
-        this.redisKey = `${REDIS_KEY_PREFIX}${sessionId}`;
     }
 
     async getMessages(): Promise<BaseMessage[]> {
-        sessionActivity.set(this.sessionId, Date.now());
-
-        // Try Redis first
-        if (useRedis && redisClient) {
-            try {
-                const raw = await redisClient.get(this.redisKey);
-                if (raw) {
-                    const parsed = JSON.parse(raw);
-                    return parsed.map((m: any) =>
-                        m.type === "human" ? new HumanMessage(m.content) : new AIMessage(m.content)
-                    );
-                }
-                return [];
-            } catch (error: any) {
-                logger.warn("[LangChain Memory] Redis read failed, using in-memory", {
-                    error: error?.message
-                });
-            }
-        }
-
-        // Fallback to in-memory
-        return inMemoryStore.get(this.sessionId) || [];
+        await pendingWrites.get(this.sessionId);
+        return toBaseMessages(await loadSessionState(this.sessionId));
     }
 
     async addMessage(message: BaseMessage): Promise<void> {
-        sessionActivity.set(this.sessionId, Date.now());
-
-        // Get existing messages
-        let messages = await this.getMessages();
-        messages.push(message);
-
-        // Trim if too many
-        if (messages.length > MAX_MESSAGES_PER_SESSION) {
-            messages = messages.slice(-MAX_MESSAGES_PER_SESSION);
-        }
-
-        // Save to Redis if available
-        if (useRedis && redisClient) {
-            try {
-                const serialized = messages.map(m => ({
-                    type: m._getType(),
-                    content: m.content,
-                }));
-                await redisClient.setex(this.redisKey, REDIS_TTL_SECONDS, JSON.stringify(serialized));
-            } catch (error: any) {
-                logger.warn("[LangChain Memory] Redis write failed", { error: error?.message });
-            }
-        }
-
-        // Always update in-memory (backup)
-        inMemoryStore.set(this.sessionId, messages);
+        const stored = toStoredMessage(message);
+        await enqueueWrite(this.sessionId, async () => {
+            const state = await loadSessionState(this.sessionId);
+            await saveSessionState(this.sessionId, appendToState(state, stored, sessionStore.windowSize));
+        });
     }
 
     async addUserMessage(message: string): Promise<void> {
@@ -166,15 +394,14 @@ export class ProductionChatHistory extends ChatMessageHistory {
         // Clear Redis
         if (useRedis && redisClient) {
             try {
-                await redisClient.del(this.redisKey);
+                await redisClient.del(redisKey(this.sessionId));
             } catch (error: any) {
                 logger.warn("[LangChain Memory] Redis clear failed", { error: error?.message });
             }
         }
 
         // Clear in-memory
-        inMemoryStore.delete(this.sessionId);
-        sessionActivity.delete(this.sessionId);
+        sessionStore.delete(this.sessionId);
         logger.info("[LangChain Memory] Session cleared", { sessionId: this.sessionId });
     }
 }
@@ -194,7 +421,7 @@ export function createMemoryForSession(sessionId: string): BufferMemory {
 }
 
 export function getSessionMessageCount(sessionId: string): number {
-    return inMemoryStore.get(sessionId)?.length || 0;
+    return sessionStore.peek(sessionId)?.messages.length || 0;
 }
 
 export function clearSessionMemory(sessionId: string): void {
@@ -203,77 +430,83 @@ export function clearSessionMemory(sessionId: string): void {
 }
 
 export function getActiveSessionIds(): string[] {
-    return Array.from(inMemoryStore.keys());
+    return sessionStore.keys();
 }
 
 /**
- * Add a message to session memory (simplified API for Gemini Agent)
+ * Append a message to session memory and persist it (awaitable).
+ * Writes go through the local bounded store and, when available, Redis.
  */
-export function addMessageToSession(sessionId: string, role: "user" | "assistant", content: string): void {
-    sessionActivity.set(sessionId, Date.now());
-
-    let messages = inMemoryStore.get(sessionId) || [];
-    const message = role === "user" ? new HumanMessage(content) : new AIMessage(content);
-    messages.push(message);
+export function appendSessionMessage(sessionId: string, role: MemoryRole, content: string): Promise<void> {
+    return enqueueWrite(sessionId, async () => {
+        if (useRedis && redisClient) {
+            const state = await loadSessionState(sessionId);
+            await saveSessionState(sessionId, appendToState(state, { role, content }, sessionStore.windowSize));
+        } else {
+            sessionStore.append(sessionId, { role, content });
+        }
+    });
+}
 
-    // Trim if too many
-    if (messages.length > MAX_MESSAGES_PER_SESSION) {
-        messages = messages.slice(-MAX_MESSAGES_PER_SESSION);
+/**
+ * Add a message to session memory (simplified API for Gemini Agent)
+ */
+export function addMessageToSession(sessionId: string, role: MemoryRole, content: string): void {
+    if (!useRedis || !redisClient) {
+        // In-memory mode stays fully synchronous for callers that read right after writing
+        sessionStore.append(sessionId, { role, content });
+        return;
     }
-
-    inMemoryStore.set(sessionId, messages);
+    appendSessionMessage(sessionId, role, content).catch((error: any) => {
+        logger.warn("[LangChain Memory] Session append failed", { sessionId, error: error?.message });
+    });
 }
 
 /**
  * Get session history as simple string array (for Gemini Agent context)
- * This version reads from in-memory store (which is kept in sync with Redis)
+ * This version reads from the local store only; use getSessionContextAsync in Redis mode.
  */
-export function getSessionHistory(sessionId: string): Array<{ role: "user" | "assistant"; content: string }> {
-    const messages = inMemoryStore.get(sessionId) || [];
-    return messages.map(m => ({
-        role: m._getType() === "human" ? "user" as const : "assistant" as const,
-        content: typeof m.content === "string" ? m.content : JSON.stringify(m.content),
-    }));
+export function getSessionHistory(sessionId: string): Array<{ role: MemoryRole; content: string }> {
+    return (sessionStore.get(sessionId)?.messages || []).map(m => ({ role: m.role, content: m.content }));
+}
+
+/**
+ * Get the windowed history plus the compacted summary of older turns.
+ * Reads from Redis lazily per turn if available, falls back to in-memory.
+ */
+export async function getSessionContextAsync(sessionId: string): Promise<{
+    summary: string | null;
+    history: Array<{ role: MemoryRole; content: string }>;
+}> {
+    await pendingWrites.get(sessionId);
+    const state = await loadSessionState(sessionId);
+    return {
+        summary: state.summary,
+        history: state.messages.map(m => ({ role: m.role, content: m.content })),
+    };
 }
 
 /**
  * Get session history with Redis support (async version)
  * Reads from Redis if available, falls back to in-memory
  */
-export async function getSessionHistoryAsync(sessionId: string): Promise<Array<{ role: "user" | "assistant"; content: string }>> {
-    const chatHistory = new ProductionChatHistory(sessionId);
-    const messages = await chatHistory.getMessages();
-    return messages.map(m => ({
-        role: m._getType() === "human" ? "user" as const : "assistant" as const,
-        content: typeof m.content === "string" ? m.content : JSON.stringify(m.content),
-    }));
+export async function getSessionHistoryAsync(sessionId: string): Promise<Array<{ role: MemoryRole; content: string }>> {
+    return (await getSessionContextAsync(sessionId)).history;
 }
 
 export function getMemoryStats(): {
     activeSessions: number;
     totalMessages: number;
     oldestSessionAge: number | null;
+    bytesUsed: number;
+    byteBudget: number;
+    evictions: number;
+    expirations: number;
+    compactions: number;
     backend: "redis" | "in-memory";
 } {
-    const now = Date.now();
-    let totalMessages = 0;
-    let oldestAge: number | null = null;
-
-    for (const [sessionId, messages] of inMemoryStore.entries()) {
-        totalMessages += messages.length;
-        const lastActivity = sessionActivity.get(sessionId);
-        if (lastActivity) {
-            const age = now - lastActivity;
-            if (oldestAge === null || age > oldestAge) {
-                oldestAge = age;
-            }
-        }
-    }
-
     return {
-        activeSessions: inMemoryStore.size,
-        totalMessages,
-        oldestSessionAge: oldestAge,
+        ...sessionStore.stats(),
         backend: useRedis ? "redis" : "in-memory",
     };
 }
@@ -301,6 +534,8 @@ export default {
     addMessageToSession,
     getSessionHistory,
     getSessionHistoryAsync,
+    getSessionContextAsync,
+    appendSessionMessage,
     ProductionChatHistory,
     SessionChatHistory,
 };
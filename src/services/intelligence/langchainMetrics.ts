@@ -133,6 +133,9 @@ export interface AgentMetrics {
         activeSessions: number;
         totalMessages: number;
         backend: string;
+        bytesUsed: number;
+        byteBudget: number;
+        evictions: number;
         redisConnected: boolean;
     };
 
@@ -192,6 +195,9 @@ export function getAgentMetrics(): AgentMetrics {
             activeSessions: memoryStats.activeSessions,
             totalMessages: memoryStats.totalMessages,
             backend: memoryStats.backend,
+            bytesUsed: memoryStats.bytesUsed,
+            byteBudget: memoryStats.byteBudget,
+            evictions: memoryStats.evictions,
             redisConnected: isRedisConnected(),
         },
 
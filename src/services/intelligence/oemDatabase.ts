@@ -7,10 +7,20 @@
  * - <10ms lookup time
  * - Full-text search on descriptions
  * - Indexed on brand+model+category
+ * - Optional read-only index file (oemIndexBuilder.ts): when
+ *   oem-index.json is present, reads go to the mmap'd immutable index and
+ *   are hot-swapped when a new version is published; writes (learning,
+ *   seeding) still go to the writable database, and rows written since the
+ *   index snapshot are read from there on top of it until refreshIndex()
+ *   publishes the next build
  */
 
 import Database from 'better-sqlite3';
 import { logger } from '@utils/logger';
+import { SupersessionClosure } from './supersessionClosure';
+import {
+    buildOemIndex, buildOemIndexInWorker, INDEX_MANIFEST_NAME, OEMIndexBuildResult, OEMIndexManifest,
+} from './oemIndexBuilder';
 import path from 'path';
 import fs from 'fs';
 
@@ -64,6 +74,32 @@ const DB_PATH = path.join(
     'oem-database.sqlite'
 );
 
+// Read-only index published by oemIndexBuilder.ts
+const INDEX_DIR = process.env.OEM_INDEX_PATH || path.dirname(DB_PATH);
+const INDEX_MANIFEST = path.join(INDEX_DIR, INDEX_MANIFEST_NAME);
+const INDEX_DISABLED = process.env.OEM_INDEX_DISABLED === 'true';
+const INDEX_POLL_MS = parseInt(process.env.OEM_INDEX_POLL_MS || '30000', 10);
+const INDEX_MMAP_BYTES = parseInt(process.env.OEM_INDEX_MMAP_BYTES || String(512 * 1024 * 1024), 10);
+const INDEX_KEEP = parseInt(process.env.OEM_INDEX_KEEP || '2', 10);
+
+// How often supersessions written by other processes are pulled into the closure
+const SUPERSESSION_SYNC_MS = parseInt(process.env.OEM_SUPERSESSION_SYNC_MS || '60000', 10);
+
+/** Identity of an oem_records row (its UNIQUE key) */
+const rowKey = (row: any): string => `${row.oem}\u0000${row.brand}\u0000${row.part_category}`;
+
+/**
+ * Index rows minus those rewritten since the index snapshot, plus the
+ * rewritten rows that match, in lookup order.
+ */
+function mergeOverlay(indexRows: any[], recentRows: any[], shadowed: Set<string>, limit: number): any[] {
+    return indexRows
+        .filter(row => !shadowed.has(rowKey(row)))
+        .concat(recentRows)
+        .sort((a, b) => b.confidence - a.confidence || b.hit_count - a.hit_count)
+        .slice(0, limit);
+}
+
 // ============================================================================
 // Database Class
 // ============================================================================
@@ -72,6 +108,20 @@ class OEMDatabase {
     private db: Database | null = null;
     private initialized = false;
 
+    // Read-only index (null → reads use the writable database)
+    private index: Database | null = null;
+    private indexVersion: string | null = null;
+    // Writable rows with updated_at >= this are overlaid on the index
+    private indexSnapshotAt: string | null = null;
+    private indexWatched = false;
+    // Build running on a worker thread (refreshIndexInBackground)
+    private indexBuild: Promise<string | null> | null = null;
+
+    // In-memory closure over the supersessions of the current read source
+    private supersessions: SupersessionClosure | null = null;
+    private supersessionsMaxId = 0;
+    private supersessionsSyncedAt = 0;
+
     constructor() {
         // Lazy init
     }
@@ -199,6 +249,7 @@ class OEMDatabase {
             CREATE INDEX IF NOT EXISTS idx_brand_category ON oem_records(brand, part_category);
             CREATE INDEX IF NOT EXISTS idx_brand_model_category ON oem_records(brand, model, part_category);
             CREATE INDEX IF NOT EXISTS idx_model_code ON oem_records(model_code);
+            CREATE INDEX IF NOT EXISTS idx_updated_at ON oem_records(updated_at);
         `);
 
         // Full-text search on descriptions
@@ -252,6 +303,168 @@ class OEMDatabase {
         logger.info('[OEMDatabase] Tables and indexes created');
     }
 
+    // ========================================================================
+    // Read-only Index
+    // ========================================================================
+
+    /**
+     * Connection for read queries: the published index if there is one,
+     * otherwise the writable database.
+     */
+    private reader(): Database {
+        if (!INDEX_DISABLED && !this.indexWatched) {
+            this.indexWatched = true;
+            this.loadIndex();
+            // Polling survives the builder's rename-over-manifest; fires when
+            // the manifest first appears, too
+            fs.watchFile(INDEX_MANIFEST, { interval: INDEX_POLL_MS, persistent: false }, () => this.loadIndex());
+        }
+        return this.index ?? this.ensureInit();
+    }
+
+    /**
+     * Open the version named by the manifest and swap it in. Queries are
+     * synchronous, so nothing is in flight on the old handle when it closes.
+     */
+    private loadIndex(): void {
+        if (!fs.existsSync(INDEX_MANIFEST)) return;
+
+        let next: Database | null = null;
+        try {
+            const manifest: OEMIndexManifest = JSON.parse(fs.readFileSync(INDEX_MANIFEST, 'utf8'));
+            if (manifest.version === this.indexVersion) return;
+
+            const start = Date.now();
+            next = new Database(path.join(INDEX_DIR, manifest.file), { readonly: true, fileMustExist: true });
+            next.pragma(`mmap_size = ${INDEX_MMAP_BYTES}`);
+
+            const meta = new Map<string, string>(
+                (next.prepare(`SELECT key, value FROM index_meta`).all() as any[]).map(r => [r.key, r.value])
+            );
+            if (meta.get('version') !== manifest.version) {
+                throw new Error(`index file version ${meta.get('version')} does not match manifest ${manifest.version}`);
+            }
+
+            const previous = this.index;
+            this.index = next;
+            this.indexVersion = manifest.version;
+            // Indexes built before snapshot_at existed: their build time, in CURRENT_TIMESTAMP format
+            this.indexSnapshotAt = meta.get('snapshot_at') ?? manifest.builtAt.replace('T', ' ').slice(0, 19);
+            this.supersessions = null;
+            previous?.close();
+
+            logger.info(`[OEMDatabase] Read-only index ${manifest.version} active`, {
+                records: manifest.records,
+                builtAt: manifest.builtAt,
+                openMs: Date.now() - start,
+            });
+        } catch (err: any) {
+            next?.close();
+            logger.warn('[OEMDatabase] Could not load read-only index, keeping current source', {
+                error: err?.message,
+                current: this.indexVersion || 'writable database',
+            });
+        }
+    }
+
+    /**
+     * Version of the active read-only index, or null when reading the writable database
+     */
+    getIndexVersion(): string | null {
+        this.reader();
+        return this.indexVersion;
+    }
+
+    /**
+     * Whether the writable database has changed since the active index was
+     * built (learner writes from any process, seeding), or there is none.
+     */
+    private indexOutdated(): boolean {
+        this.reader();
+        const db = this.ensureInit();
+        if (this.indexSnapshotAt === null) return true;
+        return !!db.prepare(`
+            SELECT 1 FROM oem_records INDEXED BY idx_updated_at WHERE updated_at >= @since
+            UNION ALL
+            SELECT 1 FROM supersessions WHERE created_at >= @since
+            LIMIT 1
+        `).get({ since: this.indexSnapshotAt });
+    }
+
+    private publishedIndex(built: OEMIndexBuildResult): string {
+        logger.info(`[OEMDatabase] Published read-only index ${built.version}`, {
+            records: built.records,
+            supersessions: built.supersessions,
+            durationMs: built.durationMs,
+        });
+        this.loadIndex();
+        return built.version;
+    }
+
+    /**
+     * Rebuild and publish the read-only index if it is outdated. The build
+     * is synchronous — for one-shot scripts (image build, CLI); long-running
+     * processes use refreshIndexInBackground(). Returns the new version, or
+     * null if nothing was published.
+     */
+    refreshIndex(): string | null {
+        if (INDEX_DISABLED) return null;
+        try {
+            if (!this.indexOutdated()) return null;
+            return this.publishedIndex(buildOemIndex({ source: DB_PATH, out: INDEX_DIR, keep: INDEX_KEEP }));
+        } catch (err: any) {
+            logger.error('[OEMDatabase] Index rebuild failed, keeping current index', { error: err?.message });
+            return null;
+        }
+    }
+
+    /**
+     * refreshIndex() with the build on a worker thread; only the hot-swap
+     * runs here. Concurrent calls share one build.
+     */
+    refreshIndexInBackground(): Promise<string | null> {
+        if (INDEX_DISABLED) return Promise.resolve(null);
+        if (this.indexBuild) return this.indexBuild;
+
+        const build = (async () => {
+            try {
+                if (!this.indexOutdated()) return null;
+                return this.publishedIndex(await buildOemIndexInWorker({ source: DB_PATH, out: INDEX_DIR, keep: INDEX_KEEP }));
+            } catch (err: any) {
+                logger.error('[OEMDatabase] Index rebuild failed, keeping current index', { error: err?.message });
+                return null;
+            }
+        })();
+        this.indexBuild = build;
+        build.finally(() => {
+            if (this.indexBuild === build) this.indexBuild = null;
+        });
+        return build;
+    }
+
+    /**
+     * Writable database and snapshot time when reads go to the index, so
+     * rows written since the build can be read on top of it.
+     */
+    private overlay(): { db: Database; since: string } | null {
+        if (!this.index || this.indexSnapshotAt === null) return null;
+        return { db: this.ensureInit(), since: this.indexSnapshotAt };
+    }
+
+    /**
+     * Keys among `oems` rewritten since the index snapshot: the index's copy
+     * of these rows is stale even where the new version no longer matches.
+     */
+    private shadowedKeys(overlay: { db: Database; since: string }, oems: string[]): Set<string> {
+        if (oems.length === 0) return new Set();
+        const unique = [...new Set(oems)];
+        const rows = overlay.db.prepare(`
+            SELECT oem, brand, part_category FROM oem_records
+            WHERE oem IN (${unique.map(() => '?').join(',')}) AND updated_at >= ?
+        `).all(...unique, overlay.since) as any[];
+        return new Set(rows.map(rowKey));
+    }
+
     // ========================================================================
     // CRUD Operations
     // ========================================================================
@@ -353,7 +566,7 @@ class OEMDatabase {
      * Look up OEM by criteria
      */
     lookup(params: OEMLookupParams): OEMLookupResult[] {
-        const db = this.ensureInit();
+        const db = this.reader();
 
         const conditions: string[] = [];
         const bindings: Record<string, any> = {};
@@ -385,17 +598,32 @@ class OEMDatabase {
 
         const stmt = db.prepare(`
             SELECT oem, brand, model, part_category, part_description, 
-                   superseded_by, sources, confidence
+                   superseded_by, sources, confidence, hit_count
             FROM oem_records
             ${whereClause}
             ORDER BY confidence DESC, hit_count DESC
             LIMIT @limit
         `);
 
-        const rows = stmt.all({ ...bindings, limit }) as any[];
+        let rows = stmt.all({ ...bindings, limit }) as any[];
+
+        const overlay = this.overlay();
+        if (overlay) {
+            const recent = overlay.db.prepare(`
+                SELECT oem, brand, model, part_category, part_description,
+                       superseded_by, sources, confidence, hit_count
+                FROM oem_records INDEXED BY idx_updated_at
+                WHERE ${[...conditions, 'updated_at >= @since'].join(' AND ')}
+                ORDER BY confidence DESC, hit_count DESC
+                LIMIT @limit
+            `).all({ ...bindings, since: overlay.since, limit }) as any[];
+            const shadowed = this.shadowedKeys(overlay, rows.map(r => r.oem));
+            recent.forEach(r => shadowed.add(rowKey(r)));
+            rows = mergeOverlay(rows, recent, shadowed, limit);
+        }
 
-        // Increment hit count for returned results
-        if (rows.length > 0) {
+        // Increment hit count for returned results (frozen at build time in the index)
+        if (rows.length > 0 && !this.index) {
             const updateHits = db.prepare(`
                 UPDATE oem_records SET hit_count = hit_count + 1 
                 WHERE oem IN (${rows.map(() => '?').join(',')})
@@ -412,11 +640,102 @@ class OEMDatabase {
         }));
     }
 
+    /**
+     * Look up several part categories for one vehicle in a single query.
+     * Same filters and ordering as lookup(), top `limit` rows per category.
+     */
+    lookupMany(params: Omit<OEMLookupParams, 'category'> & { categories: string[] }): Map<string, OEMLookupResult[]> {
+        const results = new Map<string, OEMLookupResult[]>();
+        const categories = [...new Set(params.categories)];
+        if (categories.length === 0) return results;
+
+        const db = this.reader();
+
+        const conditions: string[] = [];
+        const bindings: Record<string, any> = {};
+
+        if (params.brand) {
+            conditions.push('brand = @brand');
+            bindings.brand = params.brand.toUpperCase();
+        }
+        if (params.model) {
+            conditions.push('(model LIKE @model OR model_code = @modelCode)');
+            bindings.model = `%${params.model}%`;
+            bindings.modelCode = params.model.toUpperCase();
+        }
+        if (params.year) {
+            conditions.push('(year_from IS NULL OR year_from <= @year)');
+            conditions.push('(year_to IS NULL OR year_to >= @year)');
+            bindings.year = params.year;
+        }
+        conditions.push(`part_category IN (${categories.map((_, i) => `@cat${i}`).join(', ')})`);
+        categories.forEach((c, i) => { bindings[`cat${i}`] = c; });
+
+        const limit = params.limit || 20;
+
+        const topPerCategory = (from: string, where: string[]) => `
+            SELECT oem, brand, part_category, part_description, superseded_by, confidence, hit_count
+            FROM (
+                SELECT oem, brand, part_category, part_description, superseded_by, confidence, hit_count,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY part_category
+                           ORDER BY confidence DESC, hit_count DESC
+                       ) AS rn
+                FROM ${from}
+                WHERE ${where.join(' AND ')}
+            )
+            WHERE rn <= @limit
+            ORDER BY part_category, rn
+        `;
+
+        let rows = db.prepare(topPerCategory('oem_records', conditions)).all({ ...bindings, limit }) as any[];
+
+        const overlay = this.overlay();
+        if (overlay) {
+            const recent = overlay.db
+                .prepare(topPerCategory('oem_records INDEXED BY idx_updated_at', [...conditions, 'updated_at >= @since']))
+                .all({ ...bindings, since: overlay.since, limit }) as any[];
+            const shadowed = this.shadowedKeys(overlay, rows.map(r => r.oem));
+            recent.forEach(r => shadowed.add(rowKey(r)));
+            rows = categories.flatMap(category => mergeOverlay(
+                rows.filter(r => r.part_category === category),
+                recent.filter(r => r.part_category === category),
+                shadowed,
+                limit
+            ));
+        }
+
+        if (rows.length > 0 && !this.index) {
+            const oems = [...new Set(rows.map(r => r.oem))];
+            const updateHits = db.prepare(`
+                UPDATE oem_records SET hit_count = hit_count + 1
+                WHERE oem IN (${oems.map(() => '?').join(',')})
+            `);
+            updateHits.run(oems);
+        }
+
+        for (const row of rows) {
+            let list = results.get(row.part_category);
+            if (!list) {
+                list = [];
+                results.set(row.part_category, list);
+            }
+            list.push({
+                oem: row.oem,
+                confidence: row.confidence,
+                source: 'database',
+                description: row.part_description,
+                supersededBy: row.superseded_by,
+            });
+        }
+        return results;
+    }
+
     /**
      * Full-text search
      */
     search(query: string, limit: number = 20): OEMLookupResult[] {
-        const db = this.ensureInit();
+        const db = this.reader();
 
         const stmt = db.prepare(`
             SELECT r.oem, r.brand, r.model, r.part_category, r.part_description,
@@ -428,7 +747,24 @@ class OEMDatabase {
             LIMIT @limit
         `);
 
-        const rows = stmt.all({ query, limit }) as any[];
+        let rows = stmt.all({ query, limit }) as any[];
+
+        const overlay = this.overlay();
+        if (overlay) {
+            // FTS ranks of two databases don't compare: recent matches go first
+            const recent = overlay.db.prepare(`
+                SELECT r.oem, r.brand, r.model, r.part_category, r.part_description,
+                       r.superseded_by, r.sources, r.confidence
+                FROM oem_fts f
+                JOIN oem_records r ON f.rowid = r.id
+                WHERE oem_fts MATCH @query AND r.updated_at >= @since
+                ORDER BY rank, r.confidence DESC
+                LIMIT @limit
+            `).all({ query, since: overlay.since, limit }) as any[];
+            const shadowed = this.shadowedKeys(overlay, rows.map(r => r.oem));
+            recent.forEach(r => shadowed.add(rowKey(r)));
+            rows = recent.concat(rows.filter(r => !shadowed.has(rowKey(r)))).slice(0, limit);
+        }
 
         return rows.map(row => ({
             oem: row.oem,
@@ -443,13 +779,20 @@ class OEMDatabase {
      * Get exact OEM by number
      */
     getByOEM(oem: string): OEMRecord | null {
-        const db = this.ensureInit();
+        const db = this.reader();
 
         const stmt = db.prepare(`
             SELECT * FROM oem_records WHERE oem = @oem LIMIT 1
         `);
 
-        const row = stmt.get({ oem: oem.toUpperCase() }) as any;
+        const overlay = this.overlay();
+        const recent = overlay
+            ? overlay.db.prepare(`
+                SELECT * FROM oem_records WHERE oem = @oem AND updated_at >= @since LIMIT 1
+            `).get({ oem: oem.toUpperCase(), since: overlay.since }) as any
+            : undefined;
+
+        const row = recent ?? stmt.get({ oem: oem.toUpperCase() }) as any;
         if (!row) return null;
 
         return {
@@ -491,33 +834,62 @@ class OEMDatabase {
 
         // Also update the main record
         const update = db.prepare(`
-            UPDATE oem_records SET superseded_by = @newOem 
+            UPDATE oem_records SET superseded_by = @newOem, updated_at = CURRENT_TIMESTAMP
             WHERE oem = @oldOem AND superseded_by IS NULL
         `);
         update.run({ oldOem: oldOem.toUpperCase(), newOem: newOem.toUpperCase() });
+
+        // Visible to resolveSupersession right away (also when reading from the index)
+        this.supersessions?.add(oldOem.toUpperCase(), newOem.toUpperCase());
     }
 
     /**
-     * Resolve supersession chain
+     * Closure over all supersessions. Built once from the read source, then
+     * topped up from the writable database with rows added since the last
+     * sync (other processes, or after the index was built).
      */
-    resolveSupersession(oem: string, maxDepth: number = 5): string {
-        const db = this.ensureInit();
+    private supersessionClosure(): SupersessionClosure {
+        const now = Date.now();
+        if (this.supersessions && now - this.supersessionsSyncedAt < SUPERSESSION_SYNC_MS) {
+            return this.supersessions;
+        }
 
-        let currentOem = oem.toUpperCase();
-        let depth = 0;
+        const linksSince = (db: Database, lastId: number) => db.prepare(`
+            SELECT id, old_oem, new_oem FROM supersessions
+            WHERE id > @lastId
+            ORDER BY id
+        `).all({ lastId }) as any[];
+
+        if (!this.supersessions) {
+            const rows = linksSince(this.reader(), 0);
+            this.supersessions = SupersessionClosure.fromEdges(rows.map(r => [r.old_oem, r.new_oem] as [string, string]));
+            this.supersessionsMaxId = rows.length > 0 ? rows[rows.length - 1].id : 0;
+            logger.info(`[OEMDatabase] Supersession closure built (${rows.length} links)`);
+        }
 
-        while (depth < maxDepth) {
-            const stmt = db.prepare(`
-                SELECT new_oem FROM supersessions WHERE old_oem = @oem
-            `);
-            const row = stmt.get({ oem: currentOem }) as any;
+        // Links added since (after the index build, or by other processes)
+        // exist only in the writable database; the index keeps its ids
+        const rows = linksSince(this.ensureInit(), this.supersessionsMaxId);
+        for (const row of rows) this.supersessions.add(row.old_oem, row.new_oem);
+        if (rows.length > 0) this.supersessionsMaxId = rows[rows.length - 1].id;
+        this.supersessionsSyncedAt = now;
 
-            if (!row) break;
-            currentOem = row.new_oem;
-            depth++;
-        }
+        return this.supersessions;
+    }
 
-        return currentOem;
+    /**
+     * Resolve supersession chain (follows at most maxDepth links)
+     */
+    resolveSupersession(oem: string, maxDepth: number = 5): string {
+        return this.supersessionClosure().resolveWithin(oem.toUpperCase(), maxDepth);
+    }
+
+    /**
+     * Current OEM at the end of the supersession chain and the number of
+     * links to it (0 = not superseded, -1 = cyclic chain)
+     */
+    resolveSupersessionChain(oem: string): { current: string; depth: number } {
+        return this.supersessionClosure().resolve(oem.toUpperCase());
     }
 
     /**
@@ -551,6 +923,17 @@ class OEMDatabase {
      * Close database connection
      */
     close(): void {
+        if (this.indexWatched) {
+            fs.unwatchFile(INDEX_MANIFEST);
+            this.indexWatched = false;
+        }
+        if (this.index) {
+            this.index.close();
+            this.index = null;
+            this.indexVersion = null;
+            this.indexSnapshotAt = null;
+        }
+        this.supersessions = null;
         if (this.db) {
             this.db.close();
             this.db = null;
@@ -0,0 +1,255 @@
+/**
+ * 📦 OEM Index Builder
+ *
+ * Compiles the writable OEM database (oem_records, supersessions) into an
+ * immutable, read-only index file that workers open with mmap instead of
+ * creating tables / seeding / building FTS at startup.
+ *
+ * Output (in `out`):
+ *   oem-index-<version>.sqlite   indexes + FTS prebuilt, ANALYZEd, VACUUMed
+ *   oem-index.json               manifest pointing at the current version
+ *
+ * The manifest is replaced atomically (write + rename), so running workers
+ * hot-swap to the new file on their next manifest poll (see oemDatabase.ts).
+ * Older index files beyond `keep` are removed; workers still holding one
+ * open keep reading it until they swap.
+ *
+ * Each index records `snapshot_at` (SQLite CURRENT_TIMESTAMP format): rows of
+ * the writable database with a later updated_at may be missing from it and
+ * are overlaid by oemDatabase.ts until the next build.
+ *
+ * Used at runtime by oemDatabase.refreshIndexInBackground() (on a worker
+ * thread, see buildOemIndexInWorker), by oemDatabase.refreshIndex() and from
+ * the command line by src/scripts/buildOemIndex.ts.
+ */
+
+import Database from 'better-sqlite3';
+import path from 'path';
+import fs from 'fs';
+import crypto from 'crypto';
+import { Worker } from 'worker_threads';
+
+export const INDEX_MANIFEST_NAME = 'oem-index.json';
+const INDEX_PREFIX = 'oem-index-';
+
+// Writes whose statement started before the copy but committed after it are
+// not in the index; back-dating the snapshot keeps them in the overlay.
+const SNAPSHOT_MARGIN = '-60 seconds';
+
+export interface OEMIndexBuildOptions {
+    source: string;
+    out: string;
+    keep: number;
+}
+
+export interface OEMIndexManifest {
+    version: string;
+    file: string;
+    sha256: string;
+    bytes: number;
+    records: number;
+    supersessions: number;
+    builtAt: string;
+    snapshotAt: string;
+}
+
+export interface OEMIndexBuildResult extends OEMIndexManifest {
+    path: string;
+    removed: string[];
+    durationMs: number;
+}
+
+export function buildOemIndex({ source, out, keep }: OEMIndexBuildOptions): OEMIndexBuildResult {
+    if (!fs.existsSync(source)) {
+        throw new Error(`Source database not found: ${source}`);
+    }
+    if (!fs.existsSync(out)) {
+        fs.mkdirSync(out, { recursive: true });
+    }
+
+    const started = Date.now();
+    const version = `${new Date().toISOString().replace(/[-:TZ]/g, '').slice(0, 14)}-${crypto.randomBytes(3).toString('hex')}`;
+    const fileName = `${INDEX_PREFIX}${version}.sqlite`;
+    const tmpPath = path.join(out, `${fileName}.tmp`);
+    const finalPath = path.join(out, fileName);
+
+    const db = new Database(tmpPath);
+    try {
+        // Single writer, throwaway file until the rename → no journal needed
+        db.pragma('journal_mode = OFF');
+        db.pragma('synchronous = OFF');
+        db.pragma('page_size = 4096');
+
+        db.prepare('ATTACH DATABASE ? AS src').run(source);
+
+        // Same schema as OEMDatabase.createTables(), minus the sync triggers
+        db.exec(`
+            CREATE TABLE oem_records (
+                id INTEGER PRIMARY KEY,
+                oem TEXT NOT NULL,
+                brand TEXT NOT NULL,
+                model TEXT,
+                model_code TEXT,
+                year_from INTEGER,
+                year_to INTEGER,
+                part_category TEXT NOT NULL,
+                part_description TEXT,
+                superseded_by TEXT,
+                supersedes TEXT,
+                sources TEXT,
+                confidence REAL DEFAULT 0.5,
+                last_verified TEXT,
+                hit_count INTEGER DEFAULT 0,
+                created_at TEXT,
+                updated_at TEXT
+            );
+
+            CREATE TABLE supersessions (
+                id INTEGER PRIMARY KEY,
+                old_oem TEXT NOT NULL,
+                new_oem TEXT NOT NULL,
+                brand TEXT,
+                source TEXT,
+                verified INTEGER DEFAULT 0,
+                created_at TEXT
+            );
+
+            CREATE TABLE index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        `);
+
+        const copy = db.transaction((): string => {
+            const { snapshotAt } = db.prepare(`SELECT datetime('now', '${SNAPSHOT_MARGIN}') AS snapshotAt`).get() as any;
+            db.exec(`
+                INSERT INTO oem_records
+                SELECT id, oem, brand, model, model_code, year_from, year_to,
+                       part_category, part_description, superseded_by, supersedes,
+                       sources, confidence, last_verified, hit_count, created_at, updated_at
+                FROM src.oem_records
+                ORDER BY id;
+
+                INSERT INTO supersessions
+                SELECT id, old_oem, new_oem, brand, source, verified, created_at
+                FROM src.supersessions
+                ORDER BY id;
+            `);
+            return snapshotAt;
+        });
+        const snapshotAt = copy();
+        db.exec('DETACH DATABASE src');
+
+        // Indexes after the bulk copy: one sorted build instead of row-by-row updates
+        db.exec(`
+            CREATE UNIQUE INDEX idx_oem_brand_category ON oem_records(oem, brand, part_category);
+            CREATE INDEX idx_oem ON oem_records(oem);
+            CREATE INDEX idx_brand ON oem_records(brand);
+            CREATE INDEX idx_brand_model ON oem_records(brand, model);
+            CREATE INDEX idx_brand_category ON oem_records(brand, part_category);
+            CREATE INDEX idx_brand_model_category ON oem_records(brand, model, part_category);
+            CREATE INDEX idx_model_code ON oem_records(model_code);
+
+            CREATE INDEX idx_super_old ON supersessions(old_oem);
+            CREATE INDEX idx_super_new ON supersessions(new_oem);
+        `);
+
+        db.exec(`
+            CREATE VIRTUAL TABLE oem_fts USING fts5(
+                oem, brand, model, part_category, part_description,
+                content='oem_records',
+                content_rowid='id'
+            );
+            INSERT INTO oem_fts(oem_fts) VALUES('rebuild');
+            INSERT INTO oem_fts(oem_fts) VALUES('optimize');
+        `);
+
+        const records = (db.prepare('SELECT COUNT(*) AS count FROM oem_records').get() as any).count;
+        const supersessions = (db.prepare('SELECT COUNT(*) AS count FROM supersessions').get() as any).count;
+        const builtAt = new Date().toISOString();
+
+        const meta = db.prepare('INSERT INTO index_meta (key, value) VALUES (?, ?)');
+        meta.run('version', version);
+        meta.run('built_at', builtAt);
+        meta.run('snapshot_at', snapshotAt);
+        meta.run('records', String(records));
+        meta.run('supersessions', String(supersessions));
+
+        db.exec('ANALYZE');
+        // Rollback journal (not WAL): a read-only open must not need -wal/-shm files
+        db.pragma('journal_mode = DELETE');
+        db.exec('VACUUM');
+        db.close();
+
+        fs.renameSync(tmpPath, finalPath);
+        fs.chmodSync(finalPath, 0o444);
+
+        const sha256 = crypto.createHash('sha256').update(fs.readFileSync(finalPath)).digest('hex');
+        const manifest: OEMIndexManifest = {
+            version,
+            file: fileName,
+            sha256,
+            bytes: fs.statSync(finalPath).size,
+            records,
+            supersessions,
+            builtAt,
+            snapshotAt,
+        };
+
+        const manifestPath = path.join(out, INDEX_MANIFEST_NAME);
+        fs.writeFileSync(`${manifestPath}.tmp`, JSON.stringify(manifest, null, 2));
+        fs.renameSync(`${manifestPath}.tmp`, manifestPath);
+
+        const removed = pruneOldIndexes(out, fileName, keep);
+
+        return { ...manifest, path: finalPath, removed, durationMs: Date.now() - started };
+    } catch (err) {
+        if (db.open) db.close();
+        fs.rmSync(tmpPath, { force: true });
+        throw err;
+    }
+}
+
+/**
+ * Keep the current index plus the newest `keep - 1` previous ones.
+ */
+function pruneOldIndexes(dir: string, current: string, keep: number): string[] {
+    const old = fs.readdirSync(dir)
+        .filter(f => f.startsWith(INDEX_PREFIX) && f.endsWith('.sqlite') && f !== current)
+        .sort()
+        .reverse();
+
+    const removed: string[] = [];
+    for (const f of old.slice(keep - 1)) {
+        fs.rmSync(path.join(dir, f), { force: true });
+        removed.push(f);
+    }
+    return removed;
+}
+
+// Runs inside the build thread; under ts-node / jest the module is still .ts
+const BUILD_THREAD_SOURCE = `
+const { parentPort, workerData } = require('worker_threads');
+if (workerData.module.endsWith('.ts')) require('ts-node').register({ transpileOnly: true });
+parentPort.postMessage(require(workerData.module).buildOemIndex(workerData.options));
+`;
+
+/**
+ * buildOemIndex() on a worker thread. The copy, FTS rebuild, ANALYZE/VACUUM
+ * and checksum take seconds on a full database; off the caller's event loop
+ * they no longer stall bot turns or BullMQ lock renewal.
+ */
+export function buildOemIndexInWorker(options: OEMIndexBuildOptions): Promise<OEMIndexBuildResult> {
+    return new Promise((resolve, reject) => {
+        const worker = new Worker(BUILD_THREAD_SOURCE, {
+            eval: true,
+            workerData: { module: __filename, options },
+        });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        worker.once('exit', code => {
+            if (code !== 0) reject(new Error(`Index build thread exited with code ${code}`));
+        });
+    });
+}
+
@@ -27,6 +27,7 @@ const UNRELIABLE_SOLO_SOURCES = new Set([
     'premium_ai_oem_resolver',
     'ai_inference_unverified',
     'Document-OCR',
+    'gemini_batch',
 ]);
 
 /**
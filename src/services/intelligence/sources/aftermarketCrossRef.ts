@@ -23,6 +23,7 @@ import { isAftermarketNumber } from '../aftermarketFilter';
 import { logger } from '@utils/logger';
 
 const SCRAPER_API_KEY = process.env.SCRAPER_API_KEY;
+const SCRAPER_API_URL = process.env.SCRAPER_API_URL || 'http://api.scraperapi.com';
 const CROSSREF_TIMEOUT = 12000;
 
 // Common aftermarket brand names we can detect in other candidates
@@ -77,7 +78,7 @@ async function searchOemCrossReference(
         // Search for OEM cross-reference
         const query = `"${aftermarketNr}" OEM OE Vergleichsnummer ${brand}`.trim();
         const googleUrl = `https://www.google.de/search?q=${encodeURIComponent(query)}&hl=de&num=10`;
-        const scraperUrl = `http://api.scraperapi.com/?api_key=${SCRAPER_API_KEY}&url=${encodeURIComponent(googleUrl)}&country_code=de`;
+        const scraperUrl = `${SCRAPER_API_URL}/?api_key=${SCRAPER_API_KEY}&url=${encodeURIComponent(googleUrl)}&country_code=de`;
 
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), CROSSREF_TIMEOUT);
@@ -16,6 +16,7 @@ import { logger } from '@utils/logger';
 import { extractOEMsEnhanced } from '../enhancedOemExtractor';
 
 const SCRAPER_API_KEY = process.env.SCRAPER_API_KEY;
+const SCRAPER_API_URL = process.env.SCRAPER_API_URL || 'http://api.scraperapi.com';
 const VERIFY_TIMEOUT = 10000;
 
 // Parts sites that indicate a REAL OEM number exists
@@ -70,7 +71,7 @@ export async function verifyOemViaGoogle(
         // Search for the exact OEM number with brand context
         const query = `"${oem}" ${brand} ${model} ${part}`.trim();
         const googleUrl = `https://www.google.de/search?q=${encodeURIComponent(query)}&hl=de&num=10`;
-        const scraperUrl = `http://api.scraperapi.com/?api_key=${SCRAPER_API_KEY}&url=${encodeURIComponent(googleUrl)}&country_code=de`;
+        const scraperUrl = `${SCRAPER_API_URL}/?api_key=${SCRAPER_API_KEY}&url=${encodeURIComponent(googleUrl)}&country_code=de`;
 
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), VERIFY_TIMEOUT);
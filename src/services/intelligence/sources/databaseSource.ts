@@ -11,7 +11,7 @@
 
 import { OEMCandidate, OEMResolverRequest } from "../types";
 import { OEMSource } from "./baseSource";
-import { oemDatabase } from "../oemDatabase";
+import { oemDatabase, OEMLookupResult } from "../oemDatabase";
 import { logger } from "@utils/logger";
 
 /**
@@ -57,6 +57,97 @@ function extractModelCode(model?: string): string | undefined {
     return undefined;
 }
 
+function toCandidates(results: OEMLookupResult[], brand?: string): OEMCandidate[] {
+    return results.map(r => ({
+        oem: r.oem,
+        brand: brand,
+        source: 'enterprise-database',
+        confidence: r.confidence,
+        meta: {
+            description: r.description,
+            supersededBy: r.supersededBy,
+            fromDatabase: true,
+            priority: 8,
+        }
+    }));
+}
+
+/**
+ * Fallback: Full-text search on the query
+ */
+function searchFallback(req: OEMResolverRequest, brand?: string): OEMCandidate[] {
+    const searchQuery = [brand, req.vehicle.model, req.partQuery.rawText]
+        .filter(Boolean)
+        .join(' ');
+
+    const ftsResults = oemDatabase.search(searchQuery, 5);
+
+    if (ftsResults.length > 0) {
+        logger.info(`[DatabaseSource] FTS found ${ftsResults.length} candidates`);
+
+        return ftsResults.map(r => ({
+            oem: r.oem,
+            brand: brand,
+            source: 'enterprise-database-fts',
+            confidence: r.confidence * 0.9, // Slightly lower for FTS matches
+            meta: {
+                description: r.description,
+                supersededBy: r.supersededBy,
+                fromDatabase: true,
+                priority: 8,
+            }
+        }));
+    }
+
+    logger.debug('[DatabaseSource] No matches found in database');
+    return [];
+}
+
+/**
+ * Batch variant of databaseSource.resolveCandidates for many parts of ONE
+ * vehicle (B2B part lists): all categorised parts are answered by a single
+ * multi-category query; only parts without a category or without rows fall
+ * back to the per-part full-text search. Result order matches `reqs`.
+ */
+export function resolveDatabaseCandidatesBatch(reqs: OEMResolverRequest[]): OEMCandidate[][] {
+    if (reqs.length === 0) return [];
+
+    const vehicle = reqs[0].vehicle;
+    const brand = vehicle.make?.toUpperCase();
+    const modelCode = extractModelCode(vehicle.model);
+    const categories = reqs.map(r => mapCategory(r.partQuery.normalizedCategory || r.partQuery.rawText));
+
+    const base = { brand, model: modelCode || vehicle.model, year: vehicle.year, limit: 10 };
+    let byCategory = new Map<string, OEMLookupResult[]>();
+    // Uncategorised parts get the same vehicle-wide rows resolveCandidates would
+    let uncategorised: OEMLookupResult[] = [];
+    try {
+        byCategory = oemDatabase.lookupMany({
+            ...base,
+            categories: categories.filter((c): c is string => !!c),
+        });
+        if (categories.some(c => !c)) uncategorised = oemDatabase.lookup(base);
+        logger.info('[DatabaseSource] Batch lookup', {
+            parts: reqs.length,
+            categories: byCategory.size,
+        });
+    } catch (err: any) {
+        logger.warn('[DatabaseSource] Batch lookup failed', { error: err?.message });
+    }
+
+    return reqs.map((req, i) => {
+        const category = categories[i];
+        const rows = category ? byCategory.get(category) : uncategorised;
+        if (rows && rows.length > 0) return toCandidates(rows, brand);
+        try {
+            return searchFallback(req, brand);
+        } catch (err: any) {
+            logger.warn('[DatabaseSource] Database lookup failed', { error: err?.message });
+            return [];
+        }
+    });
+}
+
 export const databaseSource: OEMSource = {
     name: "enterprise-database",
 
@@ -81,47 +172,10 @@ export const databaseSource: OEMSource = {
 
             if (results.length > 0) {
                 logger.info(`[DatabaseSource] Found ${results.length} candidates in database`);
-
-                return results.map(r => ({
-                    oem: r.oem,
-                    brand: brand,
-                    source: 'enterprise-database',
-                    confidence: r.confidence,
-                    meta: {
-                        description: r.description,
-                        supersededBy: r.supersededBy,
-                        fromDatabase: true,
-                        priority: 8,
-                    }
-                }));
+                return toCandidates(results, brand);
             }
 
-            // Fallback: Full-text search on the query
-            const searchQuery = [brand, model, req.partQuery.rawText]
-                .filter(Boolean)
-                .join(' ');
-
-            const ftsResults = oemDatabase.search(searchQuery, 5);
-
-            if (ftsResults.length > 0) {
-                logger.info(`[DatabaseSource] FTS found ${ftsResults.length} candidates`);
-
-                return ftsResults.map(r => ({
-                    oem: r.oem,
-                    brand: brand,
-                    source: 'enterprise-database-fts',
-                    confidence: r.confidence * 0.9, // Slightly lower for FTS matches
-                    meta: {
-                        description: r.description,
-                        supersededBy: r.supersededBy,
-                        fromDatabase: true,
-                        priority: 8,
-                    }
-                }));
-            }
-
-            logger.debug('[DatabaseSource] No matches found in database');
-            return [];
+            return searchFallback(req, brand);
 
         } catch (err: any) {
             logger.warn('[DatabaseSource] Database lookup failed', { error: err?.message });
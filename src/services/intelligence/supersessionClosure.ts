@@ -0,0 +1,182 @@
+/**
+ * 🔗 SUPERSESSION CLOSURE
+ *
+ * Transitive closure over "old OEM → new OEM" edges: every OEM maps straight
+ * to the terminal (currently orderable) number at the end of its chain and
+ * the number of hops to get there, so resolution is one Map lookup instead
+ * of one query per hop.
+ *
+ * Semantics match the hop-by-hop walk it replaces:
+ *   - an OEM follows its FIRST registered successor; later edges from the
+ *     same OEM are ignored (the SQL walk used `.get()` → lowest rowid)
+ *   - OEMs on or leading into a cycle have no terminal; resolveWithin()
+ *     walks them hop by hop up to maxDepth like the old loop did
+ *
+ * Edges are added incrementally: linking A → B moves A and every OEM that
+ * currently ends at A onto B's terminal in one pass over that group.
+ */
+
+interface ClosureEntry {
+    terminal: string;
+    depth: number;
+}
+
+export class SupersessionClosure {
+    /** First registered successor per OEM */
+    private readonly next = new Map<string, string>();
+    /** OEM → terminal + hop count (absent for terminals and cyclic OEMs) */
+    private readonly entries = new Map<string, ClosureEntry>();
+    /** Terminal → OEMs whose chain ends there */
+    private readonly members = new Map<string, string[]>();
+    /** OEMs on or leading into a cycle */
+    private readonly cyclic = new Set<string>();
+
+    /**
+     * Build from edges in registration order (first edge per OEM wins).
+     */
+    static fromEdges(edges: Iterable<[string, string]>): SupersessionClosure {
+        const closure = new SupersessionClosure();
+        for (const [oldOem, newOem] of edges) {
+            if (oldOem !== newOem && !closure.next.has(oldOem)) closure.next.set(oldOem, newOem);
+        }
+        closure.rebuild();
+        return closure;
+    }
+
+    get size(): number {
+        return this.next.size;
+    }
+
+    /**
+     * Register old → new. Returns false when the edge changes nothing
+     * (self-link, or `oldOem` already has a successor).
+     */
+    add(oldOem: string, newOem: string): boolean {
+        if (oldOem === newOem || this.next.has(oldOem)) return false;
+        this.next.set(oldOem, newOem);
+
+        const group = this.members.get(oldOem) ?? [];
+        this.members.delete(oldOem);
+
+        const target = this.entries.get(newOem);
+        const terminal = target ? target.terminal : newOem;
+
+        if (this.cyclic.has(newOem) || terminal === oldOem) {
+            // Closing a loop, or feeding into one: the whole group loses its terminal
+            for (const oem of [oldOem, ...group]) {
+                this.entries.delete(oem);
+                this.cyclic.add(oem);
+            }
+            return true;
+        }
+
+        const shift = 1 + (target ? target.depth : 0);
+        this.entries.set(oldOem, { terminal, depth: shift });
+        for (const oem of group) {
+            const entry = this.entries.get(oem)!;
+            entry.terminal = terminal;
+            entry.depth += shift;
+        }
+
+        let list = this.members.get(terminal);
+        if (!list) {
+            list = [];
+            this.members.set(terminal, list);
+        }
+        list.push(oldOem, ...group);
+        return true;
+    }
+
+    /**
+     * Terminal OEM and hop count; an OEM without successor resolves to itself
+     * at depth 0. Cyclic OEMs report depth -1 and themselves as terminal.
+     */
+    resolve(oem: string): { current: string; depth: number } {
+        const entry = this.entries.get(oem);
+        if (entry) return { current: entry.terminal, depth: entry.depth };
+        return { current: oem, depth: this.cyclic.has(oem) ? -1 : 0 };
+    }
+
+    /**
+     * Where the old bounded walk (at most `maxDepth` hops) would end.
+     * O(1) unless the chain is longer than maxDepth or cyclic.
+     */
+    resolveWithin(oem: string, maxDepth: number): string {
+        const entry = this.entries.get(oem);
+        if (entry && entry.depth <= maxDepth) return entry.terminal;
+        if (!entry && !this.cyclic.has(oem)) return oem;
+
+        let current = oem;
+        for (let depth = 0; depth < maxDepth; depth++) {
+            const successor = this.next.get(current);
+            if (successor === undefined) break;
+            current = successor;
+        }
+        return current;
+    }
+
+    /**
+     * Chain from `oem` forward to its terminal (inclusive), stopping at a revisit.
+     */
+    chain(oem: string): string[] {
+        const chain = [oem];
+        const seen = new Set(chain);
+        let successor = this.next.get(oem);
+        while (successor !== undefined && !seen.has(successor)) {
+            chain.push(successor);
+            seen.add(successor);
+            successor = this.next.get(successor);
+        }
+        return chain;
+    }
+
+    /**
+     * Full recompute from `next`: each OEM is visited once, chains are
+     * resolved back to front along an explicit path stack.
+     */
+    private rebuild(): void {
+        this.entries.clear();
+        this.members.clear();
+        this.cyclic.clear();
+
+        const done = new Set<string>();
+        for (const start of this.next.keys()) {
+            if (done.has(start)) continue;
+
+            const path: string[] = [];
+            const onPath = new Set<string>();
+            let current: string | undefined = start;
+            while (current !== undefined && this.next.has(current) && !done.has(current) && !onPath.has(current)) {
+                path.push(current);
+                onPath.add(current);
+                current = this.next.get(current);
+            }
+
+            // current is a terminal, an already-resolved OEM, or a node on the path (cycle)
+            let terminal: string | undefined;
+            let depth = 0;
+            if (current !== undefined && !onPath.has(current) && !this.cyclic.has(current)) {
+                const known = this.entries.get(current);
+                terminal = known ? known.terminal : current;
+                depth = known ? known.depth : 0;
+            }
+
+            for (let i = path.length - 1; i >= 0; i--) {
+                const oem = path[i];
+                done.add(oem);
+                if (terminal === undefined) {
+                    this.cyclic.add(oem);
+                    continue;
+                }
+                depth++;
+                this.entries.set(oem, { terminal, depth });
+                let list = this.members.get(terminal);
+                if (!list) {
+                    list = [];
+                    this.members.set(terminal, list);
+                }
+                list.push(oem);
+            }
+        }
+    }
+}
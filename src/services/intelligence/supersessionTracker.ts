@@ -11,6 +11,7 @@
  */
 
 import { logger } from "@utils/logger";
+import { SupersessionClosure } from "./supersessionClosure";
 
 // ============================================================================
 // Supersession Types
@@ -171,6 +172,16 @@ const ALL_SUPERSESSIONS: Record<string, SupersessionChain> = {
     ...MERCEDES_SUPERSESSIONS,
 };
 
+/**
+ * Every link of every known chain, so intermediate revisions (e.g. 5Q0698151C)
+ * and chains learned in any order resolve straight to the current OEM.
+ */
+const CLOSURE = SupersessionClosure.fromEdges(
+    Object.values(ALL_SUPERSESSIONS).flatMap(c =>
+        c.chain.slice(1).map((next, i) => [c.chain[i], next] as [string, string])
+    )
+);
+
 // ============================================================================
 // Resolution Functions
 // ============================================================================
@@ -190,9 +201,10 @@ export interface SupersessionResult {
 export function checkSupersession(oem: string): SupersessionResult {
     const normalized = oem.replace(/[\s\-\.]/g, '').toUpperCase();
 
-    const chain = ALL_SUPERSESSIONS[normalized];
+    const known = ALL_SUPERSESSIONS[normalized];
+    const { current } = CLOSURE.resolve(normalized);
 
-    if (!chain) {
+    if (!known && current === normalized) {
         return {
             found: false,
             originalOEM: normalized,
@@ -201,11 +213,20 @@ export function checkSupersession(oem: string): SupersessionResult {
         };
     }
 
-    const isOutdated = normalized !== chain.current;
+    // The closure decides the current OEM; a stored chain that predates a
+    // learned link only contributes its metadata
+    const chain: SupersessionChain = known && known.current === current ? known : {
+        original: known?.original ?? normalized,
+        current,
+        chain: CLOSURE.chain(normalized),
+        reason: known?.reason,
+        interchangeable: known?.interchangeable ?? true,
+    };
+    const isOutdated = normalized !== current;
 
     logger.info("[Supersession] Check result", {
         originalOEM: normalized,
-        currentOEM: chain.current,
+        currentOEM: current,
         isOutdated,
         chainLength: chain.chain.length,
     });
@@ -213,11 +234,11 @@ export function checkSupersession(oem: string): SupersessionResult {
     return {
         found: true,
         originalOEM: normalized,
-        currentOEM: chain.current,
+        currentOEM: current,
         supersessionChain: chain,
         isOutdated,
         message: isOutdated
-            ? `OEM ${normalized} wurde ersetzt durch ${chain.current}${chain.reason ? ` (${chain.reason})` : ''}`
+            ? `OEM ${normalized} wurde ersetzt durch ${current}${chain.reason ? ` (${chain.reason})` : ''}`
             : `OEM ${normalized} ist aktuell`,
     };
 }
@@ -226,8 +247,7 @@ export function checkSupersession(oem: string): SupersessionResult {
  * Resolve to current OEM
  */
 export function resolveToCurrentOEM(oem: string): string {
-    const result = checkSupersession(oem);
-    return result.currentOEM;
+    return CLOSURE.resolve(oem.replace(/[\s\-\.]/g, '').toUpperCase()).current;
 }
 
 /**
@@ -278,6 +298,20 @@ export function registerSupersession(
     const normOld = oldOEM.replace(/[\s\-\.]/g, '').toUpperCase();
     const normNew = newOEM.replace(/[\s\-\.]/g, '').toUpperCase();
 
+    // A newer registration supersedes the current end of oldOEM's chain, so
+    // A → C on top of A → B reads as A → B → C everywhere
+    const terminal = CLOSURE.resolve(normOld).current;
+    if (normOld !== normNew && !CLOSURE.chain(normOld).includes(normNew)) {
+        if (CLOSURE.resolve(normNew).current === terminal) {
+            logger.warn("[Supersession] Rejected link that would close a loop", {
+                oldOEM: normOld,
+                newOEM: normNew,
+            });
+            return;
+        }
+        CLOSURE.add(terminal, normNew);
+    }
+
     // Check if oldOEM already has a chain
     const existingChain = ALL_SUPERSESSIONS[normOld];
 
@@ -285,14 +319,14 @@ export function registerSupersession(
         // Extend existing chain
         if (!existingChain.chain.includes(normNew)) {
             existingChain.chain.push(normNew);
-            existingChain.current = normNew;
+            existingChain.current = CLOSURE.resolve(normOld).current;
         }
     } else {
         // Create new chain
         ALL_SUPERSESSIONS[normOld] = {
             original: normOld,
-            current: normNew,
-            chain: [normOld, normNew],
+            current: CLOSURE.resolve(normOld).current,
+            chain: CLOSURE.chain(normOld),
             reason,
             interchangeable: true,
         };
@@ -37,6 +37,8 @@ export interface OEMResolverResult {
   candidates: OEMCandidate[];
   overallConfidence: number;
   notes?: string;
+  /** APEX phase that produced the result, e.g. "database", "claude_adversary" */
+  apexPhase?: string;
 
   // Deep OEM Resolution (10/10 Premium)
   deepResolution?: {
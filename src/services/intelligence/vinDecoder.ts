@@ -8,6 +8,10 @@
  * - PR-Codes (VAG-specific options)
  * - Motorcode extraction
  * - Production year/month
+ *
+ * Decodes are cached per input string (decodeVIN) and per VIN (NHTSA), so
+ * the repeated lookups of one conversation cost a Map hit. Fleet imports go
+ * through decodeVINBatch(), which shares the same table-driven decode core.
  */
 
 import { logger } from "@utils/logger";
@@ -106,6 +110,48 @@ const VIN_YEAR_CODES: Record<string, number> = {
     '5': 2005, '6': 2006, '7': 2007, '8': 2008, '9': 2009,
 };
 
+// ============================================================================
+// Lookup Tables (derived once from the maps above)
+// ============================================================================
+
+type WMIInfo = { brand: string; group: string };
+
+const WMI_LOOKUP = new Map<string, WMIInfo>(Object.entries(WMI_MANUFACTURERS));
+
+// Fallback by first two characters: first WMI with that prefix, in table order
+const WMI_PREFIX_LOOKUP = new Map<string, WMIInfo>();
+for (const [key, info] of Object.entries(WMI_MANUFACTURERS)) {
+    const prefix = key.substring(0, 2);
+    if (!WMI_PREFIX_LOOKUP.has(prefix)) WMI_PREFIX_LOOKUP.set(prefix, info);
+}
+
+// Char code → model year (0 = unknown)
+const YEAR_BY_CHAR = new Uint16Array(128);
+for (const [char, year] of Object.entries(VIN_YEAR_CODES)) {
+    YEAR_BY_CHAR[char.charCodeAt(0)] = year;
+}
+
+// Char code → 1 if allowed in a VIN (A-Z without I, O, Q; 0-9)
+const VIN_CHAR = new Uint8Array(128);
+for (const char of 'ABCDEFGHJKLMNPRSTUVWXYZ0123456789') {
+    VIN_CHAR[char.charCodeAt(0)] = 1;
+}
+
+// ============================================================================
+// Caches
+// ============================================================================
+
+/** decodeVIN() results by raw input (LRU) */
+const DECODE_CACHE_SIZE = 1000;
+const decodeCache = new Map<string, VINDecodeResult>();
+
+/** NHTSA answers by normalized VIN; failures are kept shorter so they get retried */
+const NHTSA_CACHE_SIZE = 500;
+const NHTSA_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+const NHTSA_NEGATIVE_TTL_MS = 5 * 60 * 1000;
+const nhtsaCache = new Map<string, { result: NHTSADecodeResult | null; expiresAt: number }>();
+const nhtsaInFlight = new Map<string, Promise<NHTSADecodeResult | null>>();
+
 // ============================================================================
 // VIN Decoding Types
 // ============================================================================
@@ -168,14 +214,38 @@ function validateVIN(vin: string): { valid: boolean; errors: string[] } {
 // ============================================================================
 
 /**
- * Decode a VIN into its components
+ * Uppercase and drop everything that cannot appear in a VIN.
+ * Clean input (the common case) skips the regex.
  */
-export function decodeVIN(vin: string): VINDecodeResult {
-    const normalized = vin.toUpperCase().replace(/[^A-HJ-NPR-Z0-9]/g, '');
-    const validation = validateVIN(normalized);
+function normalizeVIN(vin: string): string {
+    const upper = vin.toUpperCase();
+    for (let i = 0; i < upper.length; i++) {
+        const code = upper.charCodeAt(i);
+        if (code >= 128 || VIN_CHAR[code] === 0) {
+            return upper.replace(/[^A-HJ-NPR-Z0-9]/g, '');
+        }
+    }
+    return upper;
+}
+
+/**
+ * Decoded results are cached/shared — hand out copies callers may mutate
+ */
+function copyResult(result: VINDecodeResult): VINDecodeResult {
+    return { ...result, errors: [...result.errors] };
+}
+
+/**
+ * Decode a normalized VIN (no logging, no caching)
+ */
+function decodeNormalized(normalized: string): VINDecodeResult {
+    // Same outcome as validateVIN(): normalized input cannot contain I, O, Q,
+    // so only emptiness and length are left to check
+    const errors = normalized.length === VIN_LENGTH ? []
+        : [normalized ? `VIN muss 17 Zeichen haben (gefunden: ${normalized.length})` : "VIN ist leer"];
 
     const result: VINDecodeResult = {
-        valid: validation.valid,
+        valid: errors.length === 0,
         vin: normalized,
         wmi: normalized.substring(0, 3),
         vds: normalized.substring(3, 9),
@@ -186,46 +256,93 @@ export function decodeVIN(vin: string): VINDecodeResult {
         plantCode: normalized.charAt(10) || '',
         serialNumber: normalized.substring(11, 17) || '',
         isVAG: false,
-        errors: validation.errors,
+        errors,
     };
 
-    if (!validation.valid) {
+    if (errors.length > 0) {
         return result;
     }
 
-    // Decode WMI → Brand
-    const wmiInfo = WMI_MANUFACTURERS[result.wmi];
+    // Decode WMI → Brand (exact, else first 2 characters for broader match)
+    const wmiInfo = WMI_LOOKUP.get(result.wmi) ?? WMI_PREFIX_LOOKUP.get(result.wmi.substring(0, 2));
     if (wmiInfo) {
         result.brand = wmiInfo.brand;
         result.group = wmiInfo.group;
         result.isVAG = wmiInfo.group === 'VAG';
-    } else {
-        // Try first 2 characters for broader match
-        const wmi2 = result.wmi.substring(0, 2);
-        for (const [key, info] of Object.entries(WMI_MANUFACTURERS)) {
-            if (key.startsWith(wmi2)) {
-                result.brand = info.brand;
-                result.group = info.group;
-                result.isVAG = info.group === 'VAG';
-                break;
-            }
-        }
     }
 
     // Decode year (Position 10)
-    const yearChar = normalized.charAt(9);
-    if (VIN_YEAR_CODES[yearChar]) {
-        result.year = VIN_YEAR_CODES[yearChar];
+    const year = YEAR_BY_CHAR[normalized.charCodeAt(9)];
+    if (year) {
+        result.year = year;
     }
 
-    logger.info("[VIN Decoder] Decoded", {
-        vin: normalized,
-        brand: result.brand,
-        year: result.year,
-        isVAG: result.isVAG,
+    return result;
+}
+
+/**
+ * Decode a VIN into its components
+ */
+export function decodeVIN(vin: string): VINDecodeResult {
+    const cached = decodeCache.get(vin);
+    if (cached) {
+        // Refresh LRU position
+        decodeCache.delete(vin);
+        decodeCache.set(vin, cached);
+        return copyResult(cached);
+    }
+
+    const result = decodeNormalized(normalizeVIN(vin));
+
+    if (result.valid) {
+        logger.info("[VIN Decoder] Decoded", {
+            vin: result.vin,
+            brand: result.brand,
+            year: result.year,
+            isVAG: result.isVAG,
+        });
+    }
+
+    if (decodeCache.size >= DECODE_CACHE_SIZE) {
+        decodeCache.delete(decodeCache.keys().next().value!);
+    }
+    decodeCache.set(vin, result);
+
+    return copyResult(result);
+}
+
+/**
+ * Decode many VINs (fleet imports) in one pass. Results equal decodeVIN()
+ * per entry, in input order; duplicates are decoded once, nothing is logged
+ * per VIN and the conversation cache is left alone.
+ */
+export function decodeVINBatch(vins: string[]): VINDecodeResult[] {
+    const start = Date.now();
+    const byVin = new Map<string, VINDecodeResult>();
+    const results = new Array<VINDecodeResult>(vins.length);
+    let valid = 0;
+
+    for (let i = 0; i < vins.length; i++) {
+        const normalized = normalizeVIN(vins[i]);
+        let decoded = byVin.get(normalized);
+        if (decoded) {
+            decoded = copyResult(decoded);
+        } else {
+            decoded = decodeNormalized(normalized);
+            byVin.set(normalized, decoded);
+        }
+        if (decoded.valid) valid++;
+        results[i] = decoded;
+    }
+
+    logger.info("[VIN Decoder] Batch decoded", {
+        count: vins.length,
+        unique: byVin.size,
+        valid,
+        latencyMs: Date.now() - start,
     });
 
-    return result;
+    return results;
 }
 
 // ============================================================================
@@ -268,7 +385,7 @@ export function extractVAGMotorcode(vin: string): string | undefined {
     if (!decoded.valid || !decoded.isVAG) return undefined;
 
     // Engine code is typically in VDS positions 5-6 (VIN chars 7-8)
-    const engineKey = vin.substring(6, 8).toUpperCase();
+    const engineKey = decoded.vin.substring(6, 8);
     const engineInfo = VAG_ENGINE_CODES[engineKey];
 
     if (engineInfo) {
@@ -369,12 +486,37 @@ export interface NHTSADecodeResult {
  * Cost: FREE, no API key needed, no rate limits
  */
 export async function decodeVinNhtsa(vin: string): Promise<NHTSADecodeResult | null> {
-    const normalized = vin.toUpperCase().replace(/[^A-HJ-NPR-Z0-9]/g, '');
+    const normalized = normalizeVIN(vin);
     if (normalized.length !== 17) {
         logger.warn('[NHTSA] Invalid VIN length', { vin, length: normalized.length });
         return null;
     }
 
+    const cached = nhtsaCache.get(normalized);
+    if (cached && cached.expiresAt > Date.now()) {
+        return cached.result;
+    }
+
+    // Concurrent callers for the same VIN share one request
+    let pending = nhtsaInFlight.get(normalized);
+    if (!pending) {
+        pending = fetchVinNhtsa(normalized).then(result => {
+            nhtsaCache.delete(normalized);
+            if (nhtsaCache.size >= NHTSA_CACHE_SIZE) {
+                nhtsaCache.delete(nhtsaCache.keys().next().value!);
+            }
+            nhtsaCache.set(normalized, {
+                result,
+                expiresAt: Date.now() + (result ? NHTSA_CACHE_TTL_MS : NHTSA_NEGATIVE_TTL_MS),
+            });
+            return result;
+        }).finally(() => nhtsaInFlight.delete(normalized));
+        nhtsaInFlight.set(normalized, pending);
+    }
+    return pending;
+}
+
+async function fetchVinNhtsa(normalized: string): Promise<NHTSADecodeResult | null> {
     try {
         const url = `https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValues/${normalized}?format=json`;
         const controller = new AbortController();
@@ -391,7 +533,7 @@ export async function decodeVinNhtsa(vin: string): Promise<NHTSADecodeResult | n
         const data = await response.json() as any;
         const results = data?.Results?.[0];
         if (!results) {
-            logger.warn('[NHTSA] No results', { vin });
+            logger.warn('[NHTSA] No results', { vin: normalized });
             return null;
         }
 
@@ -431,9 +573,9 @@ export async function decodeVinNhtsa(vin: string): Promise<NHTSADecodeResult | n
         return result;
     } catch (err: any) {
         if (err?.name === 'AbortError') {
-            logger.warn('[NHTSA] Request timed out', { vin });
+            logger.warn('[NHTSA] Request timed out', { vin: normalized });
         } else {
-            logger.warn('[NHTSA] API call failed', { vin, error: err?.message });
+            logger.warn('[NHTSA] API call failed', { vin: normalized, error: err?.message });
         }
         return null;
     }
@@ -469,6 +611,7 @@ export async function decodeVinEnriched(vin: string): Promise<VINDecodeResult &
 
 export default {
     decodeVIN,
+    decodeVINBatch,
     validateVIN,
     extractVAGMotorcode,
     extractPRCodes,
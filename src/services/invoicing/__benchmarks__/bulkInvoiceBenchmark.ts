@@ -0,0 +1,83 @@
+/**
+ * Bulk Invoice Benchmark
+ *
+ * Creates invoices for N synthetic orders (default 10,000) with
+ * createInvoicesBulk() and, for comparison, a sample with the per-invoice
+ * createInvoice() path; then streams PDFs for a sample through
+ * iterateInvoices() → generateInvoicePDFs().
+ *
+ * Run against a local database only: it creates invoices (and WORM audit
+ * entries) for a throwaway tenant. Invoices and the sequence are removed
+ * afterwards; audit entries cannot be.
+ *
+ * Usage: DATABASE_URL=postgres://localhost:5432/postgres LOG_LEVEL=warn \
+ *   ts-node -r tsconfig-paths/register src/services/invoicing/__benchmarks__/bulkInvoiceBenchmark.ts [orders] [sequentialSample] [pdfSample]
+ */
+
+import { randomUUID } from 'crypto';
+import { db, closePool } from '@core/database';
+import { closeAuditSinks } from '../../compliance/auditSink';
+import type { CreateInvoiceRequest } from '../../../types/tax';
+import { createInvoice, createInvoicesBulk, iterateInvoices } from '../invoiceService';
+import { generateInvoicePDFs } from '../pdfGenerator';
+
+const ORDERS = Number(process.argv[2] || 10_000);
+const SEQUENTIAL_SAMPLE = Number(process.argv[3] || 500);
+const PDF_SAMPLE = Number(process.argv[4] || 200);
+const TENANT = `benchmark-${randomUUID()}`;
+
+function buildRequest(i: number): CreateInvoiceRequest {
+  // 1–5 lines per order, mixed tax rates
+  return {
+    issue_date: new Date().toISOString().split('T')[0],
+    customer_name: `Kunde ${i}`,
+    source_order_id: `bench-order-${i}`,
+    lines: Array.from({ length: 1 + (i % 5) }, (_, j) => ({
+      description: `Bremsscheibe ${i}-${j}`,
+      quantity: 1 + (j % 3),
+      unit_price: 19.99 + j * 10,
+      tax_rate: j % 4 === 3 ? 7 : 19,
+    })),
+  };
+}
+
+function report(label: string, count: number, startNs: bigint): void {
+  const seconds = Number(process.hrtime.bigint() - startNs) / 1e9;
+  console.log(`${label.padEnd(28)} ${String(count).padStart(7)} ${seconds.toFixed(2).padStart(8)}s ${Math.round(count / seconds).toLocaleString().padStart(9)}/s`);
+}
+
+async function run(): Promise<void> {
+  console.log(`Bulk invoice benchmark: tenant ${TENANT}`);
+  try {
+    let start = process.hrtime.bigint();
+    for (let i = 0; i < SEQUENTIAL_SAMPLE; i++) {
+      await createInvoice(TENANT, { ...buildRequest(i), source_order_id: `bench-seq-${i}` });
+    }
+    report('createInvoice (sequential)', SEQUENTIAL_SAMPLE, start);
+
+    const requests = Array.from({ length: ORDERS }, (_, i) => buildRequest(i));
+    start = process.hrtime.bigint();
+    const created = await createInvoicesBulk(TENANT, requests);
+    report('createInvoicesBulk', created.length, start);
+    console.log(`  numbers ${created[0].invoice_number} … ${created[created.length - 1].invoice_number}`);
+
+    start = process.hrtime.bigint();
+    let bytes = 0;
+    const ids = created.slice(0, PDF_SAMPLE).map(invoice => invoice.id);
+    for await (const { pdf } of generateInvoicePDFs(TENANT, iterateInvoices(TENANT, ids))) {
+      bytes += pdf.length;
+    }
+    report('PDF stream', ids.length, start);
+    console.log(`  ${(bytes / ids.length / 1024).toFixed(1)} KiB per PDF`);
+  } finally {
+    await db.run('DELETE FROM invoices WHERE tenant_id = ?', [TENANT]);
+    await db.run('DELETE FROM invoice_sequences WHERE tenant_id = ?', [TENANT]);
+    await closeAuditSinks();
+    await closePool();
+  }
+}
+
+run().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
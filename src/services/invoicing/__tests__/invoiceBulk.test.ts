@@ -0,0 +1,111 @@
+jest.mock('@utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+jest.mock('../../compliance/auditService', () => ({ auditLog: jest.fn().mockResolvedValue(undefined) }));
+jest.mock('../../tax/taxCalculator', () => ({ getInvoiceTaxDays: jest.fn(), refreshTaxSnapshots: jest.fn() }));
+
+const mockQuery = jest.fn();
+const mockRelease = jest.fn();
+jest.mock('@core/database', () => ({
+    db: { run: jest.fn(), get: jest.fn(), all: jest.fn() },
+    getDb: () => ({ connect: async () => ({ query: mockQuery, release: mockRelease }) }),
+}));
+
+import { createInvoicesBulk } from '../invoiceService';
+import { auditLog } from '../../compliance/auditService';
+import { refreshTaxSnapshots } from '../../tax/taxCalculator';
+import type { CreateInvoiceRequest } from '../../../types/tax';
+
+const request = (i: number, lines = 1): CreateInvoiceRequest => ({
+    issue_date: '2026-01-15',
+    customer_name: `Kunde ${i}`,
+    source_order_id: `order-${i}`,
+    lines: Array.from({ length: lines }, (_, j) => ({
+        description: `Teil ${j}`,
+        quantity: 2,
+        unit_price: 10,
+        tax_rate: 19 as const,
+    })),
+});
+
+describe('createInvoicesBulk', () => {
+    beforeEach(() => {
+        mockQuery.mockReset();
+        mockRelease.mockReset();
+        (auditLog as jest.Mock).mockClear();
+        (refreshTaxSnapshots as jest.Mock).mockClear();
+        mockQuery.mockImplementation(async (sql: string, params?: unknown[]) => {
+            if (sql.includes('invoice_sequences')) return { rows: [{ last_value: 40 + (params![2] as number) }] };
+            return { rows: [] };
+        });
+    });
+
+    it('reserves a contiguous block of numbers in one statement', async () => {
+        const created = await createInvoicesBulk('tenant-1', [request(1), request(2), request(3)]);
+        const year = new Date().getFullYear();
+
+        expect(created.map(c => c.invoice_number)).toEqual([`RE-${year}-00041`, `RE-${year}-00042`, `RE-${year}-00043`]);
+        expect(created.map(c => c.source_order_id)).toEqual(['order-1', 'order-2', 'order-3']);
+        expect(created[0].gross_amount).toBe(23.8);
+        expect(mockQuery.mock.calls.filter(([sql]) => sql.includes('invoice_sequences'))).toHaveLength(1);
+        expect(refreshTaxSnapshots).toHaveBeenCalledWith('tenant-1', created.map(c => c.id));
+    });
+
+    it('inserts headers and lines as multi-row statements in one transaction', async () => {
+        await createInvoicesBulk('tenant-1', [request(1, 2), request(2, 3)]);
+        const statements = mockQuery.mock.calls.map(([sql]) => (sql as string).trim().split(/\s+/).slice(0, 3).join(' '));
+
+        expect(statements).toEqual([
+            'BEGIN',
+            'INSERT INTO invoice_sequences',
+            'INSERT INTO invoices',
+            'INSERT INTO invoice_lines',
+            'COMMIT',
+        ]);
+        const lineInsert = mockQuery.mock.calls[3];
+        expect(lineInsert[1]).toHaveLength(5 * 9);
+        expect(mockRelease).toHaveBeenCalledTimes(1);
+    });
+
+    it('keeps explicit invoice numbers and only reserves the rest', async () => {
+        const created = await createInvoicesBulk('tenant-1', [
+            { ...request(1), invoice_number: 'MANUAL-1' },
+            request(2),
+        ]);
+
+        expect(created[0].invoice_number).toBe('MANUAL-1');
+        expect(mockQuery.mock.calls[1][1]).toEqual(['tenant-1', new Date().getFullYear(), 1]);
+    });
+
+    it('splits large batches into chunks below the parameter limit', async () => {
+        await createInvoicesBulk('tenant-1', Array.from({ length: 2500 }, (_, i) => request(i)));
+        const invoiceInserts = mockQuery.mock.calls.filter(([sql]) => /INSERT INTO invoices\s/.test(sql));
+
+        expect(invoiceInserts.map(([, params]) => params.length / 16)).toEqual([1000, 1000, 500]);
+    });
+
+    it('rolls back and writes no audit entries when an insert fails', async () => {
+        mockQuery.mockImplementation(async (sql: string) => {
+            if (sql.includes('INSERT INTO invoice_lines')) throw new Error('disk full');
+            return { rows: [{ last_value: 1 }] };
+        });
+
+        await expect(createInvoicesBulk('tenant-1', [request(1)])).rejects.toThrow('disk full');
+        expect(mockQuery.mock.calls.map(([sql]) => sql)).toContain('ROLLBACK');
+        expect(auditLog).not.toHaveBeenCalled();
+        expect(mockRelease).toHaveBeenCalledTimes(1);
+    });
+
+    it('validates every request before touching the database', async () => {
+        await expect(createInvoicesBulk('tenant-1', [request(1), { ...request(2), lines: [] }]))
+            .rejects.toThrow('Invoice 2: Invoice must have at least one line item');
+        expect(mockQuery).not.toHaveBeenCalled();
+    });
+
+    it('audits every invoice and waits for the last entry', async () => {
+        await createInvoicesBulk('tenant-1', [request(1), request(2)]);
+        const calls = (auditLog as jest.Mock).mock.calls;
+
+        expect(calls).toHaveLength(2);
+        expect(calls[0][5].sync).toBe(false);
+        expect(calls[1][5].sync).toBe(true);
+    });
+});
@@ -2,7 +2,8 @@
 // Handles invoice creation, updates, and retrieval with tax calculations
 
 import { randomUUID } from 'crypto';
-import { db } from '@core/database';
+import type { PoolClient } from 'pg';
+import { db, getDb } from '@core/database';
 import type {
     Invoice,
     InvoiceLine,
@@ -13,11 +14,19 @@ import type {
     InvoiceStatus
 } from '../../types/tax';
 import { auditLog } from '../compliance/auditService';
+import { getInvoiceTaxDays, refreshTaxSnapshots } from '../tax/taxCalculator';
 import { logger } from '@utils/logger';
 
+/** Rows per multi-row INSERT — Postgres allows at most 65535 bind parameters per statement */
+const BULK_INVOICE_CHUNK = 1000;
+const BULK_LINE_CHUNK = 2000;
+
+function formatInvoiceNumber(year: number, value: number): string {
+    return `RE-${year}-${value.toString().padStart(5, '0')}`;
+}
+
 export async function generateInvoiceNumber(tenantId: string): Promise<string> {
     const year = new Date().getFullYear();
-    const prefix = `RE-${year}-`;
 
     // Atomic increment for GoBD compliance
     const result = await db.get<{ last_value: number }>(
@@ -30,7 +39,29 @@ export async function generateInvoiceNumber(tenantId: string): Promise<string> {
     );
 
     const nextNumber = result?.last_value || 1;
-    return `${prefix}${nextNumber.toString().padStart(5, '0')}`;
+    return formatInvoiceNumber(year, nextNumber);
+}
+
+/**
+ * Reserve `count` consecutive invoice numbers with a single statement.
+ * Must run inside the transaction that inserts the invoices: a rollback
+ * also returns the numbers, so the sequence stays gap-free (GoBD).
+ */
+export async function reserveInvoiceNumbers(client: PoolClient, tenantId: string, count: number): Promise<string[]> {
+    if (count <= 0) return [];
+    const year = new Date().getFullYear();
+
+    const result = await client.query<{ last_value: number }>(
+        `INSERT INTO invoice_sequences (tenant_id, year, last_value)
+         VALUES ($1, $2, $3)
+         ON CONFLICT (tenant_id, year)
+         DO UPDATE SET last_value = invoice_sequences.last_value + EXCLUDED.last_value
+         RETURNING last_value`,
+        [tenantId, year, count]
+    );
+
+    const last = Number(result.rows[0].last_value);
+    return Array.from({ length: count }, (_, i) => formatInvoiceNumber(year, last - count + 1 + i));
 }
 
 /**
@@ -58,14 +89,9 @@ function calculateInvoiceTotals(lines: Array<{ quantity: number; unit_price: num
 }
 
 /**
- * Create a new invoice
+ * Validate an invoice request, throwing on the first problem
  */
-export async function createInvoice(tenantId: string, data: CreateInvoiceRequest): Promise<Invoice> {
-    // Validation
-    if (!tenantId) {
-        throw new Error('Tenant ID is required');
-    }
-
+function validateInvoiceRequest(data: CreateInvoiceRequest): void {
     if (!data.lines || data.lines.length === 0) {
         throw new Error('Invoice must have at least one line item');
     }
@@ -85,6 +111,18 @@ export async function createInvoice(tenantId: string, data: CreateInvoiceRequest
             throw new Error('Invalid tax rate. Must be 0, 7, or 19');
         }
     }
+}
+
+/**
+ * Create a new invoice
+ */
+export async function createInvoice(tenantId: string, data: CreateInvoiceRequest): Promise<Invoice> {
+    // Validation
+    if (!tenantId) {
+        throw new Error('Tenant ID is required');
+    }
+
+    validateInvoiceRequest(data);
 
     const id = randomUUID();
     const now = new Date().toISOString();
@@ -146,6 +184,8 @@ export async function createInvoice(tenantId: string, data: CreateInvoiceRequest
         );
     }
 
+    await refreshTaxSnapshots(tenantId, [id]);
+
     // GoBD Audit Log
     try {
         await auditLog(
@@ -170,6 +210,159 @@ export async function createInvoice(tenantId: string, data: CreateInvoiceRequest
     return getInvoiceById(tenantId, id);
 }
 
+export interface BulkCreatedInvoice {
+    id: string;
+    invoice_number: string;
+    source_order_id?: string;
+    gross_amount: number;
+}
+
+async function insertRows(client: PoolClient, head: string, rows: unknown[][], chunk: number): Promise<void> {
+    for (let start = 0; start < rows.length; start += chunk) {
+        const params: unknown[] = [];
+        const tuples = rows.slice(start, start + chunk).map(row => `(${row.map(value => {
+            params.push(value);
+            return `$${params.length}`;
+        }).join(', ')})`);
+        await client.query(`${head} VALUES ${tuples.join(', ')}`, params);
+    }
+}
+
+/**
+ * Create many invoices in one transaction: one statement reserves the
+ * invoice numbers, headers and lines go in as multi-row INSERTs. Either
+ * all invoices are created or none (and no number is consumed).
+ *
+ * Returns the created invoices in request order; use iterateInvoices()
+ * to load them with lines, e.g. for generateInvoicePDFs().
+ */
+export async function createInvoicesBulk(tenantId: string, requests: CreateInvoiceRequest[]): Promise<BulkCreatedInvoice[]> {
+    if (!tenantId) {
+        throw new Error('Tenant ID is required');
+    }
+    if (requests.length === 0) return [];
+
+    requests.forEach((data, i) => {
+        try {
+            validateInvoiceRequest(data);
+        } catch (err: any) {
+            throw new Error(`Invoice ${i + 1}: ${err.message}`);
+        }
+    });
+
+    const start = Date.now();
+    const now = new Date().toISOString();
+    const client = await getDb().connect();
+    const created: BulkCreatedInvoice[] = [];
+
+    try {
+        await client.query('BEGIN');
+
+        const numbers = await reserveInvoiceNumbers(client, tenantId, requests.filter(r => !r.invoice_number).length);
+        let nextNumber = 0;
+
+        const invoiceRows: unknown[][] = [];
+        const lineRows: unknown[][] = [];
+        for (const data of requests) {
+            const id = randomUUID();
+            const invoice_number = data.invoice_number || numbers[nextNumber++];
+            const totals = calculateInvoiceTotals(data.lines);
+
+            invoiceRows.push([
+                id,
+                tenantId,
+                invoice_number,
+                data.issue_date,
+                data.due_date || null,
+                data.customer_id || null,
+                data.customer_name || null,
+                data.billing_country || 'DE',
+                totals.net_amount,
+                totals.vat_amount,
+                totals.gross_amount,
+                'draft',
+                data.notes || null,
+                data.source_order_id || null,
+                now,
+                now
+            ]);
+            for (const line of data.lines) {
+                lineRows.push([
+                    randomUUID(),
+                    id,
+                    line.description,
+                    line.quantity,
+                    line.unit_price,
+                    line.tax_rate,
+                    line.tax_code || 'STANDARD',
+                    Math.round(line.quantity * line.unit_price * 100) / 100,
+                    now
+                ]);
+            }
+            created.push({ id, invoice_number, source_order_id: data.source_order_id, gross_amount: totals.gross_amount });
+        }
+
+        await insertRows(
+            client,
+            `INSERT INTO invoices (
+                id, tenant_id, invoice_number, issue_date, due_date,
+                customer_id, customer_name, billing_country,
+                net_amount, vat_amount, gross_amount, status, notes, source_order_id, created_at, updated_at
+            )`,
+            invoiceRows,
+            BULK_INVOICE_CHUNK
+        );
+        await insertRows(
+            client,
+            `INSERT INTO invoice_lines (
+                id, invoice_id, description, quantity, unit_price,
+                tax_rate, tax_code, line_total, created_at
+            )`,
+            lineRows,
+            BULK_LINE_CHUNK
+        );
+
+        await client.query('COMMIT');
+    } catch (err) {
+        await client.query('ROLLBACK').catch(() => undefined);
+        throw err;
+    } finally {
+        client.release();
+    }
+
+    await refreshTaxSnapshots(tenantId, created.map(invoice => invoice.id));
+
+    // GoBD Audit Log — batched; the last entry waits until all are persisted
+    for (let i = 0; i < created.length; i++) {
+        const invoice = created[i];
+        await auditLog(
+            'invoice.created',
+            'invoice',
+            invoice.id,
+            'system',
+            tenantId,
+            {
+                changes: {
+                    invoice_number: { before: null, after: invoice.invoice_number },
+                    gross_amount: { before: null, after: invoice.gross_amount },
+                    status: { before: null, after: 'draft' }
+                },
+                sync: i === created.length - 1
+            }
+        );
+    }
+
+    logger.info('[InvoiceService] Bulk invoices created', {
+        tenantId,
+        count: created.length,
+        first: created[0].invoice_number,
+        last: created[created.length - 1].invoice_number,
+        durationMs: Date.now() - start
+    });
+
+    return created;
+}
+
 /**
  * Convert numeric string fields to numbers (SQLite returns numbers as strings)
  */
@@ -239,6 +432,37 @@ export async function getInvoiceByNumber(tenantId: string, invoiceNumber: string
     });
 }
 
+/**
+ * Load invoices with lines in pages of `pageSize` (two queries per page),
+ * yielding them in the order of `invoiceIds`. Unknown IDs are skipped.
+ */
+export async function* iterateInvoices(tenantId: string, invoiceIds: string[], pageSize = 200): AsyncGenerator<Invoice> {
+    for (let start = 0; start < invoiceIds.length; start += pageSize) {
+        const ids = invoiceIds.slice(start, start + pageSize);
+        const invoices = await db.all<Invoice>(
+            `SELECT * FROM invoices WHERE tenant_id = ? AND id = ANY(?)`,
+            [tenantId, ids]
+        );
+        const lines = await db.all<InvoiceLine>(
+            `SELECT * FROM invoice_lines WHERE invoice_id = ANY(?) ORDER BY created_at`,
+            [ids]
+        );
+
+        const linesByInvoice = new Map<string, InvoiceLine[]>();
+        for (const line of lines) {
+            const list = linesByInvoice.get(line.invoice_id);
+            if (list) list.push(line);
+            else linesByInvoice.set(line.invoice_id, [line]);
+        }
+        const byId = new Map(invoices.map(invoice => [invoice.id, invoice]));
+
+        for (const id of ids) {
+            const invoice = byId.get(id);
+            if (invoice) yield normalizeInvoice({ ...invoice, lines: linesByInvoice.get(id) || [] });
+        }
+    }
+}
+
 /**
  * List invoices for tenant with optional filters
  */
@@ -356,11 +580,19 @@ export async function updateInvoice(
     // Add WHERE clause params
     params.push(invoiceId, tenantId);
 
+    // Tax snapshots only change with the dates or the status
+    const affectsTax = data.issue_date !== undefined || data.paid_at !== undefined || data.status !== undefined;
+    const previousTaxDays = affectsTax ? await getInvoiceTaxDays(tenantId, [invoiceId]) : undefined;
+
     await db.run(
         `UPDATE invoices SET ${updates.join(', ')} WHERE id = ? AND tenant_id = ?`,
         params
     );
 
+    if (affectsTax) {
+        await refreshTaxSnapshots(tenantId, [invoiceId], previousTaxDays);
+    }
+
     return getInvoiceById(tenantId, invoiceId);
 }
 
@@ -369,11 +601,13 @@ export async function updateInvoice(
  */
 export async function markInvoiceAsPaid(tenantId: string, invoiceId: string): Promise<Invoice> {
     const now = new Date().toISOString();
+    const previousTaxDays = await getInvoiceTaxDays(tenantId, [invoiceId]);
 
     await db.run(
         `UPDATE invoices SET status = ?, paid_at = ?, updated_at = ? WHERE id = ? AND tenant_id = ?`,
         ['paid', now, now, invoiceId, tenantId]
     );
+    await refreshTaxSnapshots(tenantId, [invoiceId], previousTaxDays);
 
     return getInvoiceById(tenantId, invoiceId);
 }
@@ -388,6 +622,7 @@ export async function cancelInvoice(tenantId: string, invoiceId: string): Promis
         `UPDATE invoices SET status = ?, updated_at = ? WHERE id = ? AND tenant_id = ?`,
         ['canceled', now, invoiceId, tenantId]
     );
+    await refreshTaxSnapshots(tenantId, [invoiceId]);
 
     // GoBD Audit Log
     try {
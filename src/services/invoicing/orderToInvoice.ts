@@ -1,7 +1,7 @@
 // Order to Invoice Automation Service
 // Automatically creates invoices when orders are completed
 
-import { createInvoice } from './invoiceService';
+import { createInvoice, createInvoicesBulk, type BulkCreatedInvoice } from './invoiceService';
 import { logger } from "@utils/logger";
 import { db } from '@core/database';
 import type { CreateInvoiceRequest, TaxCode } from '../../types/tax';
@@ -10,9 +10,13 @@ import {
     fetchOrderItemsFromWAWI,
     updateOrderStatusInWAWI,
     checkOrderHasInvoice,
-    type WAWIOrder
+    type WAWIOrder,
+    type WAWIOrderItem
 } from './wawiClient';
 
+/** Parallel WAWI requests when converting many orders */
+const BULK_WAWI_CONCURRENCY = Number(process.env.INVOICE_BULK_WAWI_CONCURRENCY || 8);
+
 /**
  * Generate invoice from completed order
  * Uses WAWI API to fetch order data instead of direct database access
@@ -53,29 +57,8 @@ export async function createInvoiceFromOrder(tenantId: string, orderId: string):
             throw new Error('Auftrag hat keine Positionen');
         }
 
-        // Step 5: Map order items to invoice lines
-        const invoiceLines = orderItems.map(item => {
-            const taxRate = item.tax_rate || 19;
-            const quantity = item.quantity || 1; // Default to 1 if not specified
-            return {
-                description: item.product_name,
-                quantity: quantity,
-                unit_price: item.price,
-                tax_rate: taxRate as 0 | 7 | 19,
-                tax_code: (taxRate === 0 ? 'TAX_FREE' : 'STANDARD') as TaxCode
-            };
-        });
-
-        // Step 6: Create invoice request
-        const invoiceData: CreateInvoiceRequest = {
-            issue_date: new Date().toISOString().split('T')[0],
-            due_date: calculateDueDate(14), // 14 days payment term
-            customer_name: order.customer_name || 'Kunde',
-            billing_country: 'DE',
-            notes: `Automatisch erstellt für Auftrag ${order.id}`,
-            lines: invoiceLines,
-            source_order_id: orderId // Track the source order
-        };
+        // Step 5 + 6: Map order to invoice request
+        const invoiceData = buildInvoiceRequest(orderId, order, orderItems);
 
         // Step 7: Create invoice in Bot-Service database
         const invoice = await createInvoice(tenantId, invoiceData);
@@ -93,6 +76,92 @@ export async function createInvoiceFromOrder(tenantId: string, orderId: string):
     }
 }
 
+/**
+ * Invoice request for an order: one line per order item, 14 days payment term
+ */
+function buildInvoiceRequest(orderId: string, order: WAWIOrder, orderItems: WAWIOrderItem[]): CreateInvoiceRequest {
+    const invoiceLines = orderItems.map(item => {
+        const taxRate = item.tax_rate || 19;
+        const quantity = item.quantity || 1; // Default to 1 if not specified
+        return {
+            description: item.product_name,
+            quantity: quantity,
+            unit_price: item.price,
+            tax_rate: taxRate as 0 | 7 | 19,
+            tax_code: (taxRate === 0 ? 'TAX_FREE' : 'STANDARD') as TaxCode
+        };
+    });
+
+    return {
+        issue_date: new Date().toISOString().split('T')[0],
+        due_date: calculateDueDate(14), // 14 days payment term
+        customer_name: order.customer_name || 'Kunde',
+        billing_country: 'DE',
+        notes: `Automatisch erstellt für Auftrag ${order.id}`,
+        lines: invoiceLines,
+        source_order_id: orderId // Track the source order
+    };
+}
+
+/**
+ * Create invoices for many orders at once (e.g. a day's completed orders).
+ * Orders are fetched from WAWI in parallel, then all invoices are written
+ * in one transaction via createInvoicesBulk(). Orders that already have an
+ * invoice are skipped; orders that cannot be fetched are counted as errors
+ * and do not block the others.
+ */
+export async function createInvoicesFromOrders(
+    tenantId: string,
+    orderIds: string[]
+): Promise<{ created: number; skipped: number; errors: number; invoices: BulkCreatedInvoice[] }> {
+    const uniqueIds = Array.from(new Set(orderIds));
+
+    // Step 1: One query for all orders already invoiced in Bot-Service
+    const existing = await db.all<{ source_order_id: string }>(
+        'SELECT source_order_id FROM invoices WHERE tenant_id = ? AND source_order_id = ANY(?)',
+        [tenantId, uniqueIds]
+    );
+    const invoiced = new Set(existing.map(row => row.source_order_id));
+    const pending = uniqueIds.filter(id => !invoiced.has(id));
+    let skipped = uniqueIds.length - pending.length;
+    let errors = 0;
+
+    // Step 2: Fetch orders and items from WAWI (kept in input order, so
+    // invoice numbers follow the order list rather than response timing)
+    const fetched: Array<CreateInvoiceRequest | undefined> = new Array(pending.length);
+    await forEachWithConcurrency(pending, BULK_WAWI_CONCURRENCY, async (orderId, index) => {
+        try {
+            if (await checkOrderHasInvoice(orderId)) {
+                skipped++;
+                return;
+            }
+            const [order, orderItems] = await Promise.all([
+                fetchOrderFromWAWI(orderId),
+                fetchOrderItemsFromWAWI(orderId)
+            ]);
+            if (!order || !orderItems || orderItems.length === 0) {
+                throw new Error(!order ? 'Auftrag nicht gefunden' : 'Auftrag hat keine Positionen');
+            }
+            fetched[index] = buildInvoiceRequest(orderId, order, orderItems);
+        } catch (error: any) {
+            errors++;
+            logger.error(`[Invoice] Skipping order ${orderId} in bulk run:`, error.message);
+        }
+    });
+
+    // Step 3: Create all invoices in one transaction
+    const requests = fetched.filter((request): request is CreateInvoiceRequest => request !== undefined);
+    const invoices = await createInvoicesBulk(tenantId, requests);
+
+    // Step 4: Update order status in WAWI
+    await forEachWithConcurrency(invoices, BULK_WAWI_CONCURRENCY, invoice =>
+        updateOrderStatusInWAWI(invoice.source_order_id!, 'invoiced', invoice.invoice_number)
+    );
+
+    logger.info(`✅ Bulk invoicing for tenant ${tenantId}: ${invoices.length} created, ${skipped} skipped, ${errors} errors`);
+    return { created: invoices.length, skipped, errors, invoices };
+}
+
 /**
  * Automatically create invoice when order status changes to 'completed'
  * Called from order update handler
@@ -123,6 +192,17 @@ export async function syncOrdersToInvoices(tenantId: string): Promise<{ created:
 }
 
 // Helper functions
+async function forEachWithConcurrency<T>(items: T[], concurrency: number, fn: (item: T, index: number) => Promise<unknown>): Promise<void> {
+    let next = 0;
+    const workers = Array.from({ length: Math.min(concurrency, items.length) }, async () => {
+        while (next < items.length) {
+            const index = next++;
+            await fn(items[index], index);
+        }
+    });
+    await Promise.all(workers);
+}
+
 function calculateDueDate(daysFromNow: number): string {
     const date = new Date();
     date.setDate(date.getDate() + daysFromNow);
@@ -34,28 +34,42 @@ const DEFAULT_COMPANY: CompanyInfo = {
     website: 'www.autoteile-mueller.de'
 };
 
+interface PdfContext {
+    companyInfo: CompanyInfo;
+    design: Awaited<ReturnType<typeof fetchBillingDesign>>;
+}
+
+/**
+ * Company info and billing design for a tenant — the same for every invoice
+ */
+async function loadPdfContext(tenantId: string): Promise<PdfContext> {
+    // Load company info from tax profile
+    let companyInfo = DEFAULT_COMPANY;
+    const profile = await getTaxProfile(tenantId);
+    if (profile) {
+        companyInfo = {
+            ...DEFAULT_COMPANY,
+            tax_number: profile.tax_number ?? undefined,
+            vat_id: profile.vat_id ?? undefined
+        };
+    }
+
+    // Load billing design (colors, logo, fonts)
+    logger.info('[PDF] Step 1: Loading design settings for tenant:', tenantId);
+    const design = await fetchBillingDesign(tenantId);
+    logger.info('[PDF] Step 2: Design loaded:', JSON.stringify(design, null, 2));
+
+    return { companyInfo, design };
+}
+
 /**
  * Generate PDF for invoice
  * Returns buffer that can be sent as response or saved to file
  */
-export async function generateInvoicePDF(tenantId: string, invoice: Invoice): Promise<Buffer> {
+export async function generateInvoicePDF(tenantId: string, invoice: Invoice, context?: PdfContext): Promise<Buffer> {
     return new Promise(async (resolve, reject) => {
         try {
-            // Load company info from tax profile
-            let companyInfo = DEFAULT_COMPANY;
-            const profile = await getTaxProfile(tenantId);
-            if (profile) {
-                companyInfo = {
-                    ...DEFAULT_COMPANY,
-                    tax_number: profile.tax_number ?? undefined,
-                    vat_id: profile.vat_id ?? undefined
-                };
-            }
-
-            // Load billing design (colors, logo, fonts)
-            logger.info('[PDF] Step 1: Loading design settings for tenant:', tenantId);
-            const design = await fetchBillingDesign(tenantId);
-            logger.info('[PDF] Step 2: Design loaded:', JSON.stringify(design, null, 2));
+            const { companyInfo, design } = context ?? await loadPdfContext(tenantId);
 
             const primaryColor = design?.invoice_color || '#000000';
             const accentColor = design?.accent_color || '#f3f4f6';
@@ -253,6 +267,21 @@ export async function generateInvoicePDF(tenantId: string, invoice: Invoice): Pr
     });
 }
 
+/**
+ * Render PDFs one at a time as invoices arrive (e.g. from iterateInvoices()),
+ * loading the tenant's company info and design only once. Only one PDF is
+ * held in memory at a time.
+ */
+export async function* generateInvoicePDFs(
+    tenantId: string,
+    invoices: AsyncIterable<Invoice> | Iterable<Invoice>
+): AsyncGenerator<{ invoice: Invoice; pdf: Buffer }> {
+    const context = await loadPdfContext(tenantId);
+    for await (const invoice of invoices) {
+        yield { invoice, pdf: await generateInvoicePDF(tenantId, invoice, context) };
+    }
+}
+
 /**
  * Save invoice PDF to file system
  */
@@ -1,8 +1,12 @@
 import { ScrapedOffer, ShopAdapter } from '../scrapingService';
 import { logger } from '@utils/logger';
+import { agentFor, withHostLimits } from '@utils/httpClient';
 import fetch from 'node-fetch';
 import * as cheerio from 'cheerio';
 
+// Overridable for local stand-ins (load tests)
+const SCRAPER_API_URL = process.env.SCRAPER_API_URL || 'http://api.scraperapi.com';
+
 /**
  * ScraperAPI.com Integration - Optimized for Autodoc & KFZTeile24
  */
@@ -33,7 +37,7 @@ export class ScraperAPIScraper implements ShopAdapter {
             const targetUrl = this.buildTargetUrl(oem);
 
             // ScraperAPI Ultra Premium Configuration for maximum success
-            const apiUrl = `http://api.scraperapi.com?` +
+            const apiUrl = `${SCRAPER_API_URL}?` +
                 `api_key=${this.apiKey}` +
                 `&url=${encodeURIComponent(targetUrl)}` +
                 `&render=true` +  // JavaScript rendering
@@ -45,10 +49,11 @@ export class ScraperAPIScraper implements ShopAdapter {
 
             logger.info(`[${this.name}] Requesting with Ultra Premium: ${targetUrl}`);
 
-            const response = await fetch(apiUrl, {
+            const response = await withHostLimits(apiUrl, () => fetch(apiUrl, {
                 method: 'GET',
-                timeout: 120000 // 2 minutes for ultra premium
-            });
+                timeout: 120000, // 2 minutes for ultra premium
+                agent: agentFor(apiUrl)
+            }));
 
             if (!response.ok) {
                 // Retry with different settings if failed
@@ -56,7 +61,7 @@ export class ScraperAPIScraper implements ShopAdapter {
                     logger.warn(`[${this.name}] First attempt failed (${response.status}), retrying with different config...`);
 
                     // Retry without ultra_premium but with autoparse
-                    const retryUrl = `http://api.scraperapi.com?` +
+                    const retryUrl = `${SCRAPER_API_URL}?` +
                         `api_key=${this.apiKey}` +
                         `&url=${encodeURIComponent(targetUrl)}` +
                         `&render=true` +
@@ -64,10 +69,11 @@ export class ScraperAPIScraper implements ShopAdapter {
                         `&keep_headers=true` +
                         `&session_number=${Math.floor(Math.random() * 10000)}`;
 
-                    const retryResponse = await fetch(retryUrl, {
+                    const retryResponse = await withHostLimits(retryUrl, () => fetch(retryUrl, {
                         method: 'GET',
-                        timeout: 120000
-                    });
+                        timeout: 120000,
+                        agent: agentFor(retryUrl)
+                    }));
 
                     if (!retryResponse.ok) {
                         throw new Error(`ScraperAPI returned ${retryResponse.status} after retry`);
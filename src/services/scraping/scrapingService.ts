@@ -1,6 +1,7 @@
 import { insertShopOffers } from "../adapters/supabaseService";
 import { ApifyClient } from "../communication/apifyClient";
 import { logger } from "@utils/logger";
+import { traceIo } from "../core/stateMachine/tracing";
 
 export interface ScrapedOffer {
   shopName: string;
@@ -60,6 +61,13 @@ function buildAdaptersWithVehicleData(vehicleData?: {
  * Nutzt Fahrzeugdaten für KFZTeile24 wenn verfügbar.
  */
 export async function scrapeOffersForOrder(
+  ...args: Parameters<typeof runScrapeOffersForOrder>
+): ReturnType<typeof runScrapeOffersForOrder> {
+  // Counted as scraper wait time of the current state transition (if any)
+  return traceIo('scraper', () => runScrapeOffersForOrder(...args));
+}
+
+async function runScrapeOffersForOrder(
   orderId: string,
   oemNumber: string,
   vehicleData?: {
@@ -0,0 +1,141 @@
+jest.mock('@utils/logger', () => ({ logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() } }));
+
+const mockDb = { run: jest.fn(), get: jest.fn(), all: jest.fn() };
+const mockClient = { query: jest.fn(), release: jest.fn() };
+jest.mock('@core/database', () => ({ db: mockDb, getDb: () => ({ connect: async () => mockClient }) }));
+
+import { calculateTaxPeriod, refreshTaxSnapshots } from '../taxCalculator';
+
+const profile = { tenant_id: 'tenant-1', tax_method: 'SOLL', small_business: false, period_type: 'quarterly' };
+
+/** [sql, params] of each snapshot rollup statement */
+const rollups = () => mockClient.query.mock.calls.filter(([sql]) => sql.includes('INSERT INTO tax_daily_snapshots'));
+
+const snapshotSums = (values: Record<string, string>) => ({
+    standard_19_net: null, standard_19_vat: null, reduced_7_net: null, reduced_7_vat: null,
+    zero_rated_net: null, zero_rated_vat: null, reverse_charge_net: null, reverse_charge_vat: null,
+    eu_sales_net: null, eu_sales_vat: null,
+    ...values,
+});
+
+describe('calculateTaxPeriod', () => {
+    beforeEach(() => {
+        mockDb.run.mockReset().mockResolvedValue(undefined);
+        mockDb.get.mockReset();
+        mockDb.all.mockReset();
+        mockClient.query.mockReset().mockResolvedValue({ rows: [] });
+        mockClient.release.mockReset();
+    });
+
+    it('sums the daily snapshots and rounds only the final totals', async () => {
+        mockDb.get
+            .mockResolvedValueOnce(profile)
+            .mockResolvedValueOnce(snapshotSums({
+                standard_19_net: '1000.006', standard_19_vat: '190.00095',
+                reduced_7_net: '10', reduced_7_vat: '0.7',
+            }));
+        mockDb.all.mockResolvedValueOnce([]); // no missing days
+
+        const result = await calculateTaxPeriod('tenant-1', '2026-01-01', '2026-03-31');
+
+        expect(result.totals.standard_19).toEqual({ net: 1000.01, vat: 190, gross: 1190.01 });
+        expect(result.totals.reduced_7).toEqual({ net: 10, vat: 0.7, gross: 10.7 });
+        expect(result.totals.eu_sales).toEqual({ net: 0, vat: 0, gross: 0 });
+        expect(result.tax_due).toBe(190.7);
+        expect(result.invoices).toBeUndefined();
+        expect(mockClient.query).not.toHaveBeenCalled();
+    });
+
+    it('rolls up missing days in one statement before summing', async () => {
+        mockDb.get.mockResolvedValueOnce(profile).mockResolvedValueOnce(snapshotSums({}));
+        mockDb.all.mockResolvedValueOnce([{ day: '2026-01-02' }, { day: '2026-01-01' }]);
+
+        await calculateTaxPeriod('tenant-1', '2026-01-01', '2026-01-31');
+
+        expect(rollups()).toHaveLength(1);
+        const [sql, params] = rollups()[0];
+        expect(sql).toContain('i.issue_date BETWEEN');
+        expect(params).toEqual(['tenant-1', 'SOLL', ['2026-01-01', '2026-01-02'], '2026-01-01', '2026-01-02']);
+    });
+
+    it('serializes rollups of the same tenant, method and day with an advisory lock', async () => {
+        mockDb.get.mockResolvedValueOnce(profile).mockResolvedValueOnce(snapshotSums({}));
+        mockDb.all.mockResolvedValueOnce([{ day: '2026-01-02' }, { day: '2026-01-01' }]);
+
+        await calculateTaxPeriod('tenant-1', '2026-01-01', '2026-01-31');
+
+        const calls = mockClient.query.mock.calls;
+        expect(calls.map(([sql]) => sql.trim().split(/\s+/)[0])).toEqual(['BEGIN', 'SELECT', 'WITH', 'COMMIT']);
+        expect(calls[1][0]).toContain('pg_advisory_xact_lock(hashtext(');
+        expect(calls[1][1]).toEqual(['tenant-1', 'SOLL', ['2026-01-01', '2026-01-02']]);
+        expect(mockClient.release).toHaveBeenCalledTimes(1);
+    });
+
+    it('uses the payment date under IST and zero tax for Kleinunternehmer', async () => {
+        mockDb.get
+            .mockResolvedValueOnce({ ...profile, tax_method: 'IST', small_business: true })
+            .mockResolvedValueOnce(snapshotSums({ standard_19_net: '100', standard_19_vat: '19' }));
+        mockDb.all.mockResolvedValueOnce([{ day: '2026-02-01' }]);
+
+        const result = await calculateTaxPeriod('tenant-1', '2026-02-01', '2026-02-28');
+
+        expect(rollups()[0][0]).toContain('i.paid_at::date');
+        expect(rollups()[0][1][1]).toBe('IST');
+        expect(result.tax_due).toBe(0);
+    });
+
+    it('loads the invoice list only on request', async () => {
+        mockDb.get.mockResolvedValueOnce(profile).mockResolvedValueOnce(snapshotSums({}));
+        mockDb.all
+            .mockResolvedValueOnce([])
+            .mockResolvedValueOnce([{ id: 'inv-1', lines_json: '{"id":"l1","tax_rate":19}' }]);
+
+        const result = await calculateTaxPeriod('tenant-1', '2026-01-01', '2026-01-31', { includeInvoices: true });
+
+        expect(result.invoices).toHaveLength(1);
+        expect(result.invoices![0].lines).toEqual([{ id: 'l1', tax_rate: 19 }]);
+    });
+
+    it('throws without a tax profile', async () => {
+        mockDb.get.mockResolvedValueOnce(undefined);
+        await expect(calculateTaxPeriod('tenant-1', '2026-01-01', '2026-01-31')).rejects.toThrow('Tax profile not found');
+    });
+});
+
+describe('refreshTaxSnapshots', () => {
+    beforeEach(() => {
+        mockDb.run.mockReset().mockResolvedValue(undefined);
+        mockDb.all.mockReset();
+        mockClient.query.mockReset().mockResolvedValue({ rows: [] });
+        mockClient.release.mockReset();
+    });
+
+    it('re-rolls the current and previous days of each method', async () => {
+        mockDb.all.mockResolvedValueOnce([
+            { method: 'SOLL', day: '2026-01-10' },
+            { method: 'IST', day: '2026-02-01' },
+        ]);
+
+        await refreshTaxSnapshots('tenant-1', ['inv-1'], { IST: ['2026-01-20'], SOLL: [] });
+
+        expect(rollups()).toHaveLength(2);
+        expect(rollups()[0][1].slice(1, 3)).toEqual(['IST', ['2026-01-20', '2026-02-01']]);
+        expect(rollups()[1][1].slice(1, 3)).toEqual(['SOLL', ['2026-01-10']]);
+    });
+
+    it('invalidates the affected days when the rollup fails', async () => {
+        mockDb.all.mockResolvedValueOnce([{ method: 'SOLL', day: '2026-01-10' }]);
+        mockClient.query.mockImplementation(async (sql: string) => {
+            if (sql.includes('INSERT INTO tax_daily_snapshots')) throw new Error('deadlock detected');
+            return { rows: [] };
+        });
+
+        await expect(refreshTaxSnapshots('tenant-1', ['inv-1'])).resolves.toBeUndefined();
+
+        expect(mockClient.query).toHaveBeenLastCalledWith('ROLLBACK');
+        expect(mockClient.release).toHaveBeenCalledTimes(1);
+        const [sql, params] = mockDb.run.mock.calls[0];
+        expect(sql).toContain('DELETE FROM tax_daily_snapshots');
+        expect(params).toEqual(['tenant-1', [], ['2026-01-10']]);
+    });
+});
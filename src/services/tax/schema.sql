@@ -80,3 +80,23 @@ CREATE TABLE IF NOT EXISTS tax_periods (
 CREATE INDEX IF NOT EXISTS idx_tax_periods_tenant ON tax_periods(tenant_id);
 CREATE INDEX IF NOT EXISTS idx_tax_periods_dates ON tax_periods(period_start, period_end);
 CREATE UNIQUE INDEX IF NOT EXISTS idx_tax_periods_tenant_dates ON tax_periods(tenant_id, period_start, period_end);
+
+-- Daily VAT snapshots (IST by paid_at day, SOLL by issue_date), see db/migrations/013_tax_daily_snapshots.sql
+CREATE TABLE IF NOT EXISTS tax_daily_snapshots (
+    tenant_id VARCHAR(255) NOT NULL,
+    tax_method VARCHAR(4) NOT NULL,
+    day DATE NOT NULL,
+    standard_19_net NUMERIC NOT NULL DEFAULT 0,
+    standard_19_vat NUMERIC NOT NULL DEFAULT 0,
+    reduced_7_net NUMERIC NOT NULL DEFAULT 0,
+    reduced_7_vat NUMERIC NOT NULL DEFAULT 0,
+    zero_rated_net NUMERIC NOT NULL DEFAULT 0,
+    zero_rated_vat NUMERIC NOT NULL DEFAULT 0,
+    reverse_charge_net NUMERIC NOT NULL DEFAULT 0,
+    reverse_charge_vat NUMERIC NOT NULL DEFAULT 0,
+    eu_sales_net NUMERIC NOT NULL DEFAULT 0,
+    eu_sales_vat NUMERIC NOT NULL DEFAULT 0,
+    invoice_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tenant_id, tax_method, day)
+);
@@ -2,7 +2,8 @@
 // Implements IST vs SOLL logic, tax grouping, and Kleinunternehmer handling
 
 import { randomUUID } from 'crypto';
-import { db } from '@core/database';
+import { db, getDb } from '@core/database';
+import { logger } from '@utils/logger';
 import type {
     TaxProfile,
     Invoice,
@@ -170,90 +171,211 @@ async function getInvoicesForPeriod(
     }));
 }
 
+type TaxMethod = 'IST' | 'SOLL';
+type TaxBucket = keyof PeriodAggregation['totals'];
+
+const TAX_BUCKETS: TaxBucket[] = ['standard_19', 'reduced_7', 'zero_rated', 'reverse_charge', 'eu_sales'];
+const SNAPSHOT_COLUMNS = TAX_BUCKETS.flatMap(bucket => [`${bucket}_net`, `${bucket}_vat`]);
+
+/** Days (YYYY-MM-DD) per tax method that a set of invoices contributes to */
+export type TaxDays = Record<TaxMethod, string[]>;
+
 /**
- * Aggregate invoices into tax breakdown
+ * Roll up `days` for one tax method and store them in tax_daily_snapshots.
+ * One statement: lines are bucketed like the UStVA (REVERSE and EU by tax
+ * code, the rest by tax rate) and grouped per day; days without paid
+ * invoices get a zero row so they count as computed.
+ *
+ * Runs in a transaction holding an advisory lock per (tenant, method, day):
+ * under READ COMMITTED, two concurrent refreshes of a day could otherwise
+ * let the one with the older snapshot write its totals last.
  */
-function aggregateInvoices(invoices: Invoice[]): PeriodAggregation['totals'] {
-    const totals: PeriodAggregation['totals'] = {
-        standard_19: { net: 0, vat: 0, gross: 0 },
-        reduced_7: { net: 0, vat: 0, gross: 0 },
-        zero_rated: { net: 0, vat: 0, gross: 0 },
-        reverse_charge: { net: 0, vat: 0, gross: 0 },
-        eu_sales: { net: 0, vat: 0, gross: 0 }
-    };
+async function rollupTaxDays(tenantId: string, taxMethod: TaxMethod, days: string[]): Promise<void> {
+    if (days.length === 0) return;
+    const sorted = [...days].sort();
+
+    // IST: paid_at (cash basis), SOLL: issue_date (accrual basis).
+    // The range condition lets the date indexes prefilter before the day match.
+    const dayExpr = taxMethod === 'IST' ? 'i.paid_at::date' : 'i.issue_date';
+    const rangeFilter = taxMethod === 'IST'
+        ? 'i.paid_at >= $4::date AND i.paid_at < $5::date + 1'
+        : 'i.issue_date BETWEEN $4::date AND $5::date';
+
+    const sums = TAX_BUCKETS.flatMap(bucket => [
+        `COALESCE(SUM(l.net) FILTER (WHERE l.bucket = '${bucket}'), 0)`,
+        `COALESCE(SUM(l.vat) FILTER (WHERE l.bucket = '${bucket}'), 0)`
+    ]);
+
+    const client = await getDb().connect();
+    try {
+        await client.query('BEGIN');
+        // Locks are taken in day order, so overlapping refreshes cannot
+        // deadlock; the rollup below gets a snapshot taken after them
+        await client.query(
+            `SELECT pg_advisory_xact_lock(hashtext($1 || '|' || $2 || '|' || days.day::text))
+             FROM (SELECT DISTINCT unnest($3::date[]) AS day ORDER BY 1) AS days`,
+            [tenantId, taxMethod, sorted]
+        );
+        await client.query(
+            `WITH days AS (
+                SELECT DISTINCT unnest($3::date[]) AS day
+            ),
+            lines AS (
+                SELECT ${dayExpr} AS day,
+                    i.id AS invoice_id,
+                    il.quantity * il.unit_price AS net,
+                    il.quantity * il.unit_price * il.tax_rate / 100 AS vat,
+                    CASE
+                        WHEN il.tax_code = 'REVERSE' THEN 'reverse_charge'
+                        WHEN il.tax_code = 'EU' THEN 'eu_sales'
+                        WHEN il.tax_rate = 19 THEN 'standard_19'
+                        WHEN il.tax_rate = 7 THEN 'reduced_7'
+                        ELSE 'zero_rated'
+                    END AS bucket
+                FROM invoices i
+                JOIN invoice_lines il ON il.invoice_id = i.id
+                WHERE i.tenant_id = $1
+                  AND i.status = 'paid'
+                  AND ${rangeFilter}
+                  AND ${dayExpr} = ANY($3::date[])
+            )
+            INSERT INTO tax_daily_snapshots (
+                tenant_id, tax_method, day, ${SNAPSHOT_COLUMNS.join(', ')}, invoice_count, updated_at
+            )
+            SELECT $1::text, $2::text, days.day, ${sums.join(', ')}, COUNT(DISTINCT l.invoice_id), NOW()
+            FROM days
+            LEFT JOIN lines l ON l.day = days.day
+            GROUP BY days.day
+            ON CONFLICT (tenant_id, tax_method, day) DO UPDATE SET
+                ${SNAPSHOT_COLUMNS.map(column => `${column} = EXCLUDED.${column}`).join(', ')},
+                invoice_count = EXCLUDED.invoice_count,
+                updated_at = EXCLUDED.updated_at`,
+            [tenantId, taxMethod, sorted, sorted[0], sorted[sorted.length - 1]]
+        );
+        await client.query('COMMIT');
+    } catch (err) {
+        await client.query('ROLLBACK').catch(() => undefined);
+        throw err;
+    } finally {
+        client.release();
+    }
+}
 
-    for (const invoice of invoices) {
-        if (!invoice.lines) continue;
-
-        for (const line of invoice.lines) {
-            const line_net = line.quantity * line.unit_price;
-            const line_vat = line_net * (line.tax_rate / 100);
-            const line_gross = line_net + line_vat;
-
-            // Categorize by tax_code and tax_rate
-            if (line.tax_code === 'REVERSE') {
-                totals.reverse_charge.net += line_net;
-                totals.reverse_charge.vat += line_vat;
-                totals.reverse_charge.gross += line_gross;
-            } else if (line.tax_code === 'EU') {
-                totals.eu_sales.net += line_net;
-                totals.eu_sales.vat += line_vat;
-                totals.eu_sales.gross += line_gross;
-            } else if (line.tax_rate === 19) {
-                totals.standard_19.net += line_net;
-                totals.standard_19.vat += line_vat;
-                totals.standard_19.gross += line_gross;
-            } else if (line.tax_rate === 7) {
-                totals.reduced_7.net += line_net;
-                totals.reduced_7.vat += line_vat;
-                totals.reduced_7.gross += line_gross;
-            } else {
-                totals.zero_rated.net += line_net;
-                totals.zero_rated.vat += line_vat;
-                totals.zero_rated.gross += line_gross;
-            }
+/**
+ * Days each invoice counts on: SOLL by issue date, IST by payment date
+ */
+export async function getInvoiceTaxDays(tenantId: string, invoiceIds: string[]): Promise<TaxDays> {
+    const rows = await db.all<{ method: TaxMethod; day: string }>(
+        `SELECT 'SOLL' AS method, to_char(issue_date, 'YYYY-MM-DD') AS day
+         FROM invoices WHERE tenant_id = $1 AND id = ANY($2)
+         UNION
+         SELECT 'IST' AS method, to_char(paid_at, 'YYYY-MM-DD') AS day
+         FROM invoices WHERE tenant_id = $1 AND id = ANY($2) AND paid_at IS NOT NULL`,
+        [tenantId, invoiceIds]
+    );
+
+    const days: TaxDays = { IST: [], SOLL: [] };
+    for (const row of rows) days[row.method].push(row.day);
+    return days;
+}
+
+/**
+ * Bring the daily snapshots in line after invoices were created or changed.
+ * Pass the days from getInvoiceTaxDays() taken before an update, so the day
+ * an invoice moved away from is corrected as well. Never throws: if the
+ * refresh fails, the affected days are dropped and recomputed on next read.
+ */
+export async function refreshTaxSnapshots(tenantId: string, invoiceIds: string[], previous?: TaxDays): Promise<void> {
+    let days: TaxDays = { IST: [...(previous?.IST ?? [])], SOLL: [...(previous?.SOLL ?? [])] };
+    try {
+        const current = await getInvoiceTaxDays(tenantId, invoiceIds);
+        days = { IST: [...days.IST, ...current.IST], SOLL: [...days.SOLL, ...current.SOLL] };
+        await rollupTaxDays(tenantId, 'IST', days.IST);
+        await rollupTaxDays(tenantId, 'SOLL', days.SOLL);
+    } catch (err: any) {
+        logger.error('[TaxCalculator] Snapshot refresh failed, invalidating days', { tenantId, error: err?.message });
+        try {
+            await db.run(
+                `DELETE FROM tax_daily_snapshots
+                 WHERE tenant_id = $1
+                   AND ((tax_method = 'IST' AND day = ANY($2::date[])) OR (tax_method = 'SOLL' AND day = ANY($3::date[])))`,
+                [tenantId, days.IST, days.SOLL]
+            );
+        } catch (deleteErr: any) {
+            logger.error('[TaxCalculator] CRITICAL: Could not invalidate tax snapshots', { tenantId, error: deleteErr?.message });
         }
     }
+}
 
-    // Round all values to 2 decimal places
-    for (const key of Object.keys(totals) as Array<keyof typeof totals>) {
-        totals[key].net = Math.round(totals[key].net * 100) / 100;
-        totals[key].vat = Math.round(totals[key].vat * 100) / 100;
-        totals[key].gross = Math.round(totals[key].gross * 100) / 100;
-    }
+/**
+ * Sum the daily snapshots of a period, rolling up days that have none yet
+ */
+async function aggregatePeriod(
+    tenantId: string,
+    periodStart: string,
+    periodEnd: string,
+    taxMethod: TaxMethod
+): Promise<PeriodAggregation['totals']> {
+    const missing = await db.all<{ day: string }>(
+        `SELECT to_char(d, 'YYYY-MM-DD') AS day
+         FROM generate_series($3::date, $4::date, interval '1 day') AS d
+         WHERE NOT EXISTS (
+             SELECT 1 FROM tax_daily_snapshots s
+             WHERE s.tenant_id = $1 AND s.tax_method = $2 AND s.day = d::date
+         )`,
+        [tenantId, taxMethod, periodStart, periodEnd]
+    );
+    await rollupTaxDays(tenantId, taxMethod, missing.map(row => row.day));
+
+    const row = await db.get<Record<string, string | null>>(
+        `SELECT ${SNAPSHOT_COLUMNS.map(column => `SUM(${column}) AS ${column}`).join(', ')}
+         FROM tax_daily_snapshots
+         WHERE tenant_id = $1 AND tax_method = $2 AND day BETWEEN $3::date AND $4::date`,
+        [tenantId, taxMethod, periodStart, periodEnd]
+    );
 
+    // Round to 2 decimal places only at the end, from the exact sums
+    const round = (value: number) => Math.round(value * 100) / 100;
+    const totals = {} as PeriodAggregation['totals'];
+    for (const bucket of TAX_BUCKETS) {
+        const net = parseFloat(row?.[`${bucket}_net`] ?? '0') || 0;
+        const vat = parseFloat(row?.[`${bucket}_vat`] ?? '0') || 0;
+        totals[bucket] = { net: round(net), vat: round(vat), gross: round(net + vat) };
+    }
     return totals;
 }
 
 /**
- * Calculate tax period
+ * Calculate tax period.
+ * Totals come from the daily snapshots; the invoice list is only loaded
+ * when `includeInvoices` is set.
  */
 export async function calculateTaxPeriod(
     tenantId: string,
     periodStart: string,
-    periodEnd: string
+    periodEnd: string,
+    options: { includeInvoices?: boolean } = {}
 ): Promise<PeriodAggregation> {
     const taxProfile = await getTaxProfile(tenantId);
     if (!taxProfile) {
         throw new Error('Tax profile not found. Please configure tax settings first.');
     }
 
-    // Get invoices for period
-    const invoices = await getInvoicesForPeriod(tenantId, periodStart, periodEnd, taxProfile.tax_method);
-
     // Aggregate totals
-    const totals = aggregateInvoices(invoices);
+    const totals = await aggregatePeriod(tenantId, periodStart, periodEnd, taxProfile.tax_method);
 
     // Calculate tax due (Zahllast)
     // For Kleinunternehmer, tax_due is always 0
     const tax_due = taxProfile.small_business
         ? 0
-        : totals.standard_19.vat + totals.reduced_7.vat;
+        : Math.round((totals.standard_19.vat + totals.reduced_7.vat) * 100) / 100;
 
     return {
         period_start: periodStart,
         period_end: periodEnd,
-        invoices,
+        ...(options.includeInvoices
+            ? { invoices: await getInvoicesForPeriod(tenantId, periodStart, periodEnd, taxProfile.tax_method) }
+            : {}),
         totals,
         tax_due
     };
@@ -0,0 +1,169 @@
+/**
+ * Load Replay Tests
+ *
+ * A fake webhook plays the worker: it acknowledges the POST, then calls the
+ * stand-in Twilio API (typing indicator, replies) and Gemini like the real
+ * pipeline would.
+ */
+
+import http from 'http';
+import { AddressInfo } from 'net';
+import { StandInServer, parseLatency, sampleLatency, recordingKey } from './loadReplayStandIns';
+import { runReplay, runCapacitySweep, percentile, Corpus } from './loadReplay';
+
+const TWILIO = '/2010-04-01/Accounts/AC1';
+
+async function post(url: string, body: string): Promise<any> {
+    const res = await fetch(url, { method: 'POST', headers: { 'Content-Type': 'application/x-www-form-urlencoded' }, body });
+    return res.json();
+}
+
+/** Answers every message with `replies` Twilio messages after a Gemini call */
+async function startFakeApp(standInUrl: string, replies = 1, workMs = 20): Promise<{ url: string; close: () => Promise<void> }> {
+    const server = http.createServer((req, res) => {
+        let body = '';
+        req.on('data', chunk => (body += chunk));
+        req.on('end', () => {
+            res.writeHead(200, { 'Content-Type': 'text/xml' });
+            res.end('<Response></Response>');
+            const form = new URLSearchParams(body);
+            setTimeout(async () => {
+                await post(`${standInUrl}${TWILIO}/Messages/${form.get('MessageSid')}/UserDefinedMessages.json`, '');
+                const llm = await post(`${standInUrl}/v1beta/models/gemini-2.0-flash:generateContent`, JSON.stringify({ text: form.get('Body') }));
+                for (let i = 0; i < replies; i++) {
+                    await post(`${standInUrl}${TWILIO}/Messages.json`, new URLSearchParams({
+                        To: form.get('From')!,
+                        Body: llm.candidates[0].content.parts[0].text,
+                    }).toString());
+                }
+            }, workMs);
+        });
+    });
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    return {
+        url: `http://127.0.0.1:${(server.address() as AddressInfo).port}/webhook/whatsapp`,
+        close: () => new Promise(resolve => server.close(() => resolve())),
+    };
+}
+
+const corpus: Corpus = {
+    conversations: [
+        { name: 'order', turns: [{ text: 'Hallo' }, { text: 'Bremsscheiben vorne', replies: 2 }] },
+        { name: 'question', turns: [{ text: 'Habt ihr offen?' }] },
+    ],
+};
+
+describe('loadReplay', () => {
+    let standIns: StandInServer;
+    let standInUrl: string;
+
+    beforeEach(async () => {
+        standIns = new StandInServer({
+            latency: { twilio: parseLatency('fixed:5'), gemini: parseLatency('uniform:10,30') },
+            llmFixtures: [{ match: 'Bremsscheiben', response: '{"intent":"request_part"}' }],
+        });
+        standInUrl = await standIns.start();
+    });
+
+    afterEach(async () => {
+        await standIns.stop();
+    });
+
+    it('parses and samples latency distributions', () => {
+        expect(parseLatency('lognormal:900,0.4')).toEqual({ kind: 'lognormal', median: 900, sigma: 0.4 });
+        expect(() => parseLatency('uniform:400,100')).toThrow('Invalid latency spec');
+        expect(() => parseLatency('gamma:1,2')).toThrow('Invalid latency spec');
+        expect(sampleLatency({ kind: 'uniform', min: 100, max: 300 }, 0.5, 0)).toBe(200);
+        expect(sampleLatency({ kind: 'lognormal', median: 900, sigma: 0.4 }, 1 - Math.exp(-0.5), 0.25)).toBeCloseTo(900);
+        expect(sampleLatency({ kind: 'normal', mean: 10, sd: 100 }, 0.999, 0.5)).toBe(0);
+    });
+
+    it('answers Gemini from fixtures and reports replies and pick-ups', async () => {
+        const replies: string[] = [];
+        const pickups: string[] = [];
+        standIns.on('reply', reply => replies.push(`${reply.to}: ${reply.body}`));
+        standIns.on('pickup', sid => pickups.push(sid));
+
+        const fixture = await post(`${standInUrl}/v1beta/models/m:generateContent`, '{"text":"Bremsscheiben vorne"}');
+        const fallback = await post(`${standInUrl}/v1beta/models/m:generateContent`, '{"text":"Hallo"}');
+        await post(`${standInUrl}${TWILIO}/Messages/SM1/UserDefinedMessages.json`, '');
+        await post(`${standInUrl}${TWILIO}/Messages.json`, 'To=whatsapp%3A%2B49&Body=Hi');
+
+        expect(fixture.candidates[0].content.parts[0].text).toBe('{"intent":"request_part"}');
+        expect(fallback.candidates[0].content.parts[0].text).toBe('{}');
+        expect(pickups).toEqual(['SM1']);
+        expect(replies).toEqual(['whatsapp:+49: Hi']);
+        expect(standIns.takeCallCounts()).toEqual({ twilio: 2, gemini: 2, scraper: 0, media: 0 });
+    });
+
+    it('replays recorded responses and counts misses', async () => {
+        const recordedBody = '{"contents":[{"parts":[{"text":"OEM?"}]}]}';
+        const geminiKey = recordingKey('gemini', new URL('http://x/v1beta/models/m:generateContent'), recordedBody);
+        const scraperKey = recordingKey('scraper', new URL('http://x/?url=https%3A%2F%2Fshop&api_key=a&session_number=1'), '');
+        expect(recordingKey('scraper', new URL('http://x/?api_key=b&url=https%3A%2F%2Fshop'), '')).toBe(scraperKey);
+
+        const replaying = new StandInServer({
+            recordings: {
+                [geminiKey]: { status: 200, contentType: 'application/json', body: '{"recorded":true}', latencyMs: 5000 },
+                [scraperKey]: { status: 200, contentType: 'text/html', body: '<p>shop</p>', latencyMs: 5000 },
+            },
+            recordedLatencyScale: 0,
+        });
+        const url = await replaying.start();
+        try {
+            expect(await post(`${url}/v1beta/models/m:generateContent`, recordedBody)).toEqual({ recorded: true });
+            expect(await (await fetch(`${url}/?url=https%3A%2F%2Fshop&api_key=load-replay`)).text()).toBe('<p>shop</p>');
+            const miss = await fetch(`${url}/v1beta/models/m:generateContent`, { method: 'POST', body: '{"contents":[]}' });
+            expect(miss.status).toBe(500);
+            expect(replaying.getRecordingMisses()).toBe(1);
+            expect(replaying.takeCallCounts()).toMatchObject({ gemini: 2, scraper: 1 });
+        } finally {
+            await replaying.stop();
+        }
+    });
+
+    it('measures turn latency, queue lag and throughput', async () => {
+        const app = await startFakeApp(standInUrl, 2);
+        try {
+            // The fake app sends two replies per message (an interim one and the answer)
+            const corpusOf2 = { conversations: corpus.conversations.map(c => ({ ...c, turns: c.turns.map(t => ({ ...t, replies: 2 })) })) };
+            const result = await runReplay({ webhookUrl: app.url, standIns, corpus: corpusOf2, concurrency: 2, repeat: 2 });
+
+            expect(result.turns).toBe(6);
+            expect(result.failedTurns).toBe(0);
+            expect(result.turnLatencyMs.p50).toBeGreaterThanOrEqual(35);
+            expect(result.turnLatencyMs.p99).toBeGreaterThanOrEqual(result.turnLatencyMs.p95);
+            expect(result.queueLagMs.p50).toBeGreaterThanOrEqual(20);
+            expect(result.queueLagMs.p50).toBeLessThan(result.turnLatencyMs.p50);
+            expect(result.turnsPerSecond).toBeGreaterThan(0);
+            expect(result.standInCalls).toMatchObject({ gemini: 6, twilio: 18 });
+        } finally {
+            await app.close();
+        }
+    });
+
+    it('fails turns that get no reply and stops the sweep at the SLO breach', async () => {
+        const app = await startFakeApp(standInUrl, 1);
+        try {
+            const report = await runCapacitySweep(
+                { webhookUrl: app.url, standIns, corpus, turnTimeoutMs: 500 },
+                [1, 2, 4],
+                { p95TurnMs: 10_000, maxFailureRate: 0 }
+            );
+            // "order" expects two replies on its second turn and only gets one
+            expect(report.steps).toHaveLength(1);
+            expect(report.steps[0]).toMatchObject({ turns: 3, failedTurns: 1 });
+            expect(report.capacity).toBeNull();
+        } finally {
+            await app.close();
+        }
+    });
+
+    it('computes nearest-rank percentiles', () => {
+        const sorted = Array.from({ length: 100 }, (_, i) => i + 1);
+        expect(percentile(sorted, 0.5)).toBe(50);
+        expect(percentile(sorted, 0.95)).toBe(95);
+        expect(percentile(sorted, 0.99)).toBe(99);
+        expect(percentile([], 0.5)).toBe(0);
+    });
+});
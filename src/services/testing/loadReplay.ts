@@ -0,0 +1,327 @@
+/**
+ * LOAD REPLAY
+ *
+ * Replays recorded conversations through the real webhook → botQueue →
+ * botWorker path, with Twilio, Gemini and ScraperAPI answered by local
+ * stand-ins (loadReplayStandIns.ts), and measures:
+ * - turn latency: webhook POST → the last bot reply expected for the turn
+ * - queue lag: webhook POST → worker pick-up (the typing indicator)
+ * - throughput: completed turns per second
+ *
+ * Conversations run concurrently, the turns of one conversation in order.
+ * runCapacitySweep() repeats the replay at increasing concurrency; the
+ * capacity of a release is the highest throughput whose p95 turn latency
+ * and failure rate stay within the SLO.
+ *
+ * CLI: scripts/load-replay.ts
+ */
+
+import fs from 'fs';
+import path from 'path';
+import { StandInServer, StandInReply, StandInService, ResponseFixture } from './loadReplayStandIns';
+
+// ============================================================================
+// Corpus
+// ============================================================================
+
+export interface CorpusTurn {
+    text?: string;
+    /** Image files, relative to the corpus file */
+    media?: string[];
+    /** Bot messages that complete the turn (interim replies included). Default 1 */
+    replies?: number;
+}
+
+export interface CorpusConversation {
+    name: string;
+    turns: CorpusTurn[];
+}
+
+export interface Corpus {
+    conversations: CorpusConversation[];
+    /** Recorded Gemini answers, matched against the request body */
+    llm?: ResponseFixture[];
+    defaultLlmResponse?: string;
+    /** Recorded shop pages, matched against the scraped URL */
+    scraper?: ResponseFixture[];
+    /** Every media file referenced by a turn, absolute paths (filled by loadCorpus) */
+    mediaFiles?: string[];
+}
+
+export function loadCorpus(file: string): Corpus {
+    const corpus: Corpus = JSON.parse(fs.readFileSync(file, 'utf8'));
+    if (!Array.isArray(corpus.conversations) || corpus.conversations.length === 0) {
+        throw new Error(`Corpus ${file} has no conversations`);
+    }
+
+    const dir = path.dirname(path.resolve(file));
+    const mediaFiles: string[] = [];
+    for (const conversation of corpus.conversations) {
+        for (const turn of conversation.turns) {
+            turn.media = turn.media?.map(media => {
+                const absolute = path.resolve(dir, media);
+                if (!fs.existsSync(absolute)) throw new Error(`Corpus media not found: ${absolute}`);
+                if (!mediaFiles.includes(absolute)) mediaFiles.push(absolute);
+                return absolute;
+            });
+        }
+    }
+    corpus.mediaFiles = mediaFiles;
+    return corpus;
+}
+
+// ============================================================================
+// Replay
+// ============================================================================
+
+export interface ReplayOptions {
+    /** e.g. http://127.0.0.1:3000/webhook/whatsapp */
+    webhookUrl: string;
+    standIns: StandInServer;
+    corpus: Corpus;
+    /** Conversations in flight at once */
+    concurrency: number;
+    /** Replay every conversation this many times (with distinct senders) */
+    repeat?: number;
+    turnTimeoutMs?: number;
+    /** Pause between a reply and the next turn of the same conversation */
+    thinkTimeMs?: number;
+    /** Digits that distinguish the senders of separate runs, so no run continues an earlier order */
+    runTag?: string;
+}
+
+export interface LatencySummary {
+    p50: number;
+    p95: number;
+    p99: number;
+    max: number;
+}
+
+export interface ReplayResult {
+    concurrency: number;
+    turns: number;
+    failedTurns: number;
+    failureRate: number;
+    durationMs: number;
+    turnsPerSecond: number;
+    turnLatencyMs: LatencySummary;
+    queueLagMs: LatencySummary;
+    /** Bot messages that arrived after their turn was already complete */
+    unexpectedReplies: number;
+    standInCalls: Record<StandInService, number>;
+}
+
+interface PendingTurn {
+    expected: number;
+    received: number;
+    done: (at: number) => void;
+}
+
+/** Nearest-rank percentile of ascending `sorted` */
+export function percentile(sorted: number[], q: number): number {
+    if (sorted.length === 0) return 0;
+    return sorted[Math.min(sorted.length - 1, Math.max(0, Math.ceil(q * sorted.length) - 1))];
+}
+
+export function summarize(values: number[]): LatencySummary {
+    const sorted = [...values].sort((a, b) => a - b);
+    return {
+        p50: Math.round(percentile(sorted, 0.5)),
+        p95: Math.round(percentile(sorted, 0.95)),
+        p99: Math.round(percentile(sorted, 0.99)),
+        max: Math.round(sorted[sorted.length - 1] ?? 0),
+    };
+}
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+export async function runReplay(options: ReplayOptions): Promise<ReplayResult> {
+    const { webhookUrl, standIns, corpus, concurrency } = options;
+    const repeat = options.repeat ?? 1;
+    const turnTimeoutMs = options.turnTimeoutMs ?? 60_000;
+    const thinkTimeMs = options.thinkTimeMs ?? 0;
+    const runTag = options.runTag ?? String(Math.floor(Date.now() / 1000) % 10_000).padStart(4, '0');
+
+    const pending = new Map<string, PendingTurn>();
+    const sentAt = new Map<string, number>();
+    const turnLatencies: number[] = [];
+    const queueLags: number[] = [];
+    let failedTurns = 0;
+    let unexpectedReplies = 0;
+
+    const onReply = (reply: StandInReply) => {
+        const turn = pending.get(reply.to);
+        if (!turn) {
+            unexpectedReplies++;
+            return;
+        }
+        if (++turn.received >= turn.expected) turn.done(reply.at);
+    };
+    const onPickup = (messageSid: string, at: number) => {
+        const sent = sentAt.get(messageSid);
+        if (sent === undefined) return;
+        sentAt.delete(messageSid);
+        queueLags.push(at - sent);
+    };
+    standIns.on('reply', onReply);
+    standIns.on('pickup', onPickup);
+    standIns.takeCallCounts();
+
+    const mediaIndex = new Map((corpus.mediaFiles ?? []).map((file, i) => [file, i]));
+    const sessions = Array.from({ length: repeat }, (_, r) => corpus.conversations.map((conversation, c) => ({
+        conversation,
+        // +49 00… is not an assigned German number range, so never a real customer
+        from: `whatsapp:+4900${runTag}${String(r * corpus.conversations.length + c).padStart(6, '0')}`,
+    }))).flat();
+
+    async function playTurn(from: string, turn: CorpusTurn, messageSid: string): Promise<void> {
+        const media = (turn.media ?? []).map(file => standIns.mediaUrl(mediaIndex.get(file)!));
+        const form = new URLSearchParams({
+            From: from,
+            To: 'whatsapp:+14155238886',
+            Body: turn.text ?? '',
+            NumMedia: String(media.length),
+            MessageSid: messageSid,
+        });
+        media.forEach((url, i) => {
+            form.set(`MediaUrl${i}`, url);
+            form.set(`MediaContentType${i}`, 'image/jpeg');
+        });
+
+        let timer: NodeJS.Timeout | undefined;
+        const replied = new Promise<number>((resolve, reject) => {
+            pending.set(from, { expected: turn.replies ?? 1, received: 0, done: resolve });
+            timer = setTimeout(() => reject(new Error(`Turn timed out after ${turnTimeoutMs}ms`)), turnTimeoutMs);
+        });
+        replied.catch(() => { });
+
+        const start = Date.now();
+        sentAt.set(messageSid, start);
+        try {
+            const res = await fetch(webhookUrl, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+                body: form.toString(),
+            });
+            const twiml = await res.text();
+            if (!res.ok) throw new Error(`Webhook returned ${res.status}`);
+            // Queue unavailable: the webhook answered synchronously via TwiML
+            if (twiml.includes('<Message>')) onReply({ to: from, body: twiml, at: Date.now() });
+            turnLatencies.push(await replied - start);
+        } finally {
+            clearTimeout(timer);
+            pending.delete(from);
+            sentAt.delete(messageSid);
+        }
+    }
+
+    let next = 0;
+    async function virtualUser(): Promise<void> {
+        while (next < sessions.length) {
+            const { conversation, from } = sessions[next++];
+            for (let t = 0; t < conversation.turns.length; t++) {
+                try {
+                    await playTurn(from, conversation.turns[t], `SMloadreplay${from.replace(/\D/g, '')}${String(t).padStart(4, '0')}`);
+                } catch {
+                    // A broken turn leaves the conversation in an unknown state: count the rest as failed
+                    failedTurns += conversation.turns.length - t;
+                    break;
+                }
+                if (thinkTimeMs > 0) await sleep(thinkTimeMs);
+            }
+        }
+    }
+
+    const start = Date.now();
+    try {
+        await Promise.all(Array.from({ length: Math.min(concurrency, sessions.length) }, virtualUser));
+    } finally {
+        standIns.off('reply', onReply);
+        standIns.off('pickup', onPickup);
+    }
+    const durationMs = Date.now() - start;
+    const turns = turnLatencies.length + failedTurns;
+
+    return {
+        concurrency,
+        turns,
+        failedTurns,
+        failureRate: turns > 0 ? failedTurns / turns : 0,
+        durationMs,
+        turnsPerSecond: Math.round((turnLatencies.length / (durationMs / 1000)) * 100) / 100,
+        turnLatencyMs: summarize(turnLatencies),
+        queueLagMs: summarize(queueLags),
+        unexpectedReplies,
+        standInCalls: standIns.takeCallCounts(),
+    };
+}
+
+// ============================================================================
+// Capacity
+// ============================================================================
+
+export interface CapacitySlo {
+    p95TurnMs: number;
+    maxFailureRate: number;
+}
+
+export interface CapacityReport {
+    slo: CapacitySlo;
+    steps: ReplayResult[];
+    /** Best step within the SLO, null if even the lowest concurrency breaches it */
+    capacity: { turnsPerSecond: number; concurrency: number } | null;
+}
+
+export function withinSlo(result: ReplayResult, slo: CapacitySlo): boolean {
+    return result.turnLatencyMs.p95 <= slo.p95TurnMs && result.failureRate <= slo.maxFailureRate;
+}
+
+/**
+ * Replay at each concurrency level (ascending) until one breaches the SLO.
+ */
+export async function runCapacitySweep(
+    options: Omit<ReplayOptions, 'concurrency'>,
+    levels: number[],
+    slo: CapacitySlo
+): Promise<CapacityReport> {
+    const steps: ReplayResult[] = [];
+    let capacity: CapacityReport['capacity'] = null;
+    const runTag = options.runTag ?? String(Math.floor(Date.now() / 1000) % 1000).padStart(3, '0');
+
+    for (const [i, concurrency] of [...levels].sort((a, b) => a - b).entries()) {
+        const result = await runReplay({ ...options, concurrency, runTag: `${runTag}${i}` });
+        steps.push(result);
+        if (!withinSlo(result, slo)) break;
+        if (!capacity || result.turnsPerSecond > capacity.turnsPerSecond) {
+            capacity = { turnsPerSecond: result.turnsPerSecond, concurrency };
+        }
+    }
+
+    return { slo, steps, capacity };
+}
+
+export function formatCapacityReport(report: CapacityReport): string {
+    const lines = [
+        `${'conc'.padStart(5)} ${'turns'.padStart(6)} ${'fail %'.padStart(7)} ${'turns/s'.padStart(8)} ` +
+        `${'p50 ms'.padStart(7)} ${'p95 ms'.padStart(7)} ${'p99 ms'.padStart(7)} ${'lag p50'.padStart(8)} ${'lag p95'.padStart(8)} ` +
+        `${'llm'.padStart(6)} ${'scraper'.padStart(8)}`,
+    ];
+    lines.push('-'.repeat(lines[0].length));
+    for (const step of report.steps) {
+        lines.push(
+            `${String(step.concurrency).padStart(5)} ${String(step.turns).padStart(6)} ` +
+            `${(step.failureRate * 100).toFixed(1).padStart(7)} ${step.turnsPerSecond.toFixed(2).padStart(8)} ` +
+            `${String(step.turnLatencyMs.p50).padStart(7)} ${String(step.turnLatencyMs.p95).padStart(7)} ` +
+            `${String(step.turnLatencyMs.p99).padStart(7)} ${String(step.queueLagMs.p50).padStart(8)} ` +
+            `${String(step.queueLagMs.p95).padStart(8)} ${String(step.standInCalls.gemini).padStart(6)} ` +
+            `${String(step.standInCalls.scraper).padStart(8)}` +
+            (withinSlo(step, report.slo) ? '' : '  ✗ SLO')
+        );
+    }
+    lines.push('');
+    lines.push(report.capacity
+        ? `Capacity: ${report.capacity.turnsPerSecond.toFixed(2)} turns/s at concurrency ${report.capacity.concurrency} ` +
+          `(p95 ≤ ${report.slo.p95TurnMs} ms, failures ≤ ${(report.slo.maxFailureRate * 100).toFixed(1)}%)`
+        : `Capacity: none — concurrency ${report.steps[0]?.concurrency} already breaches the SLO`);
+    return lines.join('\n');
+}
@@ -0,0 +1,358 @@
+/**
+ * LOAD REPLAY STAND-INS
+ *
+ * One local HTTP server that stands in for the external APIs of the bot
+ * pipeline, each answering after a configurable latency:
+ * - Twilio REST: Messages.json (bot replies) and UserDefinedMessages.json
+ *   (typing indicator, sent when a worker picks a message up)
+ * - Gemini: models/*:generateContent and :streamGenerateContent
+ * - ScraperAPI: GET /?url=...
+ * - media: GET /media/<n> serves the corpus images
+ *
+ * The app is pointed at it through getEnv() (GEMINI_BASE_URL,
+ * SCRAPER_API_URL, TWILIO_API_BASE_URL). Every delay is drawn from a PRNG
+ * seeded with (seed, service, request, occurrence), so the same replay sees
+ * the same delays no matter how requests interleave.
+ *
+ * With `recordings`, Gemini and ScraperAPI are answered from responses
+ * recorded from the real APIs instead (exact request match, recorded
+ * latency); with `record: true`, misses are forwarded upstream and added.
+ */
+
+import { createHash } from 'crypto';
+import { EventEmitter } from 'events';
+import fs from 'fs';
+import http from 'http';
+import { AddressInfo } from 'net';
+
+// ============================================================================
+// Latency distributions
+// ============================================================================
+
+export type LatencySpec =
+    | { kind: 'fixed'; ms: number }
+    | { kind: 'uniform'; min: number; max: number }
+    | { kind: 'normal'; mean: number; sd: number }
+    | { kind: 'lognormal'; median: number; sigma: number };
+
+/**
+ * Parse "fixed:200", "uniform:100,400", "normal:800,150" or
+ * "lognormal:900,0.4" (median ms, sigma of the underlying normal).
+ */
+export function parseLatency(spec: string): LatencySpec {
+    const [kind, args = ''] = spec.trim().split(':');
+    const [a, b] = args.split(',').map(Number);
+    const valid = (...values: number[]) => values.every(v => Number.isFinite(v) && v >= 0);
+
+    if (kind === 'fixed' && valid(a)) return { kind, ms: a };
+    if (kind === 'uniform' && valid(a, b) && a <= b) return { kind, min: a, max: b };
+    if (kind === 'normal' && valid(a, b)) return { kind, mean: a, sd: b };
+    if (kind === 'lognormal' && valid(a, b)) return { kind, median: a, sigma: b };
+    throw new Error(`Invalid latency spec "${spec}" (expected fixed:ms, uniform:min,max, normal:mean,sd or lognormal:median,sigma)`);
+}
+
+/**
+ * Latency in ms for two uniform numbers in [0, 1). Never negative.
+ */
+export function sampleLatency(spec: LatencySpec, u1: number, u2: number): number {
+    // Box-Muller; 1 - u1 keeps the log argument > 0
+    const z = () => Math.sqrt(-2 * Math.log(1 - u1)) * Math.cos(2 * Math.PI * u2);
+    switch (spec.kind) {
+        case 'fixed': return spec.ms;
+        case 'uniform': return spec.min + (spec.max - spec.min) * u1;
+        case 'normal': return Math.max(0, spec.mean + spec.sd * z());
+        case 'lognormal': return spec.median * Math.exp(spec.sigma * z());
+    }
+}
+
+/** Two uniforms in [0, 1) derived from `key` */
+function uniformsFor(key: string): [number, number] {
+    const digest = createHash('sha256').update(key).digest();
+    return [digest.readUInt32BE(0) / 2 ** 32, digest.readUInt32BE(4) / 2 ** 32];
+}
+
+// ============================================================================
+// Stand-in server
+// ============================================================================
+
+export type StandInService = 'twilio' | 'gemini' | 'scraper' | 'media';
+
+/** Canned response for requests whose body (Gemini) or target URL (ScraperAPI) contains `match` */
+export interface ResponseFixture {
+    match: string;
+    response: string;
+}
+
+/** A real Gemini / ScraperAPI response, keyed by recordingKey() */
+export interface RecordedResponse {
+    status: number;
+    contentType: string;
+    body: string;
+    latencyMs: number;
+}
+
+export interface StandInOptions {
+    /** 0 = any free port */
+    port?: number;
+    seed?: number;
+    latency?: Partial<Record<StandInService, LatencySpec>>;
+    llmFixtures?: ResponseFixture[];
+    /** Gemini answer when no fixture matches */
+    defaultLlmResponse?: string;
+    scraperFixtures?: ResponseFixture[];
+    defaultScraperHtml?: string;
+    /** Files served as /media/<index> */
+    media?: string[];
+    /** Answer Gemini and ScraperAPI from these (instead of fixtures and latency distributions) */
+    recordings?: Record<string, RecordedResponse>;
+    /** Forward requests missing from `recordings` to the real APIs and record them */
+    record?: boolean;
+    /** Multiplier for recorded latencies (0 = answer immediately). Default 1 */
+    recordedLatencyScale?: number;
+}
+
+export interface StandInReply {
+    to: string;
+    body: string;
+    at: number;
+}
+
+export const DEFAULT_LATENCY: Record<StandInService, LatencySpec> = {
+    twilio: { kind: 'lognormal', median: 120, sigma: 0.3 },
+    gemini: { kind: 'lognormal', median: 900, sigma: 0.4 },
+    scraper: { kind: 'lognormal', median: 2500, sigma: 0.5 },
+    media: { kind: 'fixed', ms: 50 },
+};
+
+const ACCOUNT_SID = 'ACloadreplay00000000000000000000';
+
+const UPSTREAM: Record<'gemini' | 'scraper', string> = {
+    gemini: 'https://generativelanguage.googleapis.com',
+    scraper: 'http://api.scraperapi.com',
+};
+
+/** ScraperAPI parameters that differ between identical requests */
+const VOLATILE_SCRAPER_PARAMS = ['api_key', 'session_number'];
+
+/**
+ * Recording key of a request: Gemini by endpoint and body (the API key is a
+ * header), ScraperAPI by its parameters minus the key and session number.
+ */
+export function recordingKey(service: 'gemini' | 'scraper', url: URL, body: string): string {
+    if (service === 'gemini') {
+        return `gemini ${url.pathname} ${createHash('sha256').update(body).digest('hex')}`;
+    }
+    const params = [...url.searchParams]
+        .filter(([name]) => !VOLATILE_SCRAPER_PARAMS.includes(name))
+        .sort(([a], [b]) => a.localeCompare(b));
+    return `scraper ${createHash('sha256').update(JSON.stringify(params)).digest('hex')}`;
+}
+
+/**
+ * Emits "reply" (StandInReply) for every message the bot sends and
+ * "pickup" (messageSid, at) for every typing indicator.
+ */
+export class StandInServer extends EventEmitter {
+    private server: http.Server | null = null;
+    private baseUrl = '';
+    private readonly latency: Record<StandInService, LatencySpec>;
+    private readonly occurrences = new Map<string, number>();
+    private readonly calls: Record<StandInService, number> = { twilio: 0, gemini: 0, scraper: 0, media: 0 };
+    private messageCount = 0;
+    private recordingMisses = 0;
+
+    constructor(private readonly options: StandInOptions = {}) {
+        super();
+        this.latency = { ...DEFAULT_LATENCY, ...options.latency };
+    }
+
+    async start(): Promise<string> {
+        this.server = http.createServer((req, res) => {
+            this.handle(req, res).catch(err => {
+                res.writeHead(500, { 'Content-Type': 'application/json' });
+                res.end(JSON.stringify({ message: err?.message }));
+            });
+        });
+        await new Promise<void>(resolve => this.server!.listen(this.options.port ?? 0, '127.0.0.1', resolve));
+        this.baseUrl = `http://127.0.0.1:${(this.server.address() as AddressInfo).port}`;
+        return this.baseUrl;
+    }
+
+    async stop(): Promise<void> {
+        if (!this.server) return;
+        this.server.closeAllConnections();
+        await new Promise<void>(resolve => this.server!.close(() => resolve()));
+        this.server = null;
+    }
+
+    /** Environment for the app under test (recording keeps the real API keys) */
+    getEnv(): Record<string, string> {
+        return {
+            ...(this.options.record ? {} : { GEMINI_API_KEY: 'load-replay', SCRAPER_API_KEY: 'load-replay' }),
+            GEMINI_BASE_URL: this.baseUrl,
+            SCRAPER_API_URL: this.baseUrl,
+            TWILIO_ACCOUNT_SID: ACCOUNT_SID,
+            TWILIO_AUTH_TOKEN: 'load-replay',
+            TWILIO_API_BASE_URL: this.baseUrl,
+            ENFORCE_TWILIO_SIGNATURE: 'false',
+        };
+    }
+
+    mediaUrl(index: number): string {
+        return `${this.baseUrl}/media/${index}`;
+    }
+
+    /** Requests served per stand-in since start (or the last call) */
+    takeCallCounts(): Record<StandInService, number> {
+        const counts = { ...this.calls };
+        for (const service of Object.keys(this.calls) as StandInService[]) this.calls[service] = 0;
+        return counts;
+    }
+
+    /** Requests that had no recording (answered with HTTP 500) */
+    getRecordingMisses(): number {
+        return this.recordingMisses;
+    }
+
+    private async handle(req: http.IncomingMessage, res: http.ServerResponse): Promise<void> {
+        const url = new URL(req.url || '/', 'http://stand-in');
+        const body = await readBody(req);
+
+        if (url.pathname.startsWith('/2010-04-01/')) {
+            await this.delay('twilio', `${url.pathname}\n${body}`);
+            return this.handleTwilio(url, body, res);
+        }
+        if (url.pathname.includes(':generateContent') || url.pathname.includes(':streamGenerateContent')) {
+            if (this.options.recordings) return this.replay('gemini', req, url, body, res);
+            await this.delay('gemini', body);
+            return this.handleGemini(url, body, res);
+        }
+        if (url.pathname.startsWith('/media/')) {
+            await this.delay('media', url.pathname);
+            const file = this.options.media?.[Number(url.pathname.slice('/media/'.length))];
+            if (!file) return send(res, 404, 'text/plain', 'not found');
+            return send(res, 200, 'image/jpeg', await fs.promises.readFile(file));
+        }
+        if (url.searchParams.has('url')) {
+            if (this.options.recordings) return this.replay('scraper', req, url, body, res);
+            const target = url.searchParams.get('url')!;
+            await this.delay('scraper', target);
+            const fixture = this.options.scraperFixtures?.find(f => target.includes(f.match));
+            return send(res, 200, 'text/html', fixture?.response ?? this.options.defaultScraperHtml ?? '<html><body></body></html>');
+        }
+        send(res, 404, 'text/plain', 'not found');
+    }
+
+    private handleTwilio(url: URL, body: string, res: http.ServerResponse): void {
+        const now = Date.now();
+        const typing = url.pathname.match(/\/Messages\/([^/]+)\/UserDefinedMessages\.json$/);
+        if (typing) {
+            this.emit('pickup', typing[1], now);
+            return send(res, 201, 'application/json', JSON.stringify({ sid: `UM${typing[1]}` }));
+        }
+        if (!url.pathname.endsWith('/Messages.json')) return send(res, 404, 'text/plain', 'not found');
+
+        const params = new URLSearchParams(body);
+        const reply: StandInReply = {
+            to: params.get('To') || '',
+            body: params.get('Body') ?? `[content ${params.get('ContentSid')}]`,
+            at: now,
+        };
+        this.emit('reply', reply);
+        send(res, 201, 'application/json', JSON.stringify({
+            sid: `SMstandin${String(++this.messageCount).padStart(24, '0')}`,
+            account_sid: ACCOUNT_SID,
+            to: reply.to,
+            from: params.get('From'),
+            body: reply.body,
+            status: 'queued',
+            num_segments: '1',
+            date_created: new Date(now).toUTCString(),
+        }));
+    }
+
+    private handleGemini(url: URL, body: string, res: http.ServerResponse): void {
+        const fixture = this.options.llmFixtures?.find(f => body.includes(f.match));
+        const text = fixture?.response ?? this.options.defaultLlmResponse ?? '{}';
+        const payload = JSON.stringify({
+            candidates: [{ content: { role: 'model', parts: [{ text }] }, finishReason: 'STOP', index: 0 }],
+            usageMetadata: {
+                promptTokenCount: Math.ceil(body.length / 4),
+                candidatesTokenCount: Math.ceil(text.length / 4),
+                totalTokenCount: Math.ceil((body.length + text.length) / 4),
+            },
+        });
+        if (url.pathname.includes(':streamGenerateContent')) {
+            return send(res, 200, 'text/event-stream', `data: ${payload}\n\n`);
+        }
+        send(res, 200, 'application/json', payload);
+    }
+
+    private async replay(
+        service: 'gemini' | 'scraper',
+        req: http.IncomingMessage,
+        url: URL,
+        body: string,
+        res: http.ServerResponse
+    ): Promise<void> {
+        this.calls[service]++;
+        const recordings = this.options.recordings!;
+        const key = recordingKey(service, url, body);
+        const recorded = recordings[key];
+
+        if (recorded) {
+            const ms = recorded.latencyMs * (this.options.recordedLatencyScale ?? 1);
+            if (ms > 0) await new Promise(resolve => setTimeout(resolve, ms));
+            return send(res, recorded.status, recorded.contentType, recorded.body);
+        }
+        if (!this.options.record) {
+            this.recordingMisses++;
+            return send(res, 500, 'application/json', JSON.stringify({ error: { code: 500, message: `No recorded response for ${key}` } }));
+        }
+
+        const headers: Record<string, string> = {};
+        for (const name of ['content-type', 'x-goog-api-key', 'x-goog-api-client']) {
+            const value = req.headers[name];
+            if (typeof value === 'string') headers[name] = value;
+        }
+        const start = Date.now();
+        const upstream = await fetch(`${UPSTREAM[service]}${url.pathname}${url.search}`, {
+            method: req.method,
+            headers,
+            body: req.method === 'GET' || req.method === 'HEAD' ? undefined : body,
+        });
+        const response: RecordedResponse = {
+            status: upstream.status,
+            contentType: upstream.headers.get('content-type') || 'application/json',
+            body: await upstream.text(),
+            latencyMs: Date.now() - start,
+        };
+        // Only successful answers are worth replaying; errors are retried on the next recording
+        if (response.status < 500 && response.status !== 429) recordings[key] = response;
+        send(res, response.status, response.contentType, response.body);
+    }
+
+    private delay(service: StandInService, request: string): Promise<void> {
+        this.calls[service]++;
+        const key = createHash('sha256').update(`${this.options.seed ?? 0}\n${service}\n${request}`).digest('hex');
+        const occurrence = (this.occurrences.get(key) ?? 0) + 1;
+        this.occurrences.set(key, occurrence);
+        const [u1, u2] = uniformsFor(`${key}\n${occurrence}`);
+        const ms = sampleLatency(this.latency[service], u1, u2);
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+}
+
+function readBody(req: http.IncomingMessage): Promise<string> {
+    return new Promise((resolve, reject) => {
+        const chunks: Buffer[] = [];
+        req.on('data', chunk => chunks.push(chunk));
+        req.on('end', () => resolve(Buffer.concat(chunks).toString('utf8')));
+        req.on('error', reject);
+    });
+}
+
+function send(res: http.ServerResponse, status: number, contentType: string, body: string | Buffer): void {
+    res.writeHead(status, { 'Content-Type': contentType });
+    res.end(body);
+}
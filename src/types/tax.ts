@@ -145,7 +145,7 @@ export interface TaxBreakdown {
 export interface PeriodAggregation {
     period_start: string;
     period_end: string;
-    invoices: Invoice[];
+    invoices?: Invoice[];  // Only with includeInvoices
     totals: {
         standard_19: TaxBreakdown;
         reduced_7: TaxBreakdown;
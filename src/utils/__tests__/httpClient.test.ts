@@ -0,0 +1,163 @@
+/**
+ * Tests for the pooled HTTP client, against a local HTTP stand-in
+ */
+jest.mock('@utils/logger', () => ({
+    logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn(), debug: jest.fn() },
+}));
+
+import * as http from 'http';
+import * as https from 'https';
+import { AddressInfo } from 'net';
+
+process.env.HTTP_BREAKER_THRESHOLD = '3';
+process.env.HTTP_BREAKER_COOLDOWN_MS = '200';
+delete process.env.HTTPS_WEB;
+delete process.env.HTTP_WEB;
+
+// Loaded after the env is set: limits are read at import
+const {
+    fetchWithTimeoutAndRetry, withHostLimits, configureHost, getHttpClientStats, resetHttpClient, CircuitOpenError,
+} = require('../httpClient');
+
+let server: http.Server;
+let base: string;
+let host: string;
+let connections = 0;
+let inFlight = 0;
+let maxInFlight = 0;
+const hits: Record<string, number> = {};
+let blockedStatus = 429;
+
+beforeAll(async () => {
+    server = http.createServer((req, res) => {
+        const path = req.url!.split('?')[0];
+        hits[path] = (hits[path] || 0) + 1;
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        const done = (status: number, body: string | Buffer, headers: Record<string, string> = {}) => {
+            inFlight--;
+            res.writeHead(status, headers);
+            res.end(body);
+        };
+
+        if (path === '/ok') return done(200, JSON.stringify({ ok: true }), { 'Content-Type': 'application/json' });
+        if (path === '/binary') return done(200, Buffer.from([0xff, 0xd8, 0x00, 0x80, 0xfe]));
+        if (path === '/slow') return setTimeout(() => done(200, 'slow'), 50);
+        if (path === '/blocked') return done(blockedStatus, 'blocked', { 'Retry-After': '0' });
+        done(404, 'not found');
+    });
+    server.on('connection', () => connections++);
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    host = `127.0.0.1:${(server.address() as AddressInfo).port}`;
+    base = `http://${host}`;
+});
+
+afterAll(async () => {
+    resetHttpClient();
+    await new Promise((resolve) => server.close(resolve));
+});
+
+beforeEach(() => {
+    resetHttpClient();
+    connections = 0;
+    maxInFlight = 0;
+    for (const key of Object.keys(hits)) delete hits[key];
+    configureHost(host, { concurrency: 8, ratePerSec: 1000, burst: 1000 });
+});
+
+describe('fetchWithTimeoutAndRetry', () => {
+    it('should reuse one keep-alive connection for sequential requests', async () => {
+        for (let i = 0; i < 5; i++) {
+            const res = await fetchWithTimeoutAndRetry(`${base}/ok`);
+            expect(await res.json()).toEqual({ ok: true });
+        }
+        expect(connections).toBe(1);
+    });
+
+    it('should return binary bodies unchanged', async () => {
+        const res = await fetchWithTimeoutAndRetry(`${base}/binary`);
+        expect([...Buffer.from(await res.arrayBuffer())]).toEqual([0xff, 0xd8, 0x00, 0x80, 0xfe]);
+    });
+
+    it('should cap concurrent requests per host', async () => {
+        configureHost(host, { concurrency: 2 });
+        await Promise.all(Array.from({ length: 6 }, () => fetchWithTimeoutAndRetry(`${base}/slow`)));
+        expect(maxInFlight).toBe(2);
+        expect(getHttpClientStats()[host]).toMatchObject({ requests: 6, inFlight: 0, queued: 0 });
+    });
+
+    it('should pace requests with the token bucket', async () => {
+        configureHost(host, { ratePerSec: 20, burst: 2 });
+        const start = Date.now();
+        await Promise.all(Array.from({ length: 6 }, () => fetchWithTimeoutAndRetry(`${base}/ok`)));
+        // 2 from the burst, 4 more at 20/s
+        expect(Date.now() - start).toBeGreaterThanOrEqual(180);
+    });
+
+    it('should open the circuit after repeated 429s and probe again after the cooldown', async () => {
+        blockedStatus = 429;
+        await expect(fetchWithTimeoutAndRetry(`${base}/blocked`, { retry: 5, retryDelayMs: 1 })).rejects.toThrow();
+        // Threshold 3: the 4th attempt is rejected locally
+        expect(hits['/blocked']).toBe(3);
+        await expect(fetchWithTimeoutAndRetry(`${base}/blocked`)).rejects.toBeInstanceOf(CircuitOpenError);
+        expect(getHttpClientStats()[host]).toMatchObject({ breaker: 'open', rejected: 2, statuses: { 429: 3 } });
+
+        await new Promise((resolve) => setTimeout(resolve, 250));
+        blockedStatus = 200;
+        const res = await fetchWithTimeoutAndRetry(`${base}/blocked`);
+        expect(res.status).toBe(200);
+        expect(getHttpClientStats()[host].breaker).toBe('closed');
+    });
+
+    it('should record a latency histogram per host', async () => {
+        await fetchWithTimeoutAndRetry(`${base}/ok`);
+        await fetchWithTimeoutAndRetry(`${base}/slow`);
+        const stats = getHttpClientStats()[host];
+        expect(stats.requests).toBe(2);
+        expect(stats.statuses).toEqual({ '2xx': 2 });
+        expect(Object.values(stats.latency.histogram).reduce((a: number, b: any) => a + b, 0)).toBe(2);
+        expect(stats.latency.maxMs).toBeGreaterThanOrEqual(40);
+    });
+});
+
+describe('withHostLimits', () => {
+    it('should hand a finished request\'s slot to the queued one', async () => {
+        configureHost(host, { concurrency: 1 });
+        let release!: () => void;
+        const done = new Promise<{ status: number }>((resolve) => { release = () => resolve({ status: 200 }); });
+        let active = 0;
+        let peak = 0;
+        const request = async () => {
+            peak = Math.max(peak, ++active);
+            await new Promise((resolve) => setTimeout(resolve, 10));
+            active--;
+            return { status: 200 };
+        };
+
+        const first = withHostLimits(`${base}/a`, () => done);
+        const queued = withHostLimits(`${base}/b`, request);
+        // Arrives after the first request finished, before the queued one wakes up
+        const late = done.then(() => withHostLimits(`${base}/c`, request));
+        release();
+        await Promise.all([first, queued, late]);
+
+        expect(peak).toBe(1);
+        expect(getHttpClientStats()[host]).toMatchObject({ requests: 3, inFlight: 0, queued: 0 });
+    });
+});
+
+describe('keepAliveAgents', () => {
+    it('should give API clients direct agents even when a scraping proxy is configured', () => {
+        process.env.HTTPS_WEB = 'http://proxy.invalid:3128';
+        try {
+            jest.isolateModules(() => {
+                const { keepAliveAgents, agentFor } = require('../httpClient');
+                const agents = keepAliveAgents('https://inventree.internal/api');
+                expect(agents.httpsAgent).toBeInstanceOf(https.Agent);
+                expect(agentFor('https://api.scraperapi.com/?url=x')).toBeInstanceOf(https.Agent);
+            });
+        } finally {
+            delete process.env.HTTPS_WEB;
+        }
+    });
+});
@@ -11,6 +11,24 @@ export interface Span {
     setTag: (key: string, value: string | number | boolean) => void;
 }
 
+export interface FinishedSpan {
+    name: string;
+    durationMs: number;
+    tags: Record<string, any>;
+}
+
+const spanListeners = new Set<(span: FinishedSpan) => void>();
+
+/**
+ * Subscribe to finished spans (benchmarks, in-process profiling).
+ * Listeners run synchronously in the async context that finished the span.
+ * Returns the unsubscribe function.
+ */
+export function onSpanFinish(listener: (span: FinishedSpan) => void): () => void {
+    spanListeners.add(listener);
+    return () => { spanListeners.delete(listener); };
+}
+
 /**
  * Start a performance tracking span
  * Compatible with Sentry/Datadog interface
@@ -33,6 +51,8 @@ export function startSpan(name: string, tags?: Record<string, any>): Span {
                 duration_ms: durationMs,
                 tags: spanTags
             }, `[APM] Span closed: ${name} (${durationMs}ms)`);
+
+            for (const listener of spanListeners) listener({ name, durationMs, tags: spanTags });
             
             // If Sentry was installed, it would be:
             // sentrySpan.finish();
@@ -1,25 +1,47 @@
-import axios, { AxiosResponse, AxiosInstance } from "axios";
+import axios, { AxiosResponse } from "axios";
+import * as http from "http";
+import * as https from "https";
 import { HttpsProxyAgent } from "https-proxy-agent";
 import { logger } from "@utils/logger";
+import { ExternalServiceError } from "@utils/errors";
+
+/**
+ * Pooled outbound HTTP:
+ * - keep-alive agents per host; scraping requests (fetchWithTimeoutAndRetry)
+ *   go through one keep-alive proxy agent when HTTPS_WEB/HTTP_WEB is set
+ * - per-host concurrency limit and token bucket
+ * - per-host circuit breaker that opens on repeated 403/429
+ * - per-host latency histograms (getHttpClientStats)
+ *
+ * fetchWithTimeoutAndRetry() applies all of it; clients with their own
+ * HTTP stack (node-fetch, axios instances) use agentFor()/keepAliveAgents()
+ * and withHostLimits() directly.
+ */
 
 // Read proxy from HTTPS_WEB or HTTP_WEB environment variables
 const PROXY_URL = process.env.HTTPS_WEB || process.env.HTTP_WEB;
 
-// Create custom axios instance with proxy configuration
-let axiosInstance: AxiosInstance;
+const DEFAULT_LIMITS: HostLimits = {
+  concurrency: Number(process.env.HTTP_HOST_CONCURRENCY || 8),
+  ratePerSec: Number(process.env.HTTP_HOST_RPS || 10),
+  burst: Number(process.env.HTTP_HOST_BURST || 20),
+};
+const BREAKER_THRESHOLD = Number(process.env.HTTP_BREAKER_THRESHOLD || 5);
+const BREAKER_COOLDOWN_MS = Number(process.env.HTTP_BREAKER_COOLDOWN_MS || 30_000);
+const BREAKER_MAX_COOLDOWN_MS = Number(process.env.HTTP_BREAKER_MAX_COOLDOWN_MS || 5 * 60_000);
+/** Upper bound for a server-provided Retry-After we are willing to sleep */
+const MAX_RETRY_AFTER_MS = 30_000;
 
-if (PROXY_URL) {
-  const proxyAgent = new HttpsProxyAgent(PROXY_URL);
-  axiosInstance = axios.create({
-    httpAgent: proxyAgent,
-    httpsAgent: proxyAgent,
-  });
-  logger.info("✅ HTTP Client (axios): Using proxy from HTTPS_WEB/HTTP_WEB:", {
-    proxyUrl: PROXY_URL.replace(/:[^:@]+@/, ':***@') // Hide password
-  });
-} else {
-  axiosInstance = axios.create();
-  logger.warn("⚠️ HTTP Client: No proxy configured (HTTPS_WEB/HTTP_WEB not set) - requests may be blocked!");
+/** Latency histogram upper bounds in ms */
+export const LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, Infinity];
+
+export interface HostLimits {
+  /** Max requests in flight per host (also caps the agent's sockets) */
+  concurrency: number;
+  /** Sustained requests per second per host */
+  ratePerSec: number;
+  /** Token bucket size */
+  burst: number;
 }
 
 export interface FetchOptions {
@@ -31,10 +53,275 @@ export interface FetchOptions {
   body?: any;
 }
 
+/**
+ * Thrown without touching the network while a host's breaker is open
+ */
+export class CircuitOpenError extends ExternalServiceError {
+  public readonly host: string;
+  public readonly retryInMs: number;
+
+  constructor(host: string, retryInMs: number) {
+    super(host, `Circuit open for ${host} (retry in ${Math.ceil(retryInMs / 1000)}s)`, { host, retryInMs });
+    this.name = "CircuitOpenError";
+    this.host = host;
+    this.retryInMs = retryInMs;
+  }
+}
+
 async function delay(ms: number) {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+// ============================================================================
+// Per-host state
+// ============================================================================
+
+type BreakerState = "closed" | "open" | "half_open";
+
+interface HostState {
+  limits: HostLimits;
+  active: number;
+  queue: Array<() => void>;
+  tokens: number;
+  lastRefill: number;
+  breaker: BreakerState;
+  /** Consecutive 403/429 responses */
+  blockedStreak: number;
+  openedAt: number;
+  cooldownMs: number;
+  trialInFlight: boolean;
+  httpAgent?: http.Agent;
+  httpsAgent?: https.Agent;
+  requests: number;
+  errors: number;
+  rejected: number;
+  statuses: Record<string, number>;
+  latencyHistogram: number[];
+  latencySumMs: number;
+  latencyMaxMs: number;
+}
+
+const hosts = new Map<string, HostState>();
+const hostOverrides = new Map<string, Partial<HostLimits>>(Object.entries(parseHostLimits(process.env.HTTP_HOST_LIMITS)));
+
+/** HTTP_HOST_LIMITS='{"api.scraperapi.com":{"concurrency":4,"ratePerSec":2}}' */
+function parseHostLimits(raw: string | undefined): Record<string, Partial<HostLimits>> {
+  if (!raw) return {};
+  try {
+    return JSON.parse(raw);
+  } catch {
+    logger.warn("HTTP_HOST_LIMITS is not valid JSON - using defaults");
+    return {};
+  }
+}
+
+function hostOf(url: string): string {
+  try {
+    return new URL(url).host;
+  } catch {
+    return "unknown";
+  }
+}
+
+function hostState(host: string): HostState {
+  let state = hosts.get(host);
+  if (!state) {
+    const limits = { ...DEFAULT_LIMITS, ...hostOverrides.get(host) };
+    state = {
+      limits,
+      active: 0,
+      queue: [],
+      tokens: limits.burst,
+      lastRefill: Date.now(),
+      breaker: "closed",
+      blockedStreak: 0,
+      openedAt: 0,
+      cooldownMs: BREAKER_COOLDOWN_MS,
+      trialInFlight: false,
+      requests: 0,
+      errors: 0,
+      rejected: 0,
+      statuses: {},
+      latencyHistogram: new Array(LATENCY_BUCKETS_MS.length).fill(0),
+      latencySumMs: 0,
+      latencyMaxMs: 0,
+    };
+    hosts.set(host, state);
+  }
+  return state;
+}
+
+/**
+ * Override the limits of one host (before or after its first request).
+ */
+export function configureHost(host: string, limits: Partial<HostLimits>): void {
+  hostOverrides.set(host, { ...hostOverrides.get(host), ...limits });
+  const state = hosts.get(host);
+  if (state) {
+    state.limits = { ...state.limits, ...limits };
+    state.tokens = Math.min(state.tokens, state.limits.burst);
+  }
+}
+
+// ============================================================================
+// Keep-alive agents
+// ============================================================================
+
+let proxyAgent: HttpsProxyAgent<string> | undefined;
+
+if (PROXY_URL) {
+  proxyAgent = new HttpsProxyAgent(PROXY_URL, { keepAlive: true, maxSockets: 64 });
+  logger.info("✅ HTTP Client (axios): Using proxy from HTTPS_WEB/HTTP_WEB:", {
+    proxyUrl: PROXY_URL.replace(/:[^:@]+@/, ':***@') // Hide password
+  });
+} else {
+  logger.warn("⚠️ HTTP Client: No proxy configured (HTTPS_WEB/HTTP_WEB not set) - requests may be blocked!");
+}
+
+/**
+ * Direct keep-alive agent for `url`: one pooled agent per host and protocol.
+ * Never the scraping proxy - internal and authenticated APIs must not be
+ * tunneled through it.
+ */
+export function agentFor(url: string): http.Agent {
+  const state = hostState(hostOf(url));
+  const options = {
+    keepAlive: true,
+    maxSockets: state.limits.concurrency,
+    maxFreeSockets: state.limits.concurrency,
+    scheduling: "lifo" as const,
+  };
+  if (url.startsWith("https:")) {
+    return (state.httpsAgent ??= new https.Agent(options));
+  }
+  return (state.httpAgent ??= new http.Agent(options));
+}
+
+/**
+ * `{ httpAgent, httpsAgent }` for axios instances bound to one base URL
+ */
+export function keepAliveAgents(baseUrl: string): { httpAgent: http.Agent; httpsAgent: https.Agent } {
+  const host = hostOf(baseUrl);
+  return {
+    httpAgent: agentFor(`http://${host}`),
+    httpsAgent: agentFor(`https://${host}`) as https.Agent,
+  };
+}
+
+// ============================================================================
+// Limits + circuit breaker
+// ============================================================================
+
+function takeToken(state: HostState): number {
+  const now = Date.now();
+  state.tokens = Math.min(state.limits.burst, state.tokens + ((now - state.lastRefill) / 1000) * state.limits.ratePerSec);
+  state.lastRefill = now;
+  if (state.tokens >= 1) {
+    state.tokens -= 1;
+    return 0;
+  }
+  return Math.ceil(((1 - state.tokens) / state.limits.ratePerSec) * 1000);
+}
+
+function checkBreaker(host: string, state: HostState): boolean {
+  if (state.breaker === "closed") return false;
+
+  const retryInMs = state.openedAt + state.cooldownMs - Date.now();
+  if (state.breaker === "open" && retryInMs <= 0) {
+    state.breaker = "half_open";
+  }
+  if (state.breaker === "half_open" && !state.trialInFlight) {
+    state.trialInFlight = true;
+    return true;
+  }
+  state.rejected++;
+  throw new CircuitOpenError(host, Math.max(retryInMs, 0));
+}
+
+function recordOutcome(host: string, state: HostState, status: number | null, trial: boolean): void {
+  if (trial) state.trialInFlight = false;
+
+  const blocked = status === 403 || status === 429;
+  if (blocked) {
+    state.blockedStreak++;
+    if (trial || (state.breaker === "closed" && state.blockedStreak >= BREAKER_THRESHOLD)) {
+      state.cooldownMs = trial ? Math.min(state.cooldownMs * 2, BREAKER_MAX_COOLDOWN_MS) : BREAKER_COOLDOWN_MS;
+      state.breaker = "open";
+      state.openedAt = Date.now();
+      logger.warn("[HTTP] Circuit opened", { host, status, streak: state.blockedStreak, cooldownMs: state.cooldownMs });
+    }
+    return;
+  }
+
+  if (status === null) {
+    // Network error / timeout: does not count towards the breaker, but a
+    // failed trial keeps it open for another cooldown
+    if (trial) {
+      state.breaker = "open";
+      state.openedAt = Date.now();
+    }
+    return;
+  }
+
+  state.blockedStreak = 0;
+  if (trial) {
+    state.breaker = "closed";
+    state.cooldownMs = BREAKER_COOLDOWN_MS;
+    logger.info("[HTTP] Circuit closed", { host });
+  }
+}
+
+function recordLatency(state: HostState, ms: number, status: number | null): void {
+  state.requests++;
+  if (status === null) state.errors++;
+  const key = status === null ? "error" : status === 403 || status === 429 ? String(status) : `${Math.floor(status / 100)}xx`;
+  state.statuses[key] = (state.statuses[key] || 0) + 1;
+
+  let bucket = 0;
+  while (ms > LATENCY_BUCKETS_MS[bucket]) bucket++;
+  state.latencyHistogram[bucket]++;
+  state.latencySumMs += ms;
+  state.latencyMaxMs = Math.max(state.latencyMaxMs, ms);
+}
+
+/**
+ * Run one request to `url` under its host's breaker, concurrency limit and
+ * token bucket, and record its latency and status. Throws CircuitOpenError
+ * without calling `request` while the breaker is open.
+ */
+export async function withHostLimits<T extends { status: number }>(url: string, request: () => Promise<T>): Promise<T> {
+  const host = hostOf(url);
+  const state = hostState(host);
+  const trial = checkBreaker(host, state);
+
+  if (state.active >= state.limits.concurrency) {
+    // Woken by a finishing request, which hands over its slot
+    await new Promise<void>((resolve) => state.queue.push(resolve));
+  } else {
+    state.active++;
+  }
+
+  let status: number | null = null;
+  try {
+    for (let wait = takeToken(state); wait > 0; wait = takeToken(state)) {
+      await delay(wait);
+    }
+    const start = Date.now();
+    try {
+      const response = await request();
+      status = response.status;
+      return response;
+    } finally {
+      recordLatency(state, Date.now() - start, status);
+    }
+  } finally {
+    recordOutcome(host, state, status, trial);
+    const next = state.queue.shift();
+    if (next) next();
+    else state.active--;
+  }
+}
+
 const USER_AGENTS = [
   "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
   "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -77,31 +364,38 @@ export interface Response {
 }
 
 function axiosToFetchResponse(axiosResponse: AxiosResponse): Response {
+  const data = axiosResponse.data;
+  const text = () => (Buffer.isBuffer(data) ? data.toString("utf8") : typeof data === "string" ? data : JSON.stringify(data));
   return {
     ok: axiosResponse.status >= 200 && axiosResponse.status < 300,
     status: axiosResponse.status,
     statusText: axiosResponse.statusText,
     headers: axiosResponse.headers,
-    text: async () => axiosResponse.data,
-    json: async () => typeof axiosResponse.data === 'string' ? JSON.parse(axiosResponse.data) : axiosResponse.data,
+    text: async () => text(),
+    json: async () => (Buffer.isBuffer(data) || typeof data === "string" ? JSON.parse(text()) : data),
     arrayBuffer: async () => {
-      if (axiosResponse.data instanceof ArrayBuffer) {
-        return axiosResponse.data;
+      if (data instanceof ArrayBuffer) {
+        return data;
       }
       // Convert Buffer to ArrayBuffer if needed
-      if (Buffer.isBuffer(axiosResponse.data)) {
-        return axiosResponse.data.buffer.slice(
-          axiosResponse.data.byteOffset,
-          axiosResponse.data.byteOffset + axiosResponse.data.byteLength
-        ) as ArrayBuffer;
+      if (Buffer.isBuffer(data)) {
+        return data.buffer.slice(data.byteOffset, data.byteOffset + data.byteLength) as ArrayBuffer;
       }
       // For string data, encode to ArrayBuffer
       const encoder = new TextEncoder();
-      return encoder.encode(axiosResponse.data).buffer as ArrayBuffer;
+      return encoder.encode(text()).buffer as ArrayBuffer;
     }
   };
 }
 
+function retryAfterMs(headers: any): number | null {
+  const value = headers?.["retry-after"];
+  if (value === undefined || value === null || value === "") return null;
+  const seconds = Number(value);
+  const ms = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(String(value)) - Date.now();
+  return Number.isFinite(ms) ? Math.min(Math.max(ms, 0), MAX_RETRY_AFTER_MS) : null;
+}
+
 export async function fetchWithTimeoutAndRetry(url: string, options: FetchOptions = {}): Promise<Response> {
   const {
     timeoutMs = Number(process.env.HTTP_TIMEOUT_MS || 10000),
@@ -112,31 +406,94 @@ export async function fetchWithTimeoutAndRetry(url: string, options: FetchOption
     body
   } = options;
 
+  // Same headers (incl. User-Agent) for every attempt of this request
+  const mergedHeaders = { ...getStealthHeaders(), ...headers };
+  const agent = proxyAgent ?? agentFor(url);
+
   let attempt = 0;
   while (true) {
     attempt++;
+    let waitMs: number | null = null;
     try {
-      const mergedHeaders = { ...getStealthHeaders(), ...headers };
-
-      const axiosResponse = await axiosInstance({
+      const axiosResponse = await withHostLimits(url, () => axios.request({
         url,
         method,
         headers: mergedHeaders,
         data: body,
         timeout: timeoutMs,
+        // Raw bytes: binary media must not go through a text decoder
+        responseType: "arraybuffer",
+        httpAgent: agent,
+        httpsAgent: agent,
+        proxy: false,
         validateStatus: () => true, // Don't throw on any status
         maxRedirects: 5
-      });
+      }));
 
       if (axiosResponse.status === 403 || axiosResponse.status === 429) {
+        waitMs = retryAfterMs(axiosResponse.headers);
         throw new Error(`HTTP ${axiosResponse.status}`); // Trigger retry for bot detection
       }
 
       return axiosToFetchResponse(axiosResponse);
     } catch (err: any) {
-      if (attempt > retry) throw err;
-      // Exponential backoff
-      await delay(retryDelayMs * Math.pow(2, attempt - 1) + Math.random() * 100);
+      // An open breaker will not close within our backoff - fail fast
+      if (err instanceof CircuitOpenError || attempt > retry) throw err;
+      // Server hint first, otherwise exponential backoff with full jitter so
+      // callers hitting the same host do not retry in lockstep
+      await delay(waitMs ?? Math.random() * retryDelayMs * Math.pow(2, attempt));
     }
   }
 }
+
+// ============================================================================
+// Stats
+// ============================================================================
+
+/**
+ * Per-host request counts, breaker state and latency histogram
+ */
+export function getHttpClientStats() {
+  const result: Record<string, {
+    requests: number;
+    errors: number;
+    rejected: number;
+    inFlight: number;
+    queued: number;
+    breaker: BreakerState;
+    statuses: Record<string, number>;
+    latency: { avgMs: number; maxMs: number; histogram: Record<string, number> };
+  }> = {};
+  for (const [host, state] of hosts) {
+    const histogram: Record<string, number> = {};
+    LATENCY_BUCKETS_MS.forEach((le, i) => {
+      if (state.latencyHistogram[i] > 0) histogram[le === Infinity ? "+Inf" : String(le)] = state.latencyHistogram[i];
+    });
+    result[host] = {
+      requests: state.requests,
+      errors: state.errors,
+      rejected: state.rejected,
+      inFlight: state.active,
+      queued: state.queue.length,
+      breaker: state.breaker,
+      statuses: { ...state.statuses },
+      latency: {
+        avgMs: state.requests > 0 ? Math.round(state.latencySumMs / state.requests) : 0,
+        maxMs: state.latencyMaxMs,
+        histogram,
+      },
+    };
+  }
+  return result;
+}
+
+/**
+ * Drop all per-host state and close pooled sockets (tests, shutdown)
+ */
+export function resetHttpClient(): void {
+  for (const state of hosts.values()) {
+    state.httpAgent?.destroy();
+    state.httpsAgent?.destroy();
+  }
+  hosts.clear();
+}
@@ -20,8 +20,10 @@ dotenv.config();
 import { logger } from '@utils/logger';
 import { initDb } from './services/core/database';
 import { runOemAutoUpdate } from './scripts/oemDatabaseUpdate';
+import { oemDatabase } from './services/intelligence/oemDatabase';
 
 const REDIS_URL = process.env.REDIS_URL;
+const OEM_INDEX_REFRESH_MS = parseInt(process.env.OEM_INDEX_REFRESH_MS || String(60 * 60 * 1000), 10);
 
 if (!REDIS_URL) {
   logger.error('[Worker] CRITICAL: REDIS_URL is required for worker mode');
@@ -58,6 +60,11 @@ function setupGracefulShutdown() {
           // @ts-ignore
           await botWorkerModule.closeWorker();
         }
+        const { stopFeatureFlagSync } = await import('./services/core/featureFlags');
+        await stopFeatureFlagSync();
+        // Write buffered audit entries
+        const { closeAuditSinks } = await import('./services/compliance/auditSink');
+        await closeAuditSinks();
       } catch (err: any) {
         logger.error('[Worker] Error during shutdown', { error: err?.message });
       }
@@ -94,21 +101,26 @@ async function startWorker() {
     process.exit(1);
   }
 
-  // 3. Set up graceful shutdown
+  // 3. Pick up feature-flag changes made on other pods
+  const { connection } = await import('./queue/connection');
+  const { startFeatureFlagSync } = await import('./services/core/featureFlags');
+  await startFeatureFlagSync(connection);
+
+  // 4. Set up graceful shutdown
   setupGracefulShutdown();
 
-  // 4. Health heartbeat (every 60s)
+  // 5. Health heartbeat (every 60s)
   setInterval(() => {
     if (!isShuttingDown) {
       logger.debug('[Worker] Heartbeat — worker is alive');
     }
   }, 60_000);
 
-  // 5. OEM Database Auto-Updater (Daily)
-  // Run once on startup, then every 24 hours
+  // 6. OEM Database Auto-Updater (Daily)
+  // Run once on startup, then every 24 hours; republish the read-only index afterwards
   if (!isShuttingDown) {
       logger.info('[Worker] Running initial OEM Database Auto-Update...');
-      runOemAutoUpdate().catch(err => {
+      runOemAutoUpdate().then(() => oemDatabase.refreshIndexInBackground()).catch(err => {
           logger.error('[Worker] Initial OEM update failed', { error: err?.message });
       });
   }
@@ -116,12 +128,19 @@ async function startWorker() {
   setInterval(() => {
     if (!isShuttingDown) {
       logger.info('[Worker] Running daily OEM Database Auto-Update...');
-      runOemAutoUpdate().catch(err => {
+      runOemAutoUpdate().then(() => oemDatabase.refreshIndexInBackground()).catch(err => {
         logger.error('[Worker] OEM update failed', { error: err?.message });
       });
     }
   }, 24 * 60 * 60 * 1000);
 
+  // 7. Republish the read-only OEM index when learned OEMs were written
+  //    (no-op while nothing changed since the last build). The build runs
+  //    on a worker thread so bot jobs and BullMQ lock renewal keep running.
+  setInterval(() => {
+    if (!isShuttingDown) void oemDatabase.refreshIndexInBackground();
+  }, OEM_INDEX_REFRESH_MS);
+
   logger.info('[Worker] Ready to process messages');
 }
 